@@ -0,0 +1,383 @@
+# bitPackedDatabase holds a vertical temporal database as one packed bitmap over the timestamps per item.
+#
+# **Importing this module into a python program**
+# --------------------------------------------------------
+#
+#     from PAMI.extras import bitPackedDatabase as bp
+#
+#     db = bp.bitPackedDatabase.read("sample.parquet")
+#
+#     words = db.items["a"] & db.items["b"]
+#
+#     print(bp.support(words), bp.periodicity(words, db.maxTS))
+#
+
+
+
+
+__copyright__ = """
+Copyright (C)  2021 Rage Uday Kiran
+
+     This program is free software: you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+
+     This program is distributed in the hope that it will be useful,
+     but WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+     GNU General Public License for more details.
+
+     You should have received a copy of the GNU General Public License
+     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import hashlib
+import numpy as np
+import pandas as pd
+
+_wordBits = 64
+_rowsPerChunk = 1024
+_one = np.uint64(1)
+
+if hasattr(np, 'bitwise_count'):
+    def _popcount(words):
+        return np.bitwise_count(words)
+else:
+    _byteCounts = np.unpackbits(np.arange(256, dtype=np.uint8)[:, None], axis=1).sum(axis=1).astype(np.uint8)
+
+    def _popcount(words):
+        return _byteCounts[words.view(np.uint8)]
+
+
+def support(words):
+    """
+    :param words: packed bitmap of a pattern
+    :type words: numpy.ndarray
+    :return: the number of timestamps set in the bitmap
+    :rtype: int
+    """
+    return int(_popcount(words).sum(dtype=np.int64))
+
+
+def timestamps(words):
+    """
+    Unpacks only the non-zero words of a bitmap, so the cost follows the number of occupied words, not the timeline.
+
+    :param words: packed bitmap of a pattern
+    :type words: numpy.ndarray
+    :return: the sorted timestamps set in the bitmap
+    :rtype: numpy.ndarray
+    """
+    occupied = np.flatnonzero(words)
+    if occupied.size == 0:
+        return np.empty(0, dtype=np.int64)
+    bits = np.unpackbits(words[occupied].view(np.uint8), bitorder='little').reshape(-1, _wordBits)
+    rows, columns = np.nonzero(bits)
+    return occupied[rows].astype(np.int64) * _wordBits + columns
+
+
+def _lowestBits(words):
+    """
+    :param words: non-zero words
+    :return: the position of the lowest set bit of every word
+    """
+    return _popcount((words & (~words + _one)) - _one).astype(np.int64)
+
+
+def _highestBits(words):
+    """
+    :param words: non-zero words
+    :return: the position of the highest set bit of every word
+    """
+    smeared = words.copy()
+    for shift in (1, 2, 4, 8, 16, 32):
+        smeared |= smeared >> np.uint64(shift)
+    return _popcount(smeared).astype(np.int64) - 1
+
+
+def _innerZeros(words, low, high):
+    """
+    :param words: non-zero words
+    :param low: the lowest set bit of every word
+    :param high: the highest set bit of every word
+    :return: the zero bits of every word lying between its lowest and its highest set bit
+    """
+    below = (_one << high.astype(np.uint64)) - _one
+    upTo = ((_one << low.astype(np.uint64)) << _one) - _one
+    return ~words & below & ~upTo
+
+
+def _runStarts(bits, length):
+    """
+    :param bits: words
+    :param length: a run length, at least 1
+    :return: words whose bit q is set when the bits q to q + length - 1 of the word are all set
+    """
+    starts, offset, power, span = None, 0, bits, 1
+    while length:
+        if length & 1:
+            starts = power if starts is None else starts & (power >> np.uint64(offset))
+            offset += span
+        length >>= 1
+        if length:
+            power = power & (power >> np.uint64(span))
+            span *= 2
+    return starts
+
+
+def _longestRuns(bits):
+    """
+    :param bits: words
+    :return: the length of the longest run of set bits of every word, found by extending the runs by 32, 16, ..., 1
+    """
+    powers = [bits]
+    for k in range(5):
+        powers.append(powers[-1] & (powers[-1] >> np.uint64(1 << k)))
+    lengths = np.zeros(bits.shape, dtype=np.uint64)
+    starts = np.full(bits.shape, ~np.uint64(0), dtype=np.uint64)
+    for k in range(5, -1, -1):
+        extended = starts & (powers[k] >> lengths)
+        grown = extended != 0
+        starts = np.where(grown, extended, starts)
+        lengths = np.where(grown, lengths + np.uint64(1 << k), lengths)
+    return lengths.astype(np.int64)
+
+
+def _gaps(words):
+    """
+    :param words: packed bitmap of a pattern
+    :return: the occupied words, their lowest and highest set bits and the timestamps of those bits
+    """
+    occupied = np.flatnonzero(words)
+    nonZero = words[occupied]
+    low, high = _lowestBits(nonZero), _highestBits(nonZero)
+    base = occupied.astype(np.int64) * _wordBits
+    return nonZero, low, high, base + low, base + high
+
+
+def span(words):
+    """
+    :param words: packed bitmap of a pattern
+    :type words: numpy.ndarray
+    :return: the first and the last timestamp set in the bitmap, None when the bitmap is empty
+    :rtype: tuple
+    """
+    occupied = np.flatnonzero(words)
+    if occupied.size == 0:
+        return None
+    ends = words[occupied[[0, -1]]]
+    return (int(occupied[0]) * _wordBits + int(_lowestBits(ends[:1])[0]),
+            int(occupied[-1]) * _wordBits + int(_highestBits(ends[1:])[0]))
+
+
+def periodicity(words, maxTS):
+    """
+    The maximum gap between consecutive timestamps of a pattern, where the timeline is bounded by 0 and maxTS. The
+    gaps across words come from the lowest and highest set bits of the occupied words, and the gaps inside a word from
+    its longest run of zeros, so no word is unpacked.
+
+    :param words: packed bitmap of a pattern
+    :type words: numpy.ndarray
+    :param maxTS: the last timestamp of the database
+    :type maxTS: int
+    :rtype: int
+    """
+    nonZero, low, high, firsts, lasts = _gaps(words)
+    if nonZero.size == 0:
+        return int(maxTS)
+    gap = max(int(firsts[0]), int(maxTS - lasts[-1]), int((firsts[1:] - lasts[:-1]).max(initial=0)))
+    several = low != high
+    if gap < _wordBits - 1 and several.any():
+        # a gap inside a word is one more than a run of zeros of the word, so it is at most 63
+        inner = _longestRuns(_innerZeros(nonZero[several], low[several], high[several]))
+        gap = max(gap, int(inner.max()) + 1)
+    return gap
+
+
+def periodicSupport(words, period):
+    """
+    The number of consecutive timestamps of a pattern that are at most period apart: every pair of consecutive
+    timestamps but those farther apart than period. A gap inside a word is farther apart than period when the word
+    holds a run of at least period zeros, and the runs are found with shifts and ANDs on the words.
+
+    :param words: packed bitmap of a pattern
+    :type words: numpy.ndarray
+    :param period: the user specified period
+    :type period: int
+    :rtype: int
+    """
+    nonZero, low, high, firsts, lasts = _gaps(words)
+    pairs = support(nonZero) - 1
+    if pairs <= 0 or period < 1:
+        return 0
+    pairs -= int(np.count_nonzero(firsts[1:] - lasts[:-1] > period))
+    if period < _wordBits - 1:
+        runs = _runStarts(_innerZeros(nonZero, low, high), int(period))
+        pairs -= support(runs & ~(runs << _one))
+    return pairs
+
+
+def fingerprint(words):
+    """
+    The key under which PAMI.extras.closedPatternIndex groups the patterns occurring at the same timestamps, for
+    patterns given as bitmaps of one database.
+
+    :param words: packed bitmap of a pattern
+    :type words: numpy.ndarray
+    :return: the support of the bitmap and a 128-bit digest of its words
+    :rtype: tuple
+    """
+    return support(words), hashlib.blake2b(np.ascontiguousarray(words).tobytes(), digest_size=16).digest()
+
+
+def isBitPacked(iFile):
+    """
+    Checks whether an input of a miner is a bit-packed vertical database rather than a temporal database.
+
+    :param iFile: the input given to a miner
+    :rtype: bool
+    """
+    if isinstance(iFile, bitPackedDatabase):
+        return True
+    if isinstance(iFile, str):
+        return iFile.endswith('.parquet')
+    if isinstance(iFile, pd.DataFrame):
+        return 'Transactions' not in iFile.columns and len(iFile.columns) > 0 and \
+            all(np.issubdtype(dtype, np.unsignedinteger) for dtype in iFile.dtypes)
+    return False
+
+
+class bitPackedDatabase:
+    """
+    :Description:   A vertical temporal database in which every item is stored as a packed bitmap over the timestamps.
+                    Bit t % 64 of word t // 64 of an item is set when the item occurs at timestamp t, so the support of
+                    a pattern is the popcount of the AND of its item bitmaps.
+
+    :Attributes:
+
+        items : dict
+            Maps every item to its bitmap as a numpy.uint64 array
+        maxTS : int
+            The last timestamp of the database
+        dbSize : int
+            The number of timestamps at which at least one item occurs
+
+    :Methods:
+
+        read(iFile, layout)
+            Reads a bit-packed database written by PAMI.extras.converters or by save(), in the layout recorded with it
+        fromTimestamps(timeStamps)
+            Builds a bit-packed database from a dictionary of item to timestamps
+        save(oFile)
+            Writes the database as a parquet file of numpy.uint32 words
+
+    **Importing this module into a python program**
+    --------------------------------------------------------
+    .. code-block:: python
+
+            from PAMI.extras import bitPackedDatabase as bp
+
+            from PAMI.periodicFrequentPattern.basic import PFECLAT as alg
+
+            bp.bitPackedDatabase.fromTimestamps({"a": [1, 2, 4], "b": [2, 4]}).save("sample.parquet")
+
+            obj = alg.PFECLAT("sample.parquet", 2, 2)
+
+            obj.mine()
+    """
+
+    def __init__(self, items, maxTS=None):
+        self.items = {item: np.ascontiguousarray(words, dtype=np.uint64) for item, words in items.items()}
+        if maxTS is None:
+            maxTS = max((bounds[1] for bounds in map(span, self.items.values()) if bounds is not None), default=0)
+        self.maxTS = int(maxTS)
+        self.numWords = self.maxTS // _wordBits + 1
+        for item, words in self.items.items():
+            if words.size < self.numWords:
+                self.items[item] = np.concatenate((words, np.zeros(self.numWords - words.size, dtype=np.uint64)))
+        union = np.zeros(self.numWords, dtype=np.uint64)
+        for words in self.items.values():
+            union |= words[:self.numWords]
+        self.dbSize = support(union)
+
+    @classmethod
+    def fromTimestamps(cls, timeStamps):
+        """
+        :param timeStamps: maps every item to the timestamps at which it occurs
+        :type timeStamps: dict
+        :rtype: bitPackedDatabase
+        """
+        maxTS = max((max(ts) for ts in timeStamps.values() if len(ts)), default=0)
+        numWords = maxTS // _wordBits + 1
+        items = {}
+        for item, ts in timeStamps.items():
+            bits = np.zeros(numWords * _wordBits, dtype=np.uint8)
+            bits[np.asarray(list(ts), dtype=np.int64)] = 1
+            items[item] = np.packbits(bits, bitorder='little').view(np.uint64)
+        return cls(items, maxTS)
+
+    @classmethod
+    def read(cls, iFile, layout='auto'):
+        """
+        Reads a parquet database with one row per item, the row index holding the item. Two column layouts are written
+        by PAMI.extras.converters: 'bits', one 0/1 column per timestamp (CSV2BitInteger), and 'words', one numpy.uint32
+        column per 32 timestamps whose most significant bit is the first timestamp of the word (CSV2Integer, the cuda
+        miners and save()). With layout='auto' the layout recorded by the writer in the 'layout' attribute of the table
+        is used. A table without it is read as 'words' when it holds a value above 1, and a table holding only 0 and 1
+        is valid in both layouts, so it must be read with an explicit layout.
+
+        :param iFile: a parquet file, a DataFrame in one of the layouts or a bitPackedDatabase
+        :param layout: 'auto', 'bits' or 'words'
+        :type layout: str
+        :rtype: bitPackedDatabase
+        """
+        if isinstance(iFile, bitPackedDatabase):
+            return iFile
+        if layout not in ('auto', 'bits', 'words'):
+            raise ValueError("layout must be 'auto', 'bits' or 'words'")
+        df = iFile if isinstance(iFile, pd.DataFrame) else pd.read_parquet(iFile)
+        names = [str(x) for x in df.index]
+        table = np.ascontiguousarray(df.to_numpy(dtype=np.uint32))
+        if layout == 'auto':
+            layout = df.attrs.get('layout')
+        if layout == 'auto' or layout is None:
+            if table.size and table.max() > 1:
+                layout = 'words'
+            elif table.any():
+                raise ValueError("a table holding only 0 and 1 is valid in both the 'bits' and the 'words' layout, read "
+                                 "it with bitPackedDatabase.read(iFile, layout) and mine the returned database")
+            else:
+                layout = 'words'
+        if layout not in ('bits', 'words'):
+            raise ValueError("unknown layout %r recorded in the table" % layout)
+        numBits = table.shape[1] if layout == 'bits' else table.shape[1] * 32
+        numWords = (numBits + _wordBits - 1) // _wordBits
+        items = {}
+        for start in range(0, len(names), _rowsPerChunk):
+            if layout == 'bits':
+                bits = table[start:start + _rowsPerChunk].astype(np.uint8)
+            else:
+                bits = np.unpackbits(table[start:start + _rowsPerChunk].astype('>u4').view(np.uint8), axis=1)
+            bits = np.pad(bits, ((0, 0), (0, numWords * _wordBits - bits.shape[1])))
+            packed = np.packbits(bits, axis=1, bitorder='little').view(np.uint64)
+            for row in range(packed.shape[0]):
+                items[names[start + row]] = packed[row]
+        return cls(items)
+
+    def save(self, oFile):
+        """
+        Writes the database in the 'words' layout of read().
+
+        :param oFile: name of the parquet file
+        :type oFile: str
+        :return: None
+        """
+        names = list(self.items)
+        numWords32 = self.maxTS // 32 + 1
+        words = np.stack([self.items[item] for item in names]) if names else np.zeros((0, self.numWords), np.uint64)
+        bits = np.unpackbits(words.view(np.uint8), axis=1, bitorder='little')[:, :numWords32 * 32]
+        words32 = np.packbits(bits, axis=1).view('>u4').astype(np.uint32)
+        df = pd.DataFrame(words32, index=names, columns=[str(i) for i in range(numWords32)])
+        df.attrs['layout'] = 'words'
+        df.to_parquet(oFile)
@@ -0,0 +1,151 @@
+# closedPatternIndex records the patterns found by a closed pattern miner and tells whether a new pattern is subsumed by a
+# recorded superset having the same tidset.
+#
+# **Importing this module into a python program**
+# --------------------------------------------------------
+#
+#     from PAMI.extras import closedPatternIndex as cpi
+#
+#     index = cpi.closedPatternIndex()
+#
+#     index.add(['a', 'b'], [1, 2, 4])
+#
+#     print(index.contains(['a'], [1, 2, 4]))
+#
+
+
+
+
+__copyright__ = """
+Copyright (C)  2021 Rage Uday Kiran
+
+     This program is free software: you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+
+     This program is distributed in the hope that it will be useful,
+     but WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+     GNU General Public License for more details.
+
+     You should have received a copy of the GNU General Public License
+     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import hashlib as _hashlib
+import numpy as _np
+
+
+class closedPatternIndex:
+    """
+    :Description:   An index of the patterns found by a closed pattern miner. Patterns are grouped by the support and a
+                    128-bit fingerprint of their tidset, so two patterns share a group only when their tidsets are equal,
+                    and every itemset is encoded as a bitset so that a superset test is a single AND of two integers.
+                    It replaces the former sum(tidSet) % tableSize buckets, whose sums collide heavily on long timelines.
+
+    :Attributes:
+
+        bits : dict
+            Maps every item seen so far to its bit in the itemset encoding
+        groups : dict
+            Maps (support, fingerprint) of a tidset to the encoded itemsets having that tidset
+
+    :Methods:
+
+        encode(itemSet)
+            Returns the bitset of an itemset
+        fingerprint(tidSet)
+            Returns the key of a tidset
+        contains(itemSet, tidSet)
+            Checks whether a superset of the itemset with the same tidset was recorded
+        add(itemSet, tidSet)
+            Records an itemset
+
+    **Importing this module into a python program**
+    --------------------------------------------------------
+    .. code-block:: python
+
+            from PAMI.extras import closedPatternIndex as cpi
+
+            index = cpi.closedPatternIndex()
+
+            if not index.contains(itemSet, tidSet):
+
+                patterns[itemSet] = len(tidSet)
+
+            index.add(itemSet, tidSet)
+    """
+
+    def __init__(self):
+        self.bits = {}
+        self.groups = {}
+
+    def __len__(self):
+        return sum(len(group) for group in self.groups.values())
+
+    def encode(self, itemSet):
+        """
+        :param itemSet: items of a pattern
+        :type itemSet: iterable
+        :return: the bitset of the itemset, new items being given the next free bit
+        :rtype: int
+        """
+        mask = 0
+        for item in itemSet:
+            bit = self.bits.get(item)
+            if bit is None:
+                bit = self.bits[item] = 1 << len(self.bits)
+            mask |= bit
+        return mask
+
+    @staticmethod
+    def fingerprint(tidSet):
+        """
+        :param tidSet: timestamps of a pattern in any order, without repetitions
+        :type tidSet: iterable
+        :return: the support of the tidset and a 128-bit digest of its sorted timestamps
+        :rtype: tuple
+        """
+        if not isinstance(tidSet, _np.ndarray):
+            tidSet = _np.fromiter(tidSet, dtype=_np.int64)
+        tidSet = _np.sort(tidSet.astype(_np.int64, copy=False))
+        return len(tidSet), _hashlib.blake2b(tidSet.tobytes(), digest_size=16).digest()
+
+    def contains(self, itemSet, tidSet, key=None):
+        """
+        :param itemSet: items of a pattern
+        :type itemSet: iterable
+        :param tidSet: timestamps of the pattern
+        :type tidSet: iterable
+        :param key: the fingerprint of tidSet when already computed
+        :type key: tuple
+        :return: True if a superset of the itemset with the same tidset was recorded
+        :rtype: bool
+        """
+        group = self.groups.get(key if key is not None else self.fingerprint(tidSet))
+        if not group:
+            return False
+        mask = self.encode(itemSet)
+        for other in group:
+            if other & mask == mask:
+                return True
+        return False
+
+    def add(self, itemSet, tidSet, key=None):
+        """
+        :param itemSet: items of a pattern
+        :type itemSet: iterable
+        :param tidSet: timestamps of the pattern
+        :type tidSet: iterable
+        :param key: the fingerprint of tidSet when already computed
+        :type key: tuple
+        :return: None
+        """
+        key = key if key is not None else self.fingerprint(tidSet)
+        mask = self.encode(itemSet)
+        group = self.groups.get(key)
+        if group is None:
+            self.groups[key] = [mask]
+        elif mask not in group:
+            group.append(mask)
@@ -96,6 +96,8 @@ def csvToBitInteger(file, output, sep = "\t"):
     fileData = dict(sorted(fileData.items(), key = lambda x: len(x[1])))
 
 
+    # keep the original items as the row index, so that miners reading the file report them
+    items = {v: k for k, v in rename.items()}
     newRep = {}
     # arraySize = maxTS // 32 + 1
 
@@ -104,7 +106,7 @@ def csvToBitInteger(file, output, sep = "\t"):
         bitRep = np.zeros(maxTS + 1, dtype=np.uint32)
         for i in range(len(v)):
             bitRep[v[i]] = 1
-        newRep[k] = bitRep
+        newRep[items[k]] = bitRep
         # print(k,":",len(v))
 
     # print("Creating dataframe...")
@@ -118,6 +120,8 @@ def csvToBitInteger(file, output, sep = "\t"):
         cols.append(str(i))
 
     df.columns = cols
+    # record the layout, so that PAMI.extras.bitPackedDatabase reads the file without guessing it
+    df.attrs['layout'] = 'bits'
 
     # print("Writing to parquet...")
     df.to_parquet(output)
@@ -111,6 +111,8 @@ def csvToBitInteger(file, output, sep = "\t"):
         cols.append(str(i))
 
     df.columns = cols
+    # record the layout, so that PAMI.extras.bitPackedDatabase reads the file without guessing it
+    df.attrs['layout'] = 'words'
 
     df.to_parquet(output)
 
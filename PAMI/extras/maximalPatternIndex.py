@@ -0,0 +1,136 @@
+# maximalPatternIndex records the patterns found by a maximal pattern miner and tells whether a candidate is subsumed by
+# one of them.
+#
+# **Importing this module into a python program**
+# --------------------------------------------------------
+#
+#     from PAMI.extras import maximalPatternIndex as mpi
+#
+#     index = mpi.maximalPatternIndex()
+#
+#     index.add(['a', 'b', 'c'])
+#
+#     print(index.hasSuperset(['a', 'c']))
+#
+
+
+
+
+__copyright__ = """
+Copyright (C)  2021 Rage Uday Kiran
+
+     This program is free software: you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+
+     This program is distributed in the hope that it will be useful,
+     but WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+     GNU General Public License for more details.
+
+     You should have received a copy of the GNU General Public License
+     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+
+class maximalPatternIndex:
+    """
+    :Description:   An index of the maximal patterns found so far. Every pattern is stored as an integer bitset, so the
+                    test for a superset of a candidate is one AND per stored pattern instead of a walk up a maximal tree.
+                    A pattern-growth miner focuses the index on every prefix it extends: the focused index keeps only
+                    the patterns containing the prefix, so checks deep in the conditional trees scan short lists, and
+                    patterns added to a focused index are added to every index it was focused from.
+
+    :Attributes:
+
+        bits : dict
+            Maps every item seen so far to its bit, shared by an index and the indexes focused from it
+        patterns : list
+            The bitsets of the stored patterns visible from this index
+
+    :Methods:
+
+        encode(itemSet)
+            Returns the bitset of an itemset
+        hasSuperset(itemSet)
+            Checks whether a stored pattern contains the itemset
+        add(itemSet)
+            Records a maximal pattern
+        focus(prefix)
+            Returns the index restricted to the patterns containing a prefix
+
+    **Importing this module into a python program**
+    --------------------------------------------------------
+    .. code-block:: python
+
+            from PAMI.extras import maximalPatternIndex as mpi
+
+            index = mpi.maximalPatternIndex()
+
+            if not index.hasSuperset(prefix + tail):
+
+                conditionalTree.generatePatterns(prefix, patterns, index.focus(prefix))
+    """
+
+    def __init__(self, bits=None, parent=None):
+        self.bits = {} if bits is None else bits
+        self._parent = parent
+        self.patterns = []
+
+    def __len__(self):
+        return len(self.patterns)
+
+    def encode(self, itemSet):
+        """
+        :param itemSet: items of a pattern
+        :type itemSet: iterable
+        :return: the bitset of the itemset, new items being given the next free bit
+        :rtype: int
+        """
+        mask = 0
+        for item in itemSet:
+            bit = self.bits.get(item)
+            if bit is None:
+                bit = self.bits[item] = 1 << len(self.bits)
+            mask |= bit
+        return mask
+
+    def hasSuperset(self, itemSet):
+        """
+        :param itemSet: items of a candidate pattern
+        :type itemSet: iterable
+        :return: True if a stored pattern contains every item of the candidate
+        :rtype: bool
+        """
+        mask = self.encode(itemSet)
+        for other in self.patterns:
+            if other & mask == mask:
+                return True
+        return False
+
+    def add(self, itemSet):
+        """
+        Records a pattern in this index and in every index it was focused from.
+
+        :param itemSet: items of a maximal pattern
+        :type itemSet: iterable
+        :return: None
+        """
+        mask = self.encode(itemSet)
+        index = self
+        while index is not None:
+            index.patterns.append(mask)
+            index = index._parent
+
+    def focus(self, prefix):
+        """
+        :param prefix: the items every pattern of the conditional search will contain
+        :type prefix: iterable
+        :return: an index holding only the stored patterns that contain the prefix
+        :rtype: maximalPatternIndex
+        """
+        mask = self.encode(prefix)
+        focused = maximalPatternIndex(self.bits, self)
+        focused.patterns = [other for other in self.patterns if other & mask == mask]
+        return focused
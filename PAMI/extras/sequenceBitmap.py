@@ -0,0 +1,176 @@
+# sequenceBitmap holds a vertical sequence database as one packed bitmap per item, every sequence owning a block of
+# words in the bitmap, and provides the S-step transform and the support count of the SPAM family of miners.
+#
+# **Importing this module into a python program**
+# --------------------------------------------------------
+#
+#     from PAMI.extras import sequenceBitmap as sb
+#
+#     db = sb.sequenceBitmap([[['a'], ['a', 'b']], [['b'], ['a']]])
+#
+#     words = db.sStep(db.items['a']) & db.items['b']
+#
+#     print(db.support(words))
+#
+
+
+
+
+__copyright__ = """
+Copyright (C)  2021 Rage Uday Kiran
+
+     This program is free software: you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+
+     This program is distributed in the hope that it will be useful,
+     but WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+     GNU General Public License for more details.
+
+     You should have received a copy of the GNU General Public License
+     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import numpy as _np
+
+_wordBits = 64
+_allBits = _np.uint64(0xFFFFFFFFFFFFFFFF)
+
+
+class sequenceBitmap:
+    """
+    :Description:   A vertical sequence database in which every item is stored as a packed bitmap. Every sequence owns a
+                    block of consecutive numpy.uint64 words, one bit per itemset, and bit e % 64 of word e // 64 of the
+                    block is set when the item occurs in itemset e of the sequence. All bitmaps share the same layout, so
+                    an I-step is the AND of two bitmaps and an S-step is the AND of the transformed bitmap of the prefix
+                    with the bitmap of the item.
+
+    :Attributes:
+
+        items : dict
+            Maps every item, in the order of its first occurrence, to its bitmap
+        starts : numpy.ndarray
+            The first word of the block of every sequence, followed by the number of words of a bitmap
+        blockOf : numpy.ndarray
+            The sequence owning every word
+
+    :Methods:
+
+        sStep(words)
+            Returns the bitmap of the itemsets following the first itemset set in every sequence block
+        shift(words, distance)
+            Returns the bitmap of the itemsets following every itemset set by a distance, within every block
+        support(words)
+            Returns the number of sequences having a bit set
+
+    **Importing this module into a python program**
+    --------------------------------------------------------
+    .. code-block:: python
+
+            from PAMI.extras import sequenceBitmap as sb
+
+            db = sb.sequenceBitmap(sequences)
+
+            transformed = db.sStep(db.items[prefix])
+
+            for item, words in db.items.items():
+
+                print(item, db.support(transformed & words))
+    """
+
+    def __init__(self, sequences):
+        """
+        :param sequences: every sequence as a list of itemsets, every itemset being an iterable of items
+        :type sequences: list
+        """
+        names = {}
+        codes, sids, eids, lengths = [], [], [], []
+        for sid, sequence in enumerate(sequences):
+            lengths.append(len(sequence))
+            for eid, itemSet in enumerate(sequence):
+                for item in dict.fromkeys(itemSet):
+                    codes.append(names.setdefault(item, len(names)))
+                    sids.append(sid)
+                    eids.append(eid)
+        blocks = _np.maximum(1, -(-_np.array(lengths, dtype=_np.int64) // _wordBits))
+        self.starts = _np.zeros(len(blocks) + 1, dtype=_np.int64)
+        _np.cumsum(blocks, out=self.starts[1:])
+        self.blockOf = _np.repeat(_np.arange(len(blocks)), blocks)
+        self._positions = _np.arange(self.starts[-1])
+        self._offsets = self._positions - self.starts[:-1][self.blockOf]
+        self._singleWord = bool((blocks == 1).all())
+        codes = _np.array(codes, dtype=_np.int64)
+        eids = _np.array(eids, dtype=_np.int64)
+        words = self.starts[_np.array(sids, dtype=_np.int64)] + eids // _wordBits
+        bits = _np.left_shift(_np.uint64(1), (eids % _wordBits).astype(_np.uint64))
+        order = _np.argsort(codes, kind='stable')
+        bounds = _np.searchsorted(codes[order], _np.arange(len(names) + 1))
+        self.items = {}
+        for item, code in names.items():
+            entries = order[bounds[code]:bounds[code + 1]]
+            bitmap = _np.zeros(self.starts[-1], dtype=_np.uint64)
+            _np.bitwise_or.at(bitmap, words[entries], bits[entries])
+            self.items[item] = bitmap
+
+    def __len__(self):
+        return len(self.starts) - 1
+
+    def sStep(self, words):
+        """
+        Keeps, in every sequence block, the bits after the first bit set and clears the others, so that an AND with
+        the bitmap of an item leaves the itemsets where the item follows the pattern. Within the first word having a
+        bit set, the bits above its lowest set bit are kept, and every later word of the block is filled.
+
+        :param words: bitmap of a pattern
+        :type words: numpy.ndarray
+        :return: the transformed bitmap
+        :rtype: numpy.ndarray
+        """
+        lowest = words & (~words + _np.uint64(1))
+        after = ~(lowest | (lowest - _np.uint64(1)))
+        if self._singleWord or not len(words):
+            return after
+        index = _np.where(words != 0, self._positions, len(words))
+        first = _np.minimum.reduceat(index, self.starts[:-1])
+        transformed = _np.where(self._positions > first[self.blockOf], _allBits, _np.uint64(0))
+        first = first[first < len(words)]
+        transformed[first] = after[first]
+        return transformed
+
+    def shift(self, words, distance):
+        """
+        Moves every bit set by a number of itemsets towards the end of its sequence block, the bits leaving the block
+        being dropped, so that the bitmap of the itemsets at a given gap after the itemsets of a pattern is one shift.
+
+        :param words: bitmap of a pattern
+        :type words: numpy.ndarray
+        :param distance: the number of itemsets
+        :type distance: int
+        :return: the shifted bitmap
+        :rtype: numpy.ndarray
+        """
+        wordShift, bitShift = divmod(int(distance), _wordBits)
+        if self._singleWord:
+            return words << _np.uint64(bitShift) if not wordShift else _np.zeros_like(words)
+        shifted = _np.zeros_like(words)
+        inBlock = self._offsets >= wordShift
+        shifted[inBlock] = words[self._positions[inBlock] - wordShift]
+        if bitShift:
+            carry = _np.zeros_like(words)
+            inBlock = self._offsets >= 1
+            carry[inBlock] = shifted[self._positions[inBlock] - 1] >> _np.uint64(_wordBits - bitShift)
+            shifted = (shifted << _np.uint64(bitShift)) | carry
+        return shifted
+
+    def support(self, words):
+        """
+        :param words: bitmap of a pattern
+        :type words: numpy.ndarray
+        :return: the number of sequence blocks having at least one bit set
+        :rtype: int
+        """
+        if self._singleWord or not len(words):
+            return int(_np.count_nonzero(words))
+        return int(_np.count_nonzero(_np.logical_or.reduceat(words != 0, self.starts[:-1])))
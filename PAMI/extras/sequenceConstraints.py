@@ -0,0 +1,259 @@
+# sequenceConstraints holds the gap, window, length and item constraints of the sequential miners and evaluates them
+# where the occurrences of a pattern are extended, on projected positions, on (sid, eid) id-lists and on bitmaps, so
+# that occurrences breaking a constraint are dropped before supports are counted.
+#
+# **Importing this module into a python program**
+# --------------------------------------------------------
+#
+#     from PAMI.extras import sequenceConstraints as sc
+#
+#     constraints = sc.sequenceConstraints(maxGap=3, maxWindow=10, requiredItems=['a'])
+#
+#     for element in constraints.nextElements(element, start, end):
+#
+#         print(element)
+#
+
+
+
+
+__copyright__ = """
+Copyright (C)  2021 Rage Uday Kiran
+
+     This program is free software: you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+
+     This program is distributed in the hope that it will be useful,
+     but WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+     GNU General Public License for more details.
+
+     You should have received a copy of the GNU General Public License
+     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import numpy as _np
+
+_sidShift = 1 << 32
+
+
+def _number(value):
+    """
+    :param value: a bound given as a number or as a string read from the command line
+    :return: the bound as a number, infinity when it is None
+    """
+    if value is None:
+        return float("inf")
+    if isinstance(value, str):
+        value = float(value)
+    return value
+
+
+class sequenceConstraints:
+    """
+    :Description:   The constraints a sequential miner pushes into its projection or join step. Distances are counted
+                    in itemsets: the itemsets e and f > e of a sequence are f - e itemsets apart. An occurrence of a
+                    pattern matches its itemsets to the itemsets e1 < e2 < ... < ek of a sequence, and it is kept when
+                    minGap <= e(j+1) - ej < maxGap for every j and ek - e1 < maxWindow. A pattern is reported when it has
+                    at most maxLen itemsets and holds every required item, and sequences lacking a required item are
+                    never counted. The default constraints keep every occurrence.
+
+    :Attributes:
+
+        maxGap : float
+            Consecutive itemsets of an occurrence are less than maxGap itemsets apart
+        minGap : int
+            Consecutive itemsets of an occurrence are at least minGap itemsets apart
+        maxWindow : float
+            The last itemset of an occurrence is less than maxWindow itemsets after its first itemset
+        maxLen : float
+            The largest number of itemsets of a pattern
+        requiredItems : frozenset
+            The items every pattern holds
+        constrainsOccurrences : bool
+            True when the gaps or the window drop occurrences, so that miners keep every occurrence of a pattern
+            instead of its first one in every sequence
+
+    :Methods:
+
+        accepts(items)
+            Returns True when the items hold every required item
+        extends(length)
+            Returns True when a pattern of length itemsets may get another itemset
+        nextElements(element, start, end)
+            Returns the itemsets an occurrence ending at an itemset may continue with
+        sequenceJoin(prefixSids, prefixEids, prefixStarts, sids, eids)
+            Returns the entries of an id-list continuing an occurrence of the prefix id-list
+        root(words)
+            Returns the bitmap of a one item pattern in the layout used by sequenceStep
+        sequenceStep(bitmap, words)
+            Returns the transformed bitmap of a pattern for an S-step
+        support(bitmap, words)
+            Returns the number of sequences of a bitmap having an occurrence
+
+    **Importing this module into a python program**
+    --------------------------------------------------------
+    .. code-block:: python
+
+            from PAMI.extras import sequenceConstraints as sc
+
+            constraints = sc.sequenceConstraints(maxGap=3, maxLen=4)
+
+            if constraints.extends(len(pattern)):
+
+                transformed = constraints.sequenceStep(db, words)
+    """
+
+    def __init__(self, maxGap=float("inf"), minGap=1, maxWindow=float("inf"), maxLen=float("inf"),
+                 requiredItems=None):
+        """
+        :param maxGap: consecutive itemsets of an occurrence are less than maxGap itemsets apart
+        :type maxGap: int or float
+        :param minGap: consecutive itemsets of an occurrence are at least minGap itemsets apart
+        :type minGap: int
+        :param maxWindow: the last itemset of an occurrence is less than maxWindow itemsets after its first itemset
+        :type maxWindow: int or float
+        :param maxLen: the largest number of itemsets of a pattern
+        :type maxLen: int or float
+        :param requiredItems: the items every pattern holds
+        :type requiredItems: iterable
+        """
+        self.maxGap = _number(maxGap)
+        self.minGap = max(1, int(_number(minGap)))
+        self.maxWindow = _number(maxWindow)
+        self.maxLen = _number(maxLen)
+        self.requiredItems = frozenset(requiredItems or ())
+        self.constrainsOccurrences = self.minGap > 1 or self.maxGap != float("inf") or \
+            self.maxWindow != float("inf")
+
+    def accepts(self, items):
+        """
+        :param items: the items of a pattern or of a sequence
+        :type items: iterable
+        :return: True when the items hold every required item
+        :rtype: bool
+        """
+        return not self.requiredItems or self.requiredItems.issubset(items)
+
+    def extends(self, length):
+        """
+        :param length: the number of itemsets of a pattern
+        :type length: int
+        :return: True when the pattern may be extended with another itemset
+        :rtype: bool
+        """
+        return length < self.maxLen
+
+    def nextElements(self, element, start, end):
+        """
+        :param element: the itemset an occurrence ends at
+        :type element: int
+        :param start: the first itemset of the occurrence
+        :type start: int
+        :param end: the number of itemsets of the sequence
+        :type end: int
+        :return: the itemsets the occurrence may continue with
+        :rtype: range
+        """
+        return range(element + self.minGap, int(min(end, element + self.maxGap, start + self.maxWindow)))
+
+    def sequenceJoin(self, prefixSids, prefixEids, prefixStarts, sids, eids):
+        """
+        Finds, for every (sid, eid) entry of an id-list, the entries of the prefix id-list in the same sequence at an
+        allowed gap before it. Both id-lists are sorted by sid then eid, so the candidates of an entry are one range of
+        the prefix id-list, bounded by two binary searches. Under a window, an entry continues the candidate having the
+        latest first itemset, the largest of the range, and is dropped when it is too far from it.
+
+        :param prefixSids: the sequences of the occurrences of the prefix
+        :type prefixSids: numpy.ndarray
+        :param prefixEids: the last itemset of the occurrences of the prefix
+        :type prefixEids: numpy.ndarray
+        :param prefixStarts: the first itemset of the occurrences of the prefix, None when there is no window
+        :type prefixStarts: numpy.ndarray
+        :param sids: the sequences of the entries of the id-list
+        :type sids: numpy.ndarray
+        :param eids: the itemsets of the entries of the id-list
+        :type eids: numpy.ndarray
+        :return: the mask of the entries continuing an occurrence and the first itemsets of the new occurrences
+        :rtype: tuple
+        """
+        keys = prefixSids.astype(_np.int64) * _sidShift + prefixEids
+        sids = sids.astype(_np.int64) * _sidShift
+        eids = eids.astype(_np.int64)
+        lowest = _np.zeros_like(eids) if self.maxGap == float("inf") else _np.maximum(eids - int(self.maxGap) + 1, 0)
+        low = _np.searchsorted(keys, sids + lowest)
+        high = _np.searchsorted(keys, sids + _np.maximum(eids - self.minGap, -1), side='right')
+        mask = high > low
+        if prefixStarts is None:
+            return mask, None
+        joined = _np.flatnonzero(mask)
+        bounds = _np.empty(2 * len(joined), dtype=_np.int64)
+        bounds[0::2] = low[joined]
+        bounds[1::2] = high[joined]
+        starts = _np.maximum.reduceat(_np.append(prefixStarts, 0), bounds)[0::2] if len(joined) else prefixStarts[:0]
+        inWindow = eids[joined] - starts < self.maxWindow
+        mask[joined[~inWindow]] = False
+        return mask, starts[inWindow]
+
+    def root(self, words):
+        """
+        Under a window, the bitmap of a pattern is a stack of bitmaps, row d holding the occurrences whose first itemset
+        is d itemsets before their last one, and the bitmap of a one item pattern is its first row.
+
+        :param words: the bitmap of an item
+        :type words: numpy.ndarray
+        :return: the bitmap of the pattern made of the item
+        :rtype: numpy.ndarray
+        """
+        if self.maxWindow == float("inf"):
+            return words
+        stack = _np.zeros((int(self.maxWindow), len(words)), dtype=words.dtype)
+        stack[0] = words
+        return stack
+
+    def sequenceStep(self, bitmap, words):
+        """
+        Transforms the bitmap of a pattern so that an AND with the bitmap of an item leaves the occurrences of the
+        pattern extended with the item as a new itemset. Without constraint on the occurrences this is the S-step of
+        the bitmap. Otherwise every itemset is shifted by every allowed gap, and under a window the row of the
+        occurrences spanning d itemsets moves to row d + gap while it stays in the window.
+
+        :param bitmap: the sequence bitmap the words belong to
+        :type bitmap: PAMI.extras.sequenceBitmap.sequenceBitmap
+        :param words: the bitmap of a pattern, as returned by root or by this method
+        :type words: numpy.ndarray
+        :return: the transformed bitmap
+        :rtype: numpy.ndarray
+        """
+        if not self.constrainsOccurrences:
+            return bitmap.sStep(words)
+        if words.ndim == 1:
+            if self.maxGap == float("inf"):
+                return bitmap.shift(bitmap.sStep(words), self.minGap - 1)
+            transformed = _np.zeros_like(words)
+            for gap in range(self.minGap, int(self.maxGap)):
+                transformed |= bitmap.shift(words, gap)
+            return transformed
+        window = len(words)
+        transformed = _np.zeros_like(words)
+        for span in range(window):
+            if not words[span].any():
+                continue
+            for gap in range(self.minGap, int(min(self.maxGap, window - span))):
+                transformed[span + gap] |= bitmap.shift(words[span], gap)
+        return transformed
+
+    def support(self, bitmap, words):
+        """
+        :param bitmap: the sequence bitmap the words belong to
+        :type bitmap: PAMI.extras.sequenceBitmap.sequenceBitmap
+        :param words: the bitmap of a pattern, as returned by root or by sequenceStep and an AND
+        :type words: numpy.ndarray
+        :return: the number of sequences having an occurrence of the pattern
+        :rtype: int
+        """
+        if words.ndim == 1:
+            return bitmap.support(words)
+        return bitmap.support(_np.bitwise_or.reduce(words, axis=0))
@@ -0,0 +1,195 @@
+# sharedDatabase places the read-only arrays of a database in shared memory for the worker processes of the parallel
+# miners, attaches the workers to them and releases the blocks, and holds the node of the conditional trees the
+# workers build from their partition of the database.
+#
+# **Importing this module into a python program**
+# --------------------------------------------------------
+#
+#     from PAMI.extras import sharedDatabase as sd
+#
+#     blocks, descriptors = sd.share({'items': items, 'offsets': offsets})
+#
+#     try:
+#
+#         run the workers, every worker calling sd.attach(descriptors)
+#
+#     finally:
+#
+#         sd.release(blocks, unlink=True)
+#
+
+
+
+
+__copyright__ = """
+Copyright (C)  2021 Rage Uday Kiran
+
+     This program is free software: you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+
+     This program is distributed in the hope that it will be useful,
+     but WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+     GNU General Public License for more details.
+
+     You should have received a copy of the GNU General Public License
+     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from multiprocessing import shared_memory as _shm
+import numpy as _np
+
+
+def share(arrays):
+    """
+    Copies numpy arrays into newly created shared memory blocks. When a copy fails, the blocks created so far are
+    released before the error is raised.
+
+    :param arrays: dictionary of array name to the array shared with the worker processes
+    :type arrays: dict
+    :return: the shared memory blocks and the dictionary of array name to the (name, dtype, shape) descriptor needed
+             to attach to its block
+    :rtype: tuple
+    """
+    blocks, descriptors = [], {}
+    try:
+        for key, arr in arrays.items():
+            block = _shm.SharedMemory(create=True, size=max(arr.nbytes, 1))
+            blocks.append(block)
+            view = _np.ndarray(arr.shape, dtype=arr.dtype, buffer=block.buf)
+            view[:] = arr[:]
+            descriptors[key] = (block.name, arr.dtype.str, arr.shape)
+    except BaseException:
+        release(blocks, unlink=True)
+        raise
+    return blocks, descriptors
+
+
+def attach(descriptors):
+    """
+    Attaches a worker process to shared arrays.
+
+    :param descriptors: dictionary of array name to (shared memory name, dtype, shape), as returned by share
+    :type descriptors: dict
+    :return: the attached blocks, to be released by the worker, and the dictionary of array name to a read-only view
+             of the array
+    :rtype: tuple
+    """
+    blocks, arrays = [], {}
+    try:
+        for key, (name, dtype, shape) in descriptors.items():
+            block = _shm.SharedMemory(name=name)
+            blocks.append(block)
+            arrays[key] = _np.ndarray(shape, dtype=_np.dtype(dtype), buffer=block.buf)
+            arrays[key].flags.writeable = False
+    except BaseException:
+        release(blocks)
+        raise
+    return blocks, arrays
+
+
+def release(blocks, unlink=False):
+    """
+    Closes shared memory blocks, and removes them when unlink is True. Only the process that created the blocks
+    unlinks them, once every worker is done.
+
+    :param blocks: the shared memory blocks
+    :type blocks: list
+    :param unlink: whether the blocks are removed
+    :type unlink: bool
+    """
+    for block in blocks:
+        try:
+            block.close()
+        except BufferError:
+            # a view of the block is still alive in this process, the mapping goes away with it
+            pass
+        if unlink:
+            try:
+                block.unlink()
+            except FileNotFoundError:
+                pass
+
+
+class timestampNode(object):
+    """
+    :Description:   A node of the conditional pattern tree built by a worker from its partition of a temporal database.
+                    Every node on the path of an added transaction keeps its timestamps.
+
+    :Attributes:
+
+        item : int or list
+            The item of the node, or the suffix of the tree at its root
+        locations : list
+            The timestamps of the transactions passing through the node
+        parent : timestampNode
+            The parent of the node
+        children : dict
+            The children of the node by item
+
+    :Methods:
+
+        addChild(item, locations)
+            Returns the child of the item, created or with the locations added to its timestamps
+        traverse()
+            Returns the prefix path of the node and its timestamps
+
+    **Importing this module into a python program**
+    --------------------------------------------------------
+    .. code-block:: python
+
+            from PAMI.extras import sharedDatabase as sd
+
+            root = sd.timestampNode([suffix], None)
+
+            node = root.addChild(item, timestamps)
+
+            path, timestamps = node.traverse()
+    """
+
+    def __init__(self, item, locations, parent=None):
+        """
+        :param item: the item of the node, or the suffix of the tree at its root
+        :type item: int or list
+        :param locations: the timestamps of the transactions ending at the node
+        :type locations: list
+        :param parent: the parent of the node
+        :type parent: timestampNode
+        """
+        self.item = item
+        self.locations = locations
+        self.parent = parent
+        self.children = {}
+
+    def addChild(self, item, locations):
+        """
+        Adds a child node for the item or extends the locations of the existing child.
+
+        :param item: Represents the distinct item to be added as a child node.
+        :type item: int
+        :param locations: Represents the timestamps associated with the item.
+        :type locations: list
+        :return: The child node associated with the item.
+        :rtype: timestampNode
+        """
+        if item not in self.children:
+            self.children[item] = timestampNode(item, locations, self)
+        else:
+            self.children[item].locations = locations + self.children[item].locations
+        return self.children[item]
+
+    def traverse(self):
+        """
+        Constructs the prefix path of the current node by walking up to the root.
+
+        :return: A tuple containing the prefix path and the locations associated with the current node.
+        :rtype: tuple(list, list)
+        """
+        transaction = []
+        node = self.parent
+        while node.parent is not None:
+            transaction.append(node.item)
+            node = node.parent
+        return transaction[::-1], self.locations
@@ -0,0 +1,150 @@
+# utilityProjection builds the projected databases of the EFIM family of high utility miners, merging the projected
+# transactions having the same items through a hash table instead of only when they happen to be consecutive.
+#
+# **Importing this module into a python program**
+# --------------------------------------------------------
+#
+#     from PAMI.extras import utilityProjection as up
+#
+#     utility, support, transactionsPe = up.project(transactionsOfP, e, _Transaction)
+#
+#     items, utilities, offsets, prefixUtilities = up.mergeIdentical(items, utilities, offsets, prefixUtilities)
+#
+
+
+
+
+__copyright__ = """
+Copyright (C)  2021 Rage Uday Kiran
+
+     This program is free software: you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+
+     This program is distributed in the hope that it will be useful,
+     but WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+     GNU General Public License for more details.
+
+     You should have received a copy of the GNU General Public License
+     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from operator import add as _add
+import numpy as _np
+
+_weights = _np.random.default_rng(0x5eed).integers(1, 2 ** 63, size=64, dtype=_np.uint64) | _np.uint64(1)
+
+
+def project(transactions: list, item: int, transactionClass: type) -> tuple:
+    """
+    Projects a list of transactions on an item. Every transaction must provide the items, utilities, offset,
+    prefixUtility and transactionUtility attributes of the EFIM transactions, the items after offset being sorted, and
+    may provide a support, taken as 1 when absent. A projected transaction shares the lists of its transaction and
+    starts after the item. Projected transactions are kept in a hash table keyed by their items, so a transaction
+    whose suffix was already met, anywhere in the list, is merged into it: the merged transaction takes its own copy of
+    the suffix and the utilities of every match are added to it. The transaction utility of a projected transaction is
+    the utility of its remaining items.
+
+    :param transactions: the transactions of a (projected) database
+    :type transactions: list
+    :param item: the item appended to the prefix
+    :type item: int
+    :param transactionClass: the class of the transactions, called with the items, utilities and transaction utility
+    :type transactionClass: type
+    :return: the utility and the support of the prefix extended with item, and the projected transactions
+    :rtype: tuple
+    """
+    utility = 0
+    support = 0
+    projected = {}
+    for transaction in transactions:
+        items = transaction.items
+        try:
+            position = items.index(item, transaction.offset)
+        except ValueError:
+            continue
+        utilities = transaction.utilities
+        prefixUtility = transaction.prefixUtility + utilities[position]
+        count = getattr(transaction, 'support', 1)
+        utility += prefixUtility
+        support += count
+        start = position + 1
+        if start == len(items):
+            continue
+        key = tuple(items[start:])
+        remaining = utilities[start:]
+        merged = projected.get(key)
+        if merged is None:
+            merged = transactionClass(items, utilities, sum(remaining))
+            merged.offset = start
+            merged.prefixUtility = prefixUtility
+            merged.support = count
+            projected[key] = merged
+            continue
+        if merged.offset:
+            merged.items = list(key)
+            merged.utilities = merged.utilities[merged.offset:]
+            merged.offset = 0
+        merged.utilities = list(map(_add, merged.utilities, remaining))
+        merged.transactionUtility += sum(remaining)
+        merged.prefixUtility += prefixUtility
+        merged.support += count
+    return utility, support, list(projected.values())
+
+
+def mergeIdentical(items: _np.ndarray, utilities: _np.ndarray, offsets: _np.ndarray,
+                   prefixUtilities: _np.ndarray) -> tuple:
+    """
+    Merges the non-empty transactions of a flat array database having the same items, wherever they are. Every
+    transaction is hashed as a weighted sum of its items, the transactions of a hash bucket are checked against the
+    first of them, and the utilities and prefix utilities of a group are summed into its first transaction, which keeps
+    its position.
+
+    :param items: the items of all transactions laid out one transaction after the other
+    :type items: numpy.ndarray
+    :param utilities: the utility of every entry of items
+    :type utilities: numpy.ndarray
+    :param offsets: transaction t occupies items[offsets[t]:offsets[t + 1]]
+    :type offsets: numpy.ndarray
+    :param prefixUtilities: the utility of the prefix in every transaction
+    :type prefixUtilities: numpy.ndarray
+    :return: the items, utilities, offsets and prefix utilities of the merged database
+    :rtype: tuple
+    """
+    count = len(offsets) - 1
+    if count < 2:
+        return items, utilities, offsets, prefixUtilities
+    lengths = _np.diff(offsets)
+    rows = _np.repeat(_np.arange(count), lengths)
+    positions = _np.arange(len(items)) - offsets[rows]
+    weights = _weights
+    if lengths.max() > len(weights):
+        extra = _np.random.default_rng(len(weights)).integers(1, 2 ** 63, size=lengths.max(), dtype=_np.uint64)
+        weights = _np.concatenate((weights, extra | _np.uint64(1)))
+    hashes = _np.zeros(count, dtype=_np.uint64)
+    _np.add.at(hashes, rows, (items.astype(_np.uint64) + _np.uint64(1)) * weights[positions])
+    hashes ^= lengths.astype(_np.uint64) * weights[0]
+    _, first, buckets = _np.unique(hashes, return_index=True, return_inverse=True)
+    if len(first) == count:
+        return items, utilities, offsets, prefixUtilities
+    leaderOf = first[buckets]
+    same = lengths == lengths[leaderOf]
+    inLeader = offsets[leaderOf[rows]] + _np.minimum(positions, lengths[leaderOf[rows]] - 1)
+    same &= _np.logical_and.reduceat(items == items[inLeader], offsets[:-1])
+    if not same.all():
+        keys = {}
+        leaderOf = _np.array([keys.setdefault(items[offsets[t]:offsets[t + 1]].tobytes(), t) for t in range(count)])
+        if len(keys) == count:
+            return items, utilities, offsets, prefixUtilities
+    leaders = _np.flatnonzero(leaderOf == _np.arange(count))
+    groups = _np.searchsorted(leaders, leaderOf)
+    newOffsets = _np.zeros(len(leaders) + 1, dtype=_np.int64)
+    _np.cumsum(lengths[leaders], out=newOffsets[1:])
+    mergedUtilities = _np.zeros(newOffsets[-1], dtype=utilities.dtype)
+    _np.add.at(mergedUtilities, newOffsets[groups[rows]] + positions, utilities)
+    mergedPrefixUtilities = _np.zeros(len(leaders), dtype=prefixUtilities.dtype)
+    _np.add.at(mergedPrefixUtilities, groups, prefixUtilities)
+    entries = _np.arange(newOffsets[-1]) + _np.repeat(offsets[leaders] - newOffsets[:-1], lengths[leaders])
+    return items[entries], mergedUtilities, newOffsets, mergedPrefixUtilities
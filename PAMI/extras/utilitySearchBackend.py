@@ -0,0 +1,362 @@
+# utilitySearchBackend evaluates the level-wise candidates of the GPU EFIM miners on a CSR utility database, either with
+# the CUDA kernel of the miners or with an equivalent NumPy implementation that needs no GPU.
+#
+# **Importing this module into a python program**
+# --------------------------------------------------------
+#
+#     from PAMI.extras import utilitySearchBackend as usb
+#
+#     backend = usb.searchBackend('numpy', items, utils, indexesStart, indexesEnd)
+#
+#     costs, localUtil, subtreeUtil = backend.search(candidates, secondaryReference, secondaries, numSecondaries)
+#
+
+
+
+
+__copyright__ = """
+Copyright (C)  2021 Rage Uday Kiran
+
+     This program is free software: you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+
+     This program is distributed in the hope that it will be useful,
+     but WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+     GNU General Public License for more details.
+
+     You should have received a copy of the GNU General Public License
+     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import numpy as np
+
+_maxBatch = 1 << 22
+
+_kernelSource = r'''
+
+#define uint32_t unsigned int
+
+extern "C" __global__
+void searchGPU(uint32_t *items, uint32_t *utils, uint32_t *indexesStart, uint32_t *indexesEnd, uint32_t numTransactions,
+                uint32_t *candidates, uint32_t candidateSize, uint32_t numCandidates,
+                uint32_t *candidateCost, uint32_t *candidateLocalUtil, uint32_t *candidateSubtreeUtil,
+                uint32_t *secondaryReference, uint32_t *secondaries, uint32_t numSecondaries)
+{
+
+    uint32_t tid = blockDim.x * blockIdx.x + threadIdx.x;
+    if (tid >= numTransactions) return;
+    uint32_t *cands = new uint32_t[candidateSize];
+
+    uint32_t start = indexesStart[tid];
+    uint32_t end = indexesEnd[tid];
+
+    for (uint32_t i = 0; i < numCandidates; i++) {
+        for (uint32_t j = 0; j < candidateSize; j++) {
+            cands[j] = candidates[i * candidateSize + j];
+        }
+
+        uint32_t found = 0;
+        uint32_t foundCost = 0;
+        uint32_t foundLoc = 0;
+
+        for (uint32_t j = start; j < end && found < candidateSize; j++)
+        {
+            if (items[j] == cands[found])
+            {
+                found++;
+                foundCost += utils[j];
+                foundLoc = j;
+            }
+        }
+
+        if (found != candidateSize) continue;
+
+        atomicAdd(&candidateCost[i], foundCost);
+
+        for (uint32_t j = foundLoc + 1; j < end; j++)
+        {
+            if (secondaries[secondaryReference[i] * numSecondaries + items[j]])
+            {
+                foundCost += utils[j];
+            }
+        }
+
+        uint32_t temp = 0;
+        for (uint32_t j = foundLoc + 1; j < end; j++)
+        {
+            if (secondaries[secondaryReference[i] * numSecondaries + items[j]])
+            {
+                atomicAdd(&candidateLocalUtil[i * numSecondaries + items[j]], foundCost);
+                atomicAdd(&candidateSubtreeUtil[i * numSecondaries + items[j]], foundCost - temp);
+                temp += utils[j];
+            }
+        }
+    }
+
+    delete[] cands;
+
+}
+
+'''
+
+_kernel = None
+
+
+def cupyAvailable():
+    """
+    :return: True if cupy can be imported and sees at least one CUDA device
+    :rtype: bool
+    """
+    try:
+        import cupy as cp
+        return cp.cuda.runtime.getDeviceCount() > 0
+    except Exception:
+        return False
+
+
+def searchBackend(name, items, utils, indexesStart, indexesEnd):
+    """
+    :param name: 'auto', 'numpy' or 'cupy'. 'auto' picks cupy when a CUDA device is available and numpy otherwise
+    :type name: str
+    :param items: items of all the transactions laid out one transaction after the other, sorted inside a transaction
+    :type items: list or numpy.ndarray
+    :param utils: utility of every entry of items
+    :type utils: list or numpy.ndarray
+    :param indexesStart: position of the first entry of every transaction
+    :type indexesStart: list or numpy.ndarray
+    :param indexesEnd: position after the last entry of every transaction
+    :type indexesEnd: list or numpy.ndarray
+    :return: the backend holding the database
+    :rtype: numpyBackend or cupyBackend
+    """
+    if name == 'auto':
+        name = 'cupy' if cupyAvailable() else 'numpy'
+    if name == 'numpy':
+        return numpyBackend(items, utils, indexesStart, indexesEnd)
+    if name == 'cupy':
+        return cupyBackend(items, utils, indexesStart, indexesEnd)
+    raise ValueError("backend must be 'auto', 'numpy' or 'cupy'")
+
+
+class cupyBackend:
+    """
+    :Description:   Evaluates the candidates with the searchGPU CUDA kernel, one thread per transaction. cupy is imported
+                    and the kernel compiled only when this backend is created.
+
+    :Methods:
+
+        search(candidates, secondaryReference, secondaries, numSecondaries)
+            Returns the utility, local utilities and subtree utilities of every candidate
+    """
+
+    name = 'cupy'
+
+    def __init__(self, items, utils, indexesStart, indexesEnd):
+        global _kernel
+        import cupy as cp
+        self._cp = cp
+        if _kernel is None:
+            _kernel = cp.RawKernel(_kernelSource, 'searchGPU')
+        self.items = cp.array(items, dtype=np.uint32)
+        self.utils = cp.array(utils, dtype=np.uint32)
+        self.indexesStart = cp.array(indexesStart, dtype=np.uint32)
+        self.indexesEnd = cp.array(indexesEnd, dtype=np.uint32)
+        self.numTransactions = len(indexesStart)
+
+    def search(self, candidates, secondaryReference, secondaries, numSecondaries):
+        """
+        :param candidates: the candidates, one row per candidate, items in increasing order
+        :type candidates: numpy.ndarray
+        :param secondaryReference: the row of secondaries used by every candidate
+        :type secondaryReference: list or numpy.ndarray
+        :param secondaries: flattened 0/1 rows of numSecondaries flags telling which items may extend a candidate
+        :type secondaries: list or numpy.ndarray
+        :param numSecondaries: the length of a row of secondaries
+        :type numSecondaries: int
+        :return: the utility of every candidate and its local and subtree utility for every item
+        :rtype: tuple
+        """
+        cp = self._cp
+        numCandidates, candidateSize = candidates.shape
+        costs = cp.zeros(numCandidates, dtype=np.uint32)
+        localUtil = cp.zeros(numCandidates * numSecondaries, dtype=np.uint32)
+        subtreeUtil = cp.zeros(numCandidates * numSecondaries, dtype=np.uint32)
+        numOfThreads = 32
+        numOfBlocks = self.numTransactions // numOfThreads + 1
+        _kernel((numOfBlocks,), (numOfThreads,),
+                (self.items, self.utils, self.indexesStart, self.indexesEnd, self.numTransactions,
+                 cp.array(candidates.ravel(), dtype=np.uint32), candidateSize, numCandidates,
+                 costs, localUtil, subtreeUtil,
+                 cp.array(secondaryReference, dtype=np.uint32), cp.array(secondaries, dtype=np.uint32),
+                 numSecondaries))
+        cp.cuda.runtime.deviceSynchronize()
+        return costs.get(), localUtil.get().reshape(numCandidates, numSecondaries), \
+            subtreeUtil.get().reshape(numCandidates, numSecondaries)
+
+
+class numpyBackend:
+    """
+    :Description:   Evaluates the candidates on the CPU with the same results as the searchGPU kernel. The candidates
+                    sharing a row of secondaries share their prefix, so the prefix is projected once through an item
+                    occurrence index and a sorted array of row * width + item keys, and every extension of the prefix
+                    is then located with one searchsorted over the projected transactions. The remaining entries of all
+                    the matched transactions are gathered at once and the local and subtree utilities are accumulated
+                    into the utility bins with np.add.at, the per-transaction sums being segment sums of a cumsum.
+
+    :Attributes:
+
+        items : numpy.ndarray
+            Items of the database in CSR layout
+        utils : numpy.ndarray
+            Utility of every entry of items
+        indexesStart : numpy.ndarray
+            Position of the first entry of every transaction
+        indexesEnd : numpy.ndarray
+            Position after the last entry of every transaction
+
+    :Methods:
+
+        search(candidates, secondaryReference, secondaries, numSecondaries)
+            Returns the utility, local utilities and subtree utilities of every candidate
+    """
+
+    name = 'numpy'
+
+    def __init__(self, items, utils, indexesStart, indexesEnd):
+        self.items = np.asarray(items, dtype=np.int64)
+        self.utils = np.asarray(utils, dtype=np.int64)
+        self.indexesStart = np.asarray(indexesStart, dtype=np.int64)
+        self.indexesEnd = np.asarray(indexesEnd, dtype=np.int64)
+        self.numTransactions = len(self.indexesStart)
+        self._width = int(self.items.max()) + 1 if len(self.items) else 1
+        self._rows = np.repeat(np.arange(self.numTransactions, dtype=np.int64), self.indexesEnd - self.indexesStart)
+        self._keys = self._rows * self._width + self.items
+        self._occurrences = np.argsort(self.items, kind='stable')
+        counts = np.bincount(self.items, minlength=self._width)
+        self._occurrenceStart = np.concatenate(([0], np.cumsum(counts)))
+
+    def _occurrencesOf(self, item):
+        """
+        :return: the positions of every entry holding the item, in transaction order
+        :rtype: numpy.ndarray
+        """
+        if item < 0 or item >= self._width:
+            return np.empty(0, dtype=np.int64)
+        return self._occurrences[self._occurrenceStart[item]:self._occurrenceStart[item + 1]]
+
+    def _locate(self, rows, last, items):
+        """
+        :param rows: the projected transactions
+        :param last: the position of the last prefix item in every projected transaction
+        :param items: the items to locate after the prefix
+        :return: the index of the item, the index of the projected transaction and the position of every match
+        :rtype: tuple
+        """
+        targets = (rows[None, :] * self._width + items[:, None]).ravel()
+        positions = np.searchsorted(self._keys, targets)
+        positions[positions == len(self._keys)] = 0
+        found = (self._keys[positions] == targets) & (positions > np.tile(last, len(items)))
+        matches = np.flatnonzero(found)
+        return matches // len(rows), matches % len(rows), positions[matches]
+
+    def _project(self, prefix):
+        """
+        :param prefix: items of the prefix in increasing order, at least one
+        :return: the transactions containing the prefix, the position of the last prefix item and the prefix utility
+        :rtype: tuple
+        """
+        last = self._occurrencesOf(int(prefix[0]))
+        rows = self._rows[last]
+        cost = self.utils[last]
+        for item in prefix[1:]:
+            if len(rows) == 0:
+                break
+            _, matched, positions = self._locate(rows, last, np.array([item], dtype=np.int64))
+            rows, last, cost = rows[matched], positions, cost[matched] + self.utils[positions]
+        return rows, last, cost
+
+    def _extendItems(self, items):
+        """
+        Matches every single item candidate against the whole database through the occurrence index.
+
+        :return: the index of the item, the transaction, the position and the utility of every match
+        :rtype: tuple
+        """
+        positions = [self._occurrencesOf(int(item)) for item in items]
+        owners = np.repeat(np.arange(len(items), dtype=np.int64), [len(occurrences) for occurrences in positions])
+        positions = np.concatenate(positions).astype(np.int64, copy=False)
+        return owners, self._rows[positions], positions, self.utils[positions]
+
+    def _extend(self, rows, last, cost, items):
+        """
+        Matches every extension item against the projected transactions, by batches of at most _maxBatch keys.
+
+        :return: the index of the item, the transaction, the position and the utility of every match
+        :rtype: tuple
+        """
+        owners, transactions, positions, costs = [], [], [], []
+        step = max(1, _maxBatch // len(rows))
+        for first in range(0, len(items), step):
+            owner, matched, position = self._locate(rows, last, items[first:first + step])
+            owners.append(owner + first)
+            transactions.append(rows[matched])
+            positions.append(position)
+            costs.append(cost[matched] + self.utils[position])
+        return np.concatenate(owners), np.concatenate(transactions), np.concatenate(positions), np.concatenate(costs)
+
+    def search(self, candidates, secondaryReference, secondaries, numSecondaries):
+        """
+        :param candidates: the candidates, one row per candidate, items in increasing order
+        :type candidates: numpy.ndarray
+        :param secondaryReference: the row of secondaries used by every candidate, candidates of a row being
+                                   consecutive and sharing every item but the last
+        :type secondaryReference: list or numpy.ndarray
+        :param secondaries: flattened 0/1 rows of numSecondaries flags telling which items may extend a candidate
+        :type secondaries: list or numpy.ndarray
+        :param numSecondaries: the length of a row of secondaries
+        :type numSecondaries: int
+        :return: the utility of every candidate and its local and subtree utility for every item
+        :rtype: tuple
+        """
+        candidates = np.asarray(candidates, dtype=np.int64)
+        numCandidates = candidates.shape[0]
+        secondaryReference = np.asarray(secondaryReference, dtype=np.int64)
+        secondaries = np.asarray(secondaries).reshape(-1, numSecondaries) != 0
+        costs = np.zeros(numCandidates, dtype=np.int64)
+        localUtil = np.zeros((numCandidates, numSecondaries), dtype=np.int64)
+        subtreeUtil = np.zeros((numCandidates, numSecondaries), dtype=np.int64)
+        if numCandidates == 0 or self.numTransactions == 0:
+            return costs, localUtil, subtreeUtil
+        bounds = np.flatnonzero(np.diff(secondaryReference)) + 1
+        for first, stop in zip(np.concatenate(([0], bounds)), np.concatenate((bounds, [numCandidates]))):
+            if candidates.shape[1] == 1:
+                owners, transactions, positions, matchCosts = self._extendItems(candidates[first:stop, -1])
+            else:
+                rows, last, cost = self._project(candidates[first, :-1])
+                if len(rows) == 0:
+                    continue
+                owners, transactions, positions, matchCosts = self._extend(rows, last, cost,
+                                                                           candidates[first:stop, -1])
+            if len(owners) == 0:
+                continue
+            owners += first
+            np.add.at(costs, owners, matchCosts)
+            lengths = self.indexesEnd[transactions] - positions - 1
+            offsets = np.cumsum(lengths) - lengths
+            entries = np.arange(lengths.sum(), dtype=np.int64) - np.repeat(offsets - positions - 1, lengths)
+            matchOf = np.repeat(np.arange(len(owners), dtype=np.int64), lengths)
+            keep = secondaries[secondaryReference[first]][self.items[entries]]
+            entries, matchOf = entries[keep], matchOf[keep]
+            utilities = self.utils[entries]
+            cumulative = np.concatenate(([0], np.cumsum(utilities)))
+            ends = np.cumsum(np.bincount(matchOf, minlength=len(owners)))
+            starts = np.concatenate(([0], ends[:-1]))
+            foundCost = matchCosts + cumulative[ends] - cumulative[starts]
+            before = cumulative[:-1] - cumulative[starts[matchOf]]
+            bins = (owners[matchOf], self.items[entries])
+            np.add.at(localUtil, bins, foundCost[matchOf])
+            np.add.at(subtreeUtil, bins, foundCost[matchOf] - before)
+        return costs, localUtil, subtreeUtil
@@ -53,6 +53,7 @@ Copyright (C)  2021 Rage Uday Kiran
 
 
 from PAMI.frequentPattern.closed import abstract as _ab
+from PAMI.extras import closedPatternIndex as _cpi
 from deprecated import deprecated
 
 
@@ -80,7 +81,7 @@ class CHARM(_ab._frequentPatterns):
                         - **tree** (*class*) -- *It represents the Tree class.*
                         - **itemSetCount** (*int*) -- *It represents the total no of patterns.*
                         - **tidList** (*dict*) -- *Stores the timestamps of an item.*
-                        - **hashing** (*dict*) -- *Stores the patterns with their support to check for the closed property.*
+                        - **closedIndex** (*closedPatternIndex*) -- *Stores the patterns by support and tidset to check for the closed property.*
 
 
     **Execution methods**
@@ -154,10 +155,9 @@ class CHARM(_ab._frequentPatterns):
     _tidList = {}
     _lno = 0
     _mapSupport = {}
-    _hashing = {}
+    _closedIndex = None
     _itemSetCount = 0
     _maxItemId = 0
-    _tableSize = 10000
     _writer = None
 
     def _convert(self, value):
@@ -239,39 +239,6 @@ class CHARM(_ab._frequentPatterns):
         _flist = [key for key, value in sorted(self._tidList.items(), key=lambda x: sum(x[1]), reverse=False)]
         return _flist
 
-    def _calculate(self, tidSet):
-        """
-
-        To calculate the hashcode of pattern
-
-        :param tidSet: the timestamps of a pattern
-        :type tidSet: list
-        :rtype: int
-        """
-
-        return abs(sum(tidSet)) % self._tableSize
-
-    def _contains(self, itemSet, value, hashcode):
-        """
-
-        Check for the closed property(patterns with same support) by checking the hashcode(sum of timestamps),
-        if hashcode key in hashing dict is none then returns a false, else returns with true.
-
-        :param itemSet: frequent pattern
-        :type itemSet: list
-        :param value: support of the pattern
-        :type value: int
-        :param hashcode: calculated from the timestamps of pattern
-        :type hashcode: int
-        """
-        if self._hashing.get(hashcode) is None:
-            return False
-        for i in self._hashing[hashcode]:
-            itemSetx = i
-            if value == self._hashing[hashcode][itemSetx] and set(itemSetx).issuperset(itemSet):
-                return True
-        return False
-
     def _save(self, prefix, suffix, tidSetx):
         """
 
@@ -293,17 +260,14 @@ class CHARM(_ab._frequentPatterns):
         prefix.sort()
         val = len(tidSetx)
         if val >= self._minSup:
-            hashcode = self._calculate(tidSetx)
-            if self._contains(prefix, val, hashcode) is False:
+            key = self._closedIndex.fingerprint(tidSetx)
+            if not self._closedIndex.contains(prefix, tidSetx, key):
                 sample = str()
                 for i in prefix:
                     sample = sample + i + "\t"
                 self._itemSetCount += 1
                 self._finalPatterns[sample] = val
-            if hashcode not in self._hashing:
-                self._hashing[hashcode] = {tuple(prefix): val}
-            else:
-                self._hashing[hashcode][tuple(prefix)] = val
+            self._closedIndex.add(prefix, tidSetx, key)
 
     def _processEquivalenceClass(self, prefix, itemSets, tidSets):
         """
@@ -390,7 +354,7 @@ class CHARM(_ab._frequentPatterns):
         self._startTime = _ab._time.time()
         _plist = self._creatingItemsets()
         self._finalPatterns = {}
-        self._hashing = {}
+        self._closedIndex = _cpi.closedPatternIndex()
         for i in range(len(_plist)):
             itemX = _plist[i]
             if itemX is None:
@@ -53,11 +53,11 @@ Copyright (C)  2021 Rage Uday Kiran
 
 
 from PAMI.frequentPattern.maximal import abstract as _ab
+from PAMI.extras import maximalPatternIndex as _mpi
 from deprecated import deprecated
 
 
 _minSup = str()
-global maximalTree
 
 
 class _Node(object):
@@ -136,7 +136,6 @@ class _Tree(object):
         self.root = _Node(None, {})
         self.summaries = {}
         self.info = {}
-        #self.maximalTree = _MPTree()
 
     def addTransaction(self, transaction):
         """
@@ -260,7 +259,7 @@ class _Tree(object):
             del i.parent.children[nodeValue]
             i = None
 
-    def generatePatterns(self, prefix, patterns, maximalTree):
+    def generatePatterns(self, prefix, patterns, maximalIndex):
         """
         Generates the patterns
         :param prefix: forms the combination of items
@@ -281,124 +280,17 @@ class _Tree(object):
             for la in info:
                 tail.append(la)
             sub = head + tail
-            if maximalTree.checkerSub(sub) == 1:
+            if not maximalIndex.hasSuperset(sub):
                 for pat in range(len(condPatterns)):
                     conditional_tree.addConditionalTransaction(condPatterns[pat], tids[pat])
                 if len(condPatterns) >= 1:
-                    conditional_tree.generatePatterns(pattern, patterns, maximalTree)
+                    conditional_tree.generatePatterns(pattern, patterns, maximalIndex.focus(pattern))
                 else:
-                    maximalTree.addTransaction(pattern)
-                    patterns[tuple(pattern)] = self.info[i]
+                    maximalIndex.add(pattern)
+                    patterns[tuple(sorted(pattern))] = self.info[i]
             self.removeNode(i)
 
 
-class _MNode(object):
-    """
-    A class used to represent the node in maximal tree
-
-    :Attributes:
-        item : int
-            storing item of a node
-        children : list
-            To maintain the children of node
-
-    :Methods:
-        addChild(itemName)
-            storing the children to their respective parent nodes
-    """
-
-    def __init__(self, item, children):
-        self.item = item
-        self.children = children
-
-    def addChild(self, node):
-        """
-        To add the children details to a parent node
-        :param node: children node
-        :type node: _MNode
-        :return: adding children details to parent node
-        """
-        self.children[node.item] = node
-        node.parent = self
-
-
-class _MPTree(object):
-    """
-    A class used to represent the frequentPatternGrowth tree structure
-
-    :Attributes:
-
-        root : Node
-            Represents the root node of the tree
-        summaries : dictionary
-            storing the nodes with same item name
-
-
-    :Methods:
-
-        addTransaction(transaction)
-            creating transaction as a branch in frequentPatternTree
-        addConditionalTransaction(prefixPaths, supportOfItems)
-            construct the conditional tree for prefix paths
-        checkerSub(items):
-            Given a set of items to the subset of them is present or not
-    """
-
-    def __init__(self):
-        self.root = _MNode(None, {})
-        self.summaries = {}
-
-    def addTransaction(self, transaction):
-        """
-        To construct the maximal frequent pattern into maximal tree
-        :param transaction: the maximal frequent patterns extracted till now
-        :type transaction: list
-        :return: the maximal tree
-        """
-        currentNode = self.root
-        transaction.sort()
-        for i in range(len(transaction)):
-            if transaction[i] not in currentNode.children:
-                newNode = _MNode(transaction[i], {})
-                currentNode.addChild(newNode)
-                if transaction[i] in self.summaries:
-                    self.summaries[transaction[i]].insert(0, newNode)
-                else:
-                    self.summaries[transaction[i]] = [newNode]
-                currentNode = newNode
-            else:
-                currentNode = currentNode.children[transaction[i]]
-
-    def checkerSub(self, items):
-        """
-        To check the subset of pattern present in tree
-        :param items: the sub frequent pattern
-        :type items: list
-        :return: checks if subset present in the tree
-        """
-        items.sort(reverse=True)
-        item = items[0]
-        if item not in self.summaries:
-            return 1
-        else:
-            if len(items) == 1:
-                return 0
-        for t in self.summaries[item]:
-            cur = t.parent
-            i = 1
-            while cur.item is not None:
-                if items[i] == cur.item:
-                    i += 1
-                    if i == len(items):
-                        return 0
-                cur = cur.parent
-        return 1
-
-
-# Initialising the  variable for maximal tree
-#maximalTree = _MPTree()
-
-
 class MaxFPGrowth(_ab._frequentPatterns):
     """
     :Description: MaxFP-Growth is one of the fundamental algorithm to discover maximal frequent patterns in a transactional database.
@@ -520,7 +412,7 @@ class MaxFPGrowth(_ab._frequentPatterns):
     _rank = {}
     _rankdup = {}
     _lno = 0
-    _maximalTree = str()
+    _maximalIndex = None
 
     def _creatingItemSets(self):
         """
@@ -676,9 +568,9 @@ class MaxFPGrowth(_ab._frequentPatterns):
         info = {self._rank[k]: v for k, v in generatedItems.items()}
         patterns = {}
         self._finalPatterns = {}
-        self._maximalTree = _MPTree()
+        self._maximalIndex = _mpi.maximalPatternIndex()
         Tree = self._buildTree(updatedTransactions, info)
-        Tree.generatePatterns([], patterns, self._maximalTree)
+        Tree.generatePatterns([], patterns, self._maximalIndex)
         for x, y in patterns.items():
             pattern = str()
             x = self._convertItems(x)
@@ -55,6 +55,7 @@ Copyright (C)  2021 Rage Uday Kiran
 
 
 from PAMI.highUtilityFrequentPattern.basic import abstract as _ab
+from PAMI.extras import utilityProjection as _up
 from typing import List, Dict, Union
 from deprecated import deprecated
 
@@ -80,8 +81,6 @@ class _Transaction:
 
     :Methods:
 
-        projectedTransaction(offsetE)
-            A method to create new Transaction from existing starting from offsetE until the end
         getItems()
             return items in transaction
         getUtilities()
@@ -105,25 +104,6 @@ class _Transaction:
         self.transactionUtility = transactionUtility
         self.support = 1
 
-    def projectTransaction(self, offsetE: int) -> '_Transaction':
-        """
-        A method to create new Transaction from existing transaction starting from offsetE until the end
-
-        :param offsetE: an offset over the original transaction for projecting the transaction
-        :type offsetE: int
-        :return: a new transaction starting from offsetE until the end of the transaction
-        :rtype: _Transaction
-        """
-        new_transaction = _Transaction(self.items, self.utilities, self.transactionUtility)
-        utilityE = self.utilities[offsetE]
-        new_transaction.prefixUtility = self.prefixUtility + utilityE
-        new_transaction.transactionUtility = self.transactionUtility - utilityE
-        new_transaction.support = self.support
-        for i in range(self.offset, offsetE):
-            new_transaction.transactionUtility -= self.utilities[i]
-        new_transaction.offset = offsetE + 1
-        return new_transaction
-
     def getItems(self) -> List[int]:
         """
         A method to return items in transaction
@@ -421,14 +401,8 @@ class HUFIM(_ab._utilityPatterns):
                A method to calculate the sub-tree utility and local utility of all items that can extend itemSet P and e
         output(tempPosition, utility)
                A method to output a relative-high-utility itemSet to file or memory depending on what the user chose
-        isEqual(transaction1, transaction2)
-               A method to Check if two transaction are identical
         useUtilityBinArrayToCalculateSubtreeUtilityFirstTime(dataset)
               A method to calculate the sub tree utility values for single items
-        sortDatabase(self, transactions)
-              A Method to sort transaction
-        sortTransaction(self, trans1, trans2)
-              A Method to sort transaction
         useUtilityBinArrayToCalculateLocalUtilityFirstTime(self, dataset)
              A method to calculate local utility values for single itemSets
 
@@ -571,12 +545,7 @@ class HUFIM(_ab._utilityPatterns):
             currentName += 1
         for transaction in self._dataset.getTransactions():
             transaction.removeUnpromisingItems(self._oldNamesToNewNames)
-        self._sortDatabase(self._dataset.getTransactions())
-        emptyTransactionCount = 0
-        for transaction in self._dataset.getTransactions():
-            if len(transaction.getItems()) == 0:
-                emptyTransactionCount += 1
-        self._dataset.transactions = self._dataset.transactions[emptyTransactionCount:]
+        self._dataset.transactions = [transaction for transaction in self._dataset.transactions if transaction.items]
         # calculating suffix utility values
         totalUtility = 0
         for item in itemsToKeep:
@@ -625,64 +594,7 @@ class HUFIM(_ab._utilityPatterns):
         self._candidateCount += len(itemsToExplore)
         for idx, e in enumerate(itemsToExplore):
             # print("exploring item", self.dataset.intToStr.get(self.newNamesToOldNames[e]))
-            transactionsPe = []
-            utilityPe = 0
-            supportPe = 0
-            previousTransaction = []
-            consecutiveMergeCount = 0
-            for transaction in transactionsOfP:
-                items = transaction.getItems()
-                if e in items:
-                    positionE = items.index(e)
-                    if transaction.getLastPosition() == positionE:
-                        utilityPe += transaction.getUtilities()[positionE] + transaction.prefixUtility
-                        supportPe += transaction.getSupport()
-                    else:
-                        projectedTransaction = transaction.projectTransaction(positionE)
-                        utilityPe += projectedTransaction.prefixUtility
-                        if previousTransaction == []:
-                            previousTransaction = projectedTransaction
-                        elif self._isEqual(projectedTransaction, previousTransaction):
-                            if consecutiveMergeCount == 0:
-                                items = previousTransaction.items[previousTransaction.offset:]
-                                utilities = previousTransaction.utilities[previousTransaction.offset:]
-                                support = previousTransaction.getSupport()
-                                itemsCount = len(items)
-                                positionPrevious = 0
-                                positionProjection = projectedTransaction.offset
-                                while positionPrevious < itemsCount:
-                                    utilities[positionPrevious] += projectedTransaction.utilities[positionProjection]
-                                    positionPrevious += 1
-                                    positionProjection += 1
-                                previousTransaction.prefixUtility += projectedTransaction.prefixUtility
-                                sumUtilities = previousTransaction.prefixUtility
-                                previousTransaction = _Transaction(items, utilities, previousTransaction.transactionUtility + projectedTransaction.transactionUtility)
-                                previousTransaction.prefixUtility = sumUtilities
-                                previousTransaction.support = support
-                                previousTransaction.support += projectedTransaction.getSupport()
-                            else:
-                                positionPrevious = 0
-                                positionProjected = projectedTransaction.offset
-                                itemsCount = len(previousTransaction.items)
-                                while positionPrevious < itemsCount:
-                                    previousTransaction.utilities[positionPrevious] += projectedTransaction.utilities[
-                                        positionProjected]
-                                    positionPrevious += 1
-                                    positionProjected += 1
-                                previousTransaction.transactionUtility += projectedTransaction.transactionUtility
-                                previousTransaction.prefixUtility += projectedTransaction.prefixUtility
-                                previousTransaction.support += projectedTransaction.getSupport()
-                            consecutiveMergeCount += 1
-                        else:
-                            transactionsPe.append(previousTransaction)
-                            supportPe += previousTransaction.getSupport()
-                            previousTransaction = projectedTransaction
-                            consecutiveMergeCount = 0
-                    transaction.offset = positionE
-            if previousTransaction != []:
-                transactionsPe.append(previousTransaction)
-                supportPe += previousTransaction.getSupport()
-            # print("support is", supportPe)
+            utilityPe, supportPe, transactionsPe = _up.project(transactionsOfP, e, _Transaction)
             self._temp[prefixLength] = self._newNamesToOldNames[e]
             if (utilityPe >= self._minUtil) and (supportPe >= self._minSup):
                 self._output(prefixLength, utilityPe, supportPe)
@@ -750,30 +662,6 @@ class HUFIM(_ab._utilityPatterns):
                 s1 += "\t"
         self._finalPatterns[s1] = [utility, support]
 
-    def _isEqual(self, transaction1: _Transaction, transaction2: _Transaction) -> bool:
-        """
-        A method to Check if two transaction are identical
-
-        :param  transaction1: the first transaction
-        :type  transaction1: Trans
-        :param  transaction2:    the second transaction
-        :type  transaction2: Trans
-        :return : whether both are identical or not
-        :rtype: bool
-        """
-        length1 = len(transaction1.items) - transaction1.offset
-        length2 = len(transaction2.items) - transaction2.offset
-        if length1 != length2:
-            return False
-        position1 = transaction1.offset
-        position2 = transaction2.offset
-        while position1 < len(transaction1.items):
-            if transaction1.items[position1] != transaction2.items[position2]:
-                return False
-            position1 += 1
-            position2 += 1
-        return True
-
     def _useUtilityBinArrayToCalculateSubtreeUtilityFirstTime(self, dataset: _Dataset) -> None:
         """
         Scan the initial database to calculate the subtree utility of each item using a utility-bin array
@@ -795,57 +683,6 @@ class HUFIM(_ab._utilityPatterns):
                     self._utilityBinArraySU[item] = sumSU
                 i -= 1
 
-    def _sortDatabase(self, transactions: List[_Transaction]) -> None:
-        """
-        A Method to sort transaction
-
-        :param transactions: transactions of items
-        :type transactions: list
-        :return: None
-        """
-        compareItems = _ab._functools.cmp_to_key(self._sortTransaction)
-        transactions.sort(key=compareItems)
-
-    def _sortTransaction(self, trans1: _Transaction, trans2: _Transaction) -> int:
-        """
-        A Method to sort transaction
-
-        :param trans1: the first transaction
-        :type trans1: Trans
-        :param trans2:the second transaction
-        :type trans2: Trans
-        :return: sorted transaction
-        :rtype: int
-        """
-        transItemsX = trans1.getItems()
-        transItemsY = trans2.getItems()
-        pos1 = len(transItemsX) - 1
-        pos2 = len(transItemsY) - 1
-        if len(transItemsX) < len(transItemsY):
-            while pos1 >= 0:
-                sub = transItemsY[pos2] - transItemsX[pos1]
-                if sub != 0:
-                    return sub
-                pos1 -= 1
-                pos2 -= 1
-            return -1
-        elif len(transItemsX) > len(transItemsY):
-            while pos2 >= 0:
-                sub = transItemsY[pos2] - transItemsX[pos1]
-                if sub != 0:
-                    return sub
-                pos1 -= 1
-                pos2 -= 1
-            return 1
-        else:
-            while pos2 >= 0:
-                sub = transItemsY[pos2] - transItemsX[pos1]
-                if sub != 0:
-                    return sub
-                pos1 -= 1
-                pos2 -= 1
-            return 0
-
     def _useUtilityBinArrayToCalculateLocalUtilityFirstTime(self, dataset: _Dataset) -> None:
         """
         A method to calculate local utility of single itemSets
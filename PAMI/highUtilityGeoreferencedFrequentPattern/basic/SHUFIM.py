@@ -53,7 +53,7 @@ Copyright (C)  2021 Rage Uday Kiran
 
 """
 from PAMI.highUtilityGeoreferencedFrequentPattern.basic import abstract as _ab
-from functools import cmp_to_key as _comToKey
+from PAMI.extras import utilityProjection as _up
 from deprecated import deprecated
 
 class _Transaction:
@@ -78,8 +78,6 @@ class _Transaction:
             maintains the support of the transaction
     :Methods:
 
-        projectedTransaction(offsetE):
-            A method to create new Transaction from existing till offsetE
         getItems():
             return items in transaction
         getUtilities():
@@ -107,22 +105,6 @@ class _Transaction:
             self.pmus = pmus
         self.support = 1
 
-    def projectTransaction(self, offsetE):
-        """
-        A method to create new Transaction from existing till offsetE
-        :param offsetE: an offset over the original transaction for projecting the transaction
-        :type offsetE: int
-        """
-        newTransaction = _Transaction(self.items, self.utilities, self.transactionUtility)
-        utilityE = self.utilities[offsetE]
-        newTransaction.prefixUtility = self.prefixUtility + utilityE
-        newTransaction.transactionUtility = self.transactionUtility - utilityE
-        newTransaction.support = self.support
-        for i in range(self.offset, offsetE):
-            newTransaction.transactionUtility -= self.utilities[i]
-        newTransaction.offset = offsetE + 1
-        return newTransaction
-
     def getItems(self):
         """
         A method to return items in transaction
@@ -408,24 +390,16 @@ class SHUFIM(_ab._utilityPatterns):
                 Total amount of RSS memory consumed by the mining process will be retrieved from this function
         getRuntime()
                Total amount of runtime taken by the mining process will be retrieved from this function
-        calculateNeighbourIntersection(self, prefixLength)
-               A method to return common Neighbours of items
-        backtrackingEFIM(transactionsOfP, itemsToKeep, itemsToExplore, prefixLength)
+        createNeighbourBitsets()
+               A method to store the neighbours of every promising item as a bitset over the new names
+        backtrackingEFIM(transactionsOfP, itemsToKeep, itemsToExplore, prefixLength, prefixNeighbourhood)
                A method to mine the SHUIs Recursively
-        useUtilityBinArraysToCalculateUpperBounds(transactionsPe, j, itemsToKeep, neighbourhoodList)
+        useUtilityBinArraysToCalculateUpperBounds(transactionsPe, j, itemsToKeep, neighbourhood)
                A method to  calculate the sub-tree utility and local utility of all items that can extend itemSet P and e
         output(tempPosition, utility)
                A method ave a high-utility itemSet to file or memory depending on what the user chose
-        isEqual(transaction1, transaction2)
-               A method to Check if two transaction are identical
-        intersection(lst1, lst2)
-               A method that return the intersection of 2 list
         useUtilityBinArrayToCalculateSubtreeUtilityFirstTime(dataset)
               Scan the initial database to calculate the subtree utility of each items using a utility-bin array
-        sortDatabase(self, transactions)
-              A Method to sort transaction in the order of PMU
-        sortTransaction(self, trans1, trans2)
-              A Method to sort transaction in the order of PMU
         useUtilityBinArrayToCalculateLocalUtilityFirstTime(self, dataset)
              A method to scan the database using utility bin array to calculate the pmus
 
@@ -489,6 +463,7 @@ class SHUFIM(_ab._utilityPatterns):
     _strToint = {}
     _intTostr = {}
     _Neighbours = {}
+    _neighbourBits = {}
     _temp = [0] * 5000
     _maxMemory = 0
     _startTime = float()
@@ -574,21 +549,17 @@ class SHUFIM(_ab._utilityPatterns):
             _currentName += 1
         for transaction in self._dataset.getTransactions():
             transaction.removeUnpromisingItems(self._oldNamesToNewNames)
-        self._sortDatabase(self._dataset.getTransactions())
-        _emptyTransactionCount = 0
-        for transaction in self._dataset.getTransactions():
-            if len(transaction.getItems()) == 0:
-                _emptyTransactionCount += 1
-        self._dataset.transactions = self._dataset.transactions[_emptyTransactionCount:]
+        self._dataset.transactions = [transaction for transaction in self._dataset.transactions if transaction.items]
+        self._createNeighbourBitsets()
         # calculating neighborhood suffix utility values
         _secondary = []
         for idx, item in enumerate(_itemsToKeep):
             _cumulativeUtility = self._singleItemSetsUtility[self._newNamesToOldNames[item]]
-            if self._newNamesToOldNames[item] in self._Neighbours:
-                neighbors = [self._oldNamesToNewNames[y] for y in self._Neighbours[self._newNamesToOldNames[item]] if y in self._oldNamesToNewNames]
+            neighbors = self._neighbourBits[item]
+            if neighbors:
                 for i in range(idx+1, len(_itemsToKeep)):
                     _nextItem = _itemsToKeep[i]
-                    if _nextItem in neighbors:
+                    if neighbors >> _nextItem & 1:
                         _cumulativeUtility += self._singleItemSetsUtility[self._newNamesToOldNames[_nextItem]]
             if _cumulativeUtility >= self._minUtil:
                 _secondary.append(item)
@@ -600,7 +571,7 @@ class SHUFIM(_ab._utilityPatterns):
         _commonitems = []
         for i in range(self._dataset.maxItem):
             _commonitems.append(i)
-        self._backtrackingEFIM(self._dataset.getTransactions(), _itemsToKeep, _itemsToExplore, 0)
+        self._backtrackingEFIM(self._dataset.getTransactions(), _itemsToKeep, _itemsToExplore, 0, -1)
         _finalMemory = _ab._psutil.virtual_memory()[3]
         memory = (_finalMemory - InitialMemory) / 10000
         if memory > self._maxMemory:
@@ -613,7 +584,7 @@ class SHUFIM(_ab._utilityPatterns):
         self._memoryRSS = process.memory_info().rss
         print('Spatial High Utility Frequent Itemsets generated successfully using SHUFIM algorithm')
 
-    def _backtrackingEFIM(self, transactionsOfP, itemsToKeep, itemsToExplore, prefixLength):
+    def _backtrackingEFIM(self, transactionsOfP, itemsToKeep, itemsToExplore, prefixLength, prefixNeighbourhood):
         """
         A method to mine the SHUFIs Recursively
         :param transactionsOfP: the list of transactions containing the current prefix P
@@ -624,92 +595,37 @@ class SHUFIM(_ab._utilityPatterns):
         :type itemsToExplore: list
         :param prefixLength: current prefixLength
         :type prefixLength: int
+        :param prefixNeighbourhood: the bitset of the common neighbours of the items of P, -1 when P is empty
+        :type prefixNeighbourhood: int
         """
         self._candidateCount += len(itemsToExplore)
         for idx, e in enumerate(itemsToExplore):
             initialMemory = _ab._psutil.virtual_memory()[3]
-            transactionsPe = []
-            utilityPe = 0
-            supportPe = 0
-            previousTransaction = []
-            consecutiveMergeCount = 0
-            for transaction in transactionsOfP:
-                items = transaction.getItems()
-                if e in items:
-                    positionE = items.index(e)
-                    if transaction.getLastPosition() == positionE:
-                        utilityPe += transaction.getUtilities()[positionE] + transaction.prefixUtility
-                        supportPe += transaction.getSupport()
-                    else:
-                        projectedTransaction = transaction.projectTransaction(positionE)
-                        utilityPe += projectedTransaction.prefixUtility
-                        if previousTransaction == []:
-                            previousTransaction = projectedTransaction
-                        elif self._isEqual(projectedTransaction, previousTransaction):
-                            if consecutiveMergeCount == 0:
-                                items = previousTransaction.items[previousTransaction.offset:]
-                                utilities = previousTransaction.utilities[previousTransaction.offset:]
-                                support = previousTransaction.getSupport()
-                                itemsCount = len(items)
-                                positionPrevious = 0
-                                positionProjection = projectedTransaction.offset
-                                while positionPrevious < itemsCount:
-                                    utilities[positionPrevious] += projectedTransaction.utilities[positionProjection]
-                                    positionPrevious += 1
-                                    positionProjection += 1
-                                previousTransaction.prefixUtility += projectedTransaction.prefixUtility
-                                sumUtilities = previousTransaction.prefixUtility
-                                previousTransaction = _Transaction(items, utilities, previousTransaction.transactionUtility + projectedTransaction.transactionUtility)
-                                previousTransaction.prefixUtility = sumUtilities
-                                previousTransaction.support = support
-                                previousTransaction.support += projectedTransaction.getSupport()
-                            else:
-                                positionPrevious = 0
-                                positionProjected = projectedTransaction.offset
-                                itemsCount = len(previousTransaction.items)
-                                while positionPrevious < itemsCount:
-                                    previousTransaction.utilities[positionPrevious] += projectedTransaction.utilities[
-                                        positionProjected]
-                                    positionPrevious += 1
-                                    positionProjected += 1
-                                previousTransaction.transactionUtility += projectedTransaction.transactionUtility
-                                previousTransaction.prefixUtility += projectedTransaction.prefixUtility
-                                previousTransaction.support += projectedTransaction.getSupport()
-                            consecutiveMergeCount += 1
-                        else:
-                            transactionsPe.append(previousTransaction)
-                            supportPe += previousTransaction.getSupport()
-                            previousTransaction = projectedTransaction
-                            consecutiveMergeCount = 0
-                    transaction.offset = positionE
-            if previousTransaction != []:
-                transactionsPe.append(previousTransaction)
-                supportPe += previousTransaction.getSupport()
+            utilityPe, supportPe, transactionsPe = _up.project(transactionsOfP, e, _Transaction)
             self._temp[prefixLength] = self._newNamesToOldNames[e]
             if utilityPe >= self._minUtil and supportPe >= self._minSup:
                 self._output(prefixLength, utilityPe, supportPe)
             if supportPe >= self._minSup:
-                neighbourhoodList = self._calculateNeighbourIntersection(prefixLength)
-                #print(neighbourhoodList)
-                self._useUtilityBinArraysToCalculateUpperBounds(transactionsPe, idx, itemsToKeep, neighbourhoodList)
+                neighbourhood = prefixNeighbourhood & self._neighbourBits[e]
+                self._useUtilityBinArraysToCalculateUpperBounds(transactionsPe, idx, itemsToKeep, neighbourhood)
                 newItemsToKeep = []
                 newItemsToExplore = []
                 for l in range(idx + 1, len(itemsToKeep)):
                     itemK = itemsToKeep[l]
+                    if not neighbourhood >> itemK & 1:
+                        continue
                     if self._utilityBinArraySU[itemK] >= self._minUtil:
-                        if itemK in neighbourhoodList:
-                            newItemsToExplore.append(itemK)
-                            newItemsToKeep.append(itemK)
+                        newItemsToExplore.append(itemK)
+                        newItemsToKeep.append(itemK)
                     elif self._utilityBinArrayLU[itemK] >= self._minUtil:
-                        if itemK in neighbourhoodList:
-                            newItemsToKeep.append(itemK)
-                self._backtrackingEFIM(transactionsPe, newItemsToKeep, newItemsToExplore, prefixLength + 1)
+                        newItemsToKeep.append(itemK)
+                self._backtrackingEFIM(transactionsPe, newItemsToKeep, newItemsToExplore, prefixLength + 1, neighbourhood)
             finalMemory = _ab._psutil.virtual_memory()[3]
             memory = (finalMemory - initialMemory) / 10000
             if self._maxMemory < memory:
                 self._maxMemory = memory
 
-    def _useUtilityBinArraysToCalculateUpperBounds(self, transactionsPe, j, itemsToKeep, neighbourhoodList):
+    def _useUtilityBinArraysToCalculateUpperBounds(self, transactionsPe, j, itemsToKeep, neighbourhood):
         """
         A method to  calculate the subtree utility and local utility of all items that can extend itemSet P U {e}
 
@@ -721,50 +637,47 @@ class SHUFIM(_ab._utilityPatterns):
         :type j:int
         :param itemsToKeep :the list of promising items
         :type itemsToKeep: list
-        :param neighbourhoodList : the list of promising items that can extend itemSet P U {e}
-        :type neighbourhoodList: list
+        :param neighbourhood : the bitset of the promising items that can extend itemSet P U {e}
+        :type neighbourhood: int
 
         """
+        keep = 0
+        for item in itemsToKeep:
+            keep |= 1 << item
         for i in range(j + 1, len(itemsToKeep)):
             item = itemsToKeep[i]
             self._utilityBinArrayLU[item] = 0
             self._utilityBinArraySU[item] = 0
         for transaction in transactionsPe:
-            length = len(transaction.getItems())
-            i = length - 1
-            while i >= transaction.offset:
-                item = transaction.getItems()[i]
-                if item in itemsToKeep:
-                    remainingUtility = 0
-                    if self._newNamesToOldNames[item] in self._Neighbours:
-                        itemNeighbours = self._Neighbours[self._newNamesToOldNames[item]]
-                        for k in range(i, length):
-                            transaction_item = transaction.getItems()[k]
-                            if self._newNamesToOldNames[transaction_item] in itemNeighbours and transaction_item in neighbourhoodList:
-                                remainingUtility += transaction.getUtilities()[k]
-
-                    remainingUtility += transaction.getUtilities()[i]
-                    self._utilityBinArraySU[item] += remainingUtility + transaction.prefixUtility
-                    self._utilityBinArrayLU[item] += transaction.transactionUtility + transaction.prefixUtility
-                i -= 1
-
-    def _calculateNeighbourIntersection(self, prefixLength):
-        """
-        A method to find common Neighbours
-        :param prefixLength: the prefix itemSet
-        :type prefixLength:int
-        """
-        intersectionList = self._Neighbours.get(self._temp[0])
-        for i in range(1, prefixLength+1):
-            intersectionList = self._intersection(self._Neighbours[self._temp[i]], intersectionList)
-        finalIntersectionList = []
-        if intersectionList is None:
-            return finalIntersectionList
-        for item in intersectionList:
-            if item in self._oldNamesToNewNames:
-                finalIntersectionList.append(self._oldNamesToNewNames[item])
-        return finalIntersectionList
-    
+            items = transaction.getItems()
+            utilities = transaction.getUtilities()
+            length = len(items)
+            for i in range(length - 1, transaction.offset - 1, -1):
+                item = items[i]
+                if not keep >> item & 1:
+                    continue
+                remainingUtility = utilities[i]
+                mask = self._neighbourBits[item] & neighbourhood
+                if mask:
+                    for k in range(i, length):
+                        if mask >> items[k] & 1:
+                            remainingUtility += utilities[k]
+                self._utilityBinArraySU[item] += remainingUtility + transaction.prefixUtility
+                self._utilityBinArrayLU[item] += transaction.transactionUtility + transaction.prefixUtility
+
+    def _createNeighbourBitsets(self):
+        """
+        A method to store the neighbours of every promising item as a bitset over the new names, so that the common
+        neighbours of a prefix are a single integer narrowed with one AND per extension
+        """
+        self._neighbourBits = {}
+        for item, newName in self._oldNamesToNewNames.items():
+            bits = 0
+            for neighbour in self._Neighbours.get(item, ()):
+                if neighbour in self._oldNamesToNewNames:
+                    bits |= 1 << self._oldNamesToNewNames[neighbour]
+            self._neighbourBits[newName] = bits
+
     def _output(self, tempPosition, utility, support):
         """
          A method save all high-utility itemSet to file or memory depending on what the user chose
@@ -783,45 +696,6 @@ class SHUFIM(_ab._utilityPatterns):
                 s1 += "\t"
         self._finalPatterns[s1] = [utility, support]
 
-    def _isEqual(self, transaction1, transaction2):
-        """
-        A method to Check if two transaction are identical
-        :param  transaction1: the first transaction
-        :type  transaction1: Trans
-        :param  transaction2:   the second transaction
-        :type  transaction2: Trans
-        :return : whether both are identical or not
-        :rtype: bool
-        """
-
-        length1 = len(transaction1.items) - transaction1.offset
-        length2 = len(transaction2.items) - transaction2.offset
-        if length1 != length2:
-            return False
-        position1 = transaction1.offset
-        position2 = transaction2.offset
-        while position1 < len(transaction1.items):
-            if transaction1.items[position1] != transaction2.items[position2]:
-                return False
-            position1 += 1
-            position2 += 1
-        return True
-    
-    def _intersection(self, lst1, lst2):
-        """
-        A method that return the intersection of 2 list
-
-        :param  lst1: items neighbour to item1
-        :type lst1: list
-        :param lst2: items neighbour to item2
-        :type lst2: list
-        :return :intersection of two lists
-        :rtype : list
-        """
-        temp = set(lst2)
-        lst3 = [value for value in lst1 if value in temp]
-        return lst3
-
     def _useUtilityBinArrayToCalculateSubtreeUtilityFirstTime(self, dataset):
         """
         Scan the initial database to calculate the subtree utility of each item using a utility-bin array
@@ -834,67 +708,14 @@ class SHUFIM(_ab._utilityPatterns):
             for idx, item in enumerate(items):
                 if item not in self._utilityBinArraySU:
                     self._utilityBinArraySU[item] = 0
-                if self._newNamesToOldNames[item] not in self._Neighbours:
-                    self._utilityBinArraySU[item] += utilities[idx]
-                    continue
-                i = idx + 1
                 sumSu = utilities[idx]
-                while i < len(items):
-                    if self._newNamesToOldNames[items[i]] in self._Neighbours[self._newNamesToOldNames[item]]:
-                        sumSu += utilities[i]
-                    i += 1
+                neighbours = self._neighbourBits[item]
+                if neighbours:
+                    for i in range(idx + 1, len(items)):
+                        if neighbours >> items[i] & 1:
+                            sumSu += utilities[i]
                 self._utilityBinArraySU[item] += sumSu
 
-    def _sortDatabase(self, transactions):
-        """
-        A Method to sort transaction in the order of PMU
-        :param transactions: transaction of items
-        :type transactions: Transaction
-        :return: sorted transaction
-        :rtype: Trans
-        """
-        cmp_items = _comToKey(self._sortTransaction)
-        transactions.sort(key=cmp_items)
-
-    def _sortTransaction(self, trans1, trans2):
-        """
-        A Method to sort transaction in the order of PMU
-        :param trans1: the first transaction
-        :type trans1: Trans
-        :param trans2:the second transaction
-        :type trans2: Trans
-        :return: sorted transaction
-        :rtype: Trans
-        """
-        trans1_items = trans1.getItems()
-        trans2_items = trans2.getItems()
-        pos1 = len(trans1_items) - 1
-        pos2 = len(trans2_items) - 1
-        if len(trans1_items) < len(trans2_items):
-            while pos1 >= 0:
-                sub = trans2_items[pos2] - trans1_items[pos1]
-                if sub != 0:
-                    return sub
-                pos1 -= 1
-                pos2 -= 1
-            return -1
-        elif len(trans1_items) > len(trans2_items):
-            while pos2 >= 0:
-                sub = trans2_items[pos2] - trans1_items[pos1]
-                if sub != 0:
-                    return sub
-                pos1 -= 1
-                pos2 -= 1
-            return 1
-        else:
-            while pos2 >= 0:
-                sub = trans2_items[pos2] - trans1_items[pos1]
-                if sub != 0:
-                    return sub
-                pos1 -= 1
-                pos2 -= 1
-            return 0
-
     def _useUtilityBinArrayToCalculateLocalUtilityFirstTime(self, dataset):
         """
         A method to scan the database using utility bin array to calculate the pmus
@@ -53,126 +53,152 @@ Copyright (C)  2021 Rage Uday Kiran
 """
 
 from PAMI.highUtilityPattern.basic import abstract as _ab
+from PAMI.extras import utilityProjection as _up
 from typing import List, Dict, Tuple, Set, Union, Any, Generator
+import itertools as _itertools
+import numpy as _np
 from deprecated import deprecated
 
 
-class _Transaction:
+class _UtilityDatabase:
     """
-        A class to store Transaction of a database
+        A class to store a (projected) utility database as flat arrays
 
     :Attributes:
 
-        items: list
-            A list of items in transaction 
-        utilities: list
-            A list of utilities of items in transaction
-        transactionUtility: int
-            represent total sum of all utilities in the database
-        prefixUtility:
-            prefix Utility values of item
-        offset:
-            an offset pointer, used by projected transactions
+        items: numpy.ndarray
+            the items of all transactions laid out one transaction after the other, sorted inside a transaction
+        utilities: numpy.ndarray
+            the utility of every entry of items
+        offsets: numpy.ndarray
+            transaction t occupies items[offsets[t]:offsets[t + 1]]
+        prefixUtilities: numpy.ndarray
+            the utility of the prefix in every transaction
+        width: int
+            one more than the largest item, used to build the search keys
+
     :Methods:
 
-        projectedTransaction(offsetE):
-            A method to create new Transaction from existing starting from offsetE until the end
-        getItems():
-            return items in transaction
-        getUtilities():
-            return utilities in transaction
-        getLastPosition():
-            return last position in a transaction
-        removeUnpromisingItems():
-            A method to remove items which are having low values when compared with minUtil
-        insertionSort():
-            A method to sort all items in the transaction
+        fromTransactions(items, utilities, lengths, width):
+            A method to build the database from renamed transactions
+        project(item):
+            A method to create the database of the transactions containing item, starting after item
+        remainingUtilities(kept):
+            return the utility of the kept items from every position to the end of its transaction
+        transactionUtilities():
+            return the utility of the remaining items of every transaction
     """
-    offset = 0
-    prefixUtility = 0
 
-    def __init__(self, items: list, utilities: list, transactionUtility: int) -> None:
+    def __init__(self, items: _np.ndarray, utilities: _np.ndarray, offsets: _np.ndarray, prefixUtilities: _np.ndarray,
+                 width: int) -> None:
         self.items = items
         self.utilities = utilities
-        self.transactionUtility = transactionUtility
-
-    def projectTransaction(self, offsetE: int) -> '_Transaction':
-        """
-        A method to create new Transaction from existing transaction starting from offsetE until the end
-        :param offsetE: an offset over the original transaction for projecting the transaction
-        :type offsetE: int
-        :return: a new transaction after projecting the transaction starting from offsetE until the end of the transaction
-        :rtype: _Transaction
-        """
-        new_transaction = _Transaction(self.items, self.utilities, self.transactionUtility)
-        utilityE = self.utilities[offsetE]
-        new_transaction.prefixUtility = self.prefixUtility + utilityE
-        new_transaction.transactionUtility = self.transactionUtility - utilityE
-        for i in range(self.offset, offsetE):
-            new_transaction.transactionUtility -= self.utilities[i]
-        new_transaction.offset = offsetE + 1
-        return new_transaction
-
-    def getItems(self) -> list:
-        """
-        A method to return items in transaction
-        :return: list of items in transaction after projecting the transaction starting from offsetE until the end of the transaction
-        :rtype: list
-        """
-        return self.items
-
-    def getUtilities(self) -> list:
-        """
-        A method to return utilities in transaction
-        :return: list of utilities in transaction
-        :rtype: list
-        """
-        return self.utilities
+        self.offsets = offsets
+        self.prefixUtilities = prefixUtilities
+        self.width = width
+        self._keys = None
+        self._rowOfEntry = None
+
+    @classmethod
+    def fromTransactions(cls, items: _np.ndarray, utilities: _np.ndarray, lengths: _np.ndarray, width: int) -> '_UtilityDatabase':
+        """
+        A method to build the database from renamed transactions, where the removed items are named 0. Items are
+        sorted inside every transaction, empty transactions are dropped and identical transactions are merged.
+        :param items: the renamed items of all transactions laid out one transaction after the other
+        :type items: numpy.ndarray
+        :param utilities: the utility of every entry of items
+        :type utilities: numpy.ndarray
+        :param lengths: the number of items of every transaction
+        :type lengths: numpy.ndarray
+        :param width: one more than the largest new name
+        :type width: int
+        :return: the database
+        :rtype: _UtilityDatabase
+        """
+        rows = _np.repeat(_np.arange(len(lengths)), lengths)
+        kept = items > 0
+        rows, items, utilities = rows[kept], items[kept], utilities[kept]
+        order = _np.lexsort((items, rows))
+        rows, items, utilities = rows[order], items[order], utilities[order]
+        lengths = _np.bincount(rows, minlength=len(lengths))
+        offsets = _np.zeros(len(lengths) + 1, dtype=_np.int64)
+        _np.cumsum(lengths, out=offsets[1:])
+        offsets = _np.unique(offsets)
+        prefixUtilities = _np.zeros(len(offsets) - 1, dtype=_np.int64)
+        return cls(*_up.mergeIdentical(items, utilities, offsets, prefixUtilities), width)
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def _rows(self) -> _np.ndarray:
+        """
+        :return: the transaction of every entry of items
+        :rtype: numpy.ndarray
+        """
+        if self._rowOfEntry is None:
+            self._rowOfEntry = _np.repeat(_np.arange(len(self)), _np.diff(self.offsets))
+        return self._rowOfEntry
+
+    def transactionUtilities(self) -> _np.ndarray:
+        """
+        A method to return the utility of the remaining items of every transaction
+        :return: utility of every transaction without its prefix
+        :rtype: numpy.ndarray
+        """
+        return _np.add.reduceat(self.utilities, self.offsets[:-1]) if len(self) else _np.zeros(0, dtype=_np.int64)
+
+    def remainingUtilities(self, kept: _np.ndarray) -> _np.ndarray:
+        """
+        A method to calculate, at every position, the utility of the kept items from there to the end of the transaction
+        :param kept: tells for every position whether its item is kept
+        :type kept: numpy.ndarray
+        :return: the remaining utility at every position
+        :rtype: numpy.ndarray
+        """
+        utilities = _np.where(kept, self.utilities, 0)
+        cumulative = _np.cumsum(utilities)
+        return cumulative[self.offsets[1:] - 1][self._rows()] - cumulative + utilities
+
+    def project(self, item: int) -> Tuple[int, '_UtilityDatabase']:
+        """
+        A method to create the database of the transactions containing item, starting after item. The position of item
+        in every transaction is found by a binary search over keys transaction * width + item, which are sorted because
+        items are sorted inside a transaction. Projected transactions with the same items are merged.
+        :param item: the item appended to the prefix
+        :type item: int
+        :return: the utility of the prefix extended with item and the projected database
+        :rtype: tuple
+        """
+        if self._keys is None:
+            self._keys = self._rows() * self.width + self.items
+        targets = _np.arange(len(self)) * self.width + item
+        positions = _np.searchsorted(self._keys, targets)
+        positions[positions == len(self._keys)] = 0
+        found = _np.flatnonzero(self._keys[positions] == targets)
+        positions = positions[found]
+        prefixUtilities = self.prefixUtilities[found] + self.utilities[positions]
+        utility = int(prefixUtilities.sum())
+        starts = positions + 1
+        lengths = self.offsets[found + 1] - starts
+        nonEmpty = lengths > 0
+        starts, lengths, prefixUtilities = starts[nonEmpty], lengths[nonEmpty], prefixUtilities[nonEmpty]
+        offsets = _np.zeros(len(lengths) + 1, dtype=_np.int64)
+        _np.cumsum(lengths, out=offsets[1:])
+        entries = _np.arange(offsets[-1]) + _np.repeat(starts - offsets[:-1], lengths)
+        projected = _UtilityDatabase(self.items[entries], self.utilities[entries], offsets, prefixUtilities, self.width)
+        return utility, projected._mergeIdentical()
+
+    def _mergeIdentical(self) -> '_UtilityDatabase':
+        """
+        A method to merge the transactions having the same items, summing their utilities
+        :return: the merged database
+        :rtype: _UtilityDatabase
+        """
+        merged = _up.mergeIdentical(self.items, self.utilities, self.offsets, self.prefixUtilities)
+        if merged[2] is self.offsets:
+            return self
+        return _UtilityDatabase(*merged, self.width)
 
-    def getLastPosition(self) -> int:
-        """
-        A method to return last position in a transaction
-        :return: last position in a transaction after projecting the transaction starting from offsetE until the end of the transaction
-        :rtype: int
-        """
-
-        return len(self.items) - 1
-
-    def removeUnpromisingItems(self, oldNamesToNewNames: dict) -> None:
-        """
-        A method to remove items which are not present in the map passed to the function
-        :param oldNamesToNewNames: A map represent old names to new names
-        :type oldNamesToNewNames: map
-        :return: None
-        """
-        tempItems = []
-        tempUtilities = []
-        for idx, item in enumerate(self.items):
-            if item in oldNamesToNewNames:
-                tempItems.append(oldNamesToNewNames[item])
-                tempUtilities.append(self.utilities[idx])
-            else:
-                self.transactionUtility -= self.utilities[idx]
-        self.items = tempItems
-        self.utilities = tempUtilities
-        self.insertionSort()
-
-    def insertionSort(self) -> None:
-        """
-        A method to sort items in order
-        :return: None
-        """
-        for i in range(1, len(self.items)):
-            key = self.items[i]
-            utilityJ = self.utilities[i]
-            j = i - 1
-            while j >= 0 and key < self.items[j]:
-                self.items[j + 1] = self.items[j]
-                self.utilities[j + 1] = self.utilities[j]
-                j -= 1
-            self.items[j + 1] = key
-            self.utilities[j + 1] = utilityJ
-        
 
 class _Dataset:
     """
@@ -181,14 +207,14 @@ class _Dataset:
     :Attributes:
 
         transactions :
-            the list of transactions in this dataset
+            the list of transactions in this dataset, each one a tuple of items, utilities and transaction utility
         maxItem:
             the largest item name
         
     :methods:
 
         createTransaction(line):
-            Create a transaction object from a line from the input file
+            Create a transaction from a line from the input file
         getMaxItem():
             return Maximum Item
         getTransactions():
@@ -226,7 +252,8 @@ class _Dataset:
                 utilities = datasetPath['Utilities'].tolist()
             if 'UtilitySum' in i:
                 transactionUtility = datasetPath['UtilitySum'].tolist()
-            self.transactions.append(self.createTransaction(data, utilities, transactionUtility))
+            for k in range(len(data)):
+                self.transactions.append(self.createTransaction(data[k], utilities[k], int(transactionUtility[k])))
         if isinstance(datasetPath, str):
             if _ab._validators.url(datasetPath):
                 data = _ab._urlopen(datasetPath)
@@ -256,7 +283,7 @@ class _Dataset:
                     print("File Not Found")
                     quit()
 
-    def createTransaction(self, itemsString: list, utilityString: list, transactionUtility: int) -> '_Transaction':
+    def createTransaction(self, itemsString: list, utilityString: list, transactionUtility: int) -> tuple:
         """
         A method to create Transaction from dataset given
         :param itemsString: List of strings representing transactions
@@ -265,17 +292,9 @@ class _Dataset:
         :type utilityString: list
         :param transactionUtility: Integer representing transaction utility
         :type transactionUtility: int
-        :return: created Transaction from the given dataset
-        :rtype: _Transaction
+        :return: the items, the utilities and the utility of the transaction
+        :rtype: tuple
         """
-
-
-        '''trans_list = line.strip().split(':')
-        transactionUtility = int(trans_list[1])
-        itemsString = trans_list[0].strip().split(self.sep)
-        itemsString = [x for x in itemsString if x]
-        utilityString = trans_list[2].strip().split(self.sep)
-        utilityString = [x for x in utilityString if x]'''
         items = []
         utilities = []
         for idx, item in enumerate(itemsString):
@@ -288,7 +307,7 @@ class _Dataset:
                 self.maxItem = item_int
             items.append(item_int)
             utilities.append(int(utilityString[idx]))
-        return _Transaction(items, utilities, transactionUtility)
+        return items, utilities, transactionUtility
 
     def getMaxItem(self) -> int:
         """
@@ -346,10 +365,10 @@ class EFIM(_ab._utilityPatterns):
             set of high utility itemSets
         candidateCount: int
              Number of candidates 
-        utilityBinArrayLU: list
-             A map to hold the local utility values of the items in database
-        utilityBinArraySU: list
-            A map to hold the subtree utility values of the items is database
+        utilityBinArrayLU: numpy.ndarray
+             An array indexed by item to hold the local utility values of the items in database
+        utilityBinArraySU: numpy.ndarray
+            An array indexed by item to hold the subtree utility values of the items is database
         oldNamesToNewNames: list
             A map which contains old names, new names of items as key value pairs
         newNamesToOldNames: list
@@ -379,21 +398,15 @@ class EFIM(_ab._utilityPatterns):
                 Total amount of RSS memory consumed by the mining process will be retrieved from this function
         getRuntime()
                Total amount of runtime taken by the mining process will be retrieved from this function
-        backTrackingEFIM(transactionsOfP, itemsToKeep, itemsToExplore, prefixLength)
+        backTrackingEFIM(transactionsOfP, itemsToKeep, itemsToExplore, prefix)
                A method to mine the HUIs Recursively
-        useUtilityBinArraysToCalculateUpperBounds(transactionsPe, j, itemsToKeep)
+        useUtilityBinArraysToCalculateUpperBounds(transactionsPe, j, itemsToKeep, isKept)
                A method to calculate the sub-tree utility and local utility of all items that can extend itemSet P and e
-        output(tempPosition, utility)
+        output(pattern, utility)
                A method to output a high-utility itemSet to file or memory depending on what the user chose
-        is_equal(transaction1, transaction2)
-               A method to Check if two transaction are identical
         useUtilityBinArrayToCalculateSubtreeUtilityFirstTime(dataset)
               A method to calculate the sub tree utility values for single items
-        sortDatabase(self, transactions)
-              A Method to sort transaction
-        sort_transaction(self, trans1, trans2)
-              A Method to sort transaction
-        useUtilityBinArrayToCalculateLocalUtilityFirstTime(self, dataset)
+        useUtilityBinArrayToCalculateLocalUtilityFirstTime(items, lengths, transactionUtilities)
              A method to calculate local utility values for single itemsets
 
     **Executing the code on terminal:**
@@ -453,8 +466,6 @@ class EFIM(_ab._utilityPatterns):
     _newNamesToOldNames = {}
     _strToInt = {}
     _intToStr = {}
-    _Neighbours = {}
-    _temp = [0] * 5000
     _patternCount = int()
     _maxMemory = 0
     _startTime = float()
@@ -480,8 +491,6 @@ class EFIM(_ab._utilityPatterns):
         self._newNamesToOldNames = {}
         self._strToInt = {}
         self._intToStr = {}
-        self._Neighbours = {}
-        self._temp = [0] * 5000
         self._patternCount = 0
         self._maxMemory = 0
         self._endTime = float()
@@ -505,33 +514,28 @@ class EFIM(_ab._utilityPatterns):
         """
         self._startTime = _ab._time.time()
         self._dataset = _Dataset(self._iFile, self._sep)
-        self._useUtilityBinArrayToCalculateLocalUtilityFirstTime(self._dataset)
         self._minUtil = int(self._minUtil)
-        itemsToKeep = []
-        for key in self._utilityBinArrayLU.keys():
-            if self._utilityBinArrayLU[key] >= self._minUtil:
-                itemsToKeep.append(key)
-        itemsToKeep = sorted(itemsToKeep, key=lambda x: self._utilityBinArrayLU[x])
-        currentName = 1
-        for idx, item in enumerate(itemsToKeep):
-            self._oldNamesToNewNames[item] = currentName
-            self._newNamesToOldNames[currentName] = item
-            itemsToKeep[idx] = currentName
-            currentName += 1
-        for transaction in self._dataset.getTransactions():
-            transaction.removeUnpromisingItems(self._oldNamesToNewNames)
-        self._sortDatabase(self._dataset.getTransactions())
-        emptyTransactionCount = 0
-        for transaction in self._dataset.getTransactions():
-            if len(transaction.getItems()) == 0:
-                emptyTransactionCount += 1
-        self._dataset.transactions = self._dataset.transactions[emptyTransactionCount:]
-        self._useUtilityBinArrayToCalculateSubtreeUtilityFirstTime(self._dataset)
-        itemsToExplore = []
-        for item in itemsToKeep:
-            if self._utilityBinArraySU[item] >= self._minUtil:
-                itemsToExplore.append(item)
-        self._backTrackingEFIM(self._dataset.getTransactions(), itemsToKeep, itemsToExplore, 0)
+        transactions = self._dataset.getTransactions()
+        lengths = _np.fromiter((len(t[0]) for t in transactions), dtype=_np.int64, count=len(transactions))
+        items = _np.fromiter(_itertools.chain.from_iterable(t[0] for t in transactions), dtype=_np.int64,
+                             count=int(lengths.sum()))
+        utilities = _np.fromiter(_itertools.chain.from_iterable(t[1] for t in transactions), dtype=_np.int64,
+                                 count=int(lengths.sum()))
+        transactionUtilities = _np.fromiter((t[2] for t in transactions), dtype=_np.int64, count=len(transactions))
+        self._useUtilityBinArrayToCalculateLocalUtilityFirstTime(items, lengths, transactionUtilities)
+        itemsToKeep = _np.flatnonzero(self._utilityBinArrayLU >= self._minUtil)
+        itemsToKeep = itemsToKeep[itemsToKeep > 0]
+        itemsToKeep = itemsToKeep[_np.argsort(self._utilityBinArrayLU[itemsToKeep], kind='stable')]
+        oldNamesToNewNames = _np.zeros(len(self._utilityBinArrayLU), dtype=_np.int64)
+        oldNamesToNewNames[itemsToKeep] = _np.arange(1, len(itemsToKeep) + 1)
+        for idx, item in enumerate(itemsToKeep.tolist()):
+            self._oldNamesToNewNames[item] = idx + 1
+            self._newNamesToOldNames[idx + 1] = item
+        database = _UtilityDatabase.fromTransactions(oldNamesToNewNames[items], utilities, lengths, len(itemsToKeep) + 1)
+        itemsToKeep = _np.arange(1, len(itemsToKeep) + 1)
+        self._useUtilityBinArrayToCalculateSubtreeUtilityFirstTime(database)
+        itemsToExplore = itemsToKeep[self._utilityBinArraySU[itemsToKeep] >= self._minUtil]
+        self._backTrackingEFIM(database, itemsToKeep, itemsToExplore, [])
         self._endTime = _ab._time.time()
         process = _ab._psutil.Process(_ab._os.getpid())
         self._memoryUSS = float()
@@ -540,233 +544,100 @@ class EFIM(_ab._utilityPatterns):
         self._memoryRSS = process.memory_info().rss
         print("High Utility patterns were generated successfully using EFIM algorithm")
 
-    def _backTrackingEFIM(self, transactionsOfP: list, itemsToKeep: list, itemsToExplore: list, prefixLength: int) -> None:
+    def _backTrackingEFIM(self, transactionsOfP: _UtilityDatabase, itemsToKeep: _np.ndarray, itemsToExplore: _np.ndarray, prefix: list) -> None:
         """
         A method to mine the HUIs Recursively
-        :param transactionsOfP: the list of transactions containing the current prefix P
-        :type transactionsOfP: list
-        :param itemsToKeep: the list of secondary items in the p-projected database
-        :type itemsToKeep: list
-        :param itemsToExplore: the list of primary items in the p-projected database
-        :type itemsToExplore: list
-        :param prefixLength: current prefixLength
-        :type prefixLength: int
+        :param transactionsOfP: the projected database of the current prefix P
+        :type transactionsOfP: _UtilityDatabase
+        :param itemsToKeep: the secondary items in the p-projected database
+        :type itemsToKeep: numpy.ndarray
+        :param itemsToExplore: the primary items in the p-projected database
+        :type itemsToExplore: numpy.ndarray
+        :param prefix: the items of the current prefix P
+        :type prefix: list
         :return: None
         """
         self._candidateCount += len(itemsToExplore)
-        for idx, e in enumerate(itemsToExplore):
-            transactionsPe = []
-            utilityPe = 0
-            previousTransaction = transactionsOfP[0]
-            consecutiveMergeCount = 0
-            for transaction in transactionsOfP:
-                items = transaction.getItems()
-                if e in items:
-                    positionE = items.index(e)
-                    if transaction.getLastPosition() == positionE:
-                        utilityPe += transaction.getUtilities()[positionE] + transaction.prefixUtility
-                    else:
-                        projectedTransaction = transaction.projectTransaction(positionE)
-                        utilityPe += projectedTransaction.prefixUtility
-                        if previousTransaction == transactionsOfP[0]:
-                            previousTransaction = projectedTransaction
-                        elif self._isEqual(projectedTransaction, previousTransaction):
-                            if consecutiveMergeCount == 0:
-                                items = previousTransaction.items[previousTransaction.offset:]
-                                utilities = previousTransaction.utilities[previousTransaction.offset:]
-                                itemsCount = len(items)
-                                positionPrevious = 0
-                                positionProjection = projectedTransaction.offset
-                                while positionPrevious < itemsCount:
-                                    utilities[positionPrevious] += projectedTransaction.utilities[positionProjection]
-                                    positionPrevious += 1
-                                    positionProjection += 1
-                                previousTransaction.prefixUtility += projectedTransaction.prefixUtility
-                                sumUtilities = previousTransaction.prefixUtility
-                                previousTransaction = _Transaction(items, utilities, previousTransaction.transactionUtility + projectedTransaction.transactionUtility)
-                                previousTransaction.prefixUtility = sumUtilities
-                            else:
-                                positionPrevious = 0
-                                positionProjected = projectedTransaction.offset
-                                itemsCount = len(previousTransaction.items)
-                                while positionPrevious < itemsCount:
-                                    previousTransaction.utilities[positionPrevious] += projectedTransaction.utilities[
-                                        positionProjected]
-                                    positionPrevious += 1
-                                    positionProjected += 1
-                                previousTransaction.transactionUtility += projectedTransaction.transactionUtility
-                                previousTransaction.prefixUtility += projectedTransaction.prefixUtility
-                            consecutiveMergeCount += 1
-                        else:
-                            transactionsPe.append(previousTransaction)
-                            previousTransaction = projectedTransaction
-                            consecutiveMergeCount = 0
-                    transaction.offset = positionE
-            if previousTransaction != transactionsOfP[0]:
-                transactionsPe.append(previousTransaction)
-            self._temp[prefixLength] = self._newNamesToOldNames[e]
+        isKept = _np.zeros(transactionsOfP.width, dtype=bool)
+        isKept[itemsToKeep] = True
+        for idx, e in enumerate(itemsToExplore.tolist()):
+            utilityPe, transactionsPe = transactionsOfP.project(e)
+            pattern = prefix + [self._newNamesToOldNames[e]]
             if utilityPe >= self._minUtil:
-                self._output(prefixLength, utilityPe)
-            self._useUtilityBinArraysToCalculateUpperBounds(transactionsPe, idx, itemsToKeep)
-            newItemsToKeep = []
-            newItemsToExplore = []
-            for l in range(idx + 1, len(itemsToKeep)):
-                itemK = itemsToKeep[l]
-                if self._utilityBinArraySU[itemK] >= self._minUtil:
-                    newItemsToExplore.append(itemK)
-                    newItemsToKeep.append(itemK)
-                elif self._utilityBinArrayLU[itemK] >= self._minUtil:
-                    newItemsToKeep.append(itemK)
-            if len(transactionsPe) != 0:
-                self._backTrackingEFIM(transactionsPe, newItemsToKeep, newItemsToExplore, prefixLength + 1)
-
-    def _useUtilityBinArraysToCalculateUpperBounds(self, transactionsPe: list, j: int, itemsToKeep: list) -> None:
+                self._output(pattern, utilityPe)
+            candidates = itemsToKeep[idx + 1:]
+            if len(candidates) == 0 or len(transactionsPe) == 0:
+                continue
+            self._useUtilityBinArraysToCalculateUpperBounds(transactionsPe, idx, itemsToKeep, isKept)
+            explore = self._utilityBinArraySU[candidates] >= self._minUtil
+            keep = explore | (self._utilityBinArrayLU[candidates] >= self._minUtil)
+            self._backTrackingEFIM(transactionsPe, candidates[keep], candidates[explore], pattern)
+
+    def _useUtilityBinArraysToCalculateUpperBounds(self, transactionsPe: _UtilityDatabase, j: int, itemsToKeep: _np.ndarray, isKept: _np.ndarray) -> None:
         """
         A method to  calculate the subtree utility and local utility of all items that can extend itemSet P U {e}
-        :param transactionsPe: transactions the projected database for P U {e}
-        :type transactionsPe: list
+        :param transactionsPe: the projected database for P U {e}
+        :type transactionsPe: _UtilityDatabase
         :param j:the position of j in the list of promising items
         :type j:int
-        :param itemsToKeep :the list of promising items
-        :type itemsToKeep: list
+        :param itemsToKeep :the promising items in increasing order
+        :type itemsToKeep: numpy.ndarray
+        :param isKept: tells for every item whether it is in itemsToKeep
+        :type isKept: numpy.ndarray
         :return: None
         """
-        for i in range(j + 1, len(itemsToKeep)):
-            item = itemsToKeep[i]
-            self._utilityBinArrayLU[item] = 0
-            self._utilityBinArraySU[item] = 0
-        for transaction in transactionsPe:
-            sumRemainingUtility = 0
-            i = len(transaction.getItems()) - 1
-            while i >= transaction.offset:
-                item = transaction.getItems()[i]
-                if item in itemsToKeep:
-                    sumRemainingUtility += transaction.getUtilities()[i]
-                    self._utilityBinArraySU[item] += sumRemainingUtility + transaction.prefixUtility
-                    self._utilityBinArrayLU[item] += transaction.transactionUtility + transaction.prefixUtility
-                i -= 1
-
-    def _output(self, tempPosition: int, utility: int) -> None:
+        if j + 1 < len(itemsToKeep):
+            self._utilityBinArrayLU[itemsToKeep[j + 1]:] = 0
+            self._utilityBinArraySU[itemsToKeep[j + 1]:] = 0
+        if len(transactionsPe) == 0:
+            return
+        rows = transactionsPe._rows()
+        kept = isKept[transactionsPe.items]
+        items = transactionsPe.items[kept]
+        remainingUtilities = transactionsPe.remainingUtilities(kept)[kept]
+        prefixUtilities = transactionsPe.prefixUtilities[rows[kept]]
+        transactionUtilities = transactionsPe.transactionUtilities()[rows[kept]]
+        _np.add.at(self._utilityBinArraySU, items, remainingUtilities + prefixUtilities)
+        _np.add.at(self._utilityBinArrayLU, items, transactionUtilities + prefixUtilities)
+
+    def _output(self, pattern: list, utility: int) -> None:
         """
         Method to print high utility items
-        :param tempPosition: position of last item
-        :type tempPosition : int
+        :param pattern: the items of the itemSet
+        :type pattern: list
         :param utility: total utility of itemSet
         :type utility: int
         :return: None
         """
         self._patternCount += 1
-        s1 = str()
-        for i in range(0, tempPosition+1):
-            s1 += self._dataset.intToStr.get((self._temp[i]))
-            if i != tempPosition:
-                s1 += "\t"
+        s1 = "\t".join(self._dataset.intToStr.get(item) for item in pattern)
         self._finalPatterns[s1] = str(utility)
 
-    def _isEqual(self, transaction1: '_Transaction', transaction2: '_Transaction') -> bool:
-        """
-         A method to Check if two transaction are identical
-         :param  transaction1: the first transaction
-         :type  transaction1: Trans
-         :param  transaction2:    the second transaction
-         :type  transaction2: Trans
-         :return : whether both are identical or not
-         :rtype: bool
-        """
-        length1 = len(transaction1.items) - transaction1.offset
-        length2 = len(transaction2.items) - transaction2.offset
-        if length1 != length2:
-            return False
-        position1 = transaction1.offset
-        position2 = transaction2.offset
-        while position1 < len(transaction1.items):
-            if transaction1.items[position1] != transaction2.items[position2]:
-                return False
-            position1 += 1
-            position2 += 1
-        return True
-
-    def _useUtilityBinArrayToCalculateSubtreeUtilityFirstTime(self, dataset: '_Dataset') -> None:
+    def _useUtilityBinArrayToCalculateSubtreeUtilityFirstTime(self, dataset: _UtilityDatabase) -> None:
         """
         Scan the initial database to calculate the subtree utility of each item using a utility-bin array
         :param dataset: the transaction database
-        :type dataset: list
-        :return: None
-        """
-        for transaction in dataset.getTransactions():
-            sumSU = 0
-            i = len(transaction.getItems()) - 1
-            while i >= 0:
-                item = transaction.getItems()[i]
-                sumSU += transaction.getUtilities()[i]
-                if item in self._utilityBinArraySU.keys():
-                    self._utilityBinArraySU[item] += sumSU
-                else:
-                    self._utilityBinArraySU[item] = sumSU
-                i -= 1
-
-    def _sortDatabase(self, transactions: list) -> None:
-        """
-        A Method to sort transactions
-        :param transactions: transaction of items
-        :type transactions: Transaction
+        :type dataset: _UtilityDatabase
         :return: None
         """
-        cmp_items = _ab._functools.cmp_to_key(self.sort_transaction)
-        transactions.sort(key=cmp_items)
+        self._utilityBinArraySU = _np.zeros(dataset.width, dtype=_np.int64)
+        kept = _np.ones(len(dataset.items), dtype=bool)
+        _np.add.at(self._utilityBinArraySU, dataset.items, dataset.remainingUtilities(kept))
+        self._utilityBinArrayLU = _np.zeros(dataset.width, dtype=_np.int64)
 
-    def sort_transaction(self, trans1: '_Transaction', trans2: '_Transaction') -> int:
-        """
-        A Method to sort transaction
-        :param trans1: the first transaction
-        :type trans1: Trans
-        :param trans2:the second transaction
-        :type trans2: Trans
-        :return: sorted transaction
-        :rtype: int
-        """
-        trans1_items = trans1.getItems()
-        trans2_items = trans2.getItems()
-        pos1 = len(trans1_items) - 1
-        pos2 = len(trans2_items) - 1
-        if len(trans1_items) < len(trans2_items):
-            while pos1 >= 0:
-                sub = trans2_items[pos2] - trans1_items[pos1]
-                if sub != 0:
-                    return sub
-                pos1 -= 1
-                pos2 -= 1
-            return -1
-        elif len(trans1_items) > len(trans2_items):
-            while pos2 >= 0:
-                sub = trans2_items[pos2] - trans1_items[pos1]
-                if sub != 0:
-                    return sub
-                pos1 -= 1
-                pos2 -= 1
-            return 1
-        else:
-            while pos2 >= 0:
-                sub = trans2_items[pos2] - trans1_items[pos1]
-                if sub != 0:
-                    return sub
-                pos1 -= 1
-                pos2 -= 1
-            return 0
-
-    def _useUtilityBinArrayToCalculateLocalUtilityFirstTime(self, dataset: '_Dataset') -> None:
+    def _useUtilityBinArrayToCalculateLocalUtilityFirstTime(self, items: _np.ndarray, lengths: _np.ndarray, transactionUtilities: _np.ndarray) -> None:
         """
         A method to calculate local utility of single itemset
-        :param dataset: the transaction database
-        :type dataset: dataset
+        :param items: the items of all transactions laid out one transaction after the other
+        :type items: numpy.ndarray
+        :param lengths: the number of items of every transaction
+        :type lengths: numpy.ndarray
+        :param transactionUtilities: the utility of every transaction
+        :type transactionUtilities: numpy.ndarray
         :return: None
         """
-        for transaction in dataset.getTransactions():
-            for item in transaction.getItems():
-                if item in self._utilityBinArrayLU:
-                    self._utilityBinArrayLU[item] += transaction.transactionUtility
-                else:
-                    self._utilityBinArrayLU[item] = transaction.transactionUtility
+        self._utilityBinArrayLU = _np.zeros(self._dataset.getMaxItem() + 1, dtype=_np.int64)
+        _np.add.at(self._utilityBinArrayLU, items, _np.repeat(transactionUtilities, lengths))
 
     def getPatternsAsDataFrame(self) -> '_pd.DataFrame':
         """
@@ -53,46 +53,47 @@ Copyright (C)  2021 Rage Uday Kiran
 """
 
 from PAMI.highUtilityPattern.basic import abstract as _ab
+import numpy as _np
 from deprecated import deprecated
 
+_empty = _np.empty(0, dtype=_np.int64)
+_maxCells = 1 << 22
 
-class _Element:
-    """
-    A class represents an Element of a utility list.
-
-    :Attributes :
 
-        ts : int
-            keep tact of transaction id
-        nu : int
-            non-closed itemSet utility
-        nru : int
-             non-closed remaining utility
-        pu : int
-            prefix utility
-        ppos: int
-            position of previous item in the list
+def _sumPairs(keys, sums, pending):
     """
-
-    def __init__(self, tid, nu, nru, pu, ppos):
-        self.tid = tid
-        self.nu = nu
-        self.nru = nru
-        self.pu = pu
-        self.ppos = ppos
+    Merges batches of pair values into the sum of every distinct pair
+
+    :param keys: the distinct pairs summed so far, sorted
+    :type keys: numpy.ndarray
+    :param sums: the sum of every pair of keys
+    :type sums: numpy.ndarray
+    :param pending: batches of (pairs, values) to be added
+    :type pending: list
+    :return: the distinct pairs, sorted, and their sums
+    :rtype: tuple
+    """
+    if not pending:
+        return keys, sums
+    allKeys = _np.concatenate([keys] + [pair[0] for pair in pending])
+    allValues = _np.concatenate([sums] + [pair[1] for pair in pending])
+    keys, inverse = _np.unique(allKeys, return_inverse=True)
+    sums = _np.zeros(len(keys), dtype=_np.int64)
+    _np.add.at(sums, inverse, allValues)
+    return keys, sums
 
 
 class _CUList:
     """
-    A class represents a UtilityList
+    A class represents a compact utility list, whose elements are stored as parallel arrays
 
     :Attributes :
 
         item: int
-            item 
-        sumNu: long
+            rank of the item in the processing order
+        sumnu: long
             the sum of item utilities
-        sumNru: long
+        sumnru: long
             the sum of remaining utilities
         sumCu : long
             the sum of closed utilities
@@ -100,42 +101,30 @@ class _CUList:
             the sum of closed remaining utilities
         sumCpu: long
             the sum of closed prefix utilities
-        elements: list
-            the list of elements 
-    :Methods :
-
-        addElement(element)
-            Method to add an element to this utility list and update the sums at the same time.
+        tids: numpy.ndarray
+            the transaction of every element, in increasing order
+        nu: numpy.ndarray
+            the non-closed itemSet utility of every element
+        nru: numpy.ndarray
+            the non-closed remaining utility of every element
+        pu: numpy.ndarray
+            the prefix utility of every element
     """
 
-    def __init__(self, item):
+    def __init__(self, item, tids=_empty, nu=_empty, nru=_empty, pu=_empty):
         self.item = item
-        self.sumnu = 0
-        self.sumnru = 0
+        self.tids = tids
+        self.nu = nu
+        self.nru = nru
+        self.pu = pu
+        self.sumnu = int(nu.sum())
+        self.sumnru = int(nru.sum())
         self.sumCu = 0
         self.sumCru = 0
         self.sumCpu = 0
-        self.elements = []
-
-    def addElements(self, element):
-        """
-        A method to add new element to CUList
-        :param element: element to be added to CUList
-        :type element: Element
-        """
-        self.sumnu += element.nu
-        self.sumnru += element.nru
-        self.elements.append(element)
 
-
-class _Pair:
-    """
-    A class represent an item and its utility in a transaction
-    """
-
-    def __init__(self):
-        self.item = 0
-        self.utility = 0
+    def __len__(self):
+        return len(self.tids)
 
 
 class HMiner(_ab._utilityPatterns):
@@ -281,30 +270,26 @@ class HMiner(_ab._utilityPatterns):
         self._candidates = 0
         self._mapOfTWU = {}
         self._minutil = 0
-        self._mapFMAP = {}
+        self._itemNames = []
+        self._eucsKeys = _empty
+        self._eucsValues = _empty
         self._finalPatterns = {}
 
-    def _HMiner(self, o1, o2) -> int:
+    def _HMiner(self, item):
         """
-        A Function that sort all FFI-list in ascending order of Support
-
-        :param o1: First FFI-list
+        A Function that gives the key sorting the items in ascending order of TWU, ties broken by the item
 
-        :type o1: _FFList
+        :param item: name of an item
 
-        :param o2: Second FFI-list
+        :type item: str
 
-        :type o1: _FFList
+        :return: the sort key of the item
 
-        :return: Comparision Value
-
-        :rtype: int
+        :rtype: tuple
         """
-        compare = self._mapOfTWU[o1.item] - self._mapOfTWU[o2.item]
-        if compare == 0:
-            return int(o1.item) - int(o2.item)
-        else:
-            return compare
+        if item.isdigit():
+            return self._mapOfTWU[item], 0, int(item), ''
+        return self._mapOfTWU[item], 1, 0, item
 
     def _creteItemsets(self):
         """
@@ -363,85 +348,57 @@ class HMiner(_ab._utilityPatterns):
         self._startTime = _ab._time.time()
         self._creteItemsets()
         self._finalPatterns = {}
-        for line in range(len(self._transactions)):
-            items_str = self._transactions[line]
-            utility_str = self._utilities[line]
-            transUtility = self._utilitySum[line]
-            for i in range(0, len(items_str)):
-                item = items_str[i]
-                twu = self._mapOfTWU.get(item)
-                if twu == None:
-                    twu = transUtility
-                else:
-                    twu += transUtility
-                self._mapOfTWU[item] = twu
-        listOfCUList = []
-        hashTable = {}
-        mapItemsToCUList = {}
+        codes = {}
+        lengths = _np.fromiter((len(items) for items in self._transactions), dtype=_np.int64,
+                               count=len(self._transactions))
+        items = _np.fromiter((codes.setdefault(item, len(codes)) for items in self._transactions for item in items),
+                             dtype=_np.int64, count=int(lengths.sum()))
+        names = list(codes)
+        utilities = _np.fromiter((int(self._utilities[line][i]) for line in range(len(self._transactions))
+                                  for i in range(lengths[line])), dtype=_np.int64, count=int(lengths.sum()))
+        transactionUtilities = _np.asarray(self._utilitySum, dtype=_np.int64)
+        twu = _np.zeros(len(names), dtype=_np.int64)
+        _np.add.at(twu, items, _np.repeat(transactionUtilities, lengths))
+        self._mapOfTWU = dict(zip(names, twu.tolist()))
         minutil = self._minUtil
-        for item in self._mapOfTWU.keys():
-            if self._mapOfTWU.get(item) >= self._minUtil:
-                uList = _CUList(item)
-                mapItemsToCUList[item] = uList
-                listOfCUList.append(uList)
-        listOfCUList.sort(key=_ab._functools.cmp_to_key(self._HMiner))
-        tid = 1
-        for line in range(len(self._transactions)):
-            items = self._transactions[line]
-            utilities = self._utilities[line]
-            ru = 0
-            newTwu = 0
-            tx_key = []
-            revisedTrans = []
-            for i in range(0, len(items)):
-                pair = _Pair()
-                pair.item = items[i]
-                pair.utility = int(utilities[i])
-                if self._mapOfTWU.get(pair.item) >= self._minUtil:
-                    revisedTrans.append(pair)
-                    tx_key.append(pair.item)
-                    newTwu += pair.utility
-            revisedTrans.sort(key=_ab._functools.cmp_to_key(self._HMiner))
-            tx_key1 = tuple(tx_key)
-            if len(revisedTrans) > 0:
-                if tx_key1 not in hashTable.keys():
-                    hashTable[tx_key1] = len(mapItemsToCUList[revisedTrans[len(revisedTrans) - 1].item].elements)
-                    for i in range(len(revisedTrans) - 1, -1, -1):
-                        pair = revisedTrans[i]
-                        cuListoFItems = mapItemsToCUList.get(pair.item)
-                        element = _Element(tid, pair.utility, ru, 0, 0)
-                        if i > 0:
-                            element.ppos = len(mapItemsToCUList[revisedTrans[i - 1].item].elements)
-                        else:
-                            element.ppos = - 1
-                        cuListoFItems.addElements(element)
-                        ru += pair.utility
-                else:
-                    pos = hashTable[tx_key1]
-                    ru = 0
-                    for i in range(len(revisedTrans) - 1, -1, -1):
-                        cuListoFItems = mapItemsToCUList[revisedTrans[i].item]
-                        cuListoFItems.elements[pos].nu += revisedTrans[i].utility
-                        cuListoFItems.elements[pos].nru += ru
-                        cuListoFItems.sumnu += revisedTrans[i].utility
-                        cuListoFItems.sumnru += ru
-                        ru += revisedTrans[i].utility
-                        pos = cuListoFItems.elements[pos].ppos
-                    # EUCS
-            for i in range(len(revisedTrans) - 1, -1, -1):
-                pair = revisedTrans[i]
-                mapFMAPItem = self._mapFMAP.get(pair.item)
-                if mapFMAPItem == None:
-                    mapFMAPItem = {}
-                    self._mapFMAP[pair.item] = mapFMAPItem
-                for j in range(i + 1, len(revisedTrans)):
-                    pairAfter = revisedTrans[j]
-                    twuSUm = mapFMAPItem.get(pairAfter.item)
-                    if twuSUm is None:
-                        mapFMAPItem[pairAfter.item] = newTwu
-                    else:
-                        mapFMAPItem[pairAfter.item] = twuSUm + newTwu
-            tid += 1
+        promising = sorted((names[code] for code in _np.flatnonzero(twu >= self._minUtil).tolist()), key=self._HMiner)
+        rank = _np.zeros(len(names), dtype=_np.int64)
+        rank[[codes[item] for item in promising]] = _np.arange(1, len(promising) + 1)
+        self._itemNames = [None] + promising
+        rows = _np.repeat(_np.arange(len(lengths)), lengths)
+        ranks = rank[items]
+        kept = ranks > 0
+        rows, ranks, utilities = rows[kept], ranks[kept], utilities[kept]
+        order = _np.lexsort((ranks, rows))
+        rows, ranks, utilities = rows[order], ranks[order], utilities[order]
+        lengths = _np.bincount(rows, minlength=len(lengths))
+        starts = _np.cumsum(lengths) - lengths
+        newTwu = _np.zeros(len(lengths), dtype=_np.int64)
+        _np.add.at(newTwu, rows, utilities)
+        self._useEUCS(ranks, lengths, starts, newTwu, len(promising) + 1)
+        hashTable = {}
+        groupOf = _np.zeros(len(lengths), dtype=_np.int64)
+        lines = _np.flatnonzero(lengths)
+        for line in lines.tolist():
+            key = ranks[starts[line]:starts[line] + lengths[line]].tobytes()
+            groupOf[line] = hashTable.setdefault(key, len(hashTable))
+        leaders = lines[_np.unique(groupOf[lines], return_index=True)[1]]
+        group = groupOf[rows]
+        leaderLengths = lengths[leaders]
+        offsets = _np.cumsum(leaderLengths) - leaderLengths
+        nu = _np.zeros(int(leaderLengths.sum()), dtype=_np.int64)
+        _np.add.at(nu, offsets[group] + _np.arange(len(rows)) - starts[rows], utilities)
+        cumulative = _np.cumsum(nu)
+        nru = _np.repeat(cumulative[offsets + leaderLengths - 1], leaderLengths) - cumulative
+        isLeader = rows == leaders[group]
+        leaderRows, leaderRanks = rows[isLeader], ranks[isLeader]
+        order = _np.argsort(leaderRanks, kind='stable')
+        counts = _np.bincount(leaderRanks, minlength=len(promising) + 1)[1:]
+        split = _np.cumsum(counts)[:-1]
+        listOfCUList = [_CUList(item + 1, tids, nus, nrus, _np.zeros(len(tids), dtype=_np.int64))
+                        for item, (tids, nus, nrus) in enumerate(zip(_np.split(leaderRows[order] + 1, split),
+                                                                     _np.split(nu[order], split),
+                                                                     _np.split(nru[order], split)))]
         self._ExploreSearchTree([], listOfCUList, minutil)
         self._endTime = _ab._time.time()
         process = _ab._psutil.Process(_ab._os.getpid())
@@ -451,6 +408,37 @@ class HMiner(_ab._utilityPatterns):
         self._memoryRSS = process.memory_info().rss
         print("High Utility patterns were generated successfully using HMiner algorithm")
 
+    def _useEUCS(self, ranks, lengths, starts, newTwu, width):
+        """
+        A method to build the EUCS, the TWU of every pair of items occurring together, as sorted pair keys and sums.
+        The pairs of the transactions having the same length are taken at once from the upper triangle of their items.
+        :parm ranks: the promising items of all transactions, sorted inside every transaction
+        :type ranks: numpy.ndarray
+        :parm lengths: the number of promising items of every transaction
+        :type lengths: numpy.ndarray
+        :parm starts: the position of the first item of every transaction
+        :type starts: numpy.ndarray
+        :parm newTwu: the utility of the promising items of every transaction
+        :type newTwu: numpy.ndarray
+        :parm width: one more than the largest rank
+        :type width: int
+        """
+        keys, sums, pending = _empty, _empty, []
+        for length in _np.unique(lengths[lengths > 1]).tolist():
+            first, second = _np.triu_indices(length, 1)
+            lines = _np.flatnonzero(lengths == length)
+            step = max(1, _maxCells // len(first))
+            for chunk in range(0, len(lines), step):
+                block = lines[chunk:chunk + step]
+                entries = starts[block, None] + _np.arange(length)
+                pending.append(((ranks[entries[:, first]] * width + ranks[entries[:, second]]).ravel(),
+                                _np.repeat(newTwu[block], len(first))))
+                if sum(len(pair[0]) for pair in pending) >= _maxCells:
+                    keys, sums = _sumPairs(keys, sums, pending)
+                    pending = []
+        self._eucsKeys, self._eucsValues = _sumPairs(keys, sums, pending)
+        self._eucsWidth = width
+
     def _ExploreSearchTree(self, prefix, uList, minutil):
         """
         A method to find all high utility itemSets
@@ -475,9 +463,13 @@ class HMiner(_ab._utilityPatterns):
 
     def _construcCUL(self, x, culs, st, minutil, length):
         """
-        A method to construct CUL's database
+        A method to construct CUL's database. Every element of x is joined on tid with every extension at once: the
+        candidate lists are matched by blocks with a searchsorted of the tids of x, the LA-prune drops an extension at
+        the first element where the utility of x lost in the transactions without it brings the bound under minutil,
+        and the transactions containing every remaining extension go to the closed sums through _UpdateCLosed while
+        the others become elements merged on their set of extensions by _updateElement.
         :parm x: Compact utility list
-        :type x: Node
+        :type x: _CUList
         :parm culs:list of Compact utility list
         :type culs:lists
         :parm st: starting pos of culs
@@ -489,147 +481,139 @@ class HMiner(_ab._utilityPatterns):
         :return: projectd database of list X
         :rtype: list
         """
-        excul = []
-        lau = []
-        cutil = []
-        ey_tid = []
-        for i in range(0, len(culs)):
-            uList = _CUList(culs[i].item)
-            excul.append(uList)
-            lau.append(0)
-            cutil.append(0)
-            ey_tid.append(0)
-        sz = len(culs) - (st + 1)
-        exSZ = sz
-        for j in range(st + 1, len(culs)):
-            mapOfTWUF = self._mapFMAP[x.item]
-            if mapOfTWUF != None:
-                twuf = mapOfTWUF.get(culs[j].item)
-                if twuf != None and twuf < minutil:
-                    excul[j] = None
-                    exSZ = sz - 1
-                else:
-                    uList = _CUList(culs[j].item)
-                    excul[j] = uList
-                    ey_tid[j] = 0
-                    lau[j] = x.sumCu + x.sumCru + x.sumnu + x.sumnru
-                    cutil[j] = x.sumCu + x.sumCru
-        hashTable = {}
-        for ex in x.elements:
-            newT = []
-            for j in range(st + 1, len(culs)):
-                if excul[j] is None:
-                    continue
-                eylist = culs[j].elements
-                while ey_tid[j] < len(eylist) and eylist[ey_tid[j]].tid < ex.tid:
-                    ey_tid[j] = ey_tid[j] + 1
-                if ey_tid[j] < len(eylist) and eylist[ey_tid[j]].tid == ex.tid:
-                    newT.append(j)
-                else:
-                    lau[j] = lau[j] - ex.nu - ex.nru
-                    if lau[j] < minutil:
-                        excul[j] = None
-                        exSZ = exSZ - 1
-            if len(newT) == exSZ:
-                self._UpdateCLosed(x, culs, st, excul, newT, ex, ey_tid, length)
-            else:
-                if len(newT) == 0:
-                    continue
-                ru = 0
-                newT1 = tuple(newT)
-                if newT1 not in hashTable.keys():
-                    hashTable[newT1] = len(excul[newT[len(newT) - 1]].elements)
-                    for i in range(len(newT) - 1, -1, -1):
-                        cuListoFItems = excul[newT[i]]
-                        y = culs[newT[i]].elements[ey_tid[newT[i]]]
-                        element = _Element(ex.tid, ex.nu + y.nu - ex.pu, ru, ex.nu, 0)
-                        if i > 0:
-                            element.ppos = len(excul[newT[i - 1]].elements)
-                        else:
-                            element.ppos = - 1
-                        cuListoFItems.addElements(element)
-                        ru += y.nu - ex.pu
-                else:
-                    dppos = hashTable[newT1]
-                    self._updateElement(x, culs, st, excul, newT, ex, dppos, ey_tid)
-            for j in range(st + 1, len(culs)):
-                cutil[j] = cutil[j] + ex.nu + ex.nru
+        extensions = culs[st + 1:]
+        count = len(extensions)
+        if count == 0 or x.sumCu + x.sumCru + x.sumnu + x.sumnru < minutil:
+            return []
+        items = _np.fromiter((y.item for y in extensions), dtype=_np.int64, count=count)
+        pairKeys = x.item * self._eucsWidth + items
+        positions = _np.searchsorted(self._eucsKeys, pairKeys)
+        positions[positions == len(self._eucsKeys)] = 0
+        known = self._eucsKeys[positions] == pairKeys if len(self._eucsKeys) else _np.zeros(count, dtype=bool)
+        active = _np.flatnonzero(~(known & (self._eucsValues[positions] < minutil)))
+        size = len(x)
+        lau = x.sumCu + x.sumCru + x.sumnu + x.sumnru
+        weights = x.nu + x.nru
+        prunedAt = _np.full(count, -1, dtype=_np.int64)
+        prunedAt[active] = size
+        pairRows, pairExtensions, pairUtilities = [_empty], [_empty], [_empty]
+        step = max(1, _maxCells // max(size, 1))
+        for first in range(0, len(active), step):
+            block = active[first:first + step]
+            found = _np.zeros((len(block), size), dtype=bool)
+            located = _np.zeros((len(block), size), dtype=_np.int64)
+            for row, j in enumerate(block.tolist()):
+                tids = extensions[j].tids
+                if len(tids):
+                    located[row] = _np.searchsorted(tids, x.tids)
+                    _np.minimum(located[row], len(tids) - 1, out=located[row])
+                    found[row] = tids[located[row]] == x.tids
+            lost = _np.cumsum(_np.where(found, 0, weights), axis=1)
+            pruned = lau - lost < minutil
+            hasPruned = pruned.any(axis=1)
+            if hasPruned.any():
+                prunedAt[block[hasPruned]] = pruned[hasPruned].argmax(axis=1)
+            found &= _np.arange(size) < prunedAt[block][:, None]
+            rows, columns = _np.nonzero(found)
+            pairRows.append(columns)
+            pairExtensions.append(block[rows])
+            pairUtilities.append(_np.concatenate([extensions[j].nu[located[row][found[row]]]
+                                                  for row, j in enumerate(block.tolist())] + [_empty]))
+        pairRows = _np.concatenate(pairRows)
+        pairExtensions = _np.concatenate(pairExtensions)
+        pairUtilities = _np.concatenate(pairUtilities)
+        order = _np.lexsort((pairExtensions, pairRows))
+        pairRows, pairExtensions, pairUtilities = pairRows[order], pairExtensions[order], pairUtilities[order]
+        newT = _np.bincount(pairRows, minlength=size)
+        exSZ = len(active) - _np.searchsorted(_np.sort(prunedAt[active]), _np.arange(size), side='right')
+        closed = (newT == exSZ)[pairRows]
+        gains = pairUtilities - x.pu[pairRows]
+        cumulative = _np.cumsum(gains)
+        ends = _np.cumsum(newT) - 1
+        nru = cumulative[ends[pairRows]] - cumulative
+        nu = x.nu[pairRows] + gains
+        sumCu = _np.zeros(count, dtype=_np.int64)
+        sumCru = _np.zeros(count, dtype=_np.int64)
+        sumCpu = _np.zeros(count, dtype=_np.int64)
+        self._UpdateCLosed(x, pairRows[closed], pairExtensions[closed], nu[closed], nru[closed], sumCu, sumCru, sumCpu)
+        excul = self._updateElement(x, extensions, pairRows[~closed], pairExtensions[~closed], nu[~closed],
+                                    nru[~closed])
         filter_culs = []
-        for j in range(st + 1, len(culs)):
-            if cutil[j] < minutil or excul[j] is None:
-                continue
-            else:
-                if length > 1:
-                    excul[j].sumCu += culs[j].sumCu + x.sumCu - x.sumCpu
-                    excul[j].sumCru += culs[j].sumCru
-                    excul[j].sumCpu += x.sumCu
-                filter_culs.append(excul[j])
+        for j in _np.flatnonzero(prunedAt == size).tolist():
+            cul = excul[j]
+            cul.sumCu, cul.sumCru, cul.sumCpu = int(sumCu[j]), int(sumCru[j]), int(sumCpu[j])
+            if length > 1:
+                cul.sumCu += extensions[j].sumCu + x.sumCu - x.sumCpu
+                cul.sumCru += extensions[j].sumCru
+                cul.sumCpu += x.sumCu
+            filter_culs.append(cul)
         return filter_culs
 
-    def _UpdateCLosed(self, x, culs, st, excul, newT, ex, ey_tid, length):
+    def _UpdateCLosed(self, x, rows, extensions, nu, nru, sumCu, sumCru, sumCpu):
         """
-        A method to update closed values
+        A method to update closed values with the transactions of x that contain every remaining extension
         :parm x: Compact utility list
-        :type x: lists
-        :parm culs:list of Compact utility list
-        :type culs:lists
-        :parm st: starting pos of culs
-        :type st:int
-        :parm excul: list of culs
-        :type excul: list
-        :parm newT:transaction to be updated
-        :type newT:list
-        :parm ex: element ex
-        :type ex:element
-        :parm ey_tid:list of tss
-        :type ey_tid:ts
-        :parm length: length of x
-        :type length:int
-        """
-        nru = 0
-        for j in range(len(newT) - 1, -1, -1):
-            ey = culs[newT[j]]
-            eyy = ey.elements[ey_tid[newT[j]]]
-            excul[newT[j]].sumCu += ex.nu + eyy.nu - ex.pu
-            excul[newT[j]].sumCru += nru
-            excul[newT[j]].sumCpu += ex.nu
-            nru = nru + eyy.nu - ex.pu
-
-    def _updateElement(self, z, culs, st, excul, newT, ex, duppos, ey_tid):
+        :type x: _CUList
+        :parm rows: the element of x of every joined pair
+        :type rows: numpy.ndarray
+        :parm extensions: the extension of every joined pair
+        :type extensions: numpy.ndarray
+        :parm nu: the utility of x extended in the transaction
+        :type nu: numpy.ndarray
+        :parm nru: the remaining utility of the following extensions in the transaction
+        :type nru: numpy.ndarray
+        :parm sumCu: closed utility of every extension, updated in place
+        :type sumCu: numpy.ndarray
+        :parm sumCru: closed remaining utility of every extension, updated in place
+        :type sumCru: numpy.ndarray
+        :parm sumCpu: closed prefix utility of every extension, updated in place
+        :type sumCpu: numpy.ndarray
+        """
+        _np.add.at(sumCu, extensions, nu)
+        _np.add.at(sumCru, extensions, nru)
+        _np.add.at(sumCpu, extensions, x.nu[rows])
+
+    def _updateElement(self, x, extensions, rows, columns, nu, nru):
+        """
+        A method to build the elements of the extensions, merging the elements of x that are joined with the same set
+        of extensions. The set of every element of x is packed as a bitset so that the duplicates are found by a single
+        np.unique, and every merged element keeps the tid of the first element of its group.
+        :parm x: Compact utility list
+        :type x: _CUList
+        :parm extensions: the candidate lists
+        :type extensions: list
+        :parm rows: the element of x of every joined pair, grouped by element
+        :type rows: numpy.ndarray
+        :parm columns: the extension of every joined pair
+        :type columns: numpy.ndarray
+        :parm nu: the utility of x extended in the transaction
+        :type nu: numpy.ndarray
+        :parm nru: the remaining utility of the following extensions in the transaction
+        :type nru: numpy.ndarray
+        :return: the list of every extension
+        :rtype: list
         """
-        A method to updates vales for duplicates
-
-        :Attributes:
-
-        :parm z: Compact utility list
-        :type z: lists
-        :parm culs:list of Compact utility list
-        :type culs:lists
-        :parm st: starting pos of culs
-        :type st:int
-        :parm excul:list of culs
-        :type excul:list
-        :parm newT:transaction to be updated
-        :type newT:list
-        :parm ex: element ex
-        :type ex:element
-        :parm duppos: position of z in excul
-        :type duppos:int
-        :parm ey_tid:list of tss
-        :type ey_tid:ts
-        """
-        nru = 0
-        pos = duppos
-        for j in range(len(newT) - 1, -1, -1):
-            ey = culs[newT[j]]
-            eyy = ey.elements[ey_tid[newT[j]]]
-            excul[newT[j]].elements[pos].nu += ex.nu + eyy.nu - ex.pu
-            excul[newT[j]].sumnu += ex.nu + eyy.nu - ex.pu
-            excul[newT[j]].elements[pos].nru += nru
-            excul[newT[j]].sumnru += nru
-            excul[newT[j]].elements[pos].pu += ex.nu
-            nru = nru + eyy.nu - ex.pu
-            pos = excul[newT[j]].elements[pos].ppos
+        count = len(extensions)
+        if len(rows) == 0:
+            return [_CUList(y.item) for y in extensions]
+        elements, rowOfPair = _np.unique(rows, return_inverse=True)
+        width = (count + 7) // 8
+        bitsets = _np.zeros((len(elements), width), dtype=_np.uint8)
+        _np.bitwise_or.at(bitsets, (rowOfPair, columns >> 3), (128 >> (columns & 7)).astype(_np.uint8))
+        _, firsts, groupOf = _np.unique(bitsets.view(_np.dtype((_np.void, width))).ravel(), return_index=True,
+                                        return_inverse=True)
+        groupOf = _np.argsort(_np.argsort(firsts))[groupOf.ravel()]
+        leaders = elements[_np.sort(firsts)]
+        groups = len(leaders)
+        keys, inverse = _np.unique(columns * groups + groupOf[rowOfPair], return_inverse=True)
+        sums = _np.zeros((3, len(keys)), dtype=_np.int64)
+        _np.add.at(sums[0], inverse, nu)
+        _np.add.at(sums[1], inverse, nru)
+        _np.add.at(sums[2], inverse, x.nu[rows])
+        tids = x.tids[leaders[keys % groups]]
+        bounds = _np.concatenate(([0], _np.cumsum(_np.bincount(keys // groups, minlength=count)))).tolist()
+        return [_CUList(y.item, tids[start:end], sums[0, start:end], sums[1, start:end], sums[2, start:end])
+                for y, start, end in zip(extensions, bounds[:-1], bounds[1:])]
 
     def _saveitemSet(self, prefix, prefixLen, item, utility):
         """
@@ -646,8 +630,8 @@ class HMiner(_ab._utilityPatterns):
         self._huiCount += 1
         res = str()
         for i in range(0, prefixLen):
-            res += str(prefix[i]) + "\t"
-        res += str(item)
+            res += self._itemNames[prefix[i]] + "\t"
+        res += self._itemNames[item]
         self._finalPatterns[str(res)] = str(utility)
 
     def getPatternsAsDataFrame(self):
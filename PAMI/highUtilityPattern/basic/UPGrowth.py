@@ -55,282 +55,119 @@ Copyright (C)  2021 Rage Uday Kiran
 from PAMI.highUtilityPattern.basic import abstract as _ab
 from typing import List, Dict, Tuple, Set, Union, Any, Generator
 from deprecated import deprecated
-
-
-class _UPItem:
-    """
-    A class to represent the UPItem
-
-    :Attributes:
-
-        name: int
-            name of item
-        utility: int
-            utility of item
-
-    :Methods:
-
-    getUtility()
-        method to get node utility
-    setUtility()
-        method to set node utility
-    getName()
-        method to get name of particular item
-    """
-    name = 0
-    utility = 0
-
-    def __init__(self, name: int, utility: int):
-        self.name = name
-        self.utility = utility
-
-    def getUtility(self) -> int:
-        """
-        method to get node utility
-        :return: Utility value of Node
-        :rtype: int
-        """
-        return self.utility
-
-    def setUtility(self, utility: int) -> None:
-        """
-        method to set node utility
-        :param utility: the utility to set
-        :type utility: int
-        :return: None
-        """
-        self.utility = utility
-
-    def getName(self) -> int:
-        """
-        method to get name for particular item
-        :return: name of particular item
-        :rtype: int
-        """
-        return self.name
-
-
-class _UPNode:
-    """
-    A class that represent UPNode
-
-    :Attributes:
-
-        itemId :int
-            name of the item
-        count: int
-            represent the count of items
-        nodeUtility: int
-            Represent the utility of current node
-        nodeLink: UPNode
-            represent the link to next node with same itemid
-        childs: list
-            link to next node with same item id (for the header table)
-    :Methods:
-
-        getChildWithId( name):
-            method to get child node Return the immediate child of this node having a given name
-    """
-    itemId = -1
-    count = 1
-    nodeUtility = 0
-    childs = []
-    nodeLink = -1
-    parent = -1
-
-    def __init__(self) -> None:
-        self.itemId = -1
-        self.count = 1
-        self.nodeUtility = 0
-        self.childs = []
-        self.nodeLink = -1
-        self.parent = -1
-
-    def getChildWithId(self, name: int) -> int:
-        """
-        method to get child node Return the immediate child of this node having a given name
-        :param name: represent id of item
-        :type name: int
-        :return: id of child node with same itemid
-        :rtype: int
-        """
-        for child in self.childs:
-            if child.itemId == name:
-                return child
-        return -1
+import numpy as _np
 
 
 class _UPTree:
     """
-    A class to represent UPTree
+    A class to represent UPTree. The nodes are stored in parallel arrays indexed by node number, node 0 being the
+    root. The tree is built at once from a batch of paths, one level at a time: the children of a level are found by
+    sorting the (parent, item) keys of the paths, so identical prefixes are merged without a per-node child search,
+    and the node-links of an item are kept as an array of its nodes.
 
     :Attributes:
 
+        itemIds: numpy.ndarray
+            Item of every node
+        counts: numpy.ndarray
+            Number of transactions passing through every node
+        nodeUtilities: numpy.ndarray
+            Estimated utility of every node
+        minimumUtilities: numpy.ndarray
+            Minimal utility of the item of every node over the transactions passing through it
+        parents: numpy.ndarray
+            Parent of every node, -1 for the root
         headerList: list
             Lists of items in the header table
         mapItemNodes: map
-            Maps that indicates the last node for each item using the node links
-        root : UPNode
-            root of the tree
-        mapItemToLastNode: map
-            List of pairs (item, Utility) of the header table
+            Maps every item to the array of its nodes
         hasMoreThanOnePath :bool
             Variable that indicate if the tree has more than one path
 
     :Methods:
 
-        addTransaction(transaction,rtu)
-            To add a transaction (for initial construction)
-        addLocalTransaction(localPath, pathUtility, mapItemToMinimumItemUtility, pathCount)
-            Add a transaction to the UP-Tree (for a local UP-Tree)
-        insertNewNode(currentLocalNode, itemName, nodeUtility)
-            Insert a new node in the UP-Tree as child of a parent node
+        addPaths(rows, items, nodeUtilities, minimumUtilities, counts)
+            Add a batch of paths to the empty tree
         createHeaderList(mapItemToTwu)
             Method for creating the list of items in the header table, in descending order of TWU or path utility.
     """
-    headerList = []
-    hasMoreThanOnePath = False
-    mapItemNodes = {}
-    root = _UPNode()
-    mapItemToLastNode = {}
 
     def __init__(self) -> None:
+        self.itemIds = _np.full(1, -1, dtype=_np.int64)
+        self.counts = _np.zeros(1, dtype=_np.int64)
+        self.nodeUtilities = _np.zeros(1, dtype=_np.int64)
+        self.minimumUtilities = _np.zeros(1, dtype=_np.int64)
+        self.parents = _np.full(1, -1, dtype=_np.int64)
         self.headerList = []
         self.hasMoreThanOnePath = False
-        self.mapItemToLastNode = {}
         self.mapItemNodes = {}
-        self.root = _UPNode()
 
-    def addTransaction(self, transaction: list, RTU: int) -> int:
-        """
-        A Method to add new Transaction to tree
-        :param transaction: the reorganised transaction
-        :type transaction: list
-        :param RTU :reorganised transaction utility
-        :type RTU: int
-        :return: the number of transactions added
-        :rtype: int
-        """
-        currentNode = self.root
-        NumberOfNodes = 0
-        RemainingUtility = 0
-        # for idx, item in enumerate(transaction):
-        #     itemName = item.name
-        #     child = currentNode.getChildWithId(itemName)
-        #     RemainingUtility += item.utility
-        #     if child == -1:
-        #         NumberOfNodes += 1
-        #         nodeUtility = RemainingUtility
-        #         currentNode = self.insertNewNode(currentNode, itemName, nodeUtility)
-        #     else:
-        #         child.count += 1
-        #         child.nodeUtility += RemainingUtility
-        #         currentNode = child
-        for idx, item in enumerate(transaction):
-            for k in range(idx + 1, len(transaction)):
-                RemainingUtility += transaction[k].getUtility()
-            itemName = item.name
-            child = currentNode.getChildWithId(itemName)
-            if child == -1:
-                NumberOfNodes += 1
-                nodeUtility = RTU - RemainingUtility
-                RemainingUtility = 0
-                currentNode = self.insertNewNode(currentNode, itemName, nodeUtility)
-            else:
-                currentNU = child.nodeUtility
-                nodeUtility = currentNU + (RTU - RemainingUtility)
-                RemainingUtility = 0
-                child.count += 1
-                child.nodeUtility = nodeUtility
-                currentNode = child
-        return NumberOfNodes
-
-    def addLocalTransaction(self, localPath: list, pathUtility: int, mapItemToMinimumItemutility: dict, pathCount: int) -> int:
-        """
-        A Method to add addLocalTransaction to tree
-        :param localPath: The path to insert
-        :type localPath: list
-        :param pathUtility: the Utility of path
-        :type pathUtility: int
-        :param mapItemToMinimumItemutility: the map storing minimum item utility
-        :type mapItemToMinimumItemutility: map
-        :param pathCount: the Path count
-        :type pathCount: int
-        :return: The number of nodes in the tree that have been added or removed from the tree
+    def __len__(self) -> int:
+        return len(self.itemIds) - 1
+
+    def addPaths(self, rows: _np.ndarray, items: _np.ndarray, nodeUtilities: _np.ndarray,
+                 minimumUtilities: _np.ndarray, counts: _np.ndarray) -> int:
+        """
+        A Method to add a batch of paths to the empty tree. Every entry is one item of a path, the entries being
+        sorted by path and, within a path, from the root downwards.
+        :param rows: the path of every entry
+        :type rows: numpy.ndarray
+        :param items: the item of every entry
+        :type items: numpy.ndarray
+        :param nodeUtilities: the utility added to the node of every entry
+        :type nodeUtilities: numpy.ndarray
+        :param minimumUtilities: the minimal utility of the item of every entry over the transactions of its path
+        :type minimumUtilities: numpy.ndarray
+        :param counts: the number of transactions sharing the path of every entry
+        :type counts: numpy.ndarray
+        :return: the number of nodes created
         :rtype: int
         """
-        currentLocalNode = self.root
-        RemainingUtility = 0
-        NumberOfNodes = 0
-        # for item in localPath:
-        #     RemainingUtility += mapItemToMinimumItemutility[item] * pathCount
-        # for item in localPath:
-        #     RemainingUtility -= mapItemToMinimumItemutility[item] * pathCount
-        #     child = currentLocalNode.getChildWithId(item)
-        #     if child == -1:
-        #         NumberOfNodes += 1
-        #         currentLocalNode = self.insertNewNode(currentLocalNode, item, pathUtility - RemainingUtility)
-        #     else:
-        #         child.count += 1
-        #         child.nodeUtility += (pathUtility - RemainingUtility)
-        #         currentLocalNode = child
-        for idx, item in enumerate(localPath):
-            for k in range(idx + 1, len(localPath)):
-                search = localPath[k]
-                RemainingUtility += mapItemToMinimumItemutility[search] * pathCount
-            child = currentLocalNode.getChildWithId(item)
-            if child == -1:
-                NumberOfNodes += 1
-                nodeUtility = pathUtility - RemainingUtility
-                RemainingUtility = 0
-                currentLocalNode = self.insertNewNode(currentLocalNode, item, nodeUtility)
-            else:
-                currentNU = child.nodeUtility
-                nodeUtility = currentNU + (pathUtility - RemainingUtility)
-                RemainingUtility = 0
-                child.count += 1
-                child.nodeUtility = nodeUtility
-                currentLocalNode = child
-        return NumberOfNodes
-
-    def insertNewNode(self, currentlocalNode: _UPNode, itemName: int, nodeUtility: int) -> _UPNode:
-        """
-        A method to Insert a new node in the UP-Tree as child of a parent node
-        :param currentlocalNode: The parent Node
-        :type currentlocalNode: UPNode
-        :param itemName: name of item in new Node
-        :type itemName: int
-        :param nodeUtility: Utility of new node
-        :type nodeUtility: int
-        :return: The newly created UPNode
-        :rtype: _UPNode
-        """
-        newNode = _UPNode()
-        newNode.itemId = itemName
-        newNode.count = 1
-        newNode.nodeUtility = nodeUtility
-        newNode.parent = currentlocalNode
-        currentlocalNode.childs.append(newNode)
-        if not self.hasMoreThanOnePath and len(currentlocalNode.childs) > 1:
-            self.hasMoreThanOnePath = True
-        if itemName in self.mapItemNodes:
-            lastNode = self.mapItemToLastNode[itemName]
-            lastNode.nodeLink = newNode
-            self.mapItemToLastNode[itemName] = newNode
-        else:
-            self.mapItemNodes[itemName] = newNode
-            self.mapItemToLastNode[itemName] = newNode
-        return newNode
+        if len(rows) == 0:
+            return 0
+        names, codes = _np.unique(items, return_inverse=True)
+        width = len(names)
+        starts = _np.flatnonzero(_np.diff(rows, prepend=-1))
+        depths = _np.arange(len(rows)) - _np.repeat(starts, _np.diff(starts, append=len(rows)))
+        order = _np.argsort(depths, kind='stable')
+        bounds = _np.searchsorted(depths[order], _np.arange(depths[order[-1]] + 2))
+        current = _np.zeros(rows[-1] + 1, dtype=_np.int64)
+        pieces = [[self.itemIds], [self.counts], [self.nodeUtilities], [self.minimumUtilities], [self.parents]]
+        size = 1
+        for first, last in zip(bounds[:-1], bounds[1:]):
+            level = order[first:last]
+            levelRows = rows[level]
+            keys, inverse = _np.unique(current[levelRows] * width + codes[level], return_inverse=True)
+            levelCounts = _np.zeros(len(keys), dtype=_np.int64)
+            _np.add.at(levelCounts, inverse, counts[level])
+            levelUtilities = _np.zeros(len(keys), dtype=_np.int64)
+            _np.add.at(levelUtilities, inverse, nodeUtilities[level])
+            levelMinimums = _np.full(len(keys), _np.iinfo(_np.int64).max, dtype=_np.int64)
+            _np.minimum.at(levelMinimums, inverse, minimumUtilities[level])
+            for piece, values in zip(pieces, (names[keys % width], levelCounts, levelUtilities, levelMinimums,
+                                              keys // width)):
+                piece.append(values)
+            current[levelRows] = size + inverse
+            size += len(keys)
+        self.itemIds, self.counts, self.nodeUtilities, self.minimumUtilities, self.parents = \
+            [_np.concatenate(piece) for piece in pieces]
+        self.hasMoreThanOnePath = bool((_np.bincount(self.parents[1:]) > 1).any())
+        nodes = _np.argsort(self.itemIds[1:], kind='stable') + 1
+        sortedItems = self.itemIds[nodes]
+        itemBounds = _np.concatenate(([0], _np.flatnonzero(sortedItems[1:] != sortedItems[:-1]) + 1, [len(nodes)]))
+        self.mapItemNodes = {int(sortedItems[first]): nodes[first:last]
+                             for first, last in zip(itemBounds[:-1], itemBounds[1:])}
+        return size - 1
 
     def createHeaderList(self, mapItemToTwu: dict) -> None:
         """
-        A Method for creating the list of items in the header table, in descending order of TWU or path utility.
+        A Method for creating the list of items in the header table, in descending order of TWU or path utility, ties
+        being broken by item, the order the paths of the tree follow.
         :param mapItemToTwu: the Utilities of each item
         :type mapItemToTwu: map
         :return: None
         """
-        self.headerList = list(self.mapItemNodes.keys())
-        self.headerList = sorted(self.headerList, key=lambda x: mapItemToTwu[x], reverse=True)
+        self.headerList = sorted(self.mapItemNodes.keys(), key=lambda x: (-mapItemToTwu[x], x))
 
 
 class UPGrowth(_ab._utilityPatterns):
@@ -524,80 +361,57 @@ class UPGrowth(_ab._utilityPatterns):
         :return: None
         """
         self._startTime = _ab._time.time()
-        tree = _UPTree()
         self._creatingItemSets()
         self._finalPatterns = {}
+        self._MapItemToTwu = {}
+        self._MapItemToMinimumUtility = {}
+        self._MapItemsetsToUtilities = _ab._defaultdict(int)
+        self._phuis = []
+        self._NumberOfNodes = 0
+        self._ParentNumberOfNodes = 0
+        transactions = []
         for line in self._Database:
             line = line.split("\n")[0]
             transaction = line.strip().split(':')
-            items = transaction[0].split(self._sep)
+            items = [int(item) for item in transaction[0].split(self._sep)]
+            utilities = [int(utility) for utility in transaction[2].split(self._sep)]
             transactionUtility = int(transaction[1])
             for item in items:
-                Item = int(item)
-                if Item in self._MapItemToTwu:
-                    self._MapItemToTwu[Item] += transactionUtility
-                else:
-                    self._MapItemToTwu[Item] = transactionUtility
-        for line in self._Database:
-            line = line.split("\n")[0]
-            transaction = line.strip().split(':')
-            items = transaction[0].split(self._sep)
-            utilities = transaction[2].split(self._sep)
-            remainingUtility = 0
-            revisedTransaction = []
-            for idx, item in enumerate(items):
-                Item = int(item)
-                utility = int(utilities[idx])
-                if self._MapItemToTwu[Item] >= self._minUtil:
-                    element = _UPItem(Item, utility)
-                    revisedTransaction.append(element)
-                    remainingUtility += utility
-                    if Item in self._MapItemToMinimumUtility:
-                        minItemUtil = self._MapItemToMinimumUtility[Item]
-                        if minItemUtil >= utility:
-                            self._MapItemToMinimumUtility[Item] = utility
-                    else:
-                        self._MapItemToMinimumUtility[Item] = utility
-            revisedTransaction = sorted(revisedTransaction, key=lambda x: self._MapItemToTwu[x.name], reverse=True)
-            self._ParentNumberOfNodes += tree.addTransaction(revisedTransaction, remainingUtility)
+                self._MapItemToTwu[item] = self._MapItemToTwu.get(item, 0) + transactionUtility
+            transactions.append((items, utilities))
+        rows, items, utilities = [], [], []
+        for tid, (transactionItems, transactionUtilities) in enumerate(transactions):
+            for item, utility in zip(transactionItems, transactionUtilities):
+                if self._MapItemToTwu[item] >= self._minUtil:
+                    rows.append(tid)
+                    items.append(item)
+                    utilities.append(utility)
+        rows = _np.array(rows, dtype=_np.int64)
+        items = _np.array(items, dtype=_np.int64)
+        utilities = _np.array(utilities, dtype=_np.int64)
+        twu = _np.array([self._MapItemToTwu[item] for item in items.tolist()], dtype=_np.int64)
+        order = _np.lexsort((items, -twu, rows))
+        rows, items, utilities = rows[order], items[order], utilities[order]
+        prefixUtilities = _np.cumsum(utilities)
+        starts = _np.flatnonzero(_np.diff(rows, prepend=-1))
+        if len(rows):
+            prefixUtilities -= _np.repeat(prefixUtilities[starts] - utilities[starts],
+                                          _np.diff(starts, append=len(rows)))
+        tree = _UPTree()
+        self._ParentNumberOfNodes += tree.addPaths(rows, items, prefixUtilities, utilities,
+                                                   _np.ones(len(rows), dtype=_np.int64))
         tree.createHeaderList(self._MapItemToTwu)
-        alpha = []
-        self._finalPatterns = {}
-        # print("number of nodes in parent tree", self.ParentNumberOfNodes)
-        self._UPGrowth(tree, alpha)
-        # self.phuis = sorted(self.phuis, key=lambda x: len(x))
-        # print(self.phuis[0:10])
-        for line in self._Database:
-            line = line.split("\n")[0]
-            transaction = line.strip().split(':')
-            items = transaction[0].split(self._sep)
-            utilities = transaction[2].split(self._sep)
-            mapItemToUtility = {}
-            for idx, item in enumerate(items):
-                Item = int(item)
-                utility = int(utilities[idx])
-                if self._MapItemToTwu[Item] >= self._minUtil:
-                    mapItemToUtility[Item] = utility
-            for itemset in self._phuis:
-                l = len(itemset)
-                count = 0
-                utility = 0
-                for item in itemset:
-                    item = int(item)
-                    if item in mapItemToUtility:
-                        utility += mapItemToUtility[item]
-                        count += 1
-                if count == l:
-                    self._MapItemsetsToUtilities[tuple(itemset)] += utility
-
-        for itemset in self._phuis:
-            util = self._MapItemsetsToUtilities[tuple(itemset)]
-            if util >= self._minUtil:
-                s = str()
-                for item in itemset:
-                    s = s + str(item)
-                    s = s + "\t"
-                self._finalPatterns[s] = util
+        order = _np.lexsort((rows, items))
+        rows, items, utilities = rows[order], items[order], utilities[order]
+        itemBounds = _np.concatenate(([0], _np.flatnonzero(items[1:] != items[:-1]) + 1, [len(items)]))
+        if not len(items):
+            itemBounds = itemBounds[:1]
+        tidLists = {}
+        for first, last in zip(itemBounds[:-1].tolist(), itemBounds[1:].tolist()):
+            tidLists[int(items[first])] = (rows[first:last], utilities[first:last])
+            self._MapItemToMinimumUtility[int(items[first])] = int(utilities[first:last].min())
+        self._UPGrowth(tree, [])
+        self._computeUtilities(tidLists)
         self._endTime = _ab._time.time()
         process = _ab._psutil.Process(_ab._os.getpid())
         self._memoryUSS = float()
@@ -616,23 +430,21 @@ class UPGrowth(_ab._utilityPatterns):
         :return: None
         """
         for item in reversed(tree.headerList):
-            localTree = self._createLocalTree(tree, item)
-            node = tree.mapItemNodes[item]
-            ItemTotalUtility = 0
-            while node != -1:
-                ItemTotalUtility += node.nodeUtility
-                node = node.nodeLink
+            ItemTotalUtility = int(tree.nodeUtilities[tree.mapItemNodes[item]].sum())
             if ItemTotalUtility >= self._minUtil:
                 beta = alpha + [item]
                 self._phuis.append(beta)
-                # str1 = ' '.join(map(str, beta))
-                # self.finalPatterns[str1] = ItemTotalUtility
+                localTree = self._createLocalTree(tree, item)
                 if len(localTree.headerList) > 0:
                     self._UPGrowth(localTree, beta)
 
     def _createLocalTree(self, tree: _UPTree, item: int) -> _UPTree:
         """
-        A Method to Construct conditional pattern base
+        A Method to Construct conditional pattern base. The prefix paths of all the nodes of the item are collected
+        together by climbing the parent array one level at a time, reorganised, and added to the local tree in a
+        single batch. Following UP-Growth+, an unpromising item dropped from a path (DLU) and the items below a node
+        of the local tree (DLN) are discounted by the minimal node utilities of the path instead of the minimum item
+        utilities of the database.
         :param tree: the UPtree
         :type tree: UP Tree
         :param item: item that need to construct conditional patterns
@@ -640,42 +452,70 @@ class UPGrowth(_ab._utilityPatterns):
         :return: the conditional pattern based UPTree
         :rtype: _UPTree
         """
-        prefixPaths = []
-        path = tree.mapItemNodes[item]
-        itemPathUtility = {}
-        while path != -1:
-            nodeUtility = path.nodeUtility
-            if path.parent != -1:
-                prefixPath = []
-                prefixPath.append(path)
-                ParentNode = path.parent
-                while ParentNode.itemId != -1:
-                    prefixPath.append(ParentNode)
-                    itemName = ParentNode.itemId
-                    if itemName in itemPathUtility:
-                        itemPathUtility[itemName] += nodeUtility
-                    else:
-                        itemPathUtility[itemName] = nodeUtility
-                    ParentNode = ParentNode.parent
-                prefixPaths.append(prefixPath)
-            path = path.nodeLink
         localTree = _UPTree()
-        for prefixPath in prefixPaths:
-            pathUtility = prefixPath[0].nodeUtility
-            pathCount = prefixPath[0].count
-            localPath = []
-            for i in range(1, len(prefixPath)):
-                node = prefixPath[i]
-                if itemPathUtility[node.itemId] >= self._minUtil:
-                    localPath.append(node.itemId)
-                else:
-                    pathUtility -= pathCount * self._MapItemToMinimumUtility[node.itemId]
-            localPath = sorted(localPath, key=lambda x: itemPathUtility[x], reverse=True)
-            self._NumberOfNodes += localTree.addLocalTransaction(localPath, pathUtility, self._MapItemToMinimumUtility,
-                                                                pathCount)
-        localTree.createHeaderList(itemPathUtility)
+        chain = tree.mapItemNodes[item]
+        rows, ancestors = [], []
+        paths = _np.arange(len(chain))
+        parents = tree.parents[chain]
+        while len(parents):
+            inner = parents > 0
+            paths, parents = paths[inner], parents[inner]
+            rows.append(paths)
+            ancestors.append(parents)
+            parents = tree.parents[parents]
+        rows = _np.concatenate(rows)
+        if len(rows) == 0:
+            return localTree
+        ancestors = _np.concatenate(ancestors)
+        names, inverse = _np.unique(tree.itemIds[ancestors], return_inverse=True)
+        pathUtilities = tree.nodeUtilities[chain]
+        itemPathUtility = _np.zeros(len(names), dtype=_np.int64)
+        _np.add.at(itemPathUtility, inverse, pathUtilities[rows])
+        pathCounts = tree.counts[chain]
+        decreases = pathCounts[rows] * tree.minimumUtilities[ancestors]
+        localUtility = itemPathUtility[inverse]
+        promising = localUtility >= self._minUtil
+        lost = _np.zeros(len(chain), dtype=_np.int64)
+        _np.add.at(lost, rows[~promising], decreases[~promising])
+        pathUtilities = pathUtilities - lost
+        kept = _np.flatnonzero(promising)
+        order = kept[_np.lexsort((tree.itemIds[ancestors[kept]], -localUtility[kept], rows[kept]))]
+        rows, ancestors, decreases = rows[order], ancestors[order], decreases[order]
+        if len(rows):
+            cumulative = _np.cumsum(decreases)
+            ends = _np.flatnonzero(_np.diff(rows, append=-1))
+            remaining = _np.repeat(cumulative[ends], _np.diff(ends, prepend=-1)) - cumulative
+            self._NumberOfNodes += localTree.addPaths(rows, tree.itemIds[ancestors], pathUtilities[rows] - remaining,
+                                                      tree.minimumUtilities[ancestors], pathCounts[rows])
+        localTree.createHeaderList(dict(zip(names.tolist(), itemPathUtility.tolist())))
         return localTree
 
+    def _computeUtilities(self, tidLists: dict) -> None:
+        """
+        Computes the exact utility of every potential high utility itemset by joining the tid-lists of its items.
+        The candidates are generated depth first, so the prefix of a candidate is the last candidate one item shorter.
+        :param tidLists: the transactions and utilities of every promising item
+        :type tidLists: dict
+        :return: None
+        """
+        prefixes = []
+        for itemset in self._phuis:
+            tids, utilities = tidLists[itemset[-1]]
+            if len(itemset) > 1:
+                prefixTids, prefixUtilities = prefixes[len(itemset) - 2]
+                tids, first, second = _np.intersect1d(prefixTids, tids, assume_unique=True, return_indices=True)
+                utilities = prefixUtilities[first] + utilities[second]
+            del prefixes[len(itemset) - 1:]
+            prefixes.append((tids, utilities))
+            util = int(utilities.sum())
+            self._MapItemsetsToUtilities[tuple(itemset)] = util
+            if util >= self._minUtil:
+                s = str()
+                for item in itemset:
+                    s = s + str(item)
+                    s = s + "\t"
+                self._finalPatterns[s] = util
+
     def PrintStats(self) -> None:
         """
         A Method to print number of phuis
@@ -56,15 +56,213 @@ import os
 import mmap
 import time
 import psutil
-from joblib import Parallel, delayed
+import pickle as _pickle
+import queue as _queue
+import traceback as _traceback
+import multiprocessing as _mp
+import numpy as np
 from deprecated import deprecated
 
 
 from PAMI.highUtilityPattern.parallel import abstract as _ab
+from PAMI.highUtilityPattern.basic.EFIM import _UtilityDatabase
+from PAMI.extras import sharedDatabase as _sd
+
+_shared = {}
+
+#: Seconds the parent waits for a result before it checks that the workers are still running.
+_pollInterval = 1.0
+
+
+class _RemoteTraceback(Exception):
+    """
+    The traceback of an exception raised in a worker process, attached as the cause of the exception raised again in
+    the parent.
+    """
+
+    def __init__(self, trace):
+        super().__init__(trace)
+        self.trace = trace
+
+    def __str__(self):
+        return '\n\n"""\n%s"""' % self.trace
+
+
+def _setDatabase(arrays, minUtil, width, primary, secondary):
+    """
+    Makes the base database and the first level of the search available to the search functions of this process.
+
+    :param arrays: the items, utilities and offsets of the base database
+    :type arrays: dict
+    :param minUtil: the minimum utility
+    :type minUtil: int
+    :param width: one more than the largest item
+    :type width: int
+    :param primary: the items to explore at the first level
+    :type primary: numpy.ndarray
+    :param secondary: the items to keep at the first level
+    :type secondary: numpy.ndarray
+    """
+    offsets = arrays['offsets']
+    _shared['database'] = _UtilityDatabase(arrays['items'], arrays['utilities'], offsets,
+                                           np.zeros(len(offsets) - 1, dtype=np.int64), width)
+    _shared['minUtil'] = minUtil
+    _shared['primary'] = primary
+    _shared['secondary'] = secondary
+
+
+def _attach(descriptors, minUtil, width, primary, secondary):
+    """
+    Attaches a worker process to the shared base database.
+
+    :param descriptors: dictionary of array name to (shared memory name, dtype, shape)
+    :type descriptors: dict
+    """
+    _shared.clear()
+    blocks, arrays = _sd.attach(descriptors)
+    _shared['blocks'] = blocks
+    _setDatabase(arrays, minUtil, width, primary, secondary)
+
+
+def _extend(database, secondary, item):
+    """
+    Projects a database on an item and computes the local and subtree utilities of the items that can follow it.
+
+    :param database: the projected database of the prefix
+    :type database: _UtilityDatabase
+    :param secondary: the secondary items of the prefix, in increasing order
+    :type secondary: numpy.ndarray
+    :param item: the item appended to the prefix
+    :type item: int
+    :return: the utility of the extended prefix, its projected database, its secondary and its primary items
+    :rtype: tuple
+    """
+    minUtil = _shared['minUtil']
+    utility, projected = database.project(item)
+    candidates = secondary[np.searchsorted(secondary, item, side='right'):]
+    if len(candidates) == 0 or len(projected) == 0:
+        return utility, projected, candidates[:0], candidates[:0]
+    isKept = np.zeros(projected.width, dtype=bool)
+    isKept[candidates] = True
+    kept = isKept[projected.items]
+    rows = projected._rows()[kept]
+    items = projected.items[kept]
+    prefixUtilities = projected.prefixUtilities[rows]
+    local = np.zeros(projected.width, dtype=np.int64)
+    subtree = np.zeros(projected.width, dtype=np.int64)
+    np.add.at(local, items, projected.transactionUtilities()[rows] + prefixUtilities)
+    np.add.at(subtree, items, projected.remainingUtilities(kept)[kept] + prefixUtilities)
+    primary = subtree[candidates] >= minUtil
+    return utility, projected, candidates[primary | (local[candidates] >= minUtil)], candidates[primary]
+
+
+def _descend(prefix):
+    """
+    Rebuilds the projected database, the secondary and the primary items of a prefix from the base database.
+
+    :param prefix: items of the prefix in the order they were appended
+    :type prefix: tuple
+    :rtype: tuple
+    """
+    database, secondary, primary = _shared['database'], _shared['secondary'], _shared['primary']
+    for item in prefix:
+        _, database, secondary, primary = _extend(database, secondary, item)
+    return database, secondary, primary
+
+
+def _depthFirst(prefix, database, secondary, primary, low, high, patterns, steal):
+    """
+    Depth-first search of the extensions of prefix by primary[low:high]. Before every extension the unexplored part
+    of the range may be handed over to an idle worker through steal.
+
+    :param prefix: items of the prefix
+    :type prefix: list
+    :param patterns: list receiving (pattern, utility) of the high utility patterns found
+    :type patterns: list
+    :param steal: function(prefix, low, high) returning the new end of the range, or None
+    """
+    minUtil = _shared['minUtil']
+    position = low
+    while position < high:
+        if steal is not None:
+            high = steal(prefix, position + 1, high)
+        pattern = prefix + [int(primary[position])]
+        utility, projected, newSecondary, newPrimary = _extend(database, secondary, primary[position])
+        if utility >= minUtil:
+            patterns.append((tuple(pattern), utility))
+        if len(newPrimary) > 0:
+            _depthFirst(pattern, projected, newSecondary, newPrimary, 0, len(newPrimary), patterns, steal)
+        position += 1
+
+
+def _failure(error):
+    """
+    Packs an exception raised in a worker so that the parent can raise it again, with the traceback of the worker as
+    its cause. An exception that cannot be pickled is replaced by a RuntimeError carrying its message.
+
+    :param error: the exception raised in the worker
+    :type error: BaseException
+    :return: the exception and the formatted traceback of the worker
+    :rtype: tuple
+    """
+    trace = ''.join(_traceback.format_exception(type(error), error, error.__traceback__))
+    try:
+        _pickle.loads(_pickle.dumps(error))
+    except Exception:
+        error = RuntimeError('%s: %s' % (type(error).__name__, error))
+    return error, trace
+
+
+def _work(descriptors, minUtil, width, primary, secondary, tasks, results, created, idle, queued):
+    """
+    Worker process: runs tasks (prefix, low, high) until it receives None. While more workers are idle than tasks are
+    waiting, half of the remaining range of the current level is put back into the task queue. A task is counted in
+    created before it is queued, so once the parent has reported, the count already includes it. Every result is put
+    as (None, patterns), and an exception ends the worker after it is put as ((exception, traceback), None).
+    """
+
+    def steal(prefix, low, high):
+        if high - low >= 2 and queued.value < idle.value:
+            middle = (low + high + 1) // 2
+            with created.get_lock():
+                created.value += 1
+            with queued.get_lock():
+                queued.value += 1
+            tasks.put((tuple(prefix), middle, high))
+            return middle
+        return high
+
+    try:
+        _attach(descriptors, minUtil, width, primary, secondary)
+        while True:
+            with idle.get_lock():
+                idle.value += 1
+            task = tasks.get()
+            with idle.get_lock():
+                idle.value -= 1
+            if task is None:
+                break
+            with queued.get_lock():
+                queued.value -= 1
+            prefix, low, high = task
+            patterns = []
+            database, taskSecondary, taskPrimary = _descend(prefix)
+            _depthFirst(list(prefix), database, taskSecondary, taskPrimary, low, high, patterns, steal)
+            results.put((None, patterns))
+    except BaseException as error:
+        results.put((_failure(error), None))
+    finally:
+        blocks = _shared.pop('blocks', [])
+        _shared.clear()
+        _sd.release(blocks)
+
 
 class efimParallel(_ab._utilityPatterns):
     """
     :Description:   EFIM is one of the fastest algorithm to mine High Utility ItemSets from transactional databases.
+                    This version keeps the database as flat arrays in shared memory. A task is only a prefix and a
+                    range of its primary items: the worker rebuilds the projected database of the prefix, searches the
+                    subtrees depth-first and hands half of its remaining range to idle workers.
     
     :Reference:     Zida, S., Fournier-Viger, P., Lin, J.CW. et al. EFIM: a fast and memory efficient algorithm for
                      high-utility itemset mining. Knowl Inf Syst 51, 595–625 (2017). https://doi.org/10.1007/s10115-016-0986-0
@@ -75,10 +273,10 @@ class efimParallel(_ab._utilityPatterns):
                    Name of the output file to store complete set of High Utility patterns
     :param minUtil: int :
                    The user given minUtil value.
-    :param maxMemory: int
-                   Maximum memory used by this program for running
     :param  sep: str :
                    This variable is used to distinguish items from one another in a transaction. The default seperator is tab space. However, the users can override their default separator.
+    :param threads: int :
+                   The number of worker processes. With 1 the search runs in the calling process.
 
 
     :Attributes:
@@ -90,7 +288,7 @@ class efimParallel(_ab._utilityPatterns):
         sep (str):
             The separator used in the input file.
         threads (int):
-            The number of threads to use.
+            The number of worker processes to use.
         Patterns (dict):
             A dictionary containing the discovered patterns.
         rename (dict):
@@ -105,16 +303,12 @@ class efimParallel(_ab._utilityPatterns):
     :Methods:
 
         read_file():
-            Read the input file and return the filtered transactions, primary items, and secondary items.
-        binarySearch(arr, item):
-            Perform a binary search on the given array to find the given item.
-        project(beta, file_data, secondary):
-            Project the given beta itemset on the given database.
-        search(collections):
-            Search for high utility itemsets in the given collections.
+            Read the input file and return the flat database, primary items, and secondary items.
+        search(arrays, primary, secondary):
+            Search for high utility itemsets, in this process or in the worker processes.
         mine():
             Start the EFIM algorithm.
-        savePatterns(outputFile):
+        save(outputFile):
             Save the patterns discovered by the algorithm to an output file.
         getPatterns():
             Get the patterns discovered by the algorithm.
@@ -141,18 +335,17 @@ class efimParallel(_ab._utilityPatterns):
     # Read input file
     def _read_file(self):
         """
-        Read the input file and return the filtered transactions, primary items, and secondary items.
+        Read the input file and return the flat database, primary items, and secondary items.
 
         :return:
 
-            filtered_transactions (dict): A dictionary containing the filtered transactions.
-            primary (set): A set containing the primary items.
-            secondary (set): A set containing the secondary items.
+            arrays (dict): The items, utilities and offsets of the database, items renamed by increasing TWU.
+            primary (numpy.ndarray): The primary items.
+            secondary (numpy.ndarray): The secondary items.
         """
 
-
-        file_data = []
-        twu = {}
+        names = {}
+        items, utilities, lengths, weights = [], [], [], []
 
         with open(self.inputFile, 'r') as f:
             fd = mmap.mmap(f.fileno(), 0, prot=mmap.PROT_READ)
@@ -162,226 +355,105 @@ class efimParallel(_ab._utilityPatterns):
                 
                 # Parse and process the line
                 line = [x.split(self.sep) for x in line]
-                weight = int(line[1][0])
-
-                # Update file data with the parsed items
-                file_data.append([line[0], [int(x) for x in line[2]]])
-
+                weights.append(int(line[1][0]))
+                lengths.append(len(line[0]))
                 for k in line[0]:
-                    if k not in twu:
-                        twu[k] = weight
-                    else:
-                        twu[k] += weight
-
-        # Filter TWU dictionary based on minUtil (minimum utility threshold)
-        twu = {k: v for k, v in twu.items() if v >= self.minUtil}
-
-        # Sort TWU items by utility
-        twu = {k: v for k, v in sorted(twu.items(), key=lambda item: item[1], reverse=True)}
-
-        strToInt = {}
-        t = len(twu)
-        for k in twu.keys():
-            strToInt[k] = t
-            self.rename[t] = k
-            t -= 1
-
-        secondary = set(self.rename.keys())
-
-        # Filter and sort transactions
-        subtree = {}
-        filtered_transactions = {}
-        for col in file_data:
-            zipped = zip(col[0], col[1])
-            transaction = [(strToInt[x], y) for x, y in zipped if x in strToInt]
-            transaction = sorted(transaction, key=lambda x: x[0])
-            if len(transaction) > 0:
-                val = [x[1] for x in transaction]
-                key = [x[0] for x in transaction]
-                
-                fs = frozenset(key)
-
-                if fs not in filtered_transactions:
-                    filtered_transactions[fs] = [key, val, 0]
-                else:
-                    filtered_transactions[fs][1] = [x + y for x, y in zip(filtered_transactions[fs][1], val)]
-
-                subUtil = sum([x[1] for x in transaction])
-                temp = 0
-
-                for i in range(len(transaction)):
-                    item = key[i]
-                    if item not in subtree:
-                        subtree[item] = subUtil - temp
-                    else:
-                        subtree[item] += subUtil - temp
-                    temp += val[i]
-
-        primary = [key for key in subtree.keys() if subtree[key] >= self.minUtil]
-
-        return filtered_transactions, primary, secondary
-    
-
-    def _binarySearch(self, arr, item):
+                    if k not in names:
+                        names[k] = len(names) + 1
+                    items.append(names[k])
+                utilities.extend(int(x) for x in line[2])
+
+        items = np.array(items, dtype=np.int64)
+        utilities = np.array(utilities, dtype=np.int64)
+        lengths = np.array(lengths, dtype=np.int64)
+
+        # Transaction weighted utility of every item, filtered on minUtil and sorted increasingly
+        twu = np.zeros(len(names) + 1, dtype=np.int64)
+        np.add.at(twu, items, np.repeat(np.array(weights, dtype=np.int64), lengths))
+        promising = np.flatnonzero(twu >= self.minUtil)
+        promising = promising[promising > 0]
+        promising = promising[np.argsort(twu[promising], kind='stable')]
+
+        oldToNew = np.zeros(len(names) + 1, dtype=np.int64)
+        oldToNew[promising] = np.arange(1, len(promising) + 1)
+        intToStr = {v: k for k, v in names.items()}
+        self.rename = {i + 1: intToStr[old] for i, old in enumerate(promising.tolist())}
+
+        database = _UtilityDatabase.fromTransactions(oldToNew[items], utilities, lengths, len(promising) + 1)
+        subtree = np.zeros(database.width, dtype=np.int64)
+        np.add.at(subtree, database.items, database.remainingUtilities(np.ones(len(database.items), dtype=bool)))
+
+        secondary = np.arange(1, len(promising) + 1)
+        primary = secondary[subtree[secondary] >= self.minUtil]
+        arrays = {'items': database.items, 'utilities': database.utilities, 'offsets': database.offsets}
+
+        return arrays, primary, secondary
+
+    def _search(self, arrays, primary, secondary):
         """
-        Do a binary search on the given array to find the given item.
-
-        :param arr: The array to search in
-
-        :type arr: list
-
-        :param item: The item to search for
-
-        :type item: int
-
-        :return:
-
-            mid (int):
-                The index of the item if found, -1 otherwise.
-
+        Search for high utility patterns, depth-first in this process when threads is 1, and otherwise in worker
+        processes sharing the database, one task per primary item of the first level.
+
+        :param arrays: The items, utilities and offsets of the database
+        :type arrays: dict
+        :param primary: The primary items of the first level
+        :type primary: numpy.ndarray
+        :param secondary: The secondary items of the first level
+        :type secondary: numpy.ndarray
         """
-
-        low = 0
-        high = len(arr) - 1
-        mid = 0
-
-        while low <= high:
-            mid = (high + low) // 2
-            if arr[mid] < item:
-                low = mid + 1
-            elif arr[mid] > item:
-                high = mid - 1
-            else:
-                return mid
-
-        return -1
-
-    def _project(self, beta, file_data, secondary):
-        """
-        Project the given beta itemset on the given database.
-
-        :param beta: The beta itemset to project
-
-        :type beta: list
-
-        :param file_data: The database to project on
-
-        :type file_data: dict
-
-        :param secondary: The set of secondary items
-
-        :type secondary: set
-
-        :return:
-
-            projected_db (dict): The projected database.
-            local_utils (dict): The local utilities of the projected database.
-            subtree_utils (dict): The subtree utilities of the projected database.
-            utility (int): The utility of the projected database.
-
-        """
-
-
-        projected_db = {}
-        local_utils = {}
-        subtree_utils = {}
-        utility = 0     
-
-        added = set()
-
-        item = beta[-1]
-
-        temp = [v for k, v in file_data.items() if item in k]
-        start = time.time()
-
-        for v in temp:
-            index = self._binarySearch(v[0], item)
-
-            curr = v[1][index] + v[2]
-            utility += curr
-
-            newKey = []
-            newVal = []
-
-            for i in range(index+1, len(v[0])):
-                if v[0][i] in secondary:
-                    newKey.append(v[0][i])
-                    newVal.append(v[1][i])
-
-            if len(newKey) == 0:
-                continue
-
-            s = sum(newVal)
-            temp = 0
-
-            for i in range(len(newKey)):
-                if newKey[i] in added:
-                    local_utils[newKey[i]] += s + curr
-                    subtree_utils[newKey[i]] += s + curr - temp
-                else:
-                    local_utils[newKey[i]] = s + curr
-                    subtree_utils[newKey[i]] = s + curr - temp
-                    added.add(newKey[i])
-                
-                temp += newVal[i]
-            
-            fs = frozenset(newKey)
-
-            if fs not in projected_db:
-                projected_db[fs] = [newKey, newVal, curr]
-            else:
-                projected_db[fs][1] = [x + y for x, y in zip(projected_db[fs][1], newVal)]
-                projected_db[fs][2] += curr
-
-        nprimary = [key for key in subtree_utils.keys() if subtree_utils[key] >= self.minUtil]
-        nsecondary = set([key for key in local_utils.keys() if local_utils[key] >= self.minUtil])
-
-        return beta, projected_db, nsecondary, nprimary, utility
-    
-
-    def _search(self, collections):
-
-        """
-        Search for frequent patterns in the given collections.
-
-        :param collections: The collections to search in
-
-        :type collections: list
-        """
-
-        if (self.threads > 1):
-            with Parallel(n_jobs=self.threads) as parallel:
-                while len(collections) > 0:
-                    new_collections = []
-
-                    # print("Num of tasks:", sum(len(collections[i][2]) for i in range(len(collections))))
-                    results = parallel(delayed(self._project)(collections[i][0] + [collections[i][2][j]], collections[i][1], collections[i][3]) for i in range(len(collections)) for j in range(len(collections[i][2])))
-
-                    for i in range(len(results)):
-                        beta, projected_db, secondary, primary, utility = results[i]
-                        if utility >= self.minUtil:
-                            pattern = "\t".join([self.rename[x] for x in beta])
-                            # self.Patterns[tuple(beta)] = utility
-                            self.Patterns[pattern] = utility
-                        if len(primary) > 0:
-                            new_collections.append([beta, projected_db, primary, secondary])
-                    
-                    collections = new_collections
-
+        width = len(secondary) + 1
+        patterns = []
+        if self.threads <= 1 or len(primary) <= 1:
+            _setDatabase(arrays, self.minUtil, width, primary, secondary)
+            try:
+                _depthFirst([], _shared['database'], secondary, primary, 0, len(primary), patterns, None)
+            finally:
+                _shared.clear()
         else:
-            while len(collections) > 0:
-                new_collections = []
-                for i in range(len(collections)):
-                    for j in range(len(collections[i][2])):
-                        beta, projected_db, secondary, primary, utility = self._project(collections[i][0] + [collections[i][2][j]], collections[i][1], collections[i][3])
-                        if utility >= self.minUtil:
-                            pattern = "\t".join([self.rename[x] for x in beta])
-                            # self.Patterns[tuple(beta)] = utility
-                            self.Patterns[pattern] = utility
-                        if len(primary) > 0:
-                            new_collections.append([beta, projected_db, primary, secondary])
-
-                collections = new_collections
+            context = _mp.get_context()
+            tasks, results = context.Queue(), context.Queue()
+            created, idle, queued = context.Value('i', len(primary)), context.Value('i', 0), context.Value('i', len(primary))
+            for i in range(len(primary)):
+                tasks.put(((), i, i + 1))
+            blocks, descriptors = _sd.share(arrays)
+            workers = []
+            try:
+                for _ in range(int(self.threads)):
+                    worker = context.Process(target=_work, args=(descriptors, self.minUtil, width, primary, secondary,
+                                                                 tasks, results, created, idle, queued))
+                    worker.start()
+                    workers.append(worker)
+                finished = 0
+                while finished < created.value:
+                    try:
+                        failure, found = results.get(timeout=_pollInterval)
+                    except _queue.Empty:
+                        # workers only stop on the None sent after the search, so a stopped worker has died
+                        for worker in workers:
+                            if not worker.is_alive():
+                                raise RuntimeError("efimParallel worker %s stopped with exit code %s before the "
+                                                   "search ended" % (worker.pid, worker.exitcode))
+                        continue
+                    if failure is not None:
+                        error, trace = failure
+                        raise error from _RemoteTraceback(trace)
+                    patterns.extend(found)
+                    finished += 1
+                for _ in workers:
+                    tasks.put(None)
+                for worker in workers:
+                    worker.join()
+            finally:
+                for worker in workers:
+                    if worker.is_alive():
+                        worker.terminate()
+                    worker.join()
+                for queue in (tasks, results):
+                    queue.close()
+                    queue.cancel_join_thread()
+                _sd.release(blocks, unlink=True)
+        for beta, utility in patterns:
+            self.Patterns["\t".join([self.rename[x] for x in beta])] = utility
 
 
     @deprecated("It is recommended to use 'mine()' instead of 'startMine()' for mining process. Starting from January 2025, 'startMine()' will be completely terminated.")
@@ -401,11 +473,12 @@ class efimParallel(_ab._utilityPatterns):
 
         self.start = time.time()
 
-        fileData, primary, secondary = self._read_file()
+        self.Patterns = {}
+        self._finalPatterns = self.Patterns
 
-        collection = [[[], fileData, primary, secondary]]
+        arrays, primary, secondary = self._read_file()
 
-        self._search(collection)
+        self._search(arrays, primary, secondary)
 
         self.memoryRSS = ps.memory_info().rss
         self.memoryUSS = ps.memory_full_info().uss
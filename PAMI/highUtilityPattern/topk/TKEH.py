@@ -0,0 +1,553 @@
+# TKEH discovers the k itemsets having the highest utility in a transactional database without a user given minUtil.
+#
+#
+# **Importing this algorithm into a python program**
+# --------------------------------------------------------
+#
+#             from PAMI.highUtilityPattern.topk import TKEH as alg
+#
+#             obj=alg.TKEH("input.txt",100)
+#
+#             obj.mine()
+#
+#             Patterns = obj.getPatterns()
+#
+#             print("Total number of top-k high utility Patterns:", len(Patterns))
+#
+#             obj.save("output")
+#
+#             memUSS = obj.getMemoryUSS()
+#
+#             print("Total Memory in USS:", memUSS)
+#
+#             memRSS = obj.getMemoryRSS()
+#
+#             print("Total Memory in RSS", memRSS)
+#
+#             run = obj.getRuntime()
+#
+#             print("Total ExecutionTime in seconds:", run)
+#
+
+
+
+
+
+__copyright__ = """
+Copyright (C)  2021 Rage Uday Kiran
+
+     This program is free software: you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+
+     This program is distributed in the hope that it will be useful,
+     but WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+     GNU General Public License for more details.
+
+     You should have received a copy of the GNU General Public License
+     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+     Copyright (C)  2021 Rage Uday Kiran
+
+"""
+
+from PAMI.highUtilityPattern.topk import abstract as _ab
+from PAMI.highUtilityPattern.basic.EFIM import _UtilityDatabase, _Dataset
+from typing import List, Dict, Tuple, Set, Union, Any, Generator
+import heapq as _heapq
+import itertools as _itertools
+import numpy as _np
+from deprecated import deprecated
+
+_pairBatch = 1 << 22
+
+
+class TKEH(_ab._utilityPatterns):
+    """
+    :Description:   TKEH mines the top-k high utility itemsets with the EFIM search. The internal minUtil starts at 0 and
+                    is raised before the search to the k-th largest utility among the single items (RIU strategy) and
+                    then among the single items and the co-occurring pairs (CUD strategy), which prunes the items whose
+                    local utility cannot reach it. During the search, the k best itemsets are kept in a min-heap and
+                    minUtil follows the utility of its root, so the subtree and local utility bounds of EFIM tighten as
+                    better itemsets are found.
+
+    :Reference:     Singh, K., Singh, S.S., Kumar, A., Biswas, B.: TKEH: an efficient algorithm for mining top-k high
+                    utility itemsets. Applied Intelligence 49, 1078–1097 (2019)
+
+    :param  iFile: str :
+                   Name of the Input file to mine the top-k High Utility patterns
+    :param  oFile: str :
+                   Name of the output file to store the top-k High Utility patterns
+    :param k: int :
+                   The number of high utility patterns to be discovered.
+    :param  sep: str :
+                   This variable is used to distinguish items from one another in a transaction. The default seperator is tab space. However, the users can override their default separator.
+
+
+    :Attributes:
+
+        iFile : file
+            Name of the input file to mine the top-k high utility patterns
+        oFile : file
+            Name of the output file to store the top-k high utility patterns
+        memoryRSS : float
+            To store the total amount of RSS memory consumed by the program
+        startTime:float
+            To record the start time of the mining process
+        endTime:float
+            To record the completion time of the mining process
+        k : int
+            The user given k value
+        minUtil : int
+            The internal threshold, the utility of the k-th best itemset once the mining is completed
+        heap: list
+            A min-heap of (utility, pattern) holding the k best itemsets found so far
+        candidateCount: int
+             Number of candidates
+        utilityBinArrayLU: numpy.ndarray
+             An array indexed by item to hold the local utility values of the items in database
+        utilityBinArraySU: numpy.ndarray
+            An array indexed by item to hold the subtree utility values of the items is database
+        oldNamesToNewNames: list
+            A map which contains old names, new names of items as key value pairs
+        newNamesToOldNames: list
+            A map which contains new names, old names of items as key value pairs
+
+    :Methods :
+
+        mine()
+                Mining process will start from here
+        getPatterns()
+                Complete set of patterns will be retrieved with this function
+        save(oFile)
+                Complete set of patterns will be loaded in to a output file
+        getPatternsAsDataFrame()
+                Complete set of patterns will be loaded in to a dataframe
+        getMemoryUSS()
+                Total amount of USS memory consumed by the mining process will be retrieved from this function
+        getMemoryRSS()
+                Total amount of RSS memory consumed by the mining process will be retrieved from this function
+        getRuntime()
+               Total amount of runtime taken by the mining process will be retrieved from this function
+        raiseThreshold(utilities)
+               A method to raise minUtil to the k-th largest utility of distinct itemsets
+        useRealItemUtilities(items, utilities)
+               A method to raise minUtil with the utility of every single item
+        useCooccurrenceUtilities(items, utilities, lengths, promising)
+               A method to raise minUtil with the utility of every pair of promising items occurring together
+        backTrackingEFIM(transactionsOfP, itemsToKeep, itemsToExplore, prefixLength)
+               A method to mine the top-k HUIs Recursively
+        useUtilityBinArraysToCalculateUpperBounds(transactionsPe, j, itemsToKeep, isKept)
+               A method to calculate the sub-tree utility and local utility of all items that can extend itemSet P and e
+        output(tempPosition, utility)
+               A method to offer an itemSet to the heap of the k best itemsets
+
+    **Executing the code on terminal:**
+    ------------------------------------------
+
+    .. code-block:: console
+
+      Format:
+
+      (.venv) $ python3 TKEH.py <inputFile> <outputFile> <k> <sep>
+
+      Example Usage:
+
+      (.venv) $ python3 TKEH.py sampleTDB.txt output.txt 100
+
+    Sample run of importing the code:
+    -------------------------------------
+    .. code-block:: python
+
+            from PAMI.highUtilityPattern.topk import TKEH as alg
+
+            obj=alg.TKEH("input.txt",100)
+
+            obj.mine()
+
+            Patterns = obj.getPatterns()
+
+            print("Total number of top-k high utility Patterns:", len(Patterns))
+
+            obj.save("output")
+
+            memUSS = obj.getMemoryUSS()
+
+            print("Total Memory in USS:", memUSS)
+
+            memRSS = obj.getMemoryRSS()
+
+            print("Total Memory in RSS", memRSS)
+
+            run = obj.getRuntime()
+
+            print("Total ExecutionTime in seconds:", run)
+
+    **Credits:**
+    -------------------
+        The complete program was written under the supervision of Professor Rage Uday Kiran.
+
+    """
+
+    _candidateCount = 0
+    _utilityBinArrayLU = {}
+    _utilityBinArraySU = {}
+    _oldNamesToNewNames = {}
+    _newNamesToOldNames = {}
+    _temp = [0] * 5000
+    _patternCount = int()
+    _heap = []
+    _startTime = float()
+    _endTime = float()
+    _finalPatterns = {}
+    _iFile = " "
+    _sep = "\t"
+    _k = 0
+    _minUtil = 0
+    _memoryUSS = float()
+    _memoryRSS = float()
+
+    def __init__(self, iFile, k, sep="\t") -> None:
+        super().__init__(iFile, k, sep)
+        self._sep = sep
+        self._candidateCount = 0
+        self._utilityBinArrayLU = {}
+        self._utilityBinArraySU = {}
+        self._oldNamesToNewNames = {}
+        self._newNamesToOldNames = {}
+        self._temp = [0] * 5000
+        self._patternCount = 0
+        self._heap = []
+        self._minUtil = 0
+        self._endTime = float()
+        self._finalPatterns = {}
+        self._memoryUSS = float()
+        self._memoryRSS = float()
+
+    @deprecated("It is recommended to use 'mine()' instead of 'startMine()' for mining process. Starting from January 2025, 'startMine()' will be completely terminated.")
+    def startMine(self) -> None:
+        """
+        Start the TKEH algorithm.
+        :return: None
+        """
+        self.mine()
+
+    def mine(self) -> None:
+        """
+        Start the TKEH algorithm.
+        :return: None
+        """
+        self._startTime = _ab._time.time()
+        self._dataset = _Dataset(self._iFile, self._sep)
+        self._k = int(self._k)
+        # an itemset that occurs has a positive utility, so the threshold starts at 1 and the itemsets that never
+        # occur are not offered to the heap when k exceeds the number of occurring itemsets
+        self._minUtil = 1
+        self._heap = []
+        self._finalPatterns = {}
+        transactions = self._dataset.getTransactions()
+        lengths = _np.fromiter((len(t[0]) for t in transactions), dtype=_np.int64, count=len(transactions))
+        items = _np.fromiter(_itertools.chain.from_iterable(t[0] for t in transactions), dtype=_np.int64,
+                             count=int(lengths.sum()))
+        utilities = _np.fromiter(_itertools.chain.from_iterable(t[1] for t in transactions), dtype=_np.int64,
+                                 count=int(lengths.sum()))
+        transactionUtilities = _np.fromiter((t[2] for t in transactions), dtype=_np.int64, count=len(transactions))
+        self._useUtilityBinArrayToCalculateLocalUtilityFirstTime(items, lengths, transactionUtilities)
+        self._useRealItemUtilities(items, utilities)
+        promising = self._utilityBinArrayLU >= self._minUtil
+        promising[0] = False
+        self._useCooccurrenceUtilities(items, utilities, lengths, promising)
+        itemsToKeep = _np.flatnonzero(self._utilityBinArrayLU >= self._minUtil)
+        itemsToKeep = itemsToKeep[itemsToKeep > 0]
+        itemsToKeep = itemsToKeep[_np.argsort(self._utilityBinArrayLU[itemsToKeep], kind='stable')]
+        oldNamesToNewNames = _np.zeros(len(self._utilityBinArrayLU), dtype=_np.int64)
+        oldNamesToNewNames[itemsToKeep] = _np.arange(1, len(itemsToKeep) + 1)
+        for idx, item in enumerate(itemsToKeep.tolist()):
+            self._oldNamesToNewNames[item] = idx + 1
+            self._newNamesToOldNames[idx + 1] = item
+        database = _UtilityDatabase.fromTransactions(oldNamesToNewNames[items], utilities, lengths, len(itemsToKeep) + 1)
+        itemsToKeep = _np.arange(1, len(itemsToKeep) + 1)
+        self._useUtilityBinArrayToCalculateSubtreeUtilityFirstTime(database)
+        itemsToExplore = itemsToKeep[self._utilityBinArraySU[itemsToKeep] >= self._minUtil]
+        self._backTrackingEFIM(database, itemsToKeep, itemsToExplore, 0)
+        for utility, pattern in sorted(self._heap, reverse=True):
+            self._finalPatterns[pattern] = utility
+        self._endTime = _ab._time.time()
+        process = _ab._psutil.Process(_ab._os.getpid())
+        self._memoryUSS = float()
+        self._memoryRSS = float()
+        self._memoryUSS = process.memory_full_info().uss
+        self._memoryRSS = process.memory_info().rss
+        print("Top-k High Utility patterns were generated successfully using TKEH algorithm")
+
+    def _raiseThreshold(self, utilities: _np.ndarray) -> None:
+        """
+        A method to raise minUtil to the k-th largest utility of distinct itemsets, since at least k itemsets reach it
+        :param utilities: the exact utility of distinct itemsets
+        :type utilities: numpy.ndarray
+        :return: None
+        """
+        if self._k <= 0 or len(utilities) < self._k:
+            return
+        kth = int(_np.partition(utilities, len(utilities) - self._k)[len(utilities) - self._k])
+        self._minUtil = max(self._minUtil, kth)
+
+    def _useRealItemUtilities(self, items: _np.ndarray, utilities: _np.ndarray) -> None:
+        """
+        A method to raise minUtil with the utility of every single item
+        :param items: the items of all transactions laid out one transaction after the other
+        :type items: numpy.ndarray
+        :param utilities: the utility of every entry of items
+        :type utilities: numpy.ndarray
+        :return: None
+        """
+        realItemUtilities = _np.zeros(len(self._utilityBinArrayLU), dtype=_np.int64)
+        _np.add.at(realItemUtilities, items, utilities)
+        self._raiseThreshold(realItemUtilities[1:])
+
+    def _useCooccurrenceUtilities(self, items: _np.ndarray, utilities: _np.ndarray, lengths: _np.ndarray, promising: _np.ndarray) -> None:
+        """
+        A method to raise minUtil with the utility of every single item and every pair of promising items occurring
+        together. The pairs of the transactions having the same length are built as one matrix of the upper triangle
+        of their items, by batches of at most _pairBatch pairs, and summed per pair after a np.unique.
+        :param items: the items of all transactions laid out one transaction after the other
+        :type items: numpy.ndarray
+        :param utilities: the utility of every entry of items
+        :type utilities: numpy.ndarray
+        :param lengths: the number of items of every transaction
+        :type lengths: numpy.ndarray
+        :param promising: tells for every item whether its local utility reaches minUtil
+        :type promising: numpy.ndarray
+        :return: None
+        """
+        rows = _np.repeat(_np.arange(len(lengths)), lengths)
+        kept = promising[items]
+        rows, items, utilities = rows[kept], items[kept], utilities[kept]
+        realItemUtilities = _np.zeros(len(promising), dtype=_np.int64)
+        _np.add.at(realItemUtilities, items, utilities)
+        lengths = _np.bincount(rows, minlength=len(lengths))
+        starts = _np.cumsum(lengths) - lengths
+        width = len(promising)
+        keys, sums, pending = _np.empty(0, dtype=_np.int64), _np.empty(0, dtype=_np.int64), []
+        for length in _np.unique(lengths[lengths > 1]).tolist():
+            first, second = _np.triu_indices(length, 1)
+            group = starts[lengths == length]
+            step = max(1, _pairBatch // len(first))
+            for chunk in range(0, len(group), step):
+                entries = group[chunk:chunk + step, None] + _np.arange(length)
+                pairItems, pairUtilities = items[entries], utilities[entries]
+                low = _np.minimum(pairItems[:, first], pairItems[:, second])
+                high = _np.maximum(pairItems[:, first], pairItems[:, second])
+                pending.append(((low * width + high).ravel(), (pairUtilities[:, first] + pairUtilities[:, second]).ravel()))
+                if sum(len(pair[0]) for pair in pending) >= _pairBatch:
+                    keys, sums = self._sumPairs(keys, sums, pending)
+                    pending = []
+        keys, sums = self._sumPairs(keys, sums, pending)
+        self._raiseThreshold(_np.concatenate((realItemUtilities[promising], sums)))
+
+    @staticmethod
+    def _sumPairs(keys: _np.ndarray, sums: _np.ndarray, pending: list) -> Tuple[_np.ndarray, _np.ndarray]:
+        """
+        A method to merge batches of pair utilities into the utility of every distinct pair
+        :param keys: the distinct pairs summed so far
+        :type keys: numpy.ndarray
+        :param sums: the utility of every pair of keys
+        :type sums: numpy.ndarray
+        :param pending: batches of (pairs, utilities) to be added
+        :type pending: list
+        :return: the distinct pairs and their utilities
+        :rtype: tuple
+        """
+        if not pending:
+            return keys, sums
+        allKeys = _np.concatenate([keys] + [pair[0] for pair in pending])
+        allUtilities = _np.concatenate([sums] + [pair[1] for pair in pending])
+        keys, inverse = _np.unique(allKeys, return_inverse=True)
+        sums = _np.zeros(len(keys), dtype=_np.int64)
+        _np.add.at(sums, inverse, allUtilities)
+        return keys, sums
+
+    def _backTrackingEFIM(self, transactionsOfP: _UtilityDatabase, itemsToKeep: _np.ndarray, itemsToExplore: _np.ndarray, prefixLength: int) -> None:
+        """
+        A method to mine the top-k HUIs Recursively, pruning with the current minUtil
+        :param transactionsOfP: the projected database of the current prefix P
+        :type transactionsOfP: _UtilityDatabase
+        :param itemsToKeep: the secondary items in the p-projected database
+        :type itemsToKeep: numpy.ndarray
+        :param itemsToExplore: the primary items in the p-projected database
+        :type itemsToExplore: numpy.ndarray
+        :param prefixLength: current prefixLength
+        :type prefixLength: int
+        :return: None
+        """
+        self._candidateCount += len(itemsToExplore)
+        isKept = _np.zeros(transactionsOfP.width, dtype=bool)
+        isKept[itemsToKeep] = True
+        for idx, e in enumerate(itemsToExplore.tolist()):
+            utilityPe, transactionsPe = transactionsOfP.project(e)
+            self._temp[prefixLength] = self._newNamesToOldNames[e]
+            if utilityPe >= self._minUtil:
+                self._output(prefixLength, utilityPe)
+            candidates = itemsToKeep[itemsToKeep > e]
+            if len(candidates) == 0 or len(transactionsPe) == 0:
+                continue
+            self._useUtilityBinArraysToCalculateUpperBounds(transactionsPe, candidates[0], isKept)
+            explore = self._utilityBinArraySU[candidates] >= self._minUtil
+            keep = explore | (self._utilityBinArrayLU[candidates] >= self._minUtil)
+            self._backTrackingEFIM(transactionsPe, candidates[keep], candidates[explore], prefixLength + 1)
+
+    def _useUtilityBinArraysToCalculateUpperBounds(self, transactionsPe: _UtilityDatabase, first: int, isKept: _np.ndarray) -> None:
+        """
+        A method to  calculate the subtree utility and local utility of all items that can extend itemSet P U {e}
+        :param transactionsPe: the projected database for P U {e}
+        :type transactionsPe: _UtilityDatabase
+        :param first: the smallest item that can extend P U {e}
+        :type first: int
+        :param isKept: tells for every item whether it is a secondary item of P
+        :type isKept: numpy.ndarray
+        :return: None
+        """
+        self._utilityBinArrayLU[first:] = 0
+        self._utilityBinArraySU[first:] = 0
+        rows = transactionsPe._rows()
+        kept = isKept[transactionsPe.items]
+        items = transactionsPe.items[kept]
+        remainingUtilities = transactionsPe.remainingUtilities(kept)[kept]
+        prefixUtilities = transactionsPe.prefixUtilities[rows[kept]]
+        transactionUtilities = transactionsPe.transactionUtilities()[rows[kept]]
+        _np.add.at(self._utilityBinArraySU, items, remainingUtilities + prefixUtilities)
+        _np.add.at(self._utilityBinArrayLU, items, transactionUtilities + prefixUtilities)
+
+    def _output(self, tempPosition: int, utility: int) -> None:
+        """
+        A method to offer an itemSet to the heap of the k best itemsets. Once the heap holds k itemsets, minUtil is
+        raised to the utility of the weakest of them.
+        :param tempPosition: position of last item
+        :type tempPosition : int
+        :param utility: total utility of itemSet
+        :type utility: int
+        :return: None
+        """
+        if self._k <= 0:
+            return
+        self._patternCount += 1
+        pattern = "\t".join(self._dataset.intToStr.get(self._temp[i]) for i in range(tempPosition + 1))
+        if len(self._heap) < self._k:
+            _heapq.heappush(self._heap, (utility, pattern))
+        elif utility > self._heap[0][0]:
+            _heapq.heapreplace(self._heap, (utility, pattern))
+        if len(self._heap) >= self._k:
+            self._minUtil = max(self._minUtil, self._heap[0][0])
+
+    def _useUtilityBinArrayToCalculateSubtreeUtilityFirstTime(self, dataset: _UtilityDatabase) -> None:
+        """
+        Scan the initial database to calculate the subtree utility of each item using a utility-bin array
+        :param dataset: the transaction database
+        :type dataset: _UtilityDatabase
+        :return: None
+        """
+        self._utilityBinArraySU = _np.zeros(dataset.width, dtype=_np.int64)
+        kept = _np.ones(len(dataset.items), dtype=bool)
+        _np.add.at(self._utilityBinArraySU, dataset.items, dataset.remainingUtilities(kept))
+        self._utilityBinArrayLU = _np.zeros(dataset.width, dtype=_np.int64)
+
+    def _useUtilityBinArrayToCalculateLocalUtilityFirstTime(self, items: _np.ndarray, lengths: _np.ndarray, transactionUtilities: _np.ndarray) -> None:
+        """
+        A method to calculate local utility of single itemset
+        :param items: the items of all transactions laid out one transaction after the other
+        :type items: numpy.ndarray
+        :param lengths: the number of items of every transaction
+        :type lengths: numpy.ndarray
+        :param transactionUtilities: the utility of every transaction
+        :type transactionUtilities: numpy.ndarray
+        :return: None
+        """
+        self._utilityBinArrayLU = _np.zeros(self._dataset.getMaxItem() + 1, dtype=_np.int64)
+        _np.add.at(self._utilityBinArrayLU, items, _np.repeat(transactionUtilities, lengths))
+
+    def getPatternsAsDataFrame(self) -> '_pd.DataFrame':
+        """
+        Storing final patterns in a dataframe
+        :return: returning patterns in a dataframe
+        :rtype: pd.DataFrame
+        """
+        dataFrame = {}
+        data = []
+        for a, b in self._finalPatterns.items():
+            data.append([a.replace('\t', ' '), b])
+            dataFrame = _ab._pd.DataFrame(data, columns=['Patterns', 'Utility'])
+
+        return dataFrame
+
+    def getPatterns(self) -> dict:
+        """
+        Function to send the set of patterns after completion of the mining process
+        :return: returning patterns, from the highest utility to the lowest
+        :rtype: dict
+        """
+        return self._finalPatterns
+
+    def save(self, outFile: str) -> None:
+        """
+        Complete set of top-k patterns will be loaded in to an output file
+        :param outFile: name of the output file
+        :type outFile: csv file
+        :return: None
+        """
+        self.oFile = outFile
+        writer = open(self.oFile, 'w+')
+        for x, y in self._finalPatterns.items():
+            patternsAndSupport = x.strip() + ":" + str(y)
+            writer.write("%s \n" % patternsAndSupport)
+
+    def getMemoryUSS(self) -> float:
+        """
+        Total amount of USS memory consumed by the mining process will be retrieved from this function
+        :return: returning USS memory consumed by the mining process
+        :rtype: float
+        """
+
+        return self._memoryUSS
+
+    def getMemoryRSS(self) -> float:
+        """
+        Total amount of RSS memory consumed by the mining process will be retrieved from this function
+        :return: returning RSS memory consumed by the mining process
+        :rtype: float
+        """
+        return self._memoryRSS
+
+    def getRuntime(self) -> float:
+        """
+        Calculating the total amount of runtime taken by the mining process
+        :return: returning total amount of runtime taken by the mining process
+        :rtype: float
+        """
+        return self._endTime-self._startTime
+
+    def printResults(self) -> None:
+        """
+        This function is used to print the results
+        """
+        print("Total number of Top-k High Utility Patterns:", len(self.getPatterns()))
+        print("Total Memory in USS:", self.getMemoryUSS())
+        print("Total Memory in RSS", self.getMemoryRSS())
+        print("Total ExecutionTime in seconds:", self.getRuntime())
+
+
+if __name__ == '__main__':
+    _ap = str()
+    if len(_ab._sys.argv) == 4 or len(_ab._sys.argv) == 5:
+        if len(_ab._sys.argv) == 5:    #includes separator
+            _ap = TKEH(_ab._sys.argv[1], int(_ab._sys.argv[3]), _ab._sys.argv[4])
+        if len(_ab._sys.argv) == 4:    #takes "\t" as a separator
+            _ap = TKEH(_ab._sys.argv[1], int(_ab._sys.argv[3]))
+        _ap.mine()
+        print("Total number of Top-k High Utility Patterns:", len(_ap.getPatterns()))
+        _ap.save(_ab._sys.argv[2])
+        print("Total Memory in USS:", _ap.getMemoryUSS())
+        print("Total Memory in RSS",  _ap.getMemoryRSS())
+        print("Total ExecutionTime in seconds:", _ap.getRuntime())
+    else:
+        print("Error! The number of input parameters do not match the total number of parameters provided")
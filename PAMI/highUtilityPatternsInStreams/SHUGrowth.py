@@ -22,10 +22,10 @@
 #
 
 
-import abstract as _hus
+from PAMI.highUtilityPatternsInStreams import abstract as _hus
 import pandas as pd
+import numpy as _np
 from functools import reduce
-from operator import and_
 from deprecated import deprecated
 
 _minSup = str()
@@ -50,15 +50,21 @@ class _Node:
         next : _Node
             pointer to the next node with same item in the tree
 
+        previous : _Node
+            pointer to the previous node with same item in the tree
+
         batchIndex : int
-            index of the batch with respect to window to which the node belongs
+            slot of the ring of batches in which the node was created
 
         utility : list
-            list of utilities of the node with respect to each batch in the window
+            fixed-size ring of utilities of the node, one slot for each batch in the window
 
         parent : _Node
             pointer to the parent of the node
 
+        pruned : bool
+            True once the node has no utility left in the window and was detached from the tree
+
     :Methods:
 
         addUtility(utility, batchIndex)
@@ -67,11 +73,11 @@ class _Node:
         removeUtility(utility)
             Removes utility from the node
 
-        shiftUtility()
-            Shifts the utility values of the node to the left useful for removing the oldest batch information
+        clearUtility(slot)
+            Clears the utility of the node in a slot of the ring useful for removing the oldest batch information
 
-        shiftTail()
-            Shifts the tail values of the node to the left useful for removing the oldest batch information
+        clearTail(slot)
+            Clears the tail flag of the node in a slot of the ring useful for removing the oldest batch information
     """
 
     def __init__(self, itemName, utility, batchSize, batchIndex):
@@ -79,9 +85,11 @@ class _Node:
         self.utility = [0 for _ in range(batchSize)]
         self.children = dict()
         self.next = None
+        self.previous = None
         self.batchIndex = batchIndex
         self.utility[batchIndex] = utility
         self.parent = None
+        self.pruned = False
         self.tail = None
 
     def addUtility(self, utility, batchIndex):
@@ -110,21 +118,34 @@ class _Node:
 
         self.utility -= utility
 
-    def shiftUtility(self):
+    def clearUtility(self, slot):
         """
-        Shifts the utility values of the node to the left
+        Clears the utility of the node in a slot of the ring
+
+        :param slot : slot of the batch leaving the window
+
+        :type slot : int
+
+        :return: utility of the node in the slot
+
+        :rtype: int
         """
-        self.utility.pop(0)
-        self.utility.append(0)
 
-    def shiftTail(self):
+        utility = self.utility[slot]
+        self.utility[slot] = 0
+        return utility
+
+    def clearTail(self, slot):
         """
-        Shifts the tail pointer of the node to the left
+        Clears the tail flag of the node in a slot of the ring
+
+        :param slot : slot of the batch leaving the window
+
+        :type slot : int
         """
 
         if(self.tail is not None):
-            self.tail.pop(0)
-            self.tail.append(False)
+            self.tail[slot] = False
 
 
 class _HeaderTable:
@@ -134,8 +155,8 @@ class _HeaderTable:
     :Attributes:
 
         table : dict
-            dictionary of items as keys and list of utility and pointer to the node in the tree as values
-            representing the header table
+            dictionary of items as keys and list of utility and pointers to the first and the last node of the item in
+            the tree as values representing the header table
 
         orderedItems : list
             List of items in the header table in lexicographical order
@@ -151,6 +172,9 @@ class _HeaderTable:
         removeUtility(item, utility)
             Removes utility from the item in the header table
 
+        removeNode(node)
+            Unlinks a node pruned from the tree from the nodes of its item
+
         itemOrdering()
             Orders the items in the header table in lexicographical order
     """
@@ -178,17 +202,14 @@ class _HeaderTable:
 
         if item in self.table:
             self.table[item][0] += utility
-            tempNode = self.table[item][1]
-
-            while tempNode.next is not None:
-                tempNode = tempNode.next
-            
-            tempNode.next = node
+            lastNode = self.table[item][2]
+            lastNode.next = node
+            node.previous = lastNode
+            self.table[item][2] = node
 
         else:
-            self.table[item] = [utility, node]
-    
-        self.itemOrdering()
+            self.table[item] = [utility, node, node]
+            self.itemOrdering()
 
     def addUtility(self, item, utility):
         """
@@ -221,8 +242,32 @@ class _HeaderTable:
 
         if self.table[item][0] == 0:
             del self.table[item]
+            self.itemOrdering()
+
+    def removeNode(self, node):
+        """
+        Unlinks a node pruned from the tree from the nodes of its item
+
+        :param node: pointer to the node pruned from the tree
+
+        :type node: _Node
+        """
+        entry = self.table.get(node.itemName)
 
-        self.itemOrdering()
+        if entry is None:
+            return
+
+        if(node.previous is None):
+            entry[1] = node.next
+
+        else:
+            node.previous.next = node.next
+
+        if(node.next is None):
+            entry[2] = node.previous
+
+        else:
+            node.next.previous = node.previous
 
     def itemOrdering(self):
         """
@@ -255,6 +300,15 @@ class _SHUTree:
         windowUtility : int
             utility of the current window
 
+        head : int
+            slot of the ring of batches holding the oldest batch of the window
+
+        paneNodes : list
+            list of the nodes having a utility in each slot of the ring
+
+        paneUtilities : list
+            utility of the transactions of each slot of the ring
+
         localTree : bool
             flag to indicate whether the tree is local useful for prefix/conditional tree generation
 
@@ -263,14 +317,8 @@ class _SHUTree:
         addTransaction(transaction, utility)
             Adds transaction to the tree
 
-        tailUtilities(root)
-            Returns the tail utilities of the tree
-
         removeBatch()
-            Removes the oldest batch from the tree
-
-        removeBatchUtility()
-            Removes the utility of the oldest batch from each subtree
+            Removes the oldest batch from the tree visiting only the nodes having a utility in it
 
     """
 
@@ -281,6 +329,9 @@ class _SHUTree:
         self.windowSize = windowSize
         self.batchIndex = 0
         self.windowUtility = 0
+        self.head = 0
+        self.paneNodes = [[] for _ in range(batchSize)]
+        self.paneUtilities = [0 for _ in range(batchSize)]
         self.localTree = localTree
 
     def addTransaction(self, transaction, utility, itemUtility = None):
@@ -294,11 +345,19 @@ class _SHUTree:
         :param utility: Net utility of the transaction
 
         :type utility: int
+
+        :param itemUtility: utilities of the items of the transaction, in the same order
+
+        :type itemUtility: list
         """
-        # print("Transaction", transaction, itemUtility, self.localTree)
-        transaction.sort(key = lambda x: x[0])
+        # the items follow the lexicographical order of the header table, their utilities moving with them
+        order = sorted(range(len(transaction)), key = lambda x: transaction[x])
+        transaction[:] = [transaction[x] for x in order]
+        itemUtility = [itemUtility[x] for x in order]
         currentNode = self.root
+        slot = (self.head + self.batchIndex) % self.batchSize
         self.windowUtility += utility
+        self.paneUtilities[slot] += utility
 
         curUtility = 0
         for iter in range(len(transaction)):
@@ -313,7 +372,9 @@ class _SHUTree:
             
             if item in currentNode.children:
                 currentNode = currentNode.children[item]
-                currentNode.addUtility(curUtility, self.batchIndex)
+                if(currentNode.utility[slot] == 0):
+                    self.paneNodes[slot].append(currentNode)
+                currentNode.addUtility(curUtility, slot)
 
                 if(self.localTree is False):
                     self.headerTable.addUtility(item, curUtility)
@@ -322,7 +383,8 @@ class _SHUTree:
                     self.headerTable.addUtility(item, utility)
 
             else:
-                newNode = _Node(item, curUtility, self.batchSize, self.batchIndex)
+                newNode = _Node(item, curUtility, self.batchSize, slot)
+                self.paneNodes[slot].append(newNode)
                 currentNode.children[item] = newNode
                 newNode.parent = currentNode
 
@@ -334,95 +396,106 @@ class _SHUTree:
                 
                 currentNode = newNode
 
-        currentNode.tail = [False for _ in range(self.batchSize)]
-        currentNode.tail[self.batchIndex] = True
-
-    def tailUtilities(self, root):
-        """
-        Calculates the utility of the tail of the node
-
-        :param root: pointer to the node in the tree
+        if currentNode.tail is None:
+            currentNode.tail = [False for _ in range(self.batchSize)]
+        currentNode.tail[slot] = True
 
-        :type root: _Node
-
-        :return: utility of the tail of the node
+    def removeBatch(self):
 
-        :rtype: int
+        """
+        Removes the oldest batch from the tree. Only the nodes having a utility in the oldest batch are visited, their
+        slot of the ring being cleared for the next batch, and the nodes left without utility in the window are pruned
+        from the tree and from the header table.
         """
 
-        if(root is None):
-            return 0
+        slot = self.head
+        self.windowUtility -= self.paneUtilities[slot]
+        self.paneUtilities[slot] = 0
 
-        if(root.tail is not None):
-            return root.utility[0]
+        for node in self.paneNodes[slot]:
+            if(node.pruned):
+                continue
 
-        netUtility = 0
-        for item in root.children:
-            netUtility += self.tailUtilities(root.children[item])
+            curBatchUtility = node.clearUtility(slot)
+            node.clearTail(slot)
+            if(curBatchUtility != 0):
+                self.headerTable.removeUtility(node.itemName, curBatchUtility)
 
-        return netUtility
+            if(not any(node.utility)):
+                node.pruned = True
+                self.headerTable.removeNode(node)
+                if(node.parent.children.get(node.itemName) is node):
+                    del node.parent.children[node.itemName]
 
-    def removeBatch(self):
+        self.paneNodes[slot] = []
+        self.head = (self.head + 1) % self.batchSize
 
-        """
-        Removes the oldest batch from the tree
-        """
 
-        currentNode = self.root
+class _PaneIndex:
+    """
+    A class used to represent the vertical index of a pane of the window
 
-        curChilds = list(currentNode.children.keys())
+    :Attributes:
 
-        for child in curChilds:
-            self.windowUtility -= self.tailUtilities(currentNode.children[child])
-            self.removeBatchUtility(currentNode.children[child])
+        tidLists : dict
+            dictionary of items as keys and, as values, the sorted positions in the pane of the transactions containing
+            the item together with the utility of the item in each of them
 
-            if(sum(currentNode.children[child].utility) == 0):
-                del currentNode.children[child]
+        utilities : dict
+            dictionary of the itemsets whose utility in the pane was already computed as keys and that utility as values
 
+        transactionCount : int
+            number of transactions in the pane
 
-    def removeBatchUtility(self, tempNode = None):
-        
-        """
-        Removes the utility of the oldest batch from each subtree
+    :Methods:
 
-        :param tempNode: pointer to the node in the tree
+        itemsetUtility(itemSet)
+            Returns the utility of an itemset in the pane
+    """
 
-        :type tempNode: _Node
+    def __init__(self, transactions, utilities):
+        tids = {}
+        values = {}
+        for tid in range(len(transactions)):
+            for item, utility in zip(transactions[tid], utilities[tid]):
+                if item not in tids:
+                    tids[item] = []
+                    values[item] = []
+                tids[item].append(tid)
+                values[item].append(utility)
+        self.tidLists = {item: (_np.array(tids[item]), _np.array(values[item])) for item in tids}
+        self.utilities = {}
+        self.transactionCount = len(transactions)
+
+    def itemsetUtility(self, itemSet):
         """
-        if tempNode is None:
-            return
+        Returns the utility of an itemset in the pane by intersecting the tid lists of its items
 
-        for item in tempNode.children:
-            self.removeBatchUtility(tempNode.children[item])
+        :param itemSet: sorted tuple of the items of the itemset
 
-        curBatchUtility = tempNode.utility[0]
-        tempNode.shiftUtility()
-        tempNode.shiftTail()
+        :type itemSet: tuple
 
-        if(sum(tempNode.utility) == 0):
-            if(tempNode.itemName in self.headerTable.table):
-                curNode = self.headerTable.table[tempNode.itemName][1]
+        :return: utility of the itemset in the pane
 
-                if(curNode == tempNode):
-                    self.headerTable.table[tempNode.itemName][1] = tempNode.next
-
-                else:
-                    while(curNode != None and curNode.next != tempNode):
-                        curNode = curNode.next
-
-                    if(curNode != None):
-                        curNode.next = tempNode.next
+        :rtype: float
+        """
 
-                del tempNode.tail
-        
-        self.headerTable.removeUtility(tempNode.itemName, curBatchUtility)
+        utility = self.utilities.get(itemSet)
+        if utility is not None:
+            return utility
+        lists = [self.tidLists.get(item) for item in itemSet]
+        if any(tidList is None for tidList in lists):
+            utility = 0
+        else:
+            lists.sort(key = lambda tidList: len(tidList[0]))
+            tids = reduce(lambda x, y: _np.intersect1d(x, y, assume_unique = True), [tidList[0] for tidList in lists])
+            utility = 0
+            for itemTids, itemUtilities in lists:
+                utility += float(itemUtilities[_np.searchsorted(itemTids, tids)].sum())
+        self.utilities[itemSet] = utility
+        return utility
 
-        curChilds = list(tempNode.children.keys())
-        for child in curChilds:
-            if(sum(tempNode.children[child].utility) == 0):
-                del tempNode.children[child]
 
-    
 class SHUGrowth(_hus._highUtilityPatternStreamMining):
     """
     :Description:   High-utility pattern mining over data stream is one of the challenging problems in data stream mining.
@@ -485,6 +558,21 @@ class SHUGrowth(_hus._highUtilityPatternStreamMining):
             __tree : _SHUTree
                 SHU tree of the current window
 
+        __panes : list
+            vertical indexes of the panes of the current window
+
+        __windowUtilities : dict
+            utilities in the current window of the candidate itemsets of the last window
+
+        __pending : list
+            transactions, utilities and transaction utilities of the pane being filled by a stream
+
+        __windowStart : int
+            position in the stream of the first transaction of the current window
+
+        __windowEnd : int
+            position in the stream of the transaction following the current window
+
             __windowSize : int
                 The size of the sliding window. It specifies the number of panes to be considered for mining patterns.
 
@@ -508,8 +596,23 @@ class SHUGrowth(_hus._highUtilityPatternStreamMining):
         createConditionalTree(root, transactions, minUtil)
             Creates the conditional tree for the given prefix tree
 
-        contains(superset, subset)
-            Checks if the superset contains the subset
+        itemsetUtility(itemSet)
+            Returns the utility of an itemset in the current window from the pane indexes
+
+        slidePaneIndexes(transactions, utilities)
+            Adds the index of a new pane to the window, replacing the index of the oldest pane once the window is full
+
+        addTransactions(batch)
+            Adds transactions arriving from a stream, every complete pane entering the window
+
+        addTransactionsFromQueue(queue)
+            Adds the transactions put in an asyncio queue until None is received
+
+        slide()
+            Moves the pane being filled into the window, removing the oldest pane once the window is full
+
+        currentPatterns()
+            Returns the high utility patterns of the current window
 
         treeGenerations(root, netUtil, candidatePattern, curItem)
             Generates the tree of the high utility patterns
@@ -577,6 +680,11 @@ class SHUGrowth(_hus._highUtilityPatternStreamMining):
     __utilities = []
     __utilitySum = []
     __tree = None
+    __panes = []
+    __windowUtilities = {}
+    __pending = None
+    __windowStart = 0
+    __windowEnd = 0
     __windowSize = 0
     __paneSize = 0
 
@@ -628,9 +736,31 @@ class SHUGrowth(_hus._highUtilityPatternStreamMining):
                     print("File Not Found")
                     quit()
 
+    def passesThrough(self, node, batch):
+        """
+        Tells whether every transaction of a batch reaching the node continues to the same child
+
+        :param node: node of the tree
+
+        :type node: _Node
+
+        :param batch: slot of the batch
+
+        :type batch: int
+
+        :rtype: bool
+        """
+
+        if(node.tail is not None and node.tail[batch]):
+            return False
+        return sum(1 for child in node.children.values() if child.utility[batch] != 0) == 1
+
     def minPathUtil(self, nodeIndex, stack):
         """
-        Calculates the minimum utility of the path from the root to the ends of the tree
+        Calculates the utility of the item of a node of the prefix branch in the transactions ending below it. The
+        utility of a node adds up the utilities of the items from the root in all the transactions reaching it, so the
+        difference with its parent is the utility of its item only in the batches where the transactions reaching the
+        parent are exactly those reaching the end of the branch; the other batches add nothing.
 
         :param nodeIndex: index of the node in the stack
 
@@ -645,7 +775,7 @@ class SHUGrowth(_hus._highUtilityPatternStreamMining):
         activeBatch = [i for i, e in enumerate(stack[0].utility) if e != 0]
 
         for batch in activeBatch:
-            if(stack[nodeIndex + 1].tail == None or stack[nodeIndex + 1].tail[batch] == False):
+            if(all(self.passesThrough(stack[i], batch) for i in range(1, nodeIndex + 2))):
                 minUtil += (stack[nodeIndex].utility[batch] - stack[nodeIndex + 1].utility[batch])
             
         return minUtil
@@ -744,24 +874,52 @@ class SHUGrowth(_hus._highUtilityPatternStreamMining):
 
         return tempTree
     
-    def contains(self, superset, subset):
+    def itemsetUtility(self, itemSet):
         """
-        Checks if the superset contains the subset
+        Returns the utility of an itemset in the current window. The utility of an itemset met in the previous window
+        is kept up to date when the window slides, otherwise it is the sum of its utilities in the panes
 
-        :param superset: list of items in the superset
+        :param itemSet: list of items in the itemset
 
-        :type superset: list
+        :type itemSet: list
 
-        :param subset: list of items in the subset
+        :return: utility of the itemset in the current window
 
-        :type subset: list
+        :rtype: float
+        """
 
-        :return: True if superset contains subset, False otherwise
+        key = tuple(sorted(itemSet))
+        utility = self.__windowUtilities.get(key)
+        if utility is None:
+            utility = sum(pane.itemsetUtility(key) for pane in self.__panes)
+            self.__windowUtilities[key] = utility
+        return utility
 
-        :rtype: bool
+    def slidePaneIndexes(self, transactions, utilities):
+        """
+        Adds the index of a new pane to the window, replacing the index of the oldest pane once the window is full, and
+        updates the window utilities of the known itemsets with the utilities in these two panes only
+
+        :param transactions: list of transactions of the new pane
+
+        :type transactions: list
+
+        :param utilities: list of utilities of the items of each transaction of the new pane
+
+        :type utilities: list
         """
-     
-        return reduce(and_, [i in superset for i in subset])
+
+        newPane = _PaneIndex(transactions, utilities)
+        expiredPane = None
+        if len(self.__panes) == self.__windowSize:
+            expiredPane = self.__panes.pop(0)
+            self.__windowStart += expiredPane.transactionCount
+        self.__panes.append(newPane)
+        self.__windowEnd += newPane.transactionCount
+        for key in self.__windowUtilities:
+            self.__windowUtilities[key] += newPane.itemsetUtility(key)
+            if expiredPane is not None:
+                self.__windowUtilities[key] -= expiredPane.itemsetUtility(key)
 
     def treeGenerations(self, root, netUtil, candidatePattern, curItem = []):
         """
@@ -827,84 +985,159 @@ class SHUGrowth(_hus._highUtilityPatternStreamMining):
                 if(len(conditionalTree.headerTable.table) != 0):
                     self.treeGenerations(conditionalTree, netUtil, candidatePattern, newItemset)
 
-    @deprecated("It is recommended to use 'mine()' instead of 'startMine()' for mining process. Starting from January 2025, 'startMine()' will be completely terminated.")
-    def startMine(self):
+    def _resetWindow(self):
         """
-        This function will start the mining process
+        Empties the window and the pane being filled before a new stream is consumed
         """
-        self.mine()
 
-    def mine(self):
-        """
-        This function will start the mining process
-        """
-        global _minUtil
-        self.__startTime = _hus._time.time()
-        if self._iFile is None:
-            raise Exception("Please enter the file path or file name:")
-        if self._minUtil is None:
-            raise Exception("Please enter the Minimum Support")
-        if self._windowSize is None:
-            raise Exception("Please enter the Window Size")
-        if self._paneSize is None:
-            raise Exception("Please enter the Pane Size")
         self.__windowSize = int(self._windowSize)
         self.__paneSize = int(self._paneSize)
-
-        self._createItemsets()
         self._minUtil = float(self._minUtil)
         self.__tree = _SHUTree(self.__windowSize, self.__paneSize)
+        self.__panes = []
+        self.__windowUtilities = {}
+        self.__pending = [[], [], []]
+        self.__windowStart = 0
+        self.__windowEnd = 0
 
-        transactionwiseUtility = []
+    def _parseTransaction(self, line):
+        """
+        Splits a line in the format of the input file into its items, their utilities and the transaction utility
 
-        for i in range(len(self._transactions)):
-            curTrans = {}
-            for j in range(len(self._transactions[i])):
-                curTrans[self._transactions[i][j]] = self._utilities[i][j]
-            transactionwiseUtility.append(curTrans)
+        :param line: a transaction of the input file
 
-        for i in range(0, self.__windowSize):
-            self.__tree.batchIndex = i
-            for j in range(0, self.__paneSize):
-                self.__tree.addTransaction(self._transactions[i * self.__paneSize + j],
-                                           self._utilitySum[i * self.__paneSize + j],
-                                           self._utilities[i * self.__paneSize + j])
+        :type line: str
 
-        startIndex = 0
-        endIndex = self.__windowSize * self.__paneSize
+        :return: list of items, list of their utilities and the transaction utility
 
-        while (endIndex <= len(self._transactions)):
+        :rtype: tuple
+        """
 
-            filteredItemsets = {}
+        parts = line.split("\n")[0].split(":")
+        items = [x for x in parts[0].split(self._sep) if x]
+        utilities = [float(x) for x in parts[2].split(self._sep)]
+        return items, utilities, float(parts[1])
 
-            self.treeGenerations(self.__tree, self._minUtil, filteredItemsets)
+    def addTransactions(self, batch):
+        """
+        Adds transactions arriving from a stream. Every time a pane is complete it enters the window, the oldest pane
+        leaving the window once it is full, so that only the transactions of the window and of one pane are kept.
 
-            results = []
+        :param batch: iterable of transactions, such as a list, a generator or an open file. Every transaction is either
+                      a line in the format of the input file or a tuple of the list of items, the list of their
+                      utilities and the transaction utility
 
-            for itemSetLen in filteredItemsets:
-                for itemSet in filteredItemsets[itemSetLen]:
-                    itemSetUtility = 0
-                    for transId in range(startIndex, endIndex):
-                        if (self.contains(list(transactionwiseUtility[transId].keys()), itemSet)):
-                            for item in itemSet:
-                                itemSetUtility += transactionwiseUtility[transId][item]
+        :type batch: iterable
+        """
 
-                    if (itemSetUtility >= self._minUtil):
-                        results.append([itemSet, itemSetUtility])
+        if self.__tree is None:
+            self._resetWindow()
+        for transaction in batch:
+            if isinstance(transaction, str):
+                if not transaction.strip():
+                    continue
+                transaction = self._parseTransaction(transaction)
+            items, utilities, utilitySum = transaction
+            self.__pending[0].append(list(items))
+            self.__pending[1].append(list(utilities))
+            self.__pending[2].append(utilitySum)
+            if len(self.__pending[0]) == self.__paneSize:
+                self.slide()
+
+    async def addTransactionsFromQueue(self, queue):
+        """
+        Adds the transactions put in an asyncio queue, as addTransactions does, until None is received
 
-            self.__finalPatterns[(startIndex, endIndex)] = results
+        :param queue: queue of transactions in any of the forms accepted by addTransactions
 
-            if (endIndex >= len(self._transactions)):
-                break
+        :type queue: asyncio.Queue
+        """
+
+        while True:
+            transaction = await queue.get()
+            try:
+                if transaction is None:
+                    return
+                self.addTransactions([transaction])
+            finally:
+                queue.task_done()
+
+    def slide(self):
+        """
+        Moves the pane being filled into the window, even when it is not complete, removing the oldest pane once the
+        window is full. Calling it at regular intervals gives panes spanning a fixed time instead of a fixed number of
+        transactions.
+        """
 
+        if self.__tree is None:
+            self._resetWindow()
+        transactions, utilities, utilitySums = self.__pending
+        self.__pending = [[], [], []]
+        if len(self.__panes) == self.__windowSize:
             self.__tree.removeBatch()
+        self.slidePaneIndexes(transactions, utilities)
+        self.__tree.batchIndex = len(self.__panes) - 1
+        for i in range(len(transactions)):
+            self.__tree.addTransaction(transactions[i], utilitySums[i], utilities[i])
+
+    def currentPatterns(self):
+        """
+        Mines the high utility patterns of the current window
+
+        :return: list of the patterns of the window, every pattern being the list of its items and its utility
+
+        :rtype: list
+        """
+
+        if self.__tree is None:
+            return []
+        filteredItemsets = {}
+
+        self.treeGenerations(self.__tree, self._minUtil, filteredItemsets)
+
+        results = []
+        windowUtilities = {}
+
+        for itemSetLen in filteredItemsets:
+            for itemSet in filteredItemsets[itemSetLen]:
+                itemSetUtility = self.itemsetUtility(itemSet)
+                windowUtilities[tuple(sorted(itemSet))] = itemSetUtility
 
-            for i in range(0, self.__paneSize):
-                self.__tree.addTransaction(self._transactions[endIndex + i], self._utilitySum[endIndex + i],
-                                           self._utilities[endIndex + i])
+                if (itemSetUtility >= self._minUtil):
+                    results.append([itemSet, itemSetUtility])
+
+        self.__windowUtilities = windowUtilities
+        return results
+
+    @deprecated("It is recommended to use 'mine()' instead of 'startMine()' for mining process. Starting from January 2025, 'startMine()' will be completely terminated.")
+    def startMine(self):
+        """
+        This function will start the mining process
+        """
+        self.mine()
+
+    def mine(self):
+        """
+        This function will start the mining process
+        """
+        global _minUtil
+        self.__startTime = _hus._time.time()
+        if self._iFile is None:
+            raise Exception("Please enter the file path or file name:")
+        if self._minUtil is None:
+            raise Exception("Please enter the Minimum Support")
+        if self._windowSize is None:
+            raise Exception("Please enter the Window Size")
+        if self._paneSize is None:
+            raise Exception("Please enter the Pane Size")
+        self._createItemsets()
+        self._resetWindow()
 
-            startIndex += self.__paneSize
-            endIndex += self.__paneSize
+        for start in range(0, len(self._transactions) - self.__paneSize + 1, self.__paneSize):
+            end = start + self.__paneSize
+            self.addTransactions(zip(self._transactions[start:end], self._utilities[start:end], self._utilitySum[start:end]))
+            if len(self.__panes) == self.__windowSize:
+                self.__finalPatterns[(self.__windowStart, self.__windowEnd)] = self.currentPatterns()
 
         self.__endTime = _hus._time.time()
         self.__memoryUSS = float()
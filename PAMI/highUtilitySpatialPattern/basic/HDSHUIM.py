@@ -198,6 +198,10 @@ class HDSHUIM(_ab._utilityPatterns):
             huis created
         neighbors: map
             keep track of neighbours of elements
+        itemBits: map
+            the bit of every promising item, given in the order of the compact utility lists
+        neighbourBits: map
+            the promising neighbours of every promising item as a bitset
         mapOfPMU: map
             a map to keep track of Probable Maximum utility(PMU) of each item
     :Methods:
@@ -220,6 +224,8 @@ class HDSHUIM(_ab._utilityPatterns):
                 Total amount of runtime taken by the mining process will be retrieved from this function
             Explore_SearchTree(prefix, uList, exNeighbours, minUtil)
                 A method to find all high utility itemSets
+            createNeighbourBitsets(listOfCUList)
+                A method to store the neighbours of every promising item as a bitset
             updateClosed(x, compactUList, st, exCul, newT, ex, eyTs, length)
                 A method to update closed values
             saveItemSet(prefix, prefixLen, item, utility)
@@ -300,6 +306,8 @@ class HDSHUIM(_ab._utilityPatterns):
         self._mapOfPMU = {}
         self._mapFMAP = {}
         self._neighbors = {}
+        self._itemBits = {}
+        self._neighbourBits = {}
         self._finalPatterns = {}
 
     def _compareItems(self, o1: Any, o2: Any) -> int:
@@ -384,6 +392,7 @@ class HDSHUIM(_ab._utilityPatterns):
                 mapItemsToCUList[item] = uList
                 listOfCUList.append(uList)
         listOfCUList.sort(key=_ab._functools.cmp_to_key(self._compareItems))
+        self._createNeighbourBitsets(listOfCUList)
         ts = 1
         with open(self._iFile, 'r') as file:
             for line in file:
@@ -443,9 +452,7 @@ class HDSHUIM(_ab._utilityPatterns):
                         else:
                             mapFMAPItem[pairAfter.item] = twuSUm + newTwu
                 ts += 1
-        exNeighbours = set(self._mapOfPMU.keys())
-        # print(self.Neighbours)
-        self._ExploreSearchTree([], listOfCUList, exNeighbours, minUtil)
+        self._ExploreSearchTree([], listOfCUList, -1, minUtil)
         self._endTime = _ab._time.time()
         process = _ab._psutil.Process(_ab._os.getpid())
         self._memoryUSS = float()
@@ -453,43 +460,58 @@ class HDSHUIM(_ab._utilityPatterns):
         self._memoryUSS = process.memory_full_info().uss
         self._memoryRSS = process.memory_info().rss
 
-    def _ExploreSearchTree(self, prefix: List[str], uList: List[_CUList], exNeighbours: set, minUtil: int) -> None:
+    def _createNeighbourBitsets(self, listOfCUList: List[_CUList]) -> None:
+        """
+        A method to give every promising item a bit and to store its promising neighbours as a bitset, so that the
+        common neighbours of a prefix are a single integer narrowed with one AND per extension
+        :parm listOfCUList: the compact utility lists of the promising items
+        :type listOfCUList: list
+        :return: None
+        """
+        self._itemBits = {}
+        for position, uList in enumerate(listOfCUList):
+            self._itemBits[uList.item] = 1 << position
+        self._neighbourBits = {}
+        for uList in listOfCUList:
+            bits = 0
+            for neighbour in self._neighbors.get(uList.item, ()):
+                bits |= self._itemBits.get(neighbour, 0)
+            self._neighbourBits[uList.item] = bits
+
+    def _ExploreSearchTree(self, prefix: List[str], uList: List[_CUList], exNeighbours: int, minUtil: int) -> None:
         """
         A method to find all high utility itemSets
         :parm prefix: it represents all items in prefix
         :type prefix :list
         :parm uList:projected Utility list.
         :type uList: list
-        :parm exNeighbours: keep track of common Neighbours
-        :type exNeighbours: set
+        :parm exNeighbours: bitset of the common Neighbours, -1 when the prefix is empty
+        :type exNeighbours: int
         :parm minUtil:user minUtil
         :type minUtil:int
         :return: None
         """
         for i in range(0, len(uList)):
             x = uList[i]
-            if x.item not in exNeighbours:
+            if not exNeighbours & self._itemBits[x.item]:
                 continue
             self._candidates += 1
-            sortedPrefix = [0] * (len(prefix) + 1)
             sortedPrefix = prefix[0:len(prefix) + 1]
             sortedPrefix.append(x.item)
-            if (x.sumSnu + x.sumCu >= minUtil) and (x.item in exNeighbours):
+            if x.sumSnu + x.sumCu >= minUtil:
                 self._saveItemSet(prefix, len(prefix), x.item, x.sumSnu + x.sumCu)
-            if x.sumSnu + x.sumCu + x.sumRemainingUtility + x.sumCru >= minUtil:  # U-Prune # and (x.item in exNeighbours)):
+            if x.sumSnu + x.sumCu + x.sumRemainingUtility + x.sumCru >= minUtil:  # U-Prune
+                commonNeighbours = exNeighbours & self._neighbourBits[x.item]
+                if not commonNeighbours:
+                    continue
                 ULIST = []
                 for j in range(i, len(uList)):
-                    if (uList[j].item in exNeighbours) and (self._neighbors.get(x.item) is not None) and (
-                            uList[j].item in self._neighbors.get(x.item)):
+                    if commonNeighbours & self._itemBits[uList[j].item]:
                         ULIST.append(uList[j])
                 exULs = self._constructCUL(x, ULIST, -1, minUtil, len(sortedPrefix), exNeighbours)
-                if self._neighbors.get(x.item) is not None and exNeighbours is not None:
-                    set1 = exNeighbours.intersection(self._neighbors.get(x.item))
-                    if exULs is None or set1 is None:
-                        continue
-                    self._ExploreSearchTree(sortedPrefix, exULs, set1, minUtil)
+                self._ExploreSearchTree(sortedPrefix, exULs, commonNeighbours, minUtil)
 
-    def _constructCUL(self, x: _Element, compactUList: List[_CUList], st: int, minUtil: int, length: int, exNeighbours: set) -> List[_CUList]:
+    def _constructCUL(self, x: _Element, compactUList: List[_CUList], st: int, minUtil: int, length: int, exNeighbours: int) -> List[_CUList]:
         """
         A method to construct CUL's database
         :parm x: Compact utility list
@@ -502,8 +524,8 @@ class HDSHUIM(_ab._utilityPatterns):
         :type minUtil:int
         :parm length: length of x
         :type length:int
-        :parm exNeighbours: common Neighbours
-        :type exNeighbours: set
+        :parm exNeighbours: bitset of the common Neighbours
+        :type exNeighbours: int
         :return: projected database of list X
         :rtype: list or set
         """
@@ -523,7 +545,7 @@ class HDSHUIM(_ab._utilityPatterns):
             mapOfTWUF = self._mapFMAP[x.item]
             if mapOfTWUF is not None:
                 twuf = mapOfTWUF.get(compactUList[j].item)
-                if twuf != None and twuf < minUtil or (not (exCul[j].item in exNeighbours)):
+                if twuf != None and twuf < minUtil or not exNeighbours & self._itemBits[exCul[j].item]:
                     exCul[j] = None
                     exSZ = sz - 1
                 else:
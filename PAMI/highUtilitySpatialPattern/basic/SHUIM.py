@@ -53,8 +53,8 @@ Copyright (C)  2021 Rage Uday Kiran
 """
 
 from PAMI.highUtilitySpatialPattern.basic import abstract as _ab
+from PAMI.extras import utilityProjection as _up
 from typing import List, Dict, Tuple, Set, Union, Any, Generator, Optional, TypeVar
-from functools import cmp_to_key as _cmpToKey
 import pandas as pd
 from deprecated import deprecated
 
@@ -79,8 +79,6 @@ class _Transaction:
             an offset pointer, used by projected transactions
     :Methods:
 
-        projectedTransaction(offsetE):
-            A method to create new Transaction from existing till offsetE
         getItems():
             return items in transaction
         getUtilities():
@@ -105,22 +103,6 @@ class _Transaction:
         if pmus is not None:
             self.pmus = pmus
 
-    def projectTransaction(self, offsetE: int) -> Self:
-        """
-        A method to create new Transaction from existing till offsetE
-
-        :param offsetE: an offset over the original transaction for projecting the transaction
-        :type offsetE: int
-        """
-        new_transaction = _Transaction(self.items, self.utilities, self.transactionUtility)
-        utilityE = self.utilities[offsetE]
-        new_transaction.prefixUtility = self.prefixUtility + utilityE
-        new_transaction.transactionUtility = self.transactionUtility - utilityE
-        for i in range(self.offset, offsetE):
-            new_transaction.transactionUtility -= self.utilities[i]
-        new_transaction.offset = offsetE + 1
-        return new_transaction
-
     def getItems(self) -> List[int]:
         """
         A method to return items in transaction
@@ -366,24 +348,16 @@ class SHUIM(_ab._utilityPatterns):
                 Total amount of RSS memory consumed by the mining process will be retrieved from this function
         getRuntime()
                Total amount of runtime taken by the mining process will be retrieved from this function
-        calculateNeighbourIntersection(self, prefixLength)
-               A method to return common Neighbours of items
-        backtrackingEFIM(transactionsOfP, itemsToKeep, itemsToExplore, prefixLength)
+        createNeighbourBitsets()
+               A method to store the neighbours of every promising item as a bitset over the new names
+        backtrackingEFIM(transactionsOfP, itemsToKeep, itemsToExplore, prefixLength, prefixNeighbourhood)
                A method to mine the SHUIs Recursively
-        useUtilityBinArraysToCalculateUpperBounds(transactionsPe, j, itemsToKeep, neighbourhoodList)
+        useUtilityBinArraysToCalculateUpperBounds(transactionsPe, j, itemsToKeep, neighbourhood)
                A method to  calculate the sub-tree utility and local utility of all items that can extend itemSet P and e
         output(tempPosition, utility)
                A method ave a high-utility itemSet to file or memory depending on what the user chose
-        _isEqual(transaction1, transaction2)
-               A method to Check if two transaction are identical
-        intersection(lst1, lst2)
-               A method that return the intersection of 2 list
         useUtilityBinArrayToCalculateSubtreeUtilityFirstTime(dataset)
               Scan the initial database to calculate the subtree utility of each items using a utility-bin array
-        sortDatabase(self, transactions)
-              A Method to sort transaction in the order of PMU
-        sort_transaction(self, trans1, trans2)
-              A Method to sort transaction in the order of PMU
         useUtilityBinArrayToCalculateLocalUtilityFirstTime(self, dataset)
              A method to scan the database using utility bin array to calculate the pmus                   
 
@@ -444,6 +418,7 @@ class SHUIM(_ab._utilityPatterns):
     _strToInt = {}
     _intToStr = {}
     _Neighbours = {}
+    _neighbourBits = {}
     _temp = [0] * 5000
     _maxMemory = 0
     _startTime = float()
@@ -505,12 +480,8 @@ class SHUIM(_ab._utilityPatterns):
             currentName += 1
         for transaction in self._dataset.getTransactions():
             transaction.removeUnpromisingItems(self._oldNamesToNewNames)
-        self._sortDatabase(self._dataset.getTransactions())
-        emptyTransactionCount = 0
-        for transaction in self._dataset.getTransactions():
-            if len(transaction.getItems()) == 0:
-                emptyTransactionCount += 1
-        self._dataset.transactions = self._dataset.transactions[emptyTransactionCount:]
+        self._dataset.transactions = [transaction for transaction in self._dataset.transactions if transaction.items]
+        self._createNeighbourBitsets()
         self._useUtilityBinArrayToCalculateSubtreeUtilityFirstTime(self._dataset)
         itemsToExplore = []
         for item in itemsToKeep:
@@ -519,7 +490,7 @@ class SHUIM(_ab._utilityPatterns):
         commonitems = []
         for i in range(self._dataset.maxItem):
             commonitems.append(i)
-        self._backtrackingEFIM(self._dataset.getTransactions(), itemsToKeep, itemsToExplore, 0)
+        self._backtrackingEFIM(self._dataset.getTransactions(), itemsToKeep, itemsToExplore, 0, -1)
         finalMemory = _ab._psutil.virtual_memory()[3]
         memory = (finalMemory - InitialMemory) / 10000
         if memory > self._maxMemory:
@@ -531,7 +502,7 @@ class SHUIM(_ab._utilityPatterns):
         self._memoryUSS = process.memory_full_info().uss
         self._memoryRSS = process.memory_info().rss
 
-    def _backtrackingEFIM(self, transactionsOfP: List[_Transaction], itemsToKeep: List[int], itemsToExplore: List[int], prefixLength: int) -> None:
+    def _backtrackingEFIM(self, transactionsOfP: List[_Transaction], itemsToKeep: List[int], itemsToExplore: List[int], prefixLength: int, prefixNeighbourhood: int) -> None:
         """
         A method to mine the SHUIs Recursively
 
@@ -543,83 +514,37 @@ class SHUIM(_ab._utilityPatterns):
         :type itemsToExplore: list
         :param prefixLength: current prefixLength
         :type prefixLength: int
+        :param prefixNeighbourhood: the bitset of the common neighbours of the items of P, -1 when P is empty
+        :type prefixNeighbourhood: int
         :return: None
         """
         self._candidateCount += len(itemsToExplore)
         for idx, e in enumerate(itemsToExplore):
             initialMemory = _ab._psutil.virtual_memory()[3]
-            transactionsPe = []
-            utilityPe = 0
-            previousTransaction = transactionsOfP[0]
-            consecutiveMergeCount = 0
-            for transaction in transactionsOfP:
-                items = transaction.getItems()
-                if e in items:
-                    positionE = items.index(e)
-                    if transaction.getLastPosition() == positionE:
-                        utilityPe += transaction.getUtilities()[positionE] + transaction.prefixUtility
-                    else:
-                        projectedTransaction = transaction.projectTransaction(positionE)
-                        utilityPe += projectedTransaction.prefixUtility
-                        if previousTransaction == transactionsOfP[0]:
-                            previousTransaction = projectedTransaction
-                        elif self._isEqual(projectedTransaction, previousTransaction):
-                            if consecutiveMergeCount == 0:
-                                items = previousTransaction.items[previousTransaction.offset:]
-                                utilities = previousTransaction.utilities[previousTransaction.offset:]
-                                itemsCount = len(items)
-                                positionPrevious = 0
-                                positionProjection = projectedTransaction.offset
-                                while positionPrevious < itemsCount:
-                                    utilities[positionPrevious] += projectedTransaction.utilities[positionProjection]
-                                    positionPrevious += 1
-                                    positionProjection += 1
-                                previousTransaction.prefixUtility += projectedTransaction.prefixUtility
-                                sumUtilities = previousTransaction.prefixUtility
-                                previousTransaction = _Transaction(items, utilities, previousTransaction.transactionUtility + projectedTransaction.transactionUtility)
-                                previousTransaction.prefixUtility = sumUtilities
-                            else:
-                                positionPrevious = 0
-                                positionProjected = projectedTransaction.offset
-                                itemsCount = len(previousTransaction.items)
-                                while positionPrevious < itemsCount:
-                                    previousTransaction.utilities[positionPrevious] += projectedTransaction.utilities[
-                                        positionProjected]
-                                    positionPrevious += 1
-                                    positionProjected += 1
-                                previousTransaction.transactionUtility += projectedTransaction.transactionUtility
-                                previousTransaction.prefixUtility += projectedTransaction.prefixUtility
-                            consecutiveMergeCount += 1
-                        else:
-                            transactionsPe.append(previousTransaction)
-                            previousTransaction = projectedTransaction
-                            consecutiveMergeCount = 0
-                    transaction.offset = positionE
-            if previousTransaction != transactionsOfP[0]:
-                transactionsPe.append(previousTransaction)
+            utilityPe, _, transactionsPe = _up.project(transactionsOfP, e, _Transaction)
             self._temp[prefixLength] = self._newNamesToOldNames[e]
             if utilityPe >= self._minUtil:
                 self._output(prefixLength, utilityPe)
-            neighbourhoodList = self._calculateNeighbourIntersection(prefixLength)
-            self._useUtilityBinArraysToCalculateUpperBounds(transactionsPe, idx, itemsToKeep, neighbourhoodList)
+            neighbourhood = prefixNeighbourhood & self._neighbourBits[e]
+            self._useUtilityBinArraysToCalculateUpperBounds(transactionsPe, idx, itemsToKeep, neighbourhood)
             newItemsToKeep = []
             newItemsToExplore = []
             for l in range(idx + 1, len(itemsToKeep)):
                 itemK = itemsToKeep[l]
+                if not neighbourhood >> itemK & 1:
+                    continue
                 if self._utilityBinArraySU[itemK] >= self._minUtil:
-                    if itemK in neighbourhoodList:
-                        newItemsToExplore.append(itemK)
-                        newItemsToKeep.append(itemK)
+                    newItemsToExplore.append(itemK)
+                    newItemsToKeep.append(itemK)
                 elif self._utilityBinArrayLU[itemK] >= self._minUtil:
-                    if itemK in neighbourhoodList:
-                        newItemsToKeep.append(itemK)
-            self._backtrackingEFIM(transactionsPe, newItemsToKeep, newItemsToExplore, prefixLength + 1)
+                    newItemsToKeep.append(itemK)
+            self._backtrackingEFIM(transactionsPe, newItemsToKeep, newItemsToExplore, prefixLength + 1, neighbourhood)
             finalMemory = _ab._psutil.virtual_memory()[3]
             memory = (finalMemory - initialMemory) / 10000
             if self._maxMemory < memory:
                 self._maxMemory = memory
 
-    def _useUtilityBinArraysToCalculateUpperBounds(self, transactionsPe: List[_Transaction], j: int, itemsToKeep: List[int], neighbourhoodList: List[int]) -> None:
+    def _useUtilityBinArraysToCalculateUpperBounds(self, transactionsPe: List[_Transaction], j: int, itemsToKeep: List[int], neighbourhood: int) -> None:
         """
         A method to  calculate the subtree utility and local utility of all items that can extend itemSet P U {e}
 
@@ -629,54 +554,49 @@ class SHUIM(_ab._utilityPatterns):
         :type j:int
         :param itemsToKeep :the list of promising items
         :type itemsToKeep: list
+        :param neighbourhood: the bitset of the common neighbours of the items of P U {e}
+        :type neighbourhood: int
         :return: None
         """
+        keep = 0
+        for item in itemsToKeep:
+            keep |= 1 << item
         for i in range(j + 1, len(itemsToKeep)):
             item = itemsToKeep[i]
             self._utilityBinArrayLU[item] = 0
             self._utilityBinArraySU[item] = 0
         for transaction in transactionsPe:
-            length = len(transaction.getItems())
-            i = length - 1
-            while i >= transaction.offset:
-                item = transaction.getItems()[i]
-                if item in itemsToKeep:
-                    remainingUtility = 0
-                    if self._newNamesToOldNames[item] in self._Neighbours:
-                        item_neighbours = self._Neighbours[self._newNamesToOldNames[item]]
-                        for k in range(i, length):
-                            transaction_item = transaction.getItems()[k]
-                            if self._newNamesToOldNames[transaction_item] in item_neighbours and transaction_item in neighbourhoodList:
-                                remainingUtility += transaction.getUtilities()[k]
-
-                    remainingUtility += transaction.getUtilities()[i]
-                    self._utilityBinArraySU[item] += remainingUtility + transaction.prefixUtility
-                    self._utilityBinArrayLU[item] += transaction.transactionUtility + transaction.prefixUtility
-                i -= 1
+            items = transaction.getItems()
+            utilities = transaction.getUtilities()
+            length = len(items)
+            for i in range(length - 1, transaction.offset - 1, -1):
+                item = items[i]
+                if not keep >> item & 1:
+                    continue
+                remainingUtility = utilities[i]
+                mask = self._neighbourBits[item] & neighbourhood
+                if mask:
+                    for k in range(i, length):
+                        if mask >> items[k] & 1:
+                            remainingUtility += utilities[k]
+                self._utilityBinArraySU[item] += remainingUtility + transaction.prefixUtility
+                self._utilityBinArrayLU[item] += transaction.transactionUtility + transaction.prefixUtility
 
-    def _calculateNeighbourIntersection(self, prefixLength: int) -> List[int]:
+    def _createNeighbourBitsets(self) -> None:
         """
-        A method to find common Neighbours
-
-        :param prefixLength: the prefix itemSet
-
-        :type prefixLength:int
+        A method to store the neighbours of every promising item as a bitset over the new names, so that the common
+        neighbours of a prefix are kept as a single integer and narrowed with one AND per extension
 
-        :return: the common neighbours
-
-        :rtype: list
+        :return: None
         """
-        intersectionList = self._Neighbours.get(self._temp[0])
-        for i in range(1, prefixLength+1):
-            intersectionList = self._intersection(self._Neighbours[self._temp[i]], intersectionList)
-        finalIntersectionList = []
-        if intersectionList is None:
-            return finalIntersectionList
-        for item in intersectionList:
-            if item in self._oldNamesToNewNames:
-                finalIntersectionList.append(self._oldNamesToNewNames[item])
-        return finalIntersectionList
-    
+        self._neighbourBits = {}
+        for item, newName in self._oldNamesToNewNames.items():
+            bits = 0
+            for neighbour in self._Neighbours.get(item, ()):
+                if neighbour in self._oldNamesToNewNames:
+                    bits |= 1 << self._oldNamesToNewNames[neighbour]
+            self._neighbourBits[newName] = bits
+
     def _output(self, tempPosition: int, utility: int) -> None:
         """
         A method save all high-utility itemSet to file or memory depending on what the user chose
@@ -695,46 +615,6 @@ class SHUIM(_ab._utilityPatterns):
                 s1 += "\t"
         self._finalPatterns[s1] = str(utility)
 
-    def _isEqual(self, transaction1: _Transaction, transaction2: _Transaction) -> bool:
-        """
-        A method to Check if two transaction are identical
-
-        :param  transaction1: the first transaction.
-        :type  transaction1: Transaction
-        :param  transaction2:   the second transaction.
-        :type  transaction2: Transaction
-        :return : whether both are identical or not
-        :rtype: bool
-        """
-
-        length1 = len(transaction1.items) - transaction1.offset
-        length2 = len(transaction2.items) - transaction2.offset
-        if length1 != length2:
-            return False
-        position1 = transaction1.offset
-        position2 = transaction2.offset
-        while position1 < len(transaction1.items):
-            if transaction1.items[position1] != transaction2.items[position2]:
-                return False
-            position1 += 1
-            position2 += 1
-        return True
-    
-    def _intersection(self, lst1: List[int], lst2: List[int]) -> List[int]:
-        """
-        A method that return the intersection of 2 list
-
-        :param  lst1: items neighbour to item1
-        :type lst1: list
-        :param lst2: items neighbour to item2
-        :type lst2: list
-        :return :intersection of two lists
-        :rtype : list
-        """
-        temp = set(lst2)
-        lst3 = [value for value in lst1 if value in temp]
-        return lst3
-
     def _useUtilityBinArrayToCalculateSubtreeUtilityFirstTime(self, dataset: _Dataset) -> None:
         """
         Scan the initial database to calculate the subtree utility of each item using a utility-bin array
@@ -751,69 +631,14 @@ class SHUIM(_ab._utilityPatterns):
             for idx, item in enumerate(items):
                 if item not in self._utilityBinArraySU:
                     self._utilityBinArraySU[item] = 0
-                if self._newNamesToOldNames[item] not in self._Neighbours:
-                    self._utilityBinArraySU[item] += utilities[idx]
-                    continue
-                i = idx + 1
                 sumSu = utilities[idx]
-                while i < len(items):
-                    if self._newNamesToOldNames[items[i]] in self._Neighbours[self._newNamesToOldNames[item]]:
-                        sumSu += utilities[i]
-                    i += 1
+                neighbours = self._neighbourBits[item]
+                if neighbours:
+                    for i in range(idx + 1, len(items)):
+                        if neighbours >> items[i] & 1:
+                            sumSu += utilities[i]
                 self._utilityBinArraySU[item] += sumSu
 
-    def _sortDatabase(self, transactions: List[_Transaction]) -> None:
-        """
-        A Method to sort transaction in the order of PMU
-
-        :param transactions: transaction of items
-        :type transactions: Transaction
-        :return: sorted transaction.
-        :rtype: Transaction
-        """
-        cmp_items = _cmpToKey(self._sortTransaction)
-        transactions.sort(key=cmp_items)
-
-    def _sortTransaction(self, trans1: _Transaction, trans2: _Transaction) -> int:
-        """
-        A Method to sort transaction in the order of PMU
-
-        :param trans1: the first transaction.
-        :type trans1: Transaction
-        :param trans2:the second transaction.
-        :type trans2: Transaction
-        :return: sorted transaction.
-        :rtype: int
-        """
-        trans1_items = trans1.getItems()
-        trans2_items = trans2.getItems()
-        pos1 = len(trans1_items) - 1
-        pos2 = len(trans2_items) - 1
-        if len(trans1_items) < len(trans2_items):
-            while pos1 >= 0:
-                sub = trans2_items[pos2] - trans1_items[pos1]
-                if sub != 0:
-                    return sub
-                pos1 -= 1
-                pos2 -= 1
-            return -1
-        elif len(trans1_items) > len(trans2_items):
-            while pos2 >= 0:
-                sub = trans2_items[pos2] - trans1_items[pos1]
-                if sub != 0:
-                    return sub
-                pos1 -= 1
-                pos2 -= 1
-            return 1
-        else:
-            while pos2 >= 0:
-                sub = trans2_items[pos2] - trans1_items[pos1]
-                if sub != 0:
-                    return sub
-                pos1 -= 1
-                pos2 -= 1
-            return 0
-
     def _useUtilityBinArrayToCalculateLocalUtilityFirstTime(self, dataset: _Dataset) -> None:
         """
         A method to scan the database using utility bin array to calculate the pmus
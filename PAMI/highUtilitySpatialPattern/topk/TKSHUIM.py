@@ -56,7 +56,7 @@ Copyright (C)  2021 Rage Uday Kiran
 """
 
 from PAMI.highUtilitySpatialPattern.topk.abstract import *
-from functools import cmp_to_key
+from PAMI.extras import utilityProjection as _up
 import heapq
 from deprecated import deprecated
 
@@ -81,8 +81,6 @@ class Transaction:
 
     :Methods:
 
-        projectedTransaction(offsetE):
-            A method to create new Transaction from existing till offsetE
         getItems():
             return items in transaction
         getUtilities():
@@ -106,22 +104,6 @@ class Transaction:
         if pmus is not None:
             self.pmus = pmus
 
-    def projectTransaction(self, offsetE):
-        """
-        A method to create new Transaction from existing till offsetE
-
-        :param offsetE: an offset over the original transaction for projecting the transaction
-        :type offsetE: int
-        """
-        new_transaction = Transaction(self.items, self.utilities, self.transactionUtility)
-        utilityE = self.utilities[offsetE]
-        new_transaction.prefixUtility = self.prefixUtility + utilityE
-        new_transaction.transactionUtility = self.transactionUtility - utilityE
-        for i in range(self.offset, offsetE):
-            new_transaction.transactionUtility -= self.utilities[i]
-        new_transaction.offset = offsetE + 1
-        return new_transaction
-
     def getItems(self):
         """
         A method to return items in transaction
@@ -341,24 +323,16 @@ class TKSHUIM(utilityPatterns):
                 Total amount of RSS memory consumed by the mining process will be retrieved from this function
         getRuntime()
                Total amount of runtime taken by the mining process will be retrieved from this function
-        calculateNeighbourIntersection(self, prefixLength)
-               A method to return common Neighbours of items
-        backtrackingEFIM(transactionsOfP, itemsToKeep, itemsToExplore, prefixLength)
+        createNeighbourBitsets()
+               A method to store the neighbours of every promising item as a bitset over the new names
+        backtrackingEFIM(transactionsOfP, itemsToKeep, itemsToExplore, prefixLength, prefixNeighbourhood)
                A method to mine the TKSHUIs Recursively
-        useUtilityBinArraysToCalculateUpperBounds(transactionsPe, j, itemsToKeep, neighbourhoodList)
+        useUtilityBinArraysToCalculateUpperBounds(transactionsPe, j, itemsToKeep, neighbourhood)
                A method to  calculate the sub-tree utility and local utility of all items that can extend itemSet P and e
         output(tempPosition, utility)
                A method ave a high-utility itemSet to file or memory depending on what the user chose
-        is_equal(transaction1, transaction2)
-               A method to Check if two transaction are identical
-        intersection(lst1, lst2)
-               A method that return the intersection of 2 list
         useUtilityBinArrayToCalculateSubtreeUtilityFirstTime(dataset)
               Scan the initial database to calculate the subtree utility of each items using a utility-bin array
-        sortDatabase(self, transactions)
-              A Method to sort transaction in the order of PMU
-        sort_transaction(self, trans1, trans2)
-              A Method to sort transaction in the order of PMU
         useUtilityBinArrayToCalculateLocalUtilityFirstTime(self, dataset)
              A method to scan the database using utility bin array to calculate the pmus                   
 
@@ -416,6 +390,7 @@ class TKSHUIM(utilityPatterns):
     strToint = {}
     intTostr = {}
     Neighbours = {}
+    neighbourBits = {}
     temp = [0] * 5000
     maxMemory = 0
     startTime = float()
@@ -473,12 +448,8 @@ class TKSHUIM(utilityPatterns):
             currentName += 1
         for transaction in self.dataset.getTransactions():
             transaction.removeUnpromisingItems(self.oldNamesToNewNames)
-        self.sortDatabase(self.dataset.getTransactions())
-        emptyTransactionCount = 0
-        for transaction in self.dataset.getTransactions():
-            if len(transaction.getItems()) == 0:
-                emptyTransactionCount += 1
-        self.dataset.transactions = self.dataset.transactions[emptyTransactionCount:]
+        self.dataset.transactions = [transaction for transaction in self.dataset.transactions if transaction.items]
+        self.createNeighbourBitsets()
         self.useUtilityBinArrayToCalculateSubtreeUtilityFirstTime(self.dataset)
         self.heapList = []
         itemsToExplore = []
@@ -488,7 +459,7 @@ class TKSHUIM(utilityPatterns):
         commonitems = []
         for i in range(self.dataset.maxItem):
             commonitems.append(i)
-        self.backtrackingEFIM(self.dataset.getTransactions(), itemsToKeep, itemsToExplore, 0)
+        self.backtrackingEFIM(self.dataset.getTransactions(), itemsToKeep, itemsToExplore, 0, -1)
         finalMemory = psutil.virtual_memory()[3]
         memory = (finalMemory - InitialMemory) / 10000
         if memory > self.maxMemory:
@@ -503,7 +474,7 @@ class TKSHUIM(utilityPatterns):
             self.finalPatterns[item[1]] = item[0]
         print('TOP-K mining process is completed by TKSHUIM')
 
-    def backtrackingEFIM(self, transactionsOfP, itemsToKeep, itemsToExplore, prefixLength):
+    def backtrackingEFIM(self, transactionsOfP, itemsToKeep, itemsToExplore, prefixLength, prefixNeighbourhood):
         """
         A method to mine the TKSHUIs Recursively
 
@@ -515,84 +486,38 @@ class TKSHUIM(utilityPatterns):
         :type itemsToExplore: list
         :param prefixLength: current prefixLength
         :type prefixLength: int
+        :param prefixNeighbourhood: the bitset of the common neighbours of the items of P, -1 when P is empty
+        :type prefixNeighbourhood: int
         """
         self.candidateCount += len(itemsToExplore)
         for idx, e in enumerate(itemsToExplore):
             initialMemory = psutil.virtual_memory()[3]
-            transactionsPe = []
-            utilityPe = 0
             if len(transactionsOfP) == 0:
-                break 
-            previousTransaction = transactionsOfP[0]
-            consecutiveMergeCount = 0
-            for transaction in transactionsOfP:
-                items = transaction.getItems()
-                if e in items:
-                    positionE = items.index(e)
-                    if transaction.getLastPosition() == positionE:
-                        utilityPe += transaction.getUtilities()[positionE] + transaction.prefixUtility
-                    else:
-                        projectedTransaction = transaction.projectTransaction(positionE)
-                        utilityPe += projectedTransaction.prefixUtility
-                        if previousTransaction == transactionsOfP[0]:
-                            previousTransaction = projectedTransaction
-                        elif self.is_equal(projectedTransaction, previousTransaction):
-                            if consecutiveMergeCount == 0:
-                                items = previousTransaction.items[previousTransaction.offset:]
-                                utilities = previousTransaction.utilities[previousTransaction.offset:]
-                                itemsCount = len(items)
-                                positionPrevious = 0
-                                positionProjection = projectedTransaction.offset
-                                while positionPrevious < itemsCount:
-                                    utilities[positionPrevious] += projectedTransaction.utilities[positionProjection]
-                                    positionPrevious += 1
-                                    positionProjection += 1
-                                previousTransaction.prefixUtility += projectedTransaction.prefixUtility
-                                sumUtilities = previousTransaction.prefixUtility
-                                previousTransaction = Transaction(items, utilities, previousTransaction.transactionUtility + projectedTransaction.transactionUtility)
-                                previousTransaction.prefixUtility = sumUtilities
-                            else:
-                                positionPrevious = 0
-                                positionProjected = projectedTransaction.offset
-                                itemsCount = len(previousTransaction.items)
-                                while positionPrevious < itemsCount:
-                                    previousTransaction.utilities[positionPrevious] += projectedTransaction.utilities[
-                                        positionProjected]
-                                    positionPrevious += 1
-                                    positionProjected += 1
-                                previousTransaction.transactionUtility += projectedTransaction.transactionUtility
-                                previousTransaction.prefixUtility += projectedTransaction.prefixUtility
-                            consecutiveMergeCount += 1
-                        else:
-                            transactionsPe.append(previousTransaction)
-                            previousTransaction = projectedTransaction
-                            consecutiveMergeCount = 0
-                    transaction.offset = positionE
-            if previousTransaction != transactionsOfP[0]:
-                transactionsPe.append(previousTransaction)
+                break
+            utilityPe, _, transactionsPe = _up.project(transactionsOfP, e, Transaction)
             self.temp[prefixLength] = self.newNamesToOldNames[e]
             if utilityPe >= self.minUtil:
                 self.output(prefixLength, utilityPe)
-            neighbourhoodList = self.calculateNeighbourIntersection(prefixLength)
-            self.useUtilityBinArraysToCalculateUpperBounds(transactionsPe, idx, itemsToKeep, neighbourhoodList)
+            neighbourhood = prefixNeighbourhood & self.neighbourBits[e]
+            self.useUtilityBinArraysToCalculateUpperBounds(transactionsPe, idx, itemsToKeep, neighbourhood)
             newItemsToKeep = []
             newItemsToExplore = []
             for l in range(idx + 1, len(itemsToKeep)):
                 itemK = itemsToKeep[l]
+                if not neighbourhood >> itemK & 1:
+                    continue
                 if self.utilityBinArraySU[itemK] >= self.minUtil:
-                    if itemK in neighbourhoodList:
-                        newItemsToExplore.append(itemK)
-                        newItemsToKeep.append(itemK)
+                    newItemsToExplore.append(itemK)
+                    newItemsToKeep.append(itemK)
                 elif self.utilityBinArrayLU[itemK] >= self.minUtil:
-                    if itemK in neighbourhoodList:
-                        newItemsToKeep.append(itemK)
-            self.backtrackingEFIM(transactionsPe, newItemsToKeep, newItemsToExplore, prefixLength + 1)
+                    newItemsToKeep.append(itemK)
+            self.backtrackingEFIM(transactionsPe, newItemsToKeep, newItemsToExplore, prefixLength + 1, neighbourhood)
             finalMemory = psutil.virtual_memory()[3]
             memory = (finalMemory - initialMemory) / 10000
             if self.maxMemory < memory:
                 self.maxMemory = memory
 
-    def useUtilityBinArraysToCalculateUpperBounds(self, transactionsPe, j, itemsToKeep, neighbourhoodList):
+    def useUtilityBinArraysToCalculateUpperBounds(self, transactionsPe, j, itemsToKeep, neighbourhood):
         """
         A method to  calculate the sub-tree utility and local utility of all items that can extend itemSet P U {e}
 
@@ -602,50 +527,46 @@ class TKSHUIM(utilityPatterns):
         :type j:int
         :param itemsToKeep :the list of promising items
         :type itemsToKeep: list
-        :param neighbourhoodList: list of neighbourhood elements
-        :type neighbourhoodList: list
+        :param neighbourhood: bitset of the common neighbours of P U {e}
+        :type neighbourhood: int
         """
+        keep = 0
+        for item in itemsToKeep:
+            keep |= 1 << item
         for i in range(j + 1, len(itemsToKeep)):
             item = itemsToKeep[i]
             self.utilityBinArrayLU[item] = 0
             self.utilityBinArraySU[item] = 0
         for transaction in transactionsPe:
-            length = len(transaction.getItems())
-            i = length - 1
-            while i >= transaction.offset:
-                item = transaction.getItems()[i]
-                if item in itemsToKeep:
-                    remainingUtility = 0
-                    if self.newNamesToOldNames[item] in self.Neighbours:
-                        item_neighbours = self.Neighbours[self.newNamesToOldNames[item]]
-                        for k in range(i, length):
-                            transaction_item = transaction.getItems()[k]
-                            if self.newNamesToOldNames[transaction_item] in item_neighbours and transaction_item in neighbourhoodList:
-                                remainingUtility += transaction.getUtilities()[k]
-
-                    remainingUtility += transaction.getUtilities()[i]
-                    self.utilityBinArraySU[item] += remainingUtility + transaction.prefixUtility
-                    self.utilityBinArrayLU[item] += transaction.transactionUtility + transaction.prefixUtility
-                i -= 1
-
-    def calculateNeighbourIntersection(self, prefixLength):
-        """
-        A method to find common Neighbours
-
-        :param prefixLength: the prefix itemSet
-        :type prefixLength:int
-        """
-        intersectionList = self.Neighbours.get(self.temp[0])
-        for i in range(1, prefixLength+1):
-            intersectionList = self.intersection(self.Neighbours[self.temp[i]], intersectionList)
-        finalIntersectionList = []
-        if intersectionList is None:
-            return finalIntersectionList
-        for item in intersectionList:
-            if item in self.oldNamesToNewNames:
-                finalIntersectionList.append(self.oldNamesToNewNames[item])
-        return finalIntersectionList
-    
+            items = transaction.getItems()
+            utilities = transaction.getUtilities()
+            length = len(items)
+            for i in range(length - 1, transaction.offset - 1, -1):
+                item = items[i]
+                if not keep >> item & 1:
+                    continue
+                remainingUtility = utilities[i]
+                mask = self.neighbourBits[item] & neighbourhood
+                if mask:
+                    for k in range(i, length):
+                        if mask >> items[k] & 1:
+                            remainingUtility += utilities[k]
+                self.utilityBinArraySU[item] += remainingUtility + transaction.prefixUtility
+                self.utilityBinArrayLU[item] += transaction.transactionUtility + transaction.prefixUtility
+
+    def createNeighbourBitsets(self):
+        """
+        A method to store the neighbours of every promising item as a bitset over the new names, so that the common
+        neighbours of a prefix are a single integer narrowed with one AND per extension
+        """
+        self.neighbourBits = {}
+        for item, newName in self.oldNamesToNewNames.items():
+            bits = 0
+            for neighbour in self.Neighbours.get(item, ()):
+                if neighbour in self.oldNamesToNewNames:
+                    bits |= 1 << self.oldNamesToNewNames[neighbour]
+            self.neighbourBits[newName] = bits
+
     def output(self, tempPosition, utility):
         """
         A method save all high-utility itemSet to file or memory depending on what the user chose
@@ -662,46 +583,6 @@ class TKSHUIM(utilityPatterns):
                 s1 += "\t"
         self.additemset(s1, utility)
 
-    def is_equal(self, transaction1, transaction2):
-        """
-        A method to Check if two transaction are identical
-
-        :param  transaction1: the first transaction.
-        :type  transaction1: Transaction
-        :param  transaction2:   the second transaction.
-        :type  transaction2: Transaction
-        :return : whether both are identical or not
-        :rtype: bool
-        """
-
-        length1 = len(transaction1.items) - transaction1.offset
-        length2 = len(transaction2.items) - transaction2.offset
-        if length1 != length2:
-            return False
-        position1 = transaction1.offset
-        position2 = transaction2.offset
-        while position1 < len(transaction1.items):
-            if transaction1.items[position1] != transaction2.items[position2]:
-                return False
-            position1 += 1
-            position2 += 1
-        return True
-    
-    def intersection(self, lst1, lst2):
-        """
-        A method that return the intersection of 2 list
-
-        :param  lst1: items neighbour to item1
-        :type lst1: list
-        :param lst2: items neighbour to item2
-        :type lst2: list
-        :return :intersection of two lists
-        :rtype : list
-        """
-        temp = set(lst2)
-        lst3 = [value for value in lst1 if value in temp]
-        return lst3
-
     def useUtilityBinArrayToCalculateSubtreeUtilityFirstTime(self, dataset):
         """
         Scan the initial database to calculate the subtree utility of each item using a utility-bin array
@@ -715,69 +596,14 @@ class TKSHUIM(utilityPatterns):
             for idx, item in enumerate(items):
                 if item not in self.utilityBinArraySU:
                     self.utilityBinArraySU[item] = 0
-                if self.newNamesToOldNames[item] not in self.Neighbours:
-                    self.utilityBinArraySU[item] += utilities[idx]
-                    continue
-                i = idx + 1
                 sumSu = utilities[idx]
-                while i < len(items):
-                    if self.newNamesToOldNames[items[i]] in self.Neighbours[self.newNamesToOldNames[item]]:
-                        sumSu += utilities[i]
-                    i += 1
+                neighbours = self.neighbourBits[item]
+                if neighbours:
+                    for i in range(idx + 1, len(items)):
+                        if neighbours >> items[i] & 1:
+                            sumSu += utilities[i]
                 self.utilityBinArraySU[item] += sumSu
 
-    def sortDatabase(self, transactions):
-        """
-        A Method to sort transaction in the order of PMU
-
-        :param transactions: transaction of items
-        :type transactions: Transaction
-        :return: sorted transaction
-        :rtype: Transaction
-        """
-        cmp_items = cmp_to_key(self.sort_transaction)
-        transactions.sort(key=cmp_items)
-
-    def sort_transaction(self, trans1, trans2):
-        """
-        A Method to sort transaction in the order of PMU
-
-        :param trans1: the first transaction.
-        :type trans1: Transaction
-        :param trans2:the second transaction.
-        :type trans2: Transaction
-        :return: sorted transaction.
-        :rtype: int
-        """
-        trans1_items = trans1.getItems()
-        trans2_items = trans2.getItems()
-        pos1 = len(trans1_items) - 1
-        pos2 = len(trans2_items) - 1
-        if len(trans1_items) < len(trans2_items):
-            while pos1 >= 0:
-                sub = trans2_items[pos2] - trans1_items[pos1]
-                if sub != 0:
-                    return sub
-                pos1 -= 1
-                pos2 -= 1
-            return -1
-        elif len(trans1_items) > len(trans2_items):
-            while pos2 >= 0:
-                sub = trans2_items[pos2] - trans1_items[pos1]
-                if sub != 0:
-                    return sub
-                pos1 -= 1
-                pos2 -= 1
-            return 1
-        else:
-            while pos2 >= 0:
-                sub = trans2_items[pos2] - trans1_items[pos1]
-                if sub != 0:
-                    return sub
-                pos1 -= 1
-                pos2 -= 1
-            return 0
-
     def useUtilityBinArrayToCalculateLocalUtilityFirstTime(self, dataset):
         """
         A method to scan the database using utility bin array to calculate the pmus
@@ -0,0 +1,129 @@
+#  Copyright (C)  2021 Rage Uday Kiran
+#
+#      This program is free software: you can redistribute it and/or modify
+#      it under the terms of the GNU General Public License as published by
+#      the Free Software Foundation, either version 3 of the License, or
+#      (at your option) any later version.
+#
+#      This program is distributed in the hope that it will be useful,
+#      but WITHOUT ANY WARRANTY; without even the implied warranty of
+#      MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#      GNU General Public License for more details.
+#
+#      You should have received a copy of the GNU General Public License
+#      along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Periodic-support kernel shared by the partial periodic pattern miners.
+
+The periodic-support of a pattern is the number of consecutive timestamps of the pattern that are at most period
+apart. Timestamps are kept as sorted numpy.int64 arrays, so that an intersection and the periodic-support of its
+result are computed together, and all the siblings of a prefix are intersected with it in a single call.
+"""
+
+import numpy as _np
+
+_empty = _np.empty(0, dtype=_np.int64)
+
+
+def asTimestamps(timeStamps):
+    """
+    :param timeStamps: timestamps of a pattern in any order
+    :type timeStamps: iterable
+    :return: the timestamps as a sorted numpy.int64 array without repetitions
+    :rtype: numpy.ndarray
+    """
+    if isinstance(timeStamps, _np.ndarray):
+        return _np.unique(timeStamps.astype(_np.int64, copy=False))
+    return _np.unique(_np.fromiter(timeStamps, dtype=_np.int64))
+
+
+def periodicSupport(timeStamps, period):
+    """
+    :param timeStamps: sorted timestamps of a pattern
+    :type timeStamps: numpy.ndarray
+    :param period: the user specified period
+    :type period: int or float
+    :return: the number of consecutive timestamps that are at most period apart
+    :rtype: int
+    """
+    return int(_np.count_nonzero(_np.diff(timeStamps) <= period))
+
+
+def _segmentPeriodicSupports(timeStamps, owners, count, period):
+    """
+    :param timeStamps: timestamps of several patterns laid out one pattern after the other, each pattern sorted
+    :param owners: index of the pattern each timestamp belongs to, non-decreasing
+    :param count: the number of patterns
+    :return: periodic-support of every pattern
+    :rtype: numpy.ndarray
+    """
+    close = (_np.diff(timeStamps) <= period) & (owners[1:] == owners[:-1])
+    return _np.bincount(owners[1:][close], minlength=count)
+
+
+def intersect(timeStamps, other, period):
+    """
+    Intersects the timestamps of two patterns and returns the periodic-support of the intersection.
+
+    :param timeStamps: sorted timestamps of the first pattern
+    :type timeStamps: numpy.ndarray
+    :param other: sorted timestamps of the second pattern
+    :type other: numpy.ndarray
+    :param period: the user specified period
+    :type period: int or float
+    :return: the timestamps of the intersection and its periodic-support
+    :rtype: tuple
+    """
+    intersection = _np.intersect1d(timeStamps, other, assume_unique=True)
+    return intersection, periodicSupport(intersection, period)
+
+
+def intersectSiblings(timeStamps, siblings, period):
+    """
+    Intersects the timestamps of a prefix with the timestamps of each of its siblings in one vectorised pass.
+
+    :param timeStamps: sorted timestamps of the prefix
+    :type timeStamps: numpy.ndarray
+    :param siblings: sorted timestamps of every sibling
+    :type siblings: list
+    :param period: the user specified period
+    :type period: int or float
+    :return: the timestamps of every intersection and the periodic-support of every intersection
+    :rtype: tuple
+    """
+    count = len(siblings)
+    if count == 0:
+        return [], _np.zeros(0, dtype=_np.int64)
+    if len(timeStamps) == 0:
+        return [_empty] * count, _np.zeros(count, dtype=_np.int64)
+    lengths = _np.fromiter((len(sibling) for sibling in siblings), dtype=_np.int64, count=count)
+    flat = _np.concatenate(siblings)
+    positions = _np.searchsorted(timeStamps, flat)
+    positions[positions == len(timeStamps)] = 0
+    found = timeStamps[positions] == flat
+    owners = _np.repeat(_np.arange(count), lengths)[found]
+    flat = flat[found]
+    sizes = _np.bincount(owners, minlength=count)
+    return _np.split(flat, _np.cumsum(sizes)[:-1]), _segmentPeriodicSupports(flat, owners, count, period)
+
+
+def periodicSupports(groups, period):
+    """
+    Periodic-support of several patterns whose timestamps are neither sorted nor merged, in one vectorised pass.
+
+    :param groups: timestamps of every pattern, without repetitions inside a pattern
+    :type groups: list
+    :param period: the user specified period
+    :type period: int or float
+    :return: periodic-support of every pattern
+    :rtype: numpy.ndarray
+    """
+    count = len(groups)
+    if count == 0:
+        return _np.zeros(0, dtype=_np.int64)
+    lengths = _np.fromiter((len(group) for group in groups), dtype=_np.int64, count=count)
+    flat = _np.concatenate([_np.asarray(group, dtype=_np.int64) for group in groups])
+    owners = _np.repeat(_np.arange(count), lengths)
+    order = _np.lexsort((flat, owners))
+    return _segmentPeriodicSupports(flat[order], owners[order], count, period)
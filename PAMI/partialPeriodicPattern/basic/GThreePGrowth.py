@@ -49,8 +49,9 @@ __copyright__ = """
 """
 
 from pandas.core.arrays import period
-import deprecated
+from deprecated import deprecated
 from PAMI.partialPeriodicPattern.basic import Gabstract as _abstract
+from PAMI.partialPeriodicPattern import _periodicSupport as _ps
 from typing import List, Dict, Tuple, Set, Union, Any, Generator
 import validators as _validators
 from urllib.request import urlopen as _urlopen
@@ -209,15 +210,18 @@ class _Tree(object):
         :param timeStamps : timestamps of a pattern
         :type timeStamps : list
         """
-        global _frequentList, _lno
-        timeStamps.sort()
-        per = 0
-        sup = 0
-        for i in range(len(timeStamps) - 1):
-            j = i + 1
-            if abs(timeStamps[j] - timeStamps[i]) <= _period:
-                per += 1
-            sup += 1
+        return self._getRelativeSupport(int(_ps.periodicSupports([timeStamps], _period)[0]), pattern)
+
+    def _getRelativeSupport(self, per, pattern) -> List[float]:
+        """
+        calculates the relative periodic support of a pattern from its periodic support
+
+        :param per : periodic support of a pattern
+        :type per : int
+        :param pattern : items of the pattern
+        :type pattern : list
+        """
+        global _frequentList
         l = []
         for i in pattern:
             l.append(_frequentList[i])
@@ -245,8 +249,9 @@ class _Tree(object):
                 else:
                     data1[j] = conditionalTimeStamps[i]
         updatedDictionary = {}
-        for m in data1:
-            updatedDictionary[m] = self._getPeriodicSupport(data1[m], temp + [m])
+        perSups = _ps.periodicSupports(list(data1.values()), _period)
+        for m, per in zip(data1, perSups):
+            updatedDictionary[m] = self._getRelativeSupport(int(per), temp + [m])
         updatedDictionary = {k: v for k, v in updatedDictionary.items() if v[0] >= _minPS}
         count = 0
         for p in conditionalPatterns:
@@ -571,6 +576,13 @@ class GThreePGrowth(_abstract._partialPeriodicPatterns):
                 value = int(value)
         return value
 
+    @deprecated("It is recommended to use 'mine()' instead of 'startMine()' for mining process. Starting from January 2025, 'startMine()' will be completely terminated.")
+    def startMine(self) -> None:
+        """
+        Main method where the patterns are mined by constructing tree.
+
+        """
+        self.mine()
 
     def mine(self) -> None:
         """
@@ -54,12 +54,12 @@ __copyright__ = """
 
 
 from PAMI.partialPeriodicPattern.basic import abstract as _abstract
+from PAMI.partialPeriodicPattern import _periodicSupport as _ps
 from typing import List, Dict, Tuple, Set, Union, Any, Iterable, Generator
 import validators as _validators
 from urllib.request import urlopen as _urlopen
 import sys as _sys
 import pandas as pd
-import numpy as np
 from deprecated import deprecated
 
 _minPS = float()
@@ -344,12 +344,7 @@ class PPPGrowth(_abstract._partialPeriodicPatterns):
         self.mine()
 
     def _getPerSup(self, arr):
-        arr = list(arr)
-        arr = np.sort(arr)
-        arr = np.diff(arr)
-        locs = len(np.where(arr <= self._period)[0])
-
-        return locs
+        return _ps.periodicSupport(_ps.asTimestamps(arr), self._period)
     
 
     def _construct(self, items, data):
@@ -378,11 +373,12 @@ class PPPGrowth(_abstract._partialPeriodicPatterns):
         """
 
 
-        items = {k: v for k, v in items.items() if self._getPerSup(v) >= self._minPS}
+        perSups = dict(zip(items, _ps.periodicSupports(list(items.values()), self._period)))
+        items = {k: v for k, v in items.items() if perSups[k] >= self._minPS}
 
         #tested ok
-        for item, ts in items.items():
-            self._finalPatterns[tuple([item])] = self._getPerSup(ts)
+        for item in items:
+            self._finalPatterns[tuple([item])] = int(perSups[item])
 
         root = _Node([], None, None)
         itemNodes = {}
@@ -445,14 +441,14 @@ class PPPGrowth(_abstract._partialPeriodicPatterns):
 
             # Precompute getMaxPer results for itemLocs
             # maxPerResults = {item: self._getMaxPer(itemLocs[item], maxTS) for item in itemLocs if len(itemLocs[item]) >= minSup}
-            maxPerResults = {item: self._getPerSup(itemLocs[item]) for item in itemLocs}
+            maxPerResults = dict(zip(itemLocs, _ps.periodicSupports(list(itemLocs.values()), self._period)))
 
             # Filter itemLocs based on minSup and maxPer
             itemLocs = {k: len(v) for k, v in itemLocs.items() if maxPerResults[k] >= self._minPS}
 
             # Iterate over filtered itemLocs
             for item in itemLocs:
-                self._finalPatterns[tuple(newRoot.item + [item])] = maxPerResults[item]
+                self._finalPatterns[tuple(newRoot.item + [item])] = int(maxPerResults[item])
             
             if not itemLocs:
                 continue
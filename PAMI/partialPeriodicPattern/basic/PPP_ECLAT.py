@@ -53,9 +53,10 @@ __copyright__ = """
 
 
 from PAMI.partialPeriodicPattern.basic import abstract as _ab
+from PAMI.partialPeriodicPattern import _periodicSupport as _ps
+from PAMI.extras import bitPackedDatabase as _bp
 from typing import List, Dict, Tuple, Set, Union, Any, Generator
 import pandas as pd
-import numpy as np
 from deprecated import deprecated
 
 class PPP_ECLAT(_ab._partialPeriodicPatterns):
@@ -66,7 +67,8 @@ class PPP_ECLAT(_ab._partialPeriodicPatterns):
                   https://www.tkl.iis.u-tokyo.ac.jp/new/uploads/publication_file/file/774/JSS_2017.pdf
 
     :param  iFile: str :
-                   Name of the Input file to mine complete set of frequent pattern's
+                   Name of the Input file to mine complete set of frequent pattern's. A parquet file or a
+                   PAMI.extras.bitPackedDatabase is mined as a bit-packed vertical database.
     :param  oFile: str :
                    Name of the output file to store complete set of frequent patterns
     :param  minPS: float:
@@ -206,6 +208,8 @@ class PPP_ECLAT(_ab._partialPeriodicPatterns):
     _tidList = {}
     _lno = 0
     _Database = []
+    _dbSize = int()
+    _packed = False
 
     def _convert(self, value) -> Union[int, float]:
         """
@@ -217,42 +221,15 @@ class PPP_ECLAT(_ab._partialPeriodicPatterns):
         if type(value) is int:
             value = int(value)
         if type(value) is float:
-            value = (len(self._Database) * value)
+            value = (self._dbSize * value)
         if type(value) is str:
             if '.' in value:
                 value = float(value)
-                value = (len(self._Database) * value)
+                value = (self._dbSize * value)
             else:
                 value = int(value)
         return value
 
-    def _getPeriodicSupport(self, timeStamps: list) -> int:
-        """
-        calculates the support and periodicity with list of timestamps.
-
-        :param timeStamps : timestamps of a pattern
-        :type timeStamps : list
-        :return: list
-        """
-        timeStamps.sort()
-        per = 0
-        for i in range(len(timeStamps) - 1):
-            j = i + 1
-            if abs(timeStamps[j] - timeStamps[i]) <= self._period:
-                per += 1
-        return per
-    
-    def _getPerSup(self, arr):
-        arr = list(arr)
-        arr.append(self._maxTS)
-        arr.append(0)
-        arr = np.sort(arr)
-        arr = np.diff(arr)
-
-        locs = len(np.where(arr <= self._period)[0])
-
-        return locs
-
     def _creatingItemSets(self) -> None:
         """
         Storing the complete transactions of the database/input file in a database variable
@@ -308,38 +285,49 @@ class PPP_ECLAT(_ab._partialPeriodicPatterns):
         """
         self.mine()
 
-    def _getPerSup(self, arr):
-        arr = list(arr)
-        arr = np.sort(arr)
-        arr = np.diff(arr)
-        locs = len(np.where(arr <= self._period)[0])
+    def _getPerSup(self, tids):
+        """
+        Calculates the periodic-support of a pattern
+
+        :param tids: sorted timestamps of the pattern, or its packed bitmap when mining a bit-packed database
+        :type tids: numpy.ndarray
+        :return: periodic-support
+        :rtype: int
+        """
+        if self._packed:
+            return _bp.periodicSupport(tids, self._period)
+        return _ps.periodicSupport(tids, self._period)
+
+    def _extend(self, tids, siblings):
+        """
+        Intersects a pattern with all of its siblings at once
+
+        :param tids: timestamps of the pattern
+        :type tids: numpy.ndarray
+        :param siblings: timestamps of the siblings
+        :type siblings: list
+        :return: timestamps of every intersection and the periodic-support of every intersection
+        :rtype: tuple
+        """
+        if self._packed:
+            intersections = [tids & sibling for sibling in siblings]
+            return intersections, [self._getPerSup(intersection) for intersection in intersections]
+        return _ps.intersectSiblings(tids, siblings, self._period)
 
-        return locs
-    
     def _recursive(self, cands, items):
         for i in range(len(cands)):
             newCands = []
             nitems = {}
-            for j in range(i + 1, len(cands)):
-                intersection = items[cands[i]].intersection(items[cands[j]])
-                perSup = self._getPerSup(intersection)
+            intersections, perSups = self._extend(items[cands[i]], [items[cand] for cand in cands[i + 1:]])
+            for cand, intersection, perSup in zip(cands[i + 1:], intersections, perSups):
                 if perSup >= self._minPS:
-                    nCand = cands[i] + tuple([cands[j][-1]])
+                    nCand = cands[i] + tuple([cand[-1]])
                     newCands.append(nCand)
                     nitems[nCand] = intersection
-                    self._finalPatterns[nCand] = perSup
-                # if len(intersection) >= self._min:
-                #     perSup = self._getPerSup(intersection)
-                #     ratio = perSup / (len(intersection) + 1)
-                #     if ratio >= self._partialPeriodicPatterns__minPR:
-                #         nCand = cands[i] + tuple([cands[j][-1]])
-                #         newCands.append(nCand)
-                #         nitems[nCand] = intersection
-                #         self._finalPatterns[nCand] = [len(intersection), ratio]
+                    self._finalPatterns[nCand] = int(perSup)
             if len(newCands) > 1:
                 self._recursive(newCands, nitems)
 
-
     def mine(self) -> None:
         """
         Main program start with extracting the periodic frequent items from the database and
@@ -348,21 +336,25 @@ class PPP_ECLAT(_ab._partialPeriodicPatterns):
 
         """
         self._startTime = _ab._time.time()
-        self._creatingItemSets()
         self._finalPatterns = {}
 
-
-        items = {}
-        maxTS = 0
-        for line in self._Database:
-            index = int(line[0])
-            maxTS = max(maxTS, index)
-            for item in line[1:]:
-                if tuple([item]) not in items:
-                    items[tuple([item])] = set()
-                items[tuple([item])].add(index)
-
-        self._dbSize = maxTS
+        self._packed = _bp.isBitPacked(self._iFile)
+        if self._packed:
+            # a bit-packed vertical database is mined directly, the tidsets being packed bitmaps over the timestamps
+            database = _bp.bitPackedDatabase.read(self._iFile)
+            items = {tuple([item]): words for item, words in database.items.items()}
+            self._dbSize = database.dbSize
+        else:
+            self._creatingItemSets()
+            items = {}
+            for line in self._Database:
+                index = int(line[0])
+                for item in line[1:]:
+                    if tuple([item]) not in items:
+                        items[tuple([item])] = set()
+                    items[tuple([item])].add(index)
+            items = {k: _ps.asTimestamps(v) for k, v in items.items()}
+            self._dbSize = len(self._Database)
 
         self._period = self._convert(self._period)
         self._minPS = self._convert(self._minPS)
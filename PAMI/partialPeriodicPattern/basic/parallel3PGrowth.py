@@ -0,0 +1,565 @@
+#  Parallel3PGrowth is a multi-process algorithm to discover partial periodic patterns in a temporal database on a single machine.
+#  The mining task is partitioned by suffix item across a pool of worker processes that share the read-only database through shared memory.
+#
+# **Importing this algorithm into a python program**
+# --------------------------------------------------------
+#
+#
+#             from PAMI.partialPeriodicPattern.basic import parallel3PGrowth as alg
+#
+#             obj = alg.parallel3PGrowth(iFile, minPS, period, numWorkers, sep='\t')
+#
+#             obj.mine()
+#
+#             partialPeriodicPatterns = obj.getPatterns()
+#
+#             print("Total number of partial periodic Patterns:", len(partialPeriodicPatterns))
+#
+#             obj.save(oFile)
+#
+#             Df = obj.getPatternsAsDataFrame()
+#
+#             memUSS = obj.getMemoryUSS()
+#
+#             print("Total Memory in USS:", memUSS)
+#
+#             memRSS = obj.getMemoryRSS()
+#
+#             print("Total Memory in RSS", memRSS)
+#
+#             run = obj.getRuntime()
+#
+#             print("Total ExecutionTime in seconds:", run)
+#
+
+
+
+__copyright__ = """
+ Copyright (C)  2021 Rage Uday Kiran
+
+     This program is free software: you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+
+     This program is distributed in the hope that it will be useful,
+     but WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+     GNU General Public License for more details.
+
+     You should have received a copy of the GNU General Public License
+     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+     Copyright (C)  2021 Rage Uday Kiran
+
+"""
+
+from PAMI.partialPeriodicPattern.basic import abstract as _abstract
+from PAMI.partialPeriodicPattern import _periodicSupport as _ps
+from typing import Dict
+import multiprocessing as _mp
+from PAMI.extras import sharedDatabase as _sd
+import sys as _sys
+import numpy as np
+from deprecated import deprecated
+
+#: Read-only views of the shared database, attached once in every worker process by :func:`_attach`.
+_shared = {}
+
+
+def _attach(descriptors, minPS, period):
+    """
+    Pool initializer: attaches the worker process to the shared database arrays.
+
+    :param descriptors: dictionary of array name to (shared memory name, dtype, shape)
+    :type descriptors: dict
+    :param minPS: minimum periodic-support in count
+    :type minPS: int
+    :param period: period in count
+    :type period: int
+    """
+    _shared.clear()
+    _shared['blocks'], arrays = _sd.attach(descriptors)
+    _shared.update(arrays)
+    _shared['minPS'] = minPS
+    _shared['period'] = period
+
+
+def _conditionalTree(root, paths, minPS, period, patterns):
+    """
+    Keeps the items of the conditional pattern base whose periodic-support reaches minPS, stores them as patterns and
+    builds the conditional tree of the surviving items.
+
+    :param root: root of the conditional tree, its item holds the suffix of the tree
+    :type root: PAMI.extras.sharedDatabase.timestampNode
+    :param paths: dictionary of prefix path to the timestamps of the path
+    :type paths: dict
+    :param minPS: minimum periodic-support in count
+    :type minPS: int
+    :param period: period in count
+    :type period: int
+    :param patterns: dictionary storing the discovered patterns
+    :type patterns: dict
+    :return: dictionary of item to the set of nodes of that item in the conditional tree
+    :rtype: dict
+    """
+    itemLocs = {}
+    for path, locs in paths.items():
+        for i in path:
+            if i in itemLocs:
+                itemLocs[i].append(locs)
+            else:
+                itemLocs[i] = [locs]
+    items = list(itemLocs)
+    perSups = _ps.periodicSupports([np.concatenate(itemLocs[i]) for i in items], period)
+    itemLocs = {i: int(perSup) for i, perSup in zip(items, perSups) if perSup >= minPS}
+    for i, perSup in itemLocs.items():
+        patterns[tuple(root.item + [i])] = perSup
+    itemNodes = {}
+    for path, locs in paths.items():
+        transaction = sorted([i for i in path if i in itemLocs], key=lambda x: itemLocs[x], reverse=True)
+        currNode = root
+        for i in transaction:
+            currNode = currNode.addChild(i, locs)
+            if i in itemNodes:
+                itemNodes[i].add(currNode)
+            else:
+                itemNodes[i] = {currNode}
+    return itemNodes
+
+
+def _recursive(root, itemNodes, minPS, period, patterns):
+    """
+    Mines the conditional pattern tree rooted at root and stores every partial periodic pattern in patterns.
+
+    :param root: root of the conditional tree, its item holds the suffix of the tree
+    :type root: PAMI.extras.sharedDatabase.timestampNode
+    :param itemNodes: dictionary of item to the set of nodes of that item
+    :type itemNodes: dict
+    :param minPS: minimum periodic-support in count
+    :type minPS: int
+    :param period: period in count
+    :type period: int
+    :param patterns: dictionary storing the discovered patterns
+    :type patterns: dict
+    """
+    for item in itemNodes:
+        paths = {}
+        for node in itemNodes[item]:
+            transaction, locs = node.traverse()
+            if len(transaction) < 1:
+                continue
+            if tuple(transaction) in paths:
+                paths[tuple(transaction)].extend(locs)
+            else:
+                paths[tuple(transaction)] = list(locs)
+        if not paths:
+            continue
+        newRoot = _sd.timestampNode(root.item + [item], None, None)
+        newItemNodes = _conditionalTree(newRoot, paths, minPS, period, patterns)
+        if newItemNodes:
+            _recursive(newRoot, newItemNodes, minPS, period, patterns)
+
+
+def _mineSuffix(suffix):
+    """
+    Worker task: mines every partial periodic pattern whose lowest ranked item is suffix.
+    The conditional database of the suffix is read directly from the shared arrays.
+
+    :param suffix: rank of the suffix item
+    :type suffix: int
+    :return: patterns of the partition, as tuples of item ranks mapped to their periodic-support
+    :rtype: dict
+    """
+    items, offsets, ts = _shared['items'], _shared['offsets'], _shared['ts']
+    tids, positions, tidOffsets = _shared['tids'], _shared['positions'], _shared['tidOffsets']
+    minPS, period = _shared['minPS'], _shared['period']
+    rows = tids[tidOffsets[suffix]:tidOffsets[suffix + 1]]
+    ends = positions[tidOffsets[suffix]:tidOffsets[suffix + 1]]
+    encoded = {}
+    # baskets are sorted by rank, so the conditional transaction is the slice of the basket before the suffix
+    for start, end, stamp in zip(offsets[rows].tolist(), ends.tolist(), ts[rows].tolist()):
+        if start == end:
+            continue
+        key = items[start:end].tobytes()
+        if key in encoded:
+            encoded[key].append(stamp)
+        else:
+            encoded[key] = [stamp]
+    paths = {tuple(np.frombuffer(key, dtype=items.dtype).tolist()): locs for key, locs in encoded.items()}
+    patterns = {}
+    if not paths:
+        return patterns
+    root = _sd.timestampNode([suffix], None, None)
+    itemNodes = _conditionalTree(root, paths, minPS, period, patterns)
+    _recursive(root, itemNodes, minPS, period, patterns)
+    return patterns
+
+
+class parallel3PGrowth(_abstract._partialPeriodicPatterns):
+    """
+    :Description:   Parallel3PGrowth is a multi-process algorithm to discover partial periodic patterns in a temporal database on a
+                    single machine. Partial periodic items are ranked by periodic-support and every worker of a process pool mines the
+                    patterns whose lowest ranked (suffix) item is assigned to it. The ranked database and the item-to-transaction
+                    index are placed once in shared memory, so the workers never receive a copy of the database, and the partition
+                    results are merged into the final patterns as they arrive. The Spark implementation of the algorithm is
+                    available in PAMI.partialPeriodicPattern.pyspark.parallel3PGrowth.
+
+    :Reference:   C. Saideep, R. Uday Kiran, Koji Zettsu, Cheng-Wei Wu, P. Krishna Reddy, Masashi Toyoda, Masaru Kitsuregawa: Parallel Mining of Partial Periodic Itemsets in Big Data. IEA/AIE 2020: 807-819
+
+    :param  iFile: str :
+                   Name of the Input file to mine complete set of frequent pattern's
+    :param  oFile: str :
+                   Name of the output file to store complete set of frequent patterns
+    :param  minPS: float:
+                   Minimum partial periodic pattern...
+    :param  period: float:
+                   Minimum partial periodic...
+    :param  numWorkers: int :
+                   The number of worker processes to be employed. The default is the number of CPUs of the machine.
+    :param  sep: str :
+                   This variable is used to distinguish items from one another in a transaction. The default seperator is tab space. However, the users can override their default separator.
+
+    :Attributes:
+
+        iFile : file
+            Name of the Input file or path of the input file
+        oFile : file
+            Name of the output file or path of the output file
+        minPS: float or int or str
+            The user can specify minPS either in count or proportion of database size.
+            If the program detects the data type of minPS is integer, then it treats minPS is expressed in count.
+            Otherwise, it will be treated as float.
+            Example: minPS=10 will be treated as integer, while minPS=10.0 will be treated as float
+        period: float or int or str
+            The user can specify period either in count or proportion of database size.
+            If the program detects the data type of period is integer, then it treats period is expressed in count.
+            Otherwise, it will be treated as float.
+            Example: period=10 will be treated as integer, while period=10.0 will be treated as float
+        numWorkers : int
+            The number of worker processes
+        sep : str
+            This variable is used to distinguish items from one another in a transaction. The default seperator is tab space or \t.
+            However, the users can override their default separator.
+        memoryUSS : float
+            To store the total amount of USS memory consumed by the program
+        memoryRSS : float
+            To store the total amount of RSS memory consumed by the program
+        startTime:float
+            To record the start time of the mining process
+        endTime:float
+            To record the completion time of the mining process
+        Database : list
+            To store the transactions of a database in list
+        finalPatterns : dict
+            it represents to store the patterns
+
+    :Methods:
+
+        mine()
+            Mining process will start from here
+        getPatterns()
+            Complete set of patterns will be retrieved with this function
+        save(oFile)
+            Complete set of frequent patterns will be loaded in to a output file
+        getPatternsAsDataFrame()
+            Complete set of frequent patterns will be loaded in to a dataframe
+        getMemoryUSS()
+            Total amount of USS memory consumed by the mining process will be retrieved from this function
+        getMemoryRSS()
+            Total amount of RSS memory consumed by the mining process will be retrieved from this function
+        getRuntime()
+            Total amount of runtime taken by the mining process will be retrieved from this function
+
+    **Executing the code on terminal:**
+    --------------------------------------
+      .. code-block:: console
+
+
+       Format:
+
+       (.venv) $ python3 parallel3PGrowth.py <inputFile> <outputFile> <minPS> <period> <numWorkers>
+
+       Examples:
+
+       (.venv) $ python3 parallel3PGrowth.py sampleDB.txt patterns.txt 10.0 2.0 4
+
+
+    **Sample run of the importing code:**
+    -----------------------------------------
+    .. code-block:: python
+
+            from PAMI.partialPeriodicPattern.basic import parallel3PGrowth as alg
+
+            obj = alg.parallel3PGrowth(iFile, minPS, period, numWorkers)
+
+            obj.mine()
+
+            partialPeriodicPatterns = obj.getPatterns()
+
+            print("Total number of partial periodic Patterns:", len(partialPeriodicPatterns))
+
+            obj.save(oFile)
+
+            Df = obj.getPatternsAsDataFrame()
+
+            memUSS = obj.getMemoryUSS()
+
+            print("Total Memory in USS:", memUSS)
+
+            memRSS = obj.getMemoryRSS()
+
+            print("Total Memory in RSS", memRSS)
+
+            run = obj.getRuntime()
+
+            print("Total ExecutionTime in seconds:", run)
+
+    """
+    _minPS = float()
+    _period = float()
+    _numWorkers = int()
+    _startTime = float()
+    _endTime = float()
+    _finalPatterns = {}
+    _iFile = " "
+    _oFile = " "
+    _sep = " "
+    _memoryUSS = float()
+    _memoryRSS = float()
+    _Database = []
+
+    def __init__(self, iFile, minPS, period, numWorkers=None, sep='\t'):
+        super().__init__(iFile, minPS, period, sep)
+        self._numWorkers = numWorkers
+
+    def _creatingItemSets(self) -> None:
+        """
+        Storing the complete transactions of the database/input file in a database variable
+
+        :return: None
+        """
+        self._Database = []
+        if isinstance(self._iFile, _abstract._pd.DataFrame):
+            data, ts = [], []
+            if self._iFile.empty:
+                print("its empty..")
+            i = self._iFile.columns.values.tolist()
+            if 'TS' in i:
+                ts = self._iFile['TS'].tolist()
+            if 'Transactions' in i:
+                data = self._iFile['Transactions'].tolist()
+            for i in range(len(data)):
+                if data[i]:
+                    tr = [str(ts[i])] + [x for x in data[i].split(self._sep)]
+                    self._Database.append(tr)
+                else:
+                    self._Database.append([str(ts[i])])
+
+        if isinstance(self._iFile, str):
+            if _abstract._validators.url(self._iFile):
+                data = _abstract._urlopen(self._iFile)
+                for line in data:
+                    line = line.decode("utf-8")
+                    temp = [i.rstrip() for i in line.split(self._sep)]
+                    temp = [x for x in temp if x]
+                    self._Database.append(temp)
+            else:
+                try:
+                    with open(self._iFile, 'r', encoding='utf-8') as f:
+                        for line in f:
+                            temp = [i.rstrip() for i in line.split(self._sep)]
+                            temp = [x for x in temp if x]
+                            self._Database.append(temp)
+                except IOError:
+                    print("File Not Found")
+                    quit()
+
+    def _convert(self, value) -> int:
+        """
+        To convert the given user specified value
+
+        :param value: user specified value
+        :return: converted value
+        """
+        if type(value) is int:
+            value = int(value)
+        if type(value) is float:
+            value = (len(self._Database) * value)
+        if type(value) is str:
+            if '.' in value:
+                value = float(value)
+                value = (len(self._Database) * value)
+            else:
+                value = int(value)
+        return value
+
+    def _rankedDatabase(self):
+        """
+        Finds the partial periodic items and encodes the database as flat arrays of item ranks.
+
+        :return: the ranked items, and the arrays (items, offsets, ts, tids, positions, tidOffsets) describing the database
+        :rtype: tuple(list, dict)
+        """
+        itemTS = {}
+        for line in self._Database:
+            index = int(line[0])
+            for item in line[1:]:
+                if item not in itemTS:
+                    itemTS[item] = []
+                itemTS[item].append(index)
+        candidates = list(itemTS)
+        perSups = _ps.periodicSupports([itemTS[item] for item in candidates], self._period)
+        for item, perSup in zip(candidates, perSups):
+            if perSup >= self._minPS:
+                self._finalPatterns[(item,)] = int(perSup)
+        ranked = sorted([k[0] for k in self._finalPatterns], key=lambda x: self._finalPatterns[(x,)], reverse=True)
+        rank = {item: index for index, item in enumerate(ranked)}
+        items, offsets, ts = [], [0], []
+        for line in self._Database:
+            basket = sorted({rank[item] for item in line[1:] if item in rank})
+            if not basket:
+                continue
+            items.extend(basket)
+            offsets.append(len(items))
+            ts.append(int(line[0]))
+        items = np.array(items, dtype=np.int32)
+        offsets = np.array(offsets, dtype=np.int64)
+        rows = np.repeat(np.arange(len(ts), dtype=np.int64), np.diff(offsets))
+        order = np.argsort(items, kind='stable')
+        tids = rows[order]
+        tidOffsets = np.zeros(len(ranked) + 1, dtype=np.int64)
+        tidOffsets[1:] = np.cumsum(np.bincount(items, minlength=len(ranked)))
+        arrays = {'items': items, 'offsets': offsets, 'ts': np.array(ts, dtype=np.int64), 'tids': tids,
+                  'positions': order.astype(np.int64), 'tidOffsets': tidOffsets}
+        return ranked, arrays
+
+    @deprecated("It is recommended to use 'mine()' instead of 'startMine()' for mining process. Starting from January 2025, 'startMine()' will be completely terminated.")
+    def startMine(self) -> None:
+        """
+        Main method where the patterns are mined by constructing tree.
+        :return: None
+        """
+        self.mine()
+
+    def mine(self) -> None:
+        """
+        Main method where the patterns are mined by constructing tree.
+        :return: None
+        """
+        self._startTime = _abstract._time.time()
+        if self._iFile is None:
+            raise Exception("Please enter the file path or file name:")
+        if self._minPS is None:
+            raise Exception("Please enter the Minimum Period-Support")
+        self._creatingItemSets()
+        self._finalPatterns = {}
+        self._minPS = self._convert(self._minPS)
+        self._period = self._convert(self._period)
+        ranked, arrays = self._rankedDatabase()
+        numWorkers = self._numWorkers if self._numWorkers else _abstract._os.cpu_count()
+        # larger conditional databases first so that the pool stays balanced until the end
+        suffixes = sorted(range(1, len(ranked)), key=lambda x: arrays['tidOffsets'][x] - arrays['tidOffsets'][x + 1])
+        blocks, descriptors = _sd.share(arrays)
+        try:
+            with _mp.Pool(int(numWorkers), initializer=_attach,
+                          initargs=(descriptors, self._minPS, self._period)) as pool:
+                for patterns in pool.imap_unordered(_mineSuffix, suffixes):
+                    for pattern, value in patterns.items():
+                        self._finalPatterns[tuple(ranked[x] for x in pattern)] = value
+        finally:
+            _sd.release(blocks, unlink=True)
+        self._finalPatterns = {"\t".join(k): v for k, v in self._finalPatterns.items()}
+        self._endTime = _abstract._time.time()
+        process = _abstract._psutil.Process(_abstract._os.getpid())
+        self._memoryUSS = float()
+        self._memoryRSS = float()
+        self._memoryUSS = process.memory_full_info().uss
+        self._memoryRSS = process.memory_info().rss
+        print("Partial Periodic Patterns were generated successfully using parallel3PGrowth algorithm ")
+
+    def getMemoryUSS(self) -> float:
+        """Total amount of USS memory consumed by the mining process will be retrieved from this function
+
+        :return: returning USS memory consumed by the mining process
+        :rtype: float
+        """
+
+        return self._memoryUSS
+
+    def getMemoryRSS(self) -> float:
+        """Total amount of RSS memory consumed by the mining process will be retrieved from this function
+
+        :return: returning RSS memory consumed by the mining process
+        :rtype: float
+        """
+
+        return self._memoryRSS
+
+    def getRuntime(self) -> float:
+        """Calculating the total amount of runtime taken by the mining process
+
+        :return: returning total amount of runtime taken by the mining process
+        :rtype: float
+        """
+
+        return self._endTime - self._startTime
+
+    def getPatternsAsDataFrame(self) -> _abstract._pd.DataFrame:
+        """Storing final frequent patterns in a dataframe
+
+        :return: returning frequent patterns in a dataframe
+        :rtype: pd.DataFrame
+        """
+
+        data = []
+        for a, b in self._finalPatterns.items():
+            data.append([a, b])
+        return _abstract._pd.DataFrame(data, columns=['Patterns', 'periodicSupport'])
+
+    def save(self, outFile: str) -> None:
+        """Complete set of frequent patterns will be loaded in to a output file
+
+        :param outFile: name of the output file
+        :type outFile: csv file
+        :return: None
+        """
+        self._oFile = outFile
+        with open(self._oFile, 'w+') as writer:
+            for x, y in self._finalPatterns.items():
+                s1 = x.strip() + ":" + str(y)
+                writer.write("%s \n" % s1)
+
+    def getPatterns(self) -> Dict[str, int]:
+        """ Function to send the set of frequent patterns after completion of the mining process
+
+        :return: returning frequent patterns
+        :rtype: dict
+        """
+        return self._finalPatterns
+
+    def printResults(self) -> None:
+        """
+        This function is used to print the results
+        :return: None
+        """
+        print("Total number of Partial Periodic Patterns:", len(self.getPatterns()))
+        print("Total Memory in USS:", self.getMemoryUSS())
+        print("Total Memory in RSS", self.getMemoryRSS())
+        print("Total ExecutionTime in ms:",  self.getRuntime())
+
+
+if __name__ == "__main__":
+    _ap = str()
+    if len(_sys.argv) == 6 or len(_sys.argv) == 7:
+        if len(_sys.argv) == 7:
+            _ap = parallel3PGrowth(_sys.argv[1], _sys.argv[3], _sys.argv[4], int(_sys.argv[5]), _sys.argv[6])
+        if len(_sys.argv) == 6:
+            _ap = parallel3PGrowth(_sys.argv[1], _sys.argv[3], _sys.argv[4], int(_sys.argv[5]))
+        _ap.mine()
+        print("Total number of Partial Periodic Patterns:", len(_ap.getPatterns()))
+        _ap.save(_sys.argv[2])
+        print("Total Memory in USS:", _ap.getMemoryUSS())
+        print("Total Memory in RSS", _ap.getMemoryRSS())
+        print("Total ExecutionTime in ms:",  _ap.getRuntime())
+    else:
+        print("Error! The number of input parameters do not match the total number of parameters provided")
@@ -57,6 +57,9 @@ import sys as _sys
 import validators as _validators
 from urllib.request import urlopen as _urlopen
 from PAMI.partialPeriodicPattern.closed import abstract as _abstract
+from PAMI.partialPeriodicPattern import _periodicSupport as _ps
+from PAMI.extras import closedPatternIndex as _cpi
+from PAMI.extras import bitPackedDatabase as _bp
 import pandas as pd
 from deprecated import deprecated
 
@@ -71,7 +74,8 @@ class PPPClose(_abstract._partialPeriodicPatterns):
                  https://www.tkl.iis.u-tokyo.ac.jp/new/uploads/publication_file/file/799/PAKDD.pdf
 
     :param  iFile: str :
-                   Name of the Input file to mine complete set of periodic frequent pattern's
+                   Name of the Input file to mine complete set of periodic frequent pattern's. A parquet file or a
+                   PAMI.extras.bitPackedDatabase is mined as a bit-packed vertical database.
     :param  oFile: str :
                    Name of the output file to store complete set of periodic frequent pattern's
     :param  sep: str :
@@ -199,13 +203,13 @@ class PPPClose(_abstract._partialPeriodicPatterns):
     _memoryUSS = float()
     _memoryRSS = float()
     _transaction = []
-    _hashing = {}
+    _closedIndex = None
     _mapSupport = {}
     _itemSetCount = 0
     _maxItemId = 0
-    _tableSize = 10000
     _tidList = {}
     _lno = 0
+    _packed = False
 
     def _convert(self, value):
         """
@@ -273,22 +277,29 @@ class PPPClose(_abstract._partialPeriodicPatterns):
         :return: Returns the 1-length periodic-frequent items
         """
         self._mapSupport = {}
-        self._tidList = {}
         self._period = self._convert(self._period)
-        for line in self._Database:
-            n = int(line[0])
-            for i in range(1, len(line)):
-                si = line[i]
-                if self._mapSupport.get(si) is None:
-                    self._mapSupport[si] = [1, 0, n]
-                    self._tidList[si] = [n]
-                else:
-                    self._mapSupport[si][0] += 1
-                    period = abs(n - self._mapSupport[si][2])
-                    if period <= self._period:
-                        self._mapSupport[si][1] += 1
-                    self._mapSupport[si][2] = n
-                    self._tidList[si].append(n)
+        if self._packed:
+            # the bitmaps of the items were read with the database
+            for item, words in self._tidList.items():
+                bounds = _bp.span(words)
+                if bounds is not None:
+                    self._mapSupport[item] = [_bp.support(words), _bp.periodicSupport(words, self._period), bounds[1]]
+        else:
+            self._tidList = {}
+            for line in self._Database:
+                n = int(line[0])
+                for i in range(1, len(line)):
+                    si = line[i]
+                    if self._mapSupport.get(si) is None:
+                        self._mapSupport[si] = [1, 0, n]
+                        self._tidList[si] = [n]
+                    else:
+                        self._mapSupport[si][0] += 1
+                        period = abs(n - self._mapSupport[si][2])
+                        if period <= self._period:
+                            self._mapSupport[si][1] += 1
+                        self._mapSupport[si][2] = n
+                        self._tidList[si].append(n)
         for x, y in self._mapSupport.items():
             period = abs(self._lno - self._mapSupport[x][2])
             if period <= self._period:
@@ -296,61 +307,46 @@ class PPPClose(_abstract._partialPeriodicPatterns):
         self._periodicSupport = self._convert(self._periodicSupport)
         self._mapSupport = {k: v[1] for k, v in self._mapSupport.items() if v[1] >= self._periodicSupport}
         periodicFrequentItems = {}
-        self._tidList = {k: v for k, v in self._tidList.items() if k in self._mapSupport}
+        if self._packed:
+            self._tidList = {k: v for k, v in self._tidList.items() if k in self._mapSupport}
+        else:
+            self._tidList = {k: _ps.asTimestamps(v) for k, v in self._tidList.items() if k in self._mapSupport}
         for x, y in self._tidList.items():
-            t1 = 0
-            for i in y:
-                t1 += i
-            periodicFrequentItems[x] = t1
+            periodicFrequentItems[x] = int((_bp.timestamps(y) if self._packed else y).sum())
         periodicFrequentItems = [key for key, value in sorted(periodicFrequentItems.items(), key=lambda x: x[1])]
         return periodicFrequentItems
 
-    def _calculate(self, tidSet):
+    def _getPeriodicSupport(self, timeStamps):
         """
-        To calculate the weight if pattern based on the respective timeStamps
+        Calculates the period and support of timeStamps
 
-        :param tidSet: timeStamps of the pattern
-        :return: the calculated weight of the timeStamps
-        """
-        hashcode = 0
-        for i in tidSet:
-            hashcode += i
-        if hashcode < 0:
-            hashcode = abs(0 - hashcode)
-        return hashcode % self._tableSize
-
-    def _contains(self, itemSet, val, hashcode):
+        :param: timeStamps: timeStamps of itemSet, or its packed bitmap when mining a bit-packed database
+        :return: period and support
         """
-        To check if the key(hashcode) is in dictionary(hashing) variable
-
-        :param itemSet: generated periodic-frequent itemSet
-        :param val: support and period of itemSet
-        :param hashcode: the key generated in calculate() method for every itemSet
+        if self._packed:
+            return _bp.periodicSupport(timeStamps, self._period)
+        return _ps.periodicSupport(timeStamps, self._period)
 
-        :return: true if itemSet with same support present in dictionary(hashing) or else returns false
+    def _support(self, timeStamps):
         """
-        if self._hashing.get(hashcode) is None:
-            return False
-        for i in self._hashing[hashcode]:
-            itemSetX = i
-            if val == self._hashing[hashcode][itemSetX] and set(itemSetX).issuperset(itemSet):
-                return True
-        return False
+        :param timeStamps: timeStamps of itemSet, or its packed bitmap when mining a bit-packed database
+        :return: the number of timestamps of the itemSet
+        """
+        if self._packed:
+            return _bp.support(timeStamps)
+        return len(timeStamps)
 
-    def _getPeriodicSupport(self, timeStamps):
+    def _extend(self, timeStamps, siblings):
         """
-        Calculates the period and support of timeStamps
+        Intersects an itemSet with all of its siblings at once
 
-        :param: timeStamps: timeStamps of itemSet
-        :return: period and support
+        :param timeStamps: timeStamps of the itemSet, or its packed bitmap when mining a bit-packed database
+        :param siblings: timeStamps of the siblings, in the same form
+        :return: the timeStamps of every intersection
         """
-        timeStamps.sort()
-        sup = 0
-        for j in range(len(timeStamps) - 1):
-            per = abs(timeStamps[j + 1] - timeStamps[j])
-            if per <= self._period:
-                sup += 1
-        return sup
+        if self._packed:
+            return [timeStamps & sibling for sibling in siblings]
+        return _ps.intersectSiblings(timeStamps, siblings, self._period)[0]
 
     def _save(self, prefix, suffix, tidSetX):
         """
@@ -369,17 +365,14 @@ class PPPClose(_abstract._partialPeriodicPatterns):
         prefix.sort()
         val = self._getPeriodicSupport(tidSetX)
         if val >= self._periodicSupport:
-            hashcode = self._calculate(tidSetX)
-            if self._contains(prefix, val, hashcode) is False:
+            key = _bp.fingerprint(tidSetX) if self._packed else self._closedIndex.fingerprint(tidSetX)
+            if not self._closedIndex.contains(prefix, tidSetX, key):
                 self._itemSetCount += 1
                 sample = str()
                 for i in prefix:
                     sample = sample + i + "\t"
                 self._finalPatterns[sample] = val
-            if hashcode not in self._hashing:
-                self._hashing[hashcode] = {tuple(prefix): val}
-            else:
-                self._hashing[hashcode][tuple(prefix)] = val
+            self._closedIndex.add(prefix, tidSetX, key)
 
     def _processEquivalenceClass(self, prefix, itemSets, tidSets):
         """
@@ -399,15 +392,16 @@ class PPPClose(_abstract._partialPeriodicPatterns):
             tidSetI = tidSets[0]
             itemJ = itemSets[1]
             tidSetJ = tidSets[1]
-            y1 = list(set(tidSetI).intersection(tidSetJ))
-            if len(y1) >= self._periodicSupport:
+            y1 = self._extend(tidSetI, [tidSetJ])[0]
+            supY1 = self._support(y1)
+            if supY1 >= self._periodicSupport:
                 suffix = []
                 suffix += [itemI, itemJ]
                 suffix = list(set(suffix))
                 self._save(prefix, suffix, y1)
-            if len(y1) != len(tidSetI):
+            if supY1 != self._support(tidSetI):
                 self._save(prefix, [itemI], tidSetI)
-            if len(y1) != len(tidSetJ):
+            if supY1 != self._support(tidSetJ):
                 self._save(prefix, [itemJ], tidSetJ)
             return
         for i in range(len(itemSets)):
@@ -418,23 +412,23 @@ class PPPClose(_abstract._partialPeriodicPatterns):
             classItemSets = []
             classTidSets = []
             itemSetX = [itemX]
-            for j in range(i + 1, len(itemSets)):
+            siblings = [j for j in range(i + 1, len(itemSets)) if itemSets[j] is not None]
+            intersections = self._extend(tidSetX, [tidSets[j] for j in siblings])
+            supX = self._support(tidSetX)
+            for j, y in zip(siblings, intersections):
                 itemJ = itemSets[j]
-                if itemJ is None:
-                    continue
-                tidSetJ = tidSets[j]
-                y = list(set(tidSetX).intersection(tidSetJ))
-                if len(y) < self._periodicSupport:
+                supJ, supY = self._support(tidSets[j]), self._support(y)
+                if supY < self._periodicSupport:
                     continue
-                if len(tidSetX) == len(tidSetJ) and len(y) == len(tidSetX):
-                    itemSets.insert(j, None)
-                    tidSets.insert(j, None)
+                if supX == supJ and supY == supX:
+                    itemSets[j] = None
+                    tidSets[j] = None
                     itemSetX.append(itemJ)
-                elif len(tidSetX) < len(tidSetJ) and len(y) == len(tidSetX):
+                elif supX < supJ and supY == supX:
                     itemSetX.append(itemJ)
-                elif len(tidSetX) > len(tidSetJ) and len(y) == len(tidSetJ):
-                    itemSets.insert(j, None)
-                    tidSets.insert(j, None)
+                elif supX > supJ and supY == supJ:
+                    itemSets[j] = None
+                    tidSets[j] = None
                     classItemSets.append(itemJ)
                     classTidSets.append(y)
                 else:
@@ -457,8 +451,15 @@ class PPPClose(_abstract._partialPeriodicPatterns):
         Mining process will start from here
         """
         self._startTime = _abstract._time.time()
-        self._creatingItemSets()
-        self._hashing = {}
+        self._packed = _bp.isBitPacked(self._iFile)
+        if self._packed:
+            # a bit-packed vertical database is mined directly, the tidsets being packed bitmaps over the timestamps
+            database = _bp.bitPackedDatabase.read(self._iFile)
+            self._tidList = dict(database.items)
+            self._lno = database.maxTS
+        else:
+            self._creatingItemSets()
+        self._closedIndex = _cpi.closedPatternIndex()
         self._finalPatterns = {}
         periodicFrequentItems = self._OneLengthPartialItems()
         for i in range(len(periodicFrequentItems)):
@@ -469,21 +470,21 @@ class PPPClose(_abstract._partialPeriodicPatterns):
             itemSetX = [itemX]
             itemSets = []
             tidSets = []
-            for j in range(i + 1, len(periodicFrequentItems)):
+            siblings = [j for j in range(i + 1, len(periodicFrequentItems)) if periodicFrequentItems[j] is not None]
+            intersections = self._extend(tidSetX, [self._tidList[periodicFrequentItems[j]] for j in siblings])
+            supX = self._support(tidSetX)
+            for j, y1 in zip(siblings, intersections):
                 itemJ = periodicFrequentItems[j]
-                if itemJ is None:
-                    continue
-                tidSetJ = self._tidList[itemJ]
-                y1 = list(set(tidSetX).intersection(tidSetJ))
-                if len(y1) < self._periodicSupport:
+                supJ, supY1 = self._support(self._tidList[itemJ]), self._support(y1)
+                if supY1 < self._periodicSupport:
                     continue
-                if len(tidSetX) == len(tidSetJ) and len(y1) is len(tidSetX):
-                    periodicFrequentItems.insert(j, None)
+                if supX == supJ and supY1 == supX:
+                    periodicFrequentItems[j] = None
                     itemSetX.append(itemJ)
-                elif len(tidSetX) < len(tidSetJ) and len(y1) is len(tidSetX):
+                elif supX < supJ and supY1 == supX:
                     itemSetX.append(itemJ)
-                elif len(tidSetX) > len(tidSetJ) and len(y1) is len(tidSetJ):
-                    periodicFrequentItems.insert(j, None)
+                elif supX > supJ and supY1 == supJ:
+                    periodicFrequentItems[j] = None
                     itemSets.append(itemJ)
                     tidSets.append(y1)
                 else:
@@ -56,9 +56,9 @@ import sys as _sys
 import validators as _validators
 from urllib.request import urlopen as _urlopen
 from PAMI.partialPeriodicPattern.maximal import abstract as _abstract
+from PAMI.extras import maximalPatternIndex as _mpi
 import deprecated
 
-global maximalTree
 _periodicSupport = float()
 _period = float()
 _lno = int()
@@ -135,7 +135,6 @@ class _Tree(object):
         self.root = _Node(None, {})
         self.summaries = {}
         self.info = {}
-        #self.maximalTree = _MPTree()
 
     def _addTransaction(self, transaction, tid):
         """
@@ -205,7 +204,7 @@ class _Tree(object):
             temp += i.timeStamps
         return temp
 
-    def _generatePatterns(self, prefix, _patterns, maximalTree):
+    def _generatePatterns(self, prefix, _patterns, maximalIndex):
         """
         To generate the maximal periodic frequent patterns
 
@@ -224,121 +223,17 @@ class _Tree(object):
             for k in info:
                 tail.append(k)
             sub = head + tail
-            if maximalTree._checkerSub(sub) == 1:
+            if not maximalIndex.hasSuperset(sub):
                 for pat in range(len(condPattern)):
                     conditionalTree._addTransaction(condPattern[pat], timeStamps[pat])
                 if len(condPattern) >= 1:
-                    conditionalTree._generatePatterns(pattern, _patterns, maximalTree)
+                    conditionalTree._generatePatterns(pattern, _patterns, maximalIndex.focus(pattern))
                 else:
-                    maximalTree._addTransaction(pattern)
-                    _patterns[tuple(pattern)] = self.info[i]
+                    maximalIndex.add(pattern)
+                    _patterns[tuple(sorted(pattern))] = self.info[i]
             self._removeNode(i)
 
 
-class _MNode(object):
-    """
-    A class used to represent the node of frequentPatternTree
-
-
-    :Attributes:
-
-        item : int
-            storing item of a node
-        children : list
-            To maintain the children of node
-
-    :Methods:
-
-        addChild(itemName)
-            storing the children to their respective parent nodes
-    """
-
-    def __init__(self, item, children):
-        self.item = item
-        self.children = children
-
-    def _addChild(self, node):
-        """
-        To add the children details to parent node children variable
-
-        :param node: children node
-        :return: adding children node to parent node
-        """
-        self.children[node.item] = node
-        node.parent = self
-
-
-class _MPTree(object):
-    """
-    A class used to represent the node of frequentPatternTree
-
-    :Attributes:
-
-        root : node
-            the root of a tree
-        summaries : dict
-            to store the items with same name into dictionary
-
-    :Methods:
-
-        checkerSub(itemSet)
-            to check of subset of itemSet is present in tree
-    """
-
-    def __init__(self):
-        self.root = _Node(None, {})
-        self.summaries = {}
-
-    def _addTransaction(self, transaction):
-        """
-        to add the transaction in maximal tree
-
-        :param transaction: resultant periodic frequent pattern
-        :return: maximal tree
-        """
-        currentNode = self.root
-        transaction.sort()
-        for i in range(len(transaction)):
-            if transaction[i] not in currentNode.children:
-                newNode = _MNode(transaction[i], {})
-                currentNode._addChild(newNode)
-                if transaction[i] in self.summaries:
-                    self.summaries[transaction[i]].insert(0, newNode)
-                else:
-                    self.summaries[transaction[i]] = [newNode]
-                currentNode = newNode
-            else:
-                currentNode = currentNode.children[transaction[i]]
-
-    def _checkerSub(self, items):
-        """
-        To check subset present of items in the maximal tree
-
-        :param items: the pattern to check for subsets
-        :return: 1
-        """
-        items.sort(reverse=True)
-        item = items[0]
-        if item not in self.summaries:
-            return 1
-        else:
-            if len(items) == 1:
-                return 0
-        for t in self.summaries[item]:
-            cur = t.parent
-            i = 1
-            while cur.item is not None:
-                if items[i] == cur.item:
-                    i += 1
-                    if i == len(items):
-                        return 0
-                cur = cur.parent
-        return 1
-
-
-#maximalTree = _MPTree()
-
-
 def _getPeriodAndSupport(timeStamps):
     """
     To calculate the periodicity and support of a pattern with their respective timeStamps
@@ -405,7 +300,7 @@ class Max3PGrowth(_abstract._partialPeriodicPatterns):
                    Minimum partial periodic...
     :param  periodicSupport: str:
                    Minimum partial periodic...
-    :param  maximalTree: str:
+    :param  maximalIndex: maximalPatternIndex:
                    Minimum partial periodic...
 
     :param  sep: str :
@@ -542,7 +437,7 @@ class Max3PGrowth(_abstract._partialPeriodicPatterns):
     _lno = 0
     _patterns = {}
     _pfList = {}
-    _maximalTree = str()
+    _maximalIndex = None
 
     def _creatingitemSets(self):
         """
@@ -684,6 +579,13 @@ class Max3PGrowth(_abstract._partialPeriodicPatterns):
             t1.append(self._pfList[i])
         return t1
 
+    @deprecated.deprecated("It is recommended to use 'mine()' instead of 'startMine()' for mining process. Starting from January 2025, 'startMine()' will be completely terminated.")
+    def startMine(self):
+        """
+        Mining process will start from this function
+        """
+        self.mine()
+
     def mine(self):
         """
         Mining process will start from this function
@@ -708,8 +610,8 @@ class Max3PGrowth(_abstract._partialPeriodicPatterns):
         info = {self._rank[k]: v for k, v in generatedItems.items()}
         Tree = self._buildTree(updatedDatabases, info)
         self._patterns = {}
-        self._maximalTree = _MPTree()
-        Tree._generatePatterns([], self._patterns, self._maximalTree)
+        self._maximalIndex = _mpi.maximalPatternIndex()
+        Tree._generatePatterns([], self._patterns, self._maximalIndex)
         self._finalPatterns = {}
         for x, y in self._patterns.items():
             st = str()
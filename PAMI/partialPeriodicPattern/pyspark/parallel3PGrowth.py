@@ -327,6 +327,8 @@ class Tree(object):
 class parallel3PGrowth(_ab._partialPeriodicPatterns):
     """
     :Description:   4PGrowth is fundamental approach to mine the partial periodic patterns in temporal database.
+                    On a single machine, the process-pool implementation PAMI.partialPeriodicPattern.basic.parallel3PGrowth
+                    runs the same partition-by-item algorithm without Spark.
 
     :Reference:   Discovering Partial Periodic Itemsets in Temporal Databases,SSDBM '17: Proceedings of the 29th International Conference on Scientific and Statistical Database ManagementJune 2017
                   Article No.: 30 Pages 1–6https://doi.org/10.1145/3085504.3085535
@@ -53,6 +53,8 @@ __copyright__ = """
 """
 
 from PAMI.partialPeriodicPattern.topk import abstract as _abstract
+from PAMI.partialPeriodicPattern import _periodicSupport as _ps
+from PAMI.extras import bitPackedDatabase as _bp
 import validators as _validators
 from urllib.request import urlopen as _urlopen
 import sys as _sys
@@ -66,7 +68,8 @@ class k3PMiner(_abstract.partialPeriodicPatterns):
     :Reference:  Palla Likhitha,Rage Uday Kiran, Discovering Top-K Partial Periodic Patterns in Big Temporal Databases https://dl.acm.org/doi/10.1007/978-3-031-39847-6_28
 
     :param  iFile: str :
-                   Name of the Input file to mine complete set of periodic frequent pattern's
+                   Name of the Input file to mine complete set of periodic frequent pattern's. A parquet file or a
+                   PAMI.extras.bitPackedDatabase is mined as a bit-packed vertical database.
     :param  oFile: str :
                    Name of the output file to store complete set of periodic frequent pattern's
     :param  sep: str :
@@ -195,6 +198,8 @@ class k3PMiner(_abstract.partialPeriodicPatterns):
     _lno = int()
     _minimum = int()
     _mapSupport = {}
+    _packed = False
+    _dbSize = int()
 
     def _creatingItemSets(self):
         """
@@ -247,11 +252,11 @@ class k3PMiner(_abstract.partialPeriodicPatterns):
         if type(value) is int:
             value = int(value)
         if type(value) is float:
-            value = (len(self._Database) * value)
+            value = (self._dbSize * value)
         if type(value) is str:
             if '.' in value:
                 value = float(value)
-                value = (len(self._Database) * value)
+                value = (self._dbSize * value)
             else:
                 value = int(value)
         return value
@@ -262,23 +267,31 @@ class k3PMiner(_abstract.partialPeriodicPatterns):
         """
 
         self._mapSupport = {}
-        self._tidList = {}
         self._period = self._convert(self._period)
         self._k = int(self._convert(self._k))
-        for line in self._Database:
-            n = int(line[0])
-            for i in range(1, len(line)):
-                si = line[i]
-                if self._mapSupport.get(si) is None:
-                    self._mapSupport[si] = [1, 0, n]
-                    self._tidList[si] = [n]
-                else:
-                    self._mapSupport[si][0] += 1
-                    period = abs(n - self._mapSupport[si][2])
-                    if period <= self._period:
-                        self._mapSupport[si][1] += 1
-                    self._mapSupport[si][2] = n
-                    self._tidList[si].append(n)
+        if self._packed:
+            # the bitmaps of the items were read with the database
+            for item, words in self._tidList.items():
+                bounds = _bp.span(words)
+                if bounds is not None:
+                    self._mapSupport[item] = [_bp.support(words), _bp.periodicSupport(words, self._period), bounds[1]]
+        else:
+            self._tidList = {}
+            for line in self._Database:
+                n = int(line[0])
+                for i in range(1, len(line)):
+                    si = line[i]
+                    if self._mapSupport.get(si) is None:
+                        self._mapSupport[si] = [1, 0, n]
+                        self._tidList[si] = [n]
+                    else:
+                        self._mapSupport[si][0] += 1
+                        period = abs(n - self._mapSupport[si][2])
+                        if period <= self._period:
+                            self._mapSupport[si][1] += 1
+                        self._mapSupport[si][2] = n
+                        self._tidList[si].append(n)
+            self._tidList = {k: _ps.asTimestamps(v) for k, v in self._tidList.items()}
         for x, y in self._mapSupport.items():
             period = abs(self._lno - self._mapSupport[x][2])
             if period <= self._period:
@@ -305,17 +318,24 @@ class k3PMiner(_abstract.partialPeriodicPatterns):
     def _getSupportAndPeriod(self, timeStamps):
         """To calculate the periodicity and support
 
-        :param timeStamps: Timestamps of an item set
+        :param timeStamps: Timestamps of an item set, or its packed bitmap when mining a bit-packed database
         :return: support, periodicity
         """
+        if self._packed:
+            return _bp.periodicSupport(timeStamps, self._period)
+        return _ps.periodicSupport(timeStamps, self._period)
+
+    def _extend(self, timeStamps, siblings):
+        """Intersects an item set with all of its siblings at once
 
-        timeStamps.sort()
-        sup = 0
-        for j in range(len(timeStamps) - 1):
-            per = abs(timeStamps[j + 1] - timeStamps[j])
-            if per <= self._period:
-                sup += 1
-        return sup
+        :param timeStamps: Timestamps of the item set, or its packed bitmap when mining a bit-packed database
+        :param siblings: Timestamps of the siblings, in the same form
+        :return: timestamps of every intersection and the periodic-support of every intersection
+        """
+        if self._packed:
+            intersections = [timeStamps & sibling for sibling in siblings]
+            return intersections, [self._getSupportAndPeriod(intersection) for intersection in intersections]
+        return _ps.intersectSiblings(timeStamps, siblings, self._period)
 
     def _save(self, prefix, suffix, tidSetI):
         """Saves the patterns that satisfy the periodic frequent property.
@@ -382,11 +402,8 @@ class k3PMiner(_abstract.partialPeriodicPatterns):
             classItemSets = []
             classTidSets = []
             itemSetX = [itemI]
-            for j in range(i + 1, len(itemSets)):
-                itemJ = itemSets[j]
-                tidSetJ = tidSets[j]
-                y = list(set(tidSetI).intersection(tidSetJ))
-                val = self._getSupportAndPeriod(y)
+            intersections, values = self._extend(tidSetI, tidSets[i + 1:])
+            for itemJ, y, val in zip(itemSets[i + 1:], intersections, values):
                 if val > self._minimum:
                     classItemSets.append(itemJ)
                     classTidSets.append(y)
@@ -412,7 +429,16 @@ class k3PMiner(_abstract.partialPeriodicPatterns):
                 raise Exception("Please enter the file path or file name:")
             if self._k is None:
                 raise Exception("Please enter the Minimum Support")
-            self._creatingItemSets()
+            self._packed = _bp.isBitPacked(self._iFile)
+            if self._packed:
+                # a bit-packed vertical database is mined directly, the tidsets being packed bitmaps over the timestamps
+                database = _bp.bitPackedDatabase.read(self._iFile)
+                self._tidList = dict(database.items)
+                self._lno = database.maxTS
+                self._dbSize = database.dbSize
+            else:
+                self._creatingItemSets()
+                self._dbSize = len(self._Database)
             plist = self._frequentOneItem()
             for i in range(len(plist)):
                 itemI = plist[i]
@@ -420,11 +446,8 @@ class k3PMiner(_abstract.partialPeriodicPatterns):
                 itemSetX = [itemI]
                 itemSets = []
                 tidSets = []
-                for j in range(i + 1, len(plist)):
-                    itemJ = plist[j]
-                    tidSetJ = self._tidList[itemJ]
-                    y1 = list(set(tidSetI).intersection(tidSetJ))
-                    val = self._getSupportAndPeriod(y1)
+                intersections, values = self._extend(tidSetI, [self._tidList[itemJ] for itemJ in plist[i + 1:]])
+                for itemJ, y1, val in zip(plist[i + 1:], intersections, values):
                     if val > self._minimum:
                         itemSets.append(itemJ)
                         tidSets.append(y1)
@@ -60,6 +60,7 @@ from deprecated import deprecated
 import numpy as np
 
 from PAMI.periodicFrequentPattern.basic import abstract as _ab
+from PAMI.extras import bitPackedDatabase as _bp
 
 
 class PFECLAT(_ab._periodicFrequentPatterns):
@@ -71,7 +72,7 @@ class PFECLAT(_ab._periodicFrequentPatterns):
     :**Reference**:   P. Ravikumar, P.Likhitha, R. Uday kiran, Y. Watanobe, and Koji Zettsu, "Towards efficient discovery of
                       periodic-frequent patterns in columnar temporal databases", 2021 IEA/AIE.
 
-    :**Parameters**:    - **iFile** (*str or URL or dataFrame*) -- *Name of the Input file to mine complete set of frequent patterns.*
+    :**Parameters**:    - **iFile** (*str or URL or dataFrame*) -- *Name of the Input file to mine complete set of frequent patterns. A parquet file or a PAMI.extras.bitPackedDatabase is mined as a bit-packed vertical database.*
                         - **oFile** (*str*) -- *Name of the output file to store complete set of frequent patterns.*
                         - **minSup** (*int or float or str*) -- *The user can specify minSup either in count or proportion of database size. If the program detects the data type of minSup is integer, then it treats minSup is expressed in count. Otherwise, it will be treated as float.*
                         - **maxPer** (*int or float or str*) -- *The user can specify maxPer either in count or proportion of database size. It controls the maximum number of transactions in which any two items within a pattern can reappear.*
@@ -258,17 +259,24 @@ class PFECLAT(_ab._periodicFrequentPatterns):
         """
         self._startTime = _ab._time.time()
         self._finalPatterns = {}
-        frequentSets = self._creatingItemSets()
-
-        items = {}
-        maxTS = 0
-        for line in self._Database:
-            index = int(line[0])
-            maxTS = max(maxTS, index)
-            for item in line[1:]:
-                if tuple([item]) not in items:
-                    items[tuple([item])] = set()
-                items[tuple([item])].add(index)
+        if _bp.isBitPacked(self._iFile):
+            # a bit-packed vertical database is mined directly, the tidsets being packed bitmaps over the timestamps
+            database = _bp.bitPackedDatabase.read(self._iFile)
+            items = {tuple([item]): words for item, words in database.items.items()}
+            maxTS = database.maxTS
+            support, getMaxPer = _bp.support, _bp.periodicity
+        else:
+            self._creatingItemSets()
+            items = {}
+            maxTS = 0
+            for line in self._Database:
+                index = int(line[0])
+                maxTS = max(maxTS, index)
+                for item in line[1:]:
+                    if tuple([item]) not in items:
+                        items[tuple([item])] = set()
+                    items[tuple([item])].add(index)
+            support, getMaxPer = len, self._getMaxPer
 
         self._dbSize = maxTS
 
@@ -278,15 +286,16 @@ class PFECLAT(_ab._periodicFrequentPatterns):
         maxPer = self._maxPer
 
 
-        items = {k: v for k, v in items.items() if len(v) >= minSup}
-        items = {k: v for k, v in sorted(items.items(), key = lambda x: len(x[1]), reverse = True)}
+        supports = {k: support(v) for k, v in items.items()}
+        items = {k: v for k, v in items.items() if supports[k] >= minSup}
+        items = {k: v for k, v in sorted(items.items(), key = lambda x: supports[x[0]], reverse = True)}
 
         keys = []
         for item in list(items.keys()):
-            per = self._getMaxPer(items[item], maxTS)
+            per = getMaxPer(items[item], maxTS)
             if per <= maxPer:
                 keys.append(item)
-                self._finalPatterns[item] = [len(items[item]), per, set(items[item])]
+                self._finalPatterns[item] = [supports[item], per, items[item]]
 
         while keys:
             newKeys = []
@@ -295,13 +304,15 @@ class PFECLAT(_ab._periodicFrequentPatterns):
                     if keys[i][:-1] == keys[j][:-1] and keys[i][-1] != keys[j][-1]:
                         # print(keys[i], keys[j])
                         newKey = tuple(keys[i] + (keys[j][-1],))
-                        intersect = items[keys[i]].intersection(items[keys[j]])
-                        per = self._getMaxPer(intersect, maxTS)
-                        sup = len(intersect)
-                        if sup >= minSup and per <= maxPer:
+                        intersect = items[keys[i]] & items[keys[j]]
+                        sup = support(intersect)
+                        if sup < minSup:
+                            continue
+                        per = getMaxPer(intersect, maxTS)
+                        if per <= maxPer:
                             items[newKey] = intersect
                             newKeys.append(newKey)
-                            self._finalPatterns[newKey] = [sup, per, set(intersect)]
+                            self._finalPatterns[newKey] = [sup, per, intersect]
                     else:
                         break
             keys = newKeys
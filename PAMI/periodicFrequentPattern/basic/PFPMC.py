@@ -53,6 +53,8 @@ __copyright__ = """
 """
 
 from PAMI.periodicFrequentPattern.basic import abstract as _ab
+from PAMI.extras import bitPackedDatabase as _bp
+import numpy as np
 import pandas as pd
 from deprecated import deprecated
 from itertools import groupby as _groupby
@@ -68,7 +70,8 @@ class PFPMC(_ab._periodicFrequentPatterns):
     :Reference: (has to be added)
 
     :param  iFile: str :
-                   Name of the Input file to mine complete set of periodic frequent pattern's
+                   Name of the Input file to mine complete set of periodic frequent pattern's. A parquet file or a
+                   PAMI.extras.bitPackedDatabase is mined as a bit-packed vertical database.
     :param  oFile: str :
                    Name of the output file to store complete set of periodic frequent pattern's
     :param  minSup: str:
@@ -256,6 +259,8 @@ class PFPMC(_ab._periodicFrequentPatterns):
         return max(diffs) + 1
 
     def _getPeriodic(self, tids: set):
+        if isinstance(tids, np.ndarray):
+            return self._getPackedPeriodic(tids)
         tids = list(tids)
         tids.sort()
         temp = self._maxPer + 1
@@ -275,6 +280,22 @@ class PFPMC(_ab._periodicFrequentPatterns):
 
         return period
 
+    def _getPackedPeriodic(self, diffSet: np.ndarray) -> int:
+        """
+        Vectorised form of _getPeriodic for a diffset given as a packed bitmap over the timestamps
+
+        :param diffSet: packed bitmap of the timestamps at which a pattern does not occur
+        :type diffSet: numpy.ndarray
+        :return: periodicity of the pattern
+        :rtype: int
+        """
+        tids = _bp.timestamps(diffSet)
+        tids = tids[tids != self._lastTid]
+        breaks = np.flatnonzero(np.diff(tids) != 1)
+        if breaks.size == 0:
+            return 0
+        return int(np.diff(breaks, prepend=-1).max())
+
     def _convert(self, value) -> float:
         """
         To convert the given user specified value
@@ -299,6 +320,8 @@ class PFPMC(_ab._periodicFrequentPatterns):
         Storing the complete transactions of the database/input file in a database variable
         :return: list
         """
+        if _bp.isBitPacked(self._iFile):
+            return self._creatingPackedItemSets()
         plist = []
         Database = []
         if isinstance(self._iFile, _ab._pd.DataFrame):
@@ -367,6 +390,31 @@ class PFPMC(_ab._periodicFrequentPatterns):
                 self._finalPatterns[item] = [sup, per, diff]
         return candidates
 
+    def _creatingPackedItemSets(self) -> list:
+        """
+        Reads a bit-packed vertical database, the diffsets of the items being packed bitmaps over the timestamps
+        :return: list
+        """
+        database = _bp.bitPackedDatabase.read(self._iFile)
+        tidSet = np.zeros(database.numWords, dtype=np.uint64)
+        for tids in database.items.values():
+            tidSet |= tids
+        self._tidSet = tidSet
+        self._lno = database.maxTS
+        self._dbSize = database.dbSize
+        self._lastTid = database.maxTS
+        self._minSup = self._convert(self._minSup)
+        self._maxPer = self._convert(self._maxPer)
+        candidates = []
+        for item, tids in database.items.items():
+            diff = tidSet & ~tids
+            per = self._getPeriodic(diff)
+            sup = _bp.support(tids)
+            if sup >= self._minSup and per <= self._maxPer:
+                candidates.append(item)
+                self._finalPatterns[item] = [sup, per, diff]
+        return candidates
+
     def _generateDiffsetEclat(self, candidates: list) -> None:
         new_freqList = []
         for i in range(0, len(candidates)):
@@ -376,9 +424,11 @@ class PFPMC(_ab._periodicFrequentPatterns):
                 item2 = candidates[j]
                 i2_list = item2.split()
                 if i1_list[:-1] == i2_list[:-1]:
-                    union_DiffSet = self._finalPatterns[item2][2].union(self._finalPatterns[item1][2])
-                    sorted(union_DiffSet)
-                    union_supp = self._dbSize - len(union_DiffSet)
+                    union_DiffSet = self._finalPatterns[item2][2] | self._finalPatterns[item1][2]
+                    if isinstance(union_DiffSet, set):
+                        union_supp = self._dbSize - len(union_DiffSet)
+                    else:
+                        union_supp = self._dbSize - _bp.support(union_DiffSet)
                     period = self._getPeriodic(union_DiffSet)
                     if union_supp >= self._minSup and period <= self._maxPer:
                         newKey = item1 + "\t" + i2_list[-1]
@@ -54,9 +54,9 @@ __copyright__ = """
 
 from PAMI.periodicFrequentPattern.basic import abstract as _ab
 import pandas as pd
+import numpy as _np
 from deprecated import deprecated
 from itertools import combinations as _combinations
-from PAMI.periodicFrequentPattern.basic import abstract as _ab
 from typing import List, Dict, Tuple, Set, Union, Any, Generator  
 
 _pfList = []
@@ -64,17 +64,49 @@ _minSup = int()
 _maxPer = int()
 _lno = int()
 
+#: Layout of a period summary: the first and last timestamp of an interval, the largest gap inside it and its support.
+_summaryType = _np.dtype([('start', _np.int64), ('end', _np.int64), ('per', _np.int64), ('sup', _np.int64)])
+_emptySummaries = _np.empty(0, dtype=_summaryType)
+#: Number of timestamps buffered by a node before they are compressed into its period summaries.
+_bufferSize = 1024
+
 
 class _Interval(object):
     """
-    To represent the timestamp interval of a node in summaries
+    To represent the timestamp interval of a node in summaries.
+    The summaries are stored as structured arrays, an _Interval is only a view over one row of such an array.
     """
 
+    __slots__ = ('_summaries', '_index')
+
     def __init__(self, start, end, per, sup) -> None:
-        self.start = start
-        self.end = end
-        self.per = per
-        self.sup = sup
+        self._summaries = _np.array([(start, end, per, sup)], dtype=_summaryType)
+        self._index = 0
+
+    @classmethod
+    def view(cls, summaries, index) -> '_Interval':
+        """
+        To view a row of period summaries as an interval
+
+        :param summaries: period summaries of a node
+        :type summaries: numpy.ndarray
+        :param index: row of the interval
+        :type index: int
+        :return: the interval
+        """
+        interval = cls.__new__(cls)
+        interval._summaries = summaries
+        interval._index = index
+        return interval
+
+    start = property(lambda self: int(self._summaries['start'][self._index]),
+                     lambda self, value: self._summaries['start'].__setitem__(self._index, value))
+    end = property(lambda self: int(self._summaries['end'][self._index]),
+                   lambda self, value: self._summaries['end'].__setitem__(self._index, value))
+    per = property(lambda self: int(self._summaries['per'][self._index]),
+                   lambda self, value: self._summaries['per'].__setitem__(self._index, value))
+    sup = property(lambda self: int(self._summaries['sup'][self._index]),
+                   lambda self, value: self._summaries['sup'].__setitem__(self._index, value))
 
 
 class _NodeSummaries(object):
@@ -83,36 +115,83 @@ class _NodeSummaries(object):
 
     :Attributes:
 
-        totalSummaries : list
-            stores the summaries of timestamps
+        totalSummaries : numpy.ndarray
+            stores the summaries of timestamps as a structured array of (start, end, per, sup)
 
     :Methods:
 
         insert(timeStamps)
             inserting and merging the timestamps into the summaries of a node
+        intervals()
+            the summaries of a node as a list of _Interval views
     """
 
+    __slots__ = ('_summaries', '_pending')
+
     def __init__(self) -> None:
-        self.totalSummaries = []
+        self._summaries = _emptySummaries
+        self._pending = []
+
+    def insert(self, tid) -> None:
+        """ To insert and merge the timeStamps into summaries of a node. The timestamps are buffered and compressed
+            into intervals in batches.
 
-    def insert(self, tid) -> List[_Interval]:
-        """ To insert and merge the timeStamps into summaries of a node
             :param tid: timeStamps of a node
-            :return: summaries of a node
-        """
-        k = self.totalSummaries[-1]
-        diff = tid - k.end
-        if diff <= _maxPer:
-            k.end = tid
-            k.per = max(diff, k.per)
-            #             print(k.per)
-            k.sup += 1
-        else:
-            self.totalSummaries.append(_Interval(tid, tid, 0, 1))
-        return self.totalSummaries
+            :return: None
+        """
+        self._pending.append(tid)
+        if len(self._pending) >= _bufferSize:
+            self._flush()
+
+    def _flush(self) -> None:
+        """
+        To compress the buffered timestamps into the summaries of a node
+        """
+        if self._pending:
+            self._summaries = _mergeAll([self._summaries, _summarise(self._pending)])
+            self._pending = []
+
+    @property
+    def totalSummaries(self) -> _np.ndarray:
+        self._flush()
+        return self._summaries
+
+    @totalSummaries.setter
+    def totalSummaries(self, summaries) -> None:
+        self._summaries = summaries
+        self._pending = []
+
+    def intervals(self) -> List[_Interval]:
+        """
+        :return: summaries of a node as a list of intervals
+        """
+        summaries = self.totalSummaries
+        return [_Interval.view(summaries, i) for i in range(len(summaries))]
 
 
-def _merge(summariesX, summariesY) -> List[_Interval]:
+def _summarise(timeStamps) -> _np.ndarray:
+    """
+    To compress a sorted list of timestamps into period summaries
+
+    :param timeStamps: sorted timestamps
+    :return: summaries of the timestamps
+    """
+    timeStamps = _np.asarray(timeStamps, dtype=_np.int64)
+    gaps = _np.diff(timeStamps)
+    breaks = _np.flatnonzero(gaps > _maxPer) + 1
+    first = _np.concatenate(([0], breaks))
+    last = _np.concatenate((breaks - 1, [len(timeStamps) - 1]))
+    inner = _np.concatenate(([0], gaps))
+    inner[first] = 0
+    summaries = _np.empty(len(first), dtype=_summaryType)
+    summaries['start'] = timeStamps[first]
+    summaries['end'] = timeStamps[last]
+    summaries['per'] = _np.maximum.reduceat(inner, first)
+    summaries['sup'] = last - first + 1
+    return summaries
+
+
+def _merge(summariesX, summariesY) -> _np.ndarray:
     """
     To Merge the timeStamps
 
@@ -120,134 +199,43 @@ def _merge(summariesX, summariesY) -> List[_Interval]:
     :param summariesY:  TimeStamps of a one itemSet
     :return:  Merged timestamp of both itemSets
     """
-    iter1 = 0
-    iter2 = 0
-    updatedSummaries = []
-    l1 = len(summariesX)
-    l2 = len(summariesY)
-    while 1:
-        if summariesX[iter1].start < summariesY[iter2].start:
-            if summariesX[iter1].end < summariesY[iter2].start:
-                diff = summariesY[iter2].start - summariesX[iter1].end
-                if diff > _maxPer:
-                    updatedSummaries.append(_Interval(summariesX[iter1].start,
-                                                     summariesX[iter1].end, summariesX[iter1].per,
-                                                     summariesX[iter1].sup))
-                    iter1 += 1
-                    if iter1 >= l1:
-                        ck = 1
-                        break
-                else:
-                    per1 = max(diff, summariesX[iter1].per)
-                    per1 = max(per1, summariesY[iter2].per)
-                    updatedSummaries.append(
-                        _Interval(summariesX[iter1].start, summariesY[iter2].end, per1,
-                                 summariesX[iter1].sup + summariesY[iter2].sup))
-                    iter1 += 1
-                    iter2 += 1
-                    if iter1 >= l1:
-                        ck = 1
-                        break
-
-                    if iter2 >= l2:
-                        ck = 2
-                        break
+    return _mergeAll([summariesX, summariesY])
 
-            else:
-                if summariesX[iter1].end > summariesY[iter2].end:
-                    updatedSummaries.append(_Interval(summariesX[iter1].start, summariesX[iter1].end,
-                                                     summariesX[iter1].per,
-                                                     summariesX[iter1].sup + summariesY[iter2].sup))
-                else:
-                    per1 = max(summariesX[iter1].per, summariesY[iter2].per)
-                    updatedSummaries.append(
-                        _Interval(summariesX[iter1].start, summariesY[iter2].end, per1,
-                                 summariesX[iter1].sup + summariesY[iter2].sup))
-                iter1 += 1
-                iter2 += 1
-                if iter1 >= l1:
-                    ck = 1
-                    break
-
-                if iter2 >= l2:
-                    ck = 2
-                    break
-        else:
-            if summariesY[iter2].end < summariesX[iter1].start:
-                diff = summariesX[iter1].start - summariesY[iter2].end
-                if diff > _maxPer:
-                    updatedSummaries.append(_Interval(summariesY[iter2].start, summariesY[iter2].end,
-                                                     summariesY[iter2].per, summariesY[iter2].sup))
-                    iter2 += 1
-                    if iter2 >= l2:
-                        ck = 2
-                        break
-                else:
-                    per1 = max(diff, summariesY[iter2].per)
-                    per1 = max(per1, summariesX[iter1].per)
-                    updatedSummaries.append(
-                        _Interval(summariesY[iter2].start, summariesX[iter1].end, per1,
-                                 summariesY[iter2].sup + summariesX[iter1].sup))
-                    iter2 += 1
-                    iter1 += 1
-                    if iter2 >= l2:
-                        ck = 2
-                        break
-
-                    if iter1 >= l1:
-                        ck = 1
-                        break
 
-            else:
-                if summariesY[iter2].end > summariesX[iter1].end:
-                    updatedSummaries.append(_Interval(summariesY[iter2].start, summariesY[iter2].end,
-                                                     summariesY[iter2].per,
-                                                     summariesY[iter2].sup + summariesX[iter1].sup))
-                else:
-                    per1 = max(summariesY[iter2].per, summariesX[iter1].per)
-                    updatedSummaries.append(
-                        _Interval(summariesY[iter2].start, summariesX[iter1].end, per1,
-                                 summariesY[iter2].sup + summariesX[iter1].sup))
-                iter2 += 1
-                iter1 += 1
-                if iter2 >= l2:
-                    ck = 2
-                    break
-
-                if iter1 >= l1:
-                    ck = 1
-                    break
-    if ck == 1:
-        while iter2 < l2:
-            updatedSummaries.append(summariesY[iter2])
-            iter2 += 1
-    else:
-        while iter1 < l1:
-            updatedSummaries.append(summariesX[iter1])
-            iter1 += 1
-    updatedSummaries = _update(updatedSummaries)
+def _mergeAll(summaries) -> _np.ndarray:
+    """
+    To merge the summaries of any number of itemSets at once
 
-    return updatedSummaries
+    :param summaries: list of summaries
+    :return: merged summaries
+    """
+    if len(summaries) == 1:
+        return summaries[0]
+    # concatenating the plain int64 buffers avoids numpy's slow structured dtype promotion
+    merged = _np.concatenate([x.view(_np.int64) for x in summaries]).view(_summaryType)
+    merged = merged[_np.argsort(merged['start'], kind='stable')]
+    return _update(merged)
 
 
-def _update(updatedSummaries) -> List[_Interval]:
-    """ After updating the summaries with first, last, and period elements in summaries
+def _update(updatedSummaries) -> _np.ndarray:
+    """ After updating the summaries with first, last, and period elements in summaries.
+    Intervals, sorted by their start, that overlap or lie within maxPer of each other are collapsed into one.
 
     :param updatedSummaries: summaries that have been merged
     :return: updated summaries of a node
     """
-    summaries = [updatedSummaries[0]]
-    cur = updatedSummaries[0]
-    for i in range(1, len(updatedSummaries)):
-        v = (updatedSummaries[i].start - cur.end)
-        if cur.end > updatedSummaries[i].start or v <= _maxPer:
-            cur.end = max(updatedSummaries[i].end, cur.end)
-            cur.sup += updatedSummaries[i].sup
-            cur.per = max(cur.per, updatedSummaries[i].per)
-            cur.per = max(cur.per, v)
-        else:
-            summaries.append(updatedSummaries[i])
-        cur = summaries[-1]
+    if len(updatedSummaries) < 2:
+        return updatedSummaries
+    ends = _np.maximum.accumulate(updatedSummaries['end'])
+    gaps = updatedSummaries['start'][1:] - ends[:-1]
+    first = _np.flatnonzero(_np.concatenate(([True], gaps > _maxPer)))
+    inner = _np.concatenate(([0], _np.maximum(gaps, 0)))
+    inner[first] = 0
+    summaries = _np.empty(len(first), dtype=_summaryType)
+    summaries['start'] = updatedSummaries['start'][first]
+    summaries['end'] = _np.maximum.reduceat(updatedSummaries['end'], first)
+    summaries['per'] = _np.maximum.reduceat(_np.maximum(updatedSummaries['per'], inner), first)
+    summaries['sup'] = _np.add.reduceat(updatedSummaries['sup'], first)
     return summaries
 
 
@@ -357,10 +345,7 @@ class _Tree(object):
                 currentNode = newNode
             else:
                 currentNode = currentNode.children[transaction[i]]
-        if len(currentNode.timeStamps.totalSummaries) != 0:
-            currentNode.timeStamps.insert(tid)
-        else:
-            currentNode.timeStamps.totalSummaries.append(_Interval(tid, tid, 0, 1))
+        currentNode.timeStamps.insert(tid)
 
     def addConditionalPatterns(self, transaction, tid) -> None:
         """
@@ -387,7 +372,7 @@ class _Tree(object):
         else:
             currentNode.timeStamps.totalSummaries = tid
 
-    def getConditionalPatterns(self, alpha) -> Tuple[List[List[int]], List[List[_Interval]], Dict[int, Tuple[int, int]]]:
+    def getConditionalPatterns(self, alpha) -> Tuple[List[List[int]], List[_np.ndarray], Dict[int, Tuple[int, int]]]:
         """
         To mine the conditional patterns of a node
 
@@ -426,17 +411,14 @@ class _Tree(object):
             del i
         del self.summaries[nodeValue]
 
-    def getTimeStamps(self, alpha) -> List[_Interval]:
+    def getTimeStamps(self, alpha) -> _np.ndarray:
         """
         To get the timeStamps of a respective node
 
         :param alpha: name of node for the timeStamp
         :return: timeStamps of a node
         """
-        temp = []
-        for i in self.summaries[alpha]:
-            temp += i.timeStamps
-        return temp
+        return _mergeAll([i.timeStamps.totalSummaries for i in self.summaries[alpha]])
 
     def check(self) -> int:
         """
@@ -478,10 +460,7 @@ class _Tree(object):
                     yield cp
             else:
                 if len(conditionalTree.info) != 0:
-                    j = []
-                    for r in timeStamps:
-                        j += r
-                    inf = getPeriodAndSupport(j)
+                    inf = getPeriodAndSupport(_mergeAll(timeStamps))
                     patterns[0].reverse()
                     upp = []
                     for jm in patterns[0]:
@@ -518,21 +497,18 @@ def getPeriodAndSupport(timeStamps) -> List[int]:
     :param timeStamps: timeStamps of a  pattern or item
     :return: support and periodicity
     """
-    cur = 0
-    per = 0
-    sup = 0
-    for j in range(len(timeStamps)):
-        per = max(per, timeStamps[j].start - cur)
-        per = max(per, timeStamps[j].per)
-        if per > _maxPer:
-            return [0, 0]
-        cur = timeStamps[j].end
-        sup += timeStamps[j].sup
-    per = max(per, _lno - cur)
-    return [sup, per]
-
-
-def conditionalTransactions(patterns, timestamp) -> Tuple[List[List[int]], List[List[_Interval]], Dict[int, Tuple[int, int]]]:
+    if len(timeStamps) == 0:
+        return [0, 0]
+    starts, ends = timeStamps['start'], timeStamps['end']
+    per = max(int(starts[0]), int(timeStamps['per'].max()), _lno - int(ends[-1]))
+    if len(timeStamps) > 1:
+        per = max(per, int((starts[1:] - ends[:-1]).max()))
+    if per > _maxPer:
+        return [0, 0]
+    return [int(timeStamps['sup'].sum()), per]
+
+
+def conditionalTransactions(patterns, timestamp) -> Tuple[List[List[int]], List[_np.ndarray], Dict[int, Tuple[int, int]]]:
     """
     To sort and update the conditional transactions by removing the items which fails frequency
     and periodicity conditions
@@ -548,13 +524,13 @@ def conditionalTransactions(patterns, timestamp) -> Tuple[List[List[int]], List[
     for i in range(len(patterns)):
         for j in patterns[i]:
             if j in data1:
-                data1[j] = _merge(data1[j], timestamp[i])
+                data1[j].append(timestamp[i])
             else:
-                data1[j] = timestamp[i]
+                data1[j] = [timestamp[i]]
 
     updatedDict = {}
     for m in data1:
-        updatedDict[m] = getPeriodAndSupport(data1[m])
+        updatedDict[m] = getPeriodAndSupport(_mergeAll(data1[m]))
     updatedDict = {k: v for k, v in updatedDict.items() if v[0] >= _minSup and v[1] <= _maxPer}
     count = 0
     for p in patterns:
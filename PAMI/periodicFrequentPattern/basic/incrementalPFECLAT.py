@@ -0,0 +1,537 @@
+# incrementalPFECLAT discovers periodic-frequent patterns in an append-only temporal database. After mining the initial
+# database it keeps the support, last timestamp and periodicity of every periodic pattern, so that newly appended
+# transactions can be mined without rescanning the history.
+#
+# **Importing this algorithm into a python program**
+#
+#             from PAMI.periodicFrequentPattern.basic import incrementalPFECLAT as alg
+#
+#             iFile = 'sampleDB.txt'
+#
+#             minSup = 10  # can also be specified between 0 and 1
+#
+#             maxPer = 20 # can also be specified between 0 and 1
+#
+#             obj = alg.incrementalPFECLAT(iFile, minSup, maxPer)
+#
+#             obj.mine()
+#
+#             obj.saveState("state.pkl")
+#
+#             obj = alg.incrementalPFECLAT(None, minSup, maxPer)
+#
+#             obj.loadState("state.pkl")
+#
+#             obj.update("newTransactions.txt")
+#
+#             periodicFrequentPatterns = obj.getPatterns()
+#
+#             print("Total number of Periodic Frequent Patterns:", len(periodicFrequentPatterns))
+#
+#             obj.save("periodicFrequentPatterns")
+#
+#             Df = obj.getPatternsAsDataFrame()
+#
+#             memUSS = obj.getMemoryUSS()
+#
+#             print("Total Memory in USS:", memUSS)
+#
+#             memRSS = obj.getMemoryRSS()
+#
+#             print("Total Memory in RSS", memRSS)
+#
+#             run = obj.getRuntime()
+#
+#             print("Total ExecutionTime in seconds:", run)
+#
+
+
+__copyright__ = """
+ Copyright (C)  2021 Rage Uday Kiran
+
+     This program is free software: you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+
+     This program is distributed in the hope that it will be useful,
+     but WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+     GNU General Public License for more details.
+
+     You should have received a copy of the GNU General Public License
+     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+     Copyright (C)  2021 Rage Uday Kiran
+
+"""
+
+import pickle as _pickle
+import numpy as np
+from deprecated import deprecated
+
+from PAMI.periodicFrequentPattern.basic import abstract as _ab
+
+
+class incrementalPFECLAT(_ab._periodicFrequentPatterns):
+    """
+    **About this algorithm**
+
+    :**Description**:   incrementalPFECLAT discovers periodic-frequent patterns in an append-only temporal database.
+                        The periodicity of a pattern can never decrease when transactions are appended, so a pattern whose
+                        periodicity exceeds maxPer is discarded for good. The algorithm therefore mines the initial database
+                        once for every periodic pattern, irrespective of its support, and keeps for each of them the support,
+                        the last timestamp and the largest period seen so far. update() intersects the stored patterns with the
+                        newly appended transactions only: existing patterns are updated, aperiodic ones are dropped, and
+                        periodic patterns that reach minSup become periodic-frequent.
+
+    :**Reference**:   P. Ravikumar, P.Likhitha, R. Uday kiran, Y. Watanobe, and Koji Zettsu, "Towards efficient discovery of
+                      periodic-frequent patterns in columnar temporal databases", 2021 IEA/AIE.
+
+    :**Parameters**:    - **iFile** (*str or URL or dataFrame*) -- *Name of the Input file to mine complete set of frequent patterns.*
+                        - **oFile** (*str*) -- *Name of the output file to store complete set of frequent patterns.*
+                        - **minSup** (*int or float or str*) -- *The user can specify minSup either in count or proportion of database size. A proportion is converted with the size of the initial database and kept fixed afterwards.*
+                        - **maxPer** (*int or float or str*) -- *The user can specify maxPer either in count or proportion of database size. A proportion is converted with the size of the initial database and kept fixed afterwards.*
+                        - **sep** (*str*) -- *This variable is used to distinguish items from one another in a transaction. The default seperator is tab space. However, the users can override their default separator.*
+
+    :**Attributes**:    - **startTime** (*float*) -- *To record the start time of the mining process.*
+                        - **endTime** (*float*) -- *To record the completion time of the mining process.*
+                        - **finalPatterns** (*dict*) -- *Storing the complete set of patterns in a dictionary variable.*
+                        - **memoryUSS** (*float*) -- *To store the total amount of USS memory consumed by the program.*
+                        - **memoryRSS** (*float*) -- *To store the total amount of RSS memory consumed by the program.*
+                        - **Database** (*list*) -- *To store the transactions of a database in list.*
+                        - **state** (*dict*) -- *Stores [support, last timestamp, periodicity without the tail] of every periodic pattern.*
+                        - **dbSize** (*int*) -- *The last timestamp of the database mined so far.*
+
+    :**Methods**:       - **mine()** -- *Mines the initial database.*
+                        - **update(iFile)** -- *Mines the transactions appended to the database.*
+                        - **saveState(outFile)** -- *Stores the state of the patterns in a file.*
+                        - **loadState(inFile)** -- *Restores the state of the patterns from a file.*
+                        - **getPatterns()** -- *Complete set of patterns will be retrieved with this function.*
+                        - **save(oFile)** -- *Complete set of periodic-frequent patterns will be loaded in to a output file.*
+                        - **getPatternsAsDataFrame()** -- *Complete set of periodic-frequent patterns will be loaded in to a dataframe.*
+                        - **getMemoryUSS()** -- *Total amount of USS memory consumed by the mining process will be retrieved from this function.*
+                        - **getMemoryRSS()** -- *Total amount of RSS memory consumed by the mining process will be retrieved from this function.*
+                        - **getRuntime()** -- *Total amount of runtime taken by the mining process will be retrieved from this function.*
+
+    **Execution methods**
+
+    **Terminal command**
+
+    .. code-block:: console
+
+       Format:
+
+       (.venv) $ python3 incrementalPFECLAT.py <inputFile> <outputFile> <minSup> <maxPer> [<newTransactionsFile>]
+
+       Example usage:
+
+       (.venv) $ python3 incrementalPFECLAT.py sampleDB.txt patterns.txt 10.0 20.0 newTransactions.txt
+
+    .. note:: minSup will be considered in percentage of database transactions
+
+
+    **Calling from a python program**
+
+    .. code-block:: python
+
+            from PAMI.periodicFrequentPattern.basic import incrementalPFECLAT as alg
+
+            iFile = 'sampleDB.txt'
+
+            minSup = 10  # can also be specified between 0 and 1
+
+            maxPer = 20 # can also be specified between 0 and 1
+
+            obj = alg.incrementalPFECLAT(iFile, minSup, maxPer)
+
+            obj.mine()
+
+            obj.saveState("state.pkl")
+
+            obj = alg.incrementalPFECLAT(None, minSup, maxPer)
+
+            obj.loadState("state.pkl")
+
+            obj.update("newTransactions.txt")
+
+            periodicFrequentPatterns = obj.getPatterns()
+
+            print("Total number of Periodic Frequent Patterns:", len(periodicFrequentPatterns))
+
+            obj.save("periodicFrequentPatterns")
+
+            Df = obj.getPatternsAsDataFrame()
+
+            memUSS = obj.getMemoryUSS()
+
+            print("Total Memory in USS:", memUSS)
+
+            memRSS = obj.getMemoryRSS()
+
+            print("Total Memory in RSS", memRSS)
+
+            run = obj.getRuntime()
+
+            print("Total ExecutionTime in seconds:", run)
+
+    """
+
+    _iFile = " "
+    _oFile = " "
+    _sep = " "
+    _dbSize = None
+    _Database = None
+    _minSup = str()
+    _maxPer = str()
+    _state = {}
+    _finalPatterns = {}
+    _startTime = None
+    _endTime = None
+    _memoryUSS = float()
+    _memoryRSS = float()
+
+    def _convert(self, value) -> float:
+        """
+        To convert the given user specified value
+
+        :param value: user specified value
+        :type value: int or float or str
+        :return: converted value
+        :rtype: int or float
+        """
+        if type(value) is int:
+            value = int(value)
+        if type(value) is float:
+            value = (self._dbSize * value)
+        if type(value) is str:
+            if '.' in value:
+                value = float(value)
+                value = (self._dbSize * value)
+            else:
+                value = int(value)
+        return value
+
+    def _readDatabase(self, iFile) -> list:
+        """
+        Reads the transactions of a database/input file
+
+        :param iFile: input file, URL or dataframe
+        :type iFile: str or DataFrame
+        :return: transactions of the database, each one starting with its timestamp
+        :rtype: list
+        """
+        database = []
+        if isinstance(iFile, _ab._pd.DataFrame):
+            data, ts = [], []
+            if iFile.empty:
+                print("its empty..")
+            i = iFile.columns.values.tolist()
+            if 'TS' in i:
+                ts = iFile['TS'].tolist()
+            if 'Transactions' in i:
+                data = iFile['Transactions'].tolist()
+            for i in range(len(data)):
+                if data[i]:
+                    tr = [str(ts[i])] + [x for x in data[i].split(self._sep)]
+                    database.append(tr)
+                else:
+                    database.append([str(ts[i])])
+
+        if isinstance(iFile, str):
+            if _ab._validators.url(iFile):
+                data = _ab._urlopen(iFile)
+                for line in data:
+                    line = line.decode("utf-8")
+                    temp = [i.rstrip() for i in line.split(self._sep)]
+                    temp = [x for x in temp if x]
+                    database.append(temp)
+            else:
+                try:
+                    with open(iFile, 'r', encoding='utf-8') as f:
+                        for line in f:
+                            temp = [i.rstrip() for i in line.split(self._sep)]
+                            temp = [x for x in temp if x]
+                            database.append(temp)
+                except IOError:
+                    print("File Not Found")
+                    quit()
+        return database
+
+    def _creatingItemSets(self) -> None:
+        """
+        Storing the complete transactions of the database/input file in a database variable
+
+        :return: None
+        """
+        self._Database = self._readDatabase(self._iFile)
+
+    def _innerPer(self, arr):
+        """
+        Calculates the largest period of a pattern up to its last timestamp, i.e. without the period between the last
+        timestamp and the end of the database.
+
+        :param arr: timestamps of a pattern
+        :type arr: set or list
+        :return: the largest period
+        :rtype: int
+        """
+        arr = np.sort(np.append(list(arr), [0]))
+        return int(np.max(np.diff(arr)))
+
+    def _isAlive(self, value) -> bool:
+        """
+        A pattern stays periodic as long as no period, including the open one up to the end of the database, exceeds maxPer.
+
+        :param value: [support, last timestamp, periodicity without the tail] of a pattern
+        :type value: list
+        :rtype: bool
+        """
+        return value[2] <= self._maxPer and self._dbSize - value[1] <= self._maxPer
+
+    def _collectPatterns(self) -> None:
+        """
+        Stores the periodic patterns of the state which satisfy minSup as the periodic-frequent patterns
+        """
+        self._finalPatterns = {}
+        for pattern, (support, last, per) in self._state.items():
+            if support >= self._minSup:
+                self._finalPatterns["\t".join(pattern)] = [support, max(per, self._dbSize - last)]
+
+    @deprecated("It is recommended to use 'mine()' instead of 'startMine()' for mining process. Starting from January 2025, 'startMine()' will be completely terminated.")
+    def startMine(self) -> None:
+        self.mine()
+
+    def mine(self) -> None:
+        """
+        Mines the initial database and builds the state of every periodic pattern
+
+        :return: None
+        """
+        self._startTime = _ab._time.time()
+        if self._iFile is None:
+            raise Exception("Please enter the file path or file name:")
+        self._creatingItemSets()
+        items = {}
+        maxTS = 0
+        for line in self._Database:
+            index = int(line[0])
+            maxTS = max(maxTS, index)
+            for item in line[1:]:
+                if tuple([item]) not in items:
+                    items[tuple([item])] = set()
+                items[tuple([item])].add(index)
+        self._dbSize = maxTS
+        self._minSup = self._convert(self._minSup)
+        self._maxPer = self._convert(self._maxPer)
+        if self._maxPer >= self._dbSize:
+            raise Exception("Please enter a maxPer smaller than the timeline of the initial database")
+        self._state = {}
+        items = {k: v for k, v in sorted(items.items(), key=lambda x: len(x[1]), reverse=True)}
+        keys = []
+        for item, ts in items.items():
+            value = [len(ts), max(ts), self._innerPer(ts)]
+            if self._isAlive(value):
+                keys.append(item)
+                self._state[item] = value
+        while keys:
+            newKeys = []
+            for i in range(len(keys)):
+                for j in range(i + 1, len(keys)):
+                    if keys[i][:-1] == keys[j][:-1] and keys[i][-1] != keys[j][-1]:
+                        newKey = tuple(keys[i] + (keys[j][-1],))
+                        intersect = items[keys[i]].intersection(items[keys[j]])
+                        if not intersect:
+                            continue
+                        value = [len(intersect), max(intersect), self._innerPer(intersect)]
+                        if self._isAlive(value):
+                            items[newKey] = intersect
+                            newKeys.append(newKey)
+                            self._state[newKey] = value
+                    else:
+                        break
+            keys = newKeys
+        self._Database = []
+        self._collectPatterns()
+        self._endTime = _ab._time.time()
+        process = _ab._psutil.Process(_ab._os.getpid())
+        self._memoryRSS = float()
+        self._memoryUSS = float()
+        self._memoryUSS = process.memory_full_info().uss
+        self._memoryRSS = process.memory_info().rss
+        print("Periodic-Frequent patterns were generated successfully using incrementalPFECLAT algorithm ")
+
+    def update(self, iFile) -> None:
+        """
+        Mines the transactions appended to the database. Only the new transactions are scanned: the timestamps of every
+        stored pattern within them are obtained by intersecting the timestamps of its prefix with those of its last item.
+
+        :param iFile: the appended transactions, as a file, URL or dataframe. Their timestamps must be larger than the
+                      last timestamp mined so far.
+        :type iFile: str or DataFrame
+        :return: None
+        """
+        self._startTime = _ab._time.time()
+        if not self._state and self._dbSize is None:
+            raise Exception("Please mine the initial database or load a state before updating it")
+        batch = self._readDatabase(iFile)
+        newTS = {}
+        maxTS = self._dbSize
+        for line in batch:
+            index = int(line[0])
+            if index <= self._dbSize:
+                raise Exception("The timestamps of the appended transactions must be larger than " + str(self._dbSize))
+            maxTS = max(maxTS, index)
+            for item in line[1:]:
+                if item not in newTS:
+                    newTS[item] = set()
+                newTS[item].add(index)
+        self._dbSize = maxTS
+        occurrences = {}
+        # prefixes are visited before their extensions, so the timestamps of a prefix are always available
+        for pattern in sorted(self._state, key=len):
+            if len(pattern) == 1:
+                tids = newTS.get(pattern[0], set())
+            else:
+                prefix = occurrences.get(pattern[:-1])
+                if prefix is None:
+                    # the prefix was dropped as aperiodic, so is every extension of it
+                    del self._state[pattern]
+                    continue
+                tids = prefix.intersection(newTS.get(pattern[-1], ())) if prefix else prefix
+            value = self._state[pattern]
+            for ts in sorted(tids):
+                value[2] = max(value[2], ts - value[1])
+                value[1] = ts
+            value[0] += len(tids)
+            if self._isAlive(value):
+                occurrences[pattern] = tids
+            else:
+                del self._state[pattern]
+        self._collectPatterns()
+        self._endTime = _ab._time.time()
+        process = _ab._psutil.Process(_ab._os.getpid())
+        self._memoryRSS = float()
+        self._memoryUSS = float()
+        self._memoryUSS = process.memory_full_info().uss
+        self._memoryRSS = process.memory_info().rss
+        print("Periodic-Frequent patterns were updated successfully using incrementalPFECLAT algorithm ")
+
+    def saveState(self, outFile: str) -> None:
+        """
+        Stores the thresholds, the last timestamp and the state of every periodic pattern in a file
+
+        :param outFile: name of the state file
+        :type outFile: str
+        :return: None
+        """
+        with open(outFile, 'wb') as writer:
+            _pickle.dump({'minSup': self._minSup, 'maxPer': self._maxPer, 'dbSize': self._dbSize,
+                          'state': self._state}, writer)
+
+    def loadState(self, inFile: str) -> None:
+        """
+        Restores the state written by saveState(). The thresholds of the state replace the user specified ones.
+
+        :param inFile: name of the state file
+        :type inFile: str
+        :return: None
+        """
+        with open(inFile, 'rb') as reader:
+            state = _pickle.load(reader)
+        self._minSup = state['minSup']
+        self._maxPer = state['maxPer']
+        self._dbSize = state['dbSize']
+        self._state = state['state']
+        self._collectPatterns()
+
+    def getMemoryUSS(self) -> float:
+        """
+        Total amount of USS memory consumed by the mining process will be retrieved from this function
+
+        :return: returning USS memory consumed by the mining process
+        :rtype: float
+        """
+
+        return self._memoryUSS
+
+    def getMemoryRSS(self) -> float:
+        """
+        Total amount of RSS memory consumed by the mining process will be retrieved from this function
+
+        :return: returning RSS memory consumed by the mining process
+        :rtype: float
+        """
+
+        return self._memoryRSS
+
+    def getRuntime(self) -> float:
+        """
+        Calculating the total amount of runtime taken by the mining process
+
+        :return: returning total amount of runtime taken by the mining process
+        :rtype: float
+        """
+
+        return self._endTime - self._startTime
+
+    def getPatternsAsDataFrame(self) -> _ab._pd.DataFrame:
+        """
+        Storing final periodic-frequent patterns in a dataframe
+
+        :return: returning periodic-frequent patterns in a dataframe
+        :rtype: pd.DataFrame
+        """
+
+        data = []
+        for a, b in self._finalPatterns.items():
+            data.append([a, b[0], b[1]])
+        return _ab._pd.DataFrame(data, columns=['Patterns', 'Support', 'Periodicity'])
+
+    def save(self, outFile: str) -> None:
+        """
+        Complete set of periodic-frequent patterns will be loaded in to a output file
+
+        :param outFile: name of the output file
+        :type outFile: csv file
+        :return: None
+        """
+        self._oFile = outFile
+        with open(self._oFile, 'w+') as writer:
+            for x, y in self._finalPatterns.items():
+                s1 = x + ":" + str(y[0]) + ":" + str(y[1])
+                writer.write("%s \n" % s1)
+
+    def getPatterns(self) -> dict:
+        """
+        Function to send the set of periodic-frequent patterns after completion of the mining process
+
+        :return: returning periodic-frequent patterns
+        :rtype: dict
+        """
+        return self._finalPatterns
+
+    def printResults(self) -> None:
+        """
+        This function is used to print the results
+        :return: None
+        """
+        print("Total number of Periodic Frequent Patterns:", len(self.getPatterns()))
+        print("Total Memory in USS:", self.getMemoryUSS())
+        print("Total Memory in RSS", self.getMemoryRSS())
+        print("Total ExecutionTime in ms:",  self.getRuntime())
+
+
+if __name__ == "__main__":
+    _ap = str()
+    if len(_ab._sys.argv) == 5 or len(_ab._sys.argv) == 6:
+        _ap = incrementalPFECLAT(_ab._sys.argv[1], _ab._sys.argv[3], _ab._sys.argv[4])
+        _ap.mine()
+        if len(_ab._sys.argv) == 6:
+            _ap.update(_ab._sys.argv[5])
+        print("Total number of Periodic-Frequent Patterns:", len(_ap.getPatterns()))
+        _ap.save(_ab._sys.argv[2])
+        print("Total Memory in USS:", _ap.getMemoryUSS())
+        print("Total Memory in RSS", _ap.getMemoryRSS())
+        print("Total ExecutionTime in ms:", _ap.getRuntime())
+    else:
+        print("Error! The number of input parameters do not match the total number of parameters provided")
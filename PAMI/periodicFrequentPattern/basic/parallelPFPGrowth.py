@@ -1,4 +1,5 @@
-#  ParallelPFPGrowth is one of the fundamental distributed algorithm to discover periodic-frequent patterns in a transactional database. It is based PySpark framework.
+#  ParallelPFPGrowth is a multi-process algorithm to discover periodic-frequent patterns in a temporal database on a single machine.
+#  The mining task is partitioned by suffix item across a pool of worker processes that share the read-only database through shared memory.
 #
 # **Importing this algorithm into a python program**
 # --------------------------------------------------------
@@ -8,7 +9,7 @@
 #
 #             obj = alg.parallelPFPGrowth(iFile, minSup, maxPer, numWorkers, sep='\t')
 #
-#             obj.startMine()
+#             obj.mine()
 #
 #             periodicFrequentPatterns = obj.getPatterns()
 #
@@ -53,699 +54,484 @@ __copyright__ = """
 """
 
 from PAMI.periodicFrequentPattern.basic import abstract as _ab
-import pandas as pd
+from typing import Dict, Tuple
+import multiprocessing as _mp
+from PAMI.extras import sharedDatabase as _sd
+import numpy as np
 from deprecated import deprecated
 
-# from PAMI.periodicFrequentPattern.basic
-import abstract as _ab
+#: Read-only views of the shared database, attached once in every worker process by :func:`_attach`.
+_shared = {}
 
-_maxPer = float()
-_minSup = float()
-_lno = int()
 
-
-class Node(object):
+def _getMaxPer(arr, maxTS):
     """
-    A class used to represent the node of frequentPatternTree
-
-    :Attributes:
-
-        item : int or None
-            Storing item of a node
-        timeStamps : list
-            To maintain the timestamps of a database at the end of the branch
-        parent : node
-            To maintain the parent of every node
-        children : list
-            To maintain the children of a node
-        count : int
-            To maintain the count of every node
-
-    :Methods:
-
-        addChild(itemName)
-            Storing the children to their respective parent nodes
-        toString()
-            To print the node
+    Computes the periodicity of a timestamp list, i.e. the largest gap between consecutive timestamps including the
+    boundaries 0 and maxTS.
+
+    :param arr: timestamps of a pattern
+    :type arr: list or numpy.ndarray
+    :param maxTS: the last timestamp of the database
+    :type maxTS: int
+    :return: periodicity of the timestamps
+    :rtype: int
     """
+    arr = np.append(arr, [0, maxTS])
+    arr = np.sort(arr)
+    return np.max(np.diff(arr))
 
-    def __init__(self, item, count, children):
-        """
-        Initializing the Node class
-
-        :param item: item of a node
-        :param count: count of a node
-        :param children: children of a node
-
-        """
-        self.item = item
-        self.count = count
-        self.children = children  # dictionary of children
-        self.parent = None
-        self.tids = set()
-
-    def __repr__(self):
-        return self.toString(0)
-
-    def toString(self, level=0):
-        """ To print the node
 
-        :param level: level of a node
-        """
-        if self.item == None:
-            s = "Root("
-        else:
-            s = "(item=" + str(self.item)
-            s += ", count=" + str(self.count)
-            for i in self.tids:
-                s += " " + str(i)
-        tabs = "\t".join(['' for i in range(0, level + 2)])
-        for v in self.children.values():
-            s += tabs + "\n"
-            s += tabs + v.toString(level=level + 1)
-        s += ")"
-        return s
-
-    def addChild(self, node):
-        """
-        To add the children to a node
-
-        :param node: children of a node
-        """
-        self.children[node.item] = node
-        node.parent = self
-
-    def _getTransactions(self):
-        count = self.count
-        tids = self.tids
-        for child in self.children.values():
-            for t in child._getTransactions():
-                count -= t[2]
-                t[0].insert(0, child.item)
-                yield t
-        if (count > 0):
-            yield ([], tids, count)
-
-
-class PFPTree(object):
+def _attach(descriptors, minSup, maxPer, maxTS):
     """
-
-    A class used to represent the periodic frequent pattern tree
-
-    :Attributes:
-
-        root : node
-            To maintain the root of the tree
-        summaries : dict
-            To maintain the summary of the tree
-
-    :Methods:
-
-        add(basket, tid, count)
-            To add the basket to the tree
-        getTransactions()
-            To get the transactions of the tree
-        merge(tree)
-            To merge the tree
-        project(itemId)
-            To project the tree
-        satisfyPer(tids, maxPer, numTrans)
-            To satisfy the periodicity constraint
-        extract(minCount, maxPer, numTrans, isResponsible = lambda x:True)
-            To extract the periodic frequent patterns
-
-
+    Pool initializer: attaches the worker process to the shared database arrays.
+
+    :param descriptors: dictionary of array name to (shared memory name, dtype, shape)
+    :type descriptors: dict
+    :param minSup: minimum support in count
+    :type minSup: int
+    :param maxPer: maximum periodicity in count
+    :type maxPer: int
+    :param maxTS: the last timestamp of the database
+    :type maxTS: int
     """
+    _shared.clear()
+    _shared['blocks'], arrays = _sd.attach(descriptors)
+    _shared.update(arrays)
+    _shared['minSup'] = minSup
+    _shared['maxPer'] = maxPer
+    _shared['maxTS'] = maxTS
 
-    def __init__(self):
-        self.root = Node(None, 0, {})
-        self.summaries = {}
 
-    def __repr__(self):
-        return repr(self.root)
-
-    def add(self, basket, tid, count):
-        """
-        To add the basket to the tree
-
-        :param basket: basket of a database
-        :param tid: timestamp of a database
-        :param count: count of a node
-        """
-        curr = self.root
-        curr.count += count
-        for i in tid:
-            curr.tids.add(i)
-
-        for i in range(0, len(basket)):
-            item = basket[i]
-            if item in self.summaries.keys():
-                summary = self.summaries.get(item)
+def _recursive(root, itemNodes, minSup, maxPer, maxTS, patterns):
+    """
+    Mines the conditional pattern tree rooted at root and stores every periodic-frequent pattern in patterns.
+
+    :param root: root of the conditional tree, its item holds the suffix of the tree
+    :type root: PAMI.extras.sharedDatabase.timestampNode
+    :param itemNodes: dictionary of item to the set of nodes of that item
+    :type itemNodes: dict
+    :param minSup: minimum support in count
+    :type minSup: int
+    :param maxPer: maximum periodicity in count
+    :type maxPer: int
+    :param maxTS: the last timestamp of the database
+    :type maxTS: int
+    :param patterns: dictionary storing the discovered patterns
+    :type patterns: dict
+    """
+    for item in itemNodes:
+        newRoot = _sd.timestampNode(root.item + [item], None, None)
+        itemLocs = {}
+        transactions = {}
+        for node in itemNodes[item]:
+            transaction, locs = node.traverse()
+            if len(transaction) < 1:
+                continue
+            if tuple(transaction) in transactions:
+                transactions[tuple(transaction)].extend(locs)
             else:
-                summary = Summary(0, set())
-                self.summaries[item] = summary
-            summary.count += count
+                transactions[tuple(transaction)] = list(locs)
+            for i in transaction:
+                if i in itemLocs:
+                    itemLocs[i] += locs
+                else:
+                    itemLocs[i] = list(locs)
+        periods = {i: _getMaxPer(v, maxTS) for i, v in itemLocs.items() if len(v) >= minSup}
+        itemLocs = {k: len(v) for k, v in itemLocs.items() if k in periods and periods[k] <= maxPer}
+        if not itemLocs:
+            continue
+        for i in itemLocs:
+            patterns[tuple(newRoot.item + [i])] = [itemLocs[i], periods[i]]
+        newItemNodes = {}
+        for transaction, locs in transactions.items():
+            transaction = sorted([i for i in transaction if i in itemLocs], key=lambda x: itemLocs[x], reverse=True)
+            currNode = newRoot
+            for i in transaction:
+                currNode = currNode.addChild(i, locs)
+                if i in newItemNodes:
+                    newItemNodes[i].add(currNode)
+                else:
+                    newItemNodes[i] = {currNode}
+        _recursive(newRoot, newItemNodes, minSup, maxPer, maxTS, patterns)
+
+
+def _mineSuffix(suffix):
+    """
+    Worker task: mines every periodic-frequent pattern whose lowest ranked item is suffix.
+    The conditional database of the suffix is read directly from the shared arrays.
 
-            if item in curr.children.keys():
-                child = curr.children.get(item)
+    :param suffix: rank of the suffix item
+    :type suffix: int
+    :return: patterns of the partition, as tuples of item ranks mapped to [support, periodicity]
+    :rtype: dict
+    """
+    items, offsets = _shared['items'], _shared['offsets']
+    ts, tids, tidOffsets = _shared['ts'], _shared['tids'], _shared['tidOffsets']
+    minSup, maxPer, maxTS = _shared['minSup'], _shared['maxPer'], _shared['maxTS']
+    root = _sd.timestampNode([suffix], None, None)
+    itemNodes = {}
+    patterns = {}
+    support = {}
+    paths = {}
+    for row in tids[tidOffsets[suffix]:tidOffsets[suffix + 1]]:
+        basket = items[offsets[row]:offsets[row + 1]]
+        # baskets are sorted by rank, so the conditional transaction is the slice before the suffix
+        prefix = tuple(basket[:np.searchsorted(basket, suffix)].tolist())
+        if not prefix:
+            continue
+        if prefix in paths:
+            paths[prefix].append(int(ts[row]))
+        else:
+            paths[prefix] = [int(ts[row])]
+        for item in prefix:
+            support[item] = support.get(item, 0) + 1
+    itemLocs = {}
+    for prefix, locs in paths.items():
+        for item in prefix:
+            if support[item] >= minSup:
+                if item in itemLocs:
+                    itemLocs[item] += locs
+                else:
+                    itemLocs[item] = list(locs)
+    periods = {item: _getMaxPer(locs, maxTS) for item, locs in itemLocs.items()}
+    itemLocs = {k: len(v) for k, v in itemLocs.items() if periods[k] <= maxPer}
+    for item in itemLocs:
+        patterns[(suffix, item)] = [itemLocs[item], periods[item]]
+    for prefix, locs in paths.items():
+        transaction = sorted([i for i in prefix if i in itemLocs], key=lambda x: itemLocs[x], reverse=True)
+        currNode = root
+        for item in transaction:
+            currNode = currNode.addChild(item, locs)
+            if item in itemNodes:
+                itemNodes[item].add(currNode)
             else:
-                child = Node(item, 0, {})
-                curr.addChild(child)
-            summary.nodes.add(child)
-            child.count += count
-            for j in tid:
-                summary.tids.add(j)
-                if (i == len(basket) - 1):
-                    child.tids.add(j)
-            curr = child
-        return self
-
-    def getTransactions(self):
-        """
-        To get the transactions of the tree
+                itemNodes[item] = {currNode}
+    _recursive(root, itemNodes, minSup, maxPer, maxTS, patterns)
+    return patterns
 
-        :return: returning the transactions of the tree
-        """
-        return [x for x in self.root._getTransactions()]
-
-    def merge(self, tree):
-        """
-        To merge the tree
 
-        :param tree: tree of a database
-        """
-        for t in tree.getTransactions():
-            self.add(t[0], t[1], t[2])
-        return self
-
-    def project(self, itemId):
-        """
-        To project the tree
-
-        :param itemId: item of a node
-        """
-        newTree = PFPTree()
-        summaryItem = self.summaries.get(itemId)
-        if summaryItem:
-            for element in summaryItem.nodes:
-                t = []
-                curr = element.parent
-                while curr.parent:
-                    t.insert(0, curr.item)
-                    curr = curr.parent
-                newTree.add(t, element.tids, element.count)
-        return newTree
-
-    def satisfyPer(self, tids, maxPer, numTrans):
-        """
-        To satisfy the periodicity constraint
-
-        :param tids: timestamps of a database
-        :param maxPer: maximum periodicity
-        :param numTrans: number of transactions
-
-        """
-
-        tids = list(tids)
-        tids.sort()
-        if tids[0] > maxPer:
-            return 0
-        tids.append(numTrans)
-        for i in range(1, len(tids)):
-            if (tids[i] - tids[i - 1]) > maxPer:
-                return 0
-        return 1
-
-    def extract(self, minCount, maxPer, numTrans, isResponsible=lambda x: True):
-        """
-        To extract the periodic frequent patterns
+class parallelPFPGrowth(_ab._periodicFrequentPatterns):
+    """
+    **About this algorithm**
 
-        :param minCount: minimum count of a node
-        :param maxPer: maximum periodicity
-        :param numTrans: number of transactions
-        :param isResponsible: responsible node of a tree
+    :**Description**:   ParallelPFPGrowth is a multi-process algorithm to discover periodic-frequent patterns in a temporal database
+                        on a single machine. Periodic-frequent items are ranked by support and every worker of a process pool mines the
+                        patterns whose lowest ranked (suffix) item is assigned to it. The ranked database and the item-to-transaction index
+                        are placed once in shared memory, so the workers never receive a copy of the database, and the partition results
+                        are merged into the final patterns as they arrive. The Spark implementation of the algorithm is available in
+                        PAMI.periodicFrequentPattern.pyspark.parallelPFPGrowth.
 
-        """
-        for item in sorted(self.summaries, reverse=True):
-            summary = self.summaries[item]
-            if (isResponsible(item)):
-                if (summary.count >= minCount and self.satisfyPer(summary.tids, maxPer, numTrans)):
-                    yield ([item], summary.count)
-                    for element in self.project(item).extract(minCount, maxPer, numTrans):
-                        yield ([item] + element[0], element[1])
-            for element in summary.nodes:
-                parent = element.parent
-                parent.tids |= element.tids
-
-
-class Summary(object):
-    """
-    A class used to represent the summary of the tree
+    :**Reference**:   C. Saideep, R. Uday Kiran, Koji Zettsu, Cheng-Wei Wu, P. Krishna Reddy, Masashi Toyoda, Masaru Kitsuregawa: Parallel Mining of Partial Periodic Itemsets in Big Data. IEA/AIE 2020: 807-819
 
-    :Attributes:
+    :**Parameters**:    - **iFile** (*str or URL or dataFrame*) -- *Name of the Input file to mine complete set of periodic-frequent patterns.*
+                        - **oFile** (*str*) -- *Name of the output file to store complete set of periodic-frequent patterns.*
+                        - **minSup** (*int or float or str*) -- *The user can specify minSup either in count or proportion of database size. If the program detects the data type of minSup is integer, then it treats minSup is expressed in count. Otherwise, it will be treated as float.*
+                        - **maxPer** (*int or float or str*) -- *The user can specify maxPer either in count or proportion of database size. It controls the maximum number of transactions in which any two items within a pattern can reappear.*
+                        - **numWorkers** (*int*) -- *The number of worker processes to be employed. The default is the number of CPUs of the machine.*
+                        - **sep** (*str*) -- *This variable is used to distinguish items from one another in a transaction. The default seperator is tab space. However, the users can override their default separator.*
 
-        count : int
-            To maintain the count of a node
-        nodes : list
-            To maintain the nodes of a tree
-        tids : set
-            To maintain the timestamps of a database
-    """
+    :**Attributes**:    - **startTime** (*float*) -- *To record the start time of the mining process.*
+                        - **endTime** (*float*) -- *To record the completion time of the mining process.*
+                        - **finalPatterns** (*dict*) -- *Storing the complete set of patterns in a dictionary variable.*
+                        - **memoryUSS** (*float*) -- *To store the total amount of USS memory consumed by the program.*
+                        - **memoryRSS** (*float*) -- *To store the total amount of RSS memory consumed by the program.*
+                        - **Database** (*list*) -- *To store the transactions of a database in list.*
 
-    def __init__(self, count, nodes):
-        self.count = count
-        self.nodes = nodes
-        self.tids = set()
+    :**Methods**:       - **mine()** -- *Mining process will start from here.*
+                        - **getPatterns()** -- *Complete set of patterns will be retrieved with this function.*
+                        - **save(oFile)** -- *Complete set of periodic-frequent patterns will be loaded in to a output file.*
+                        - **getPatternsAsDataFrame()** -- *Complete set of periodic-frequent patterns will be loaded in to a dataframe.*
+                        - **getMemoryUSS()** -- *Total amount of USS memory consumed by the mining process will be retrieved from this function.*
+                        - **getMemoryRSS()** -- *Total amount of RSS memory consumed by the mining process will be retrieved from this function.*
+                        - **getRuntime()** -- *Total amount of runtime taken by the mining process will be retrieved from this function.*
 
+    **Execution methods**
 
-class parallelPFPGrowth(_ab._periodicFrequentPatterns):
-    """
-    :Description:   ParallelPFPGrowth is one of the fundamental distributed algorithm to discover periodic-frequent patterns in a transactional database. It is based PySpark framework.
-
-    :Reference:   C. Saideep, R. Uday Kiran, Koji Zettsu, Cheng-Wei Wu, P. Krishna Reddy, Masashi Toyoda, Masaru Kitsuregawa: Parallel Mining of Partial Periodic Itemsets in Big Data. IEA/AIE 2020: 807-819
-
-    :param  iFile: str :
-                   Name of the Input file to mine complete set of periodic frequent pattern's
-    :param  oFile: str :
-                   Name of the output file to store complete set of periodic frequent pattern's
-    :param  minSup: str:
-                   Controls the minimum number of transactions in which every item must appear in a database.
-    :param  maxPer: str:
-                   Controls the maximum number of transactions in which any two items within a pattern can reappear.
-    :param  sep: str :
-                   This variable is used to distinguish items from one another in a transaction. The default seperator is tab space. However, the users can override their default separator.
-
-    :Attributes:
-
-        iFile : file
-            Name of the Input file or path of the input file
-        oFile : file
-            Name of the output file or path of the output file
-        minSup : int or float or str
-            The user can specify minSup either in count or proportion of database size.
-            If the program detects the data type of minSup is integer, then it treats minSup is expressed in count.
-            Otherwise, it will be treated as float.
-            Example: minSup=10 will be treated as integer, while minSup=10.0 will be treated as float
-        maxPer : int or float or str
-            The user can specify maxPer either in count or proportion of database size.
-            If the program detects the data type of maxPer is integer, then it treats maxPer is expressed in count.
-            Otherwise, it will be treated as float.
-            Example: maxPer=10 will be treated as integer, while maxPer=10.0 will be treated as float
-        numWorker : int
-            The user can specify the number of worker machines to be employed for finding periodic-frequent patterns.
-        sep : str
-            This variable is used to distinguish items from one another in a transaction. The default seperator is tab space or \t.
-            However, the users can override their default separator.
-        memoryUSS : float
-            To store the total amount of USS memory consumed by the program
-        memoryRSS : float
-            To store the total amount of RSS memory consumed by the program
-        startTime : float
-            To record the start time of the mining process
-        endTime : float
-            To record the completion time of the mining process
-        Database : list
-            To store the transactions of a database in list
-        mapSupport : Dictionary
-            To maintain the information of item and their frequency
-        lno : int
-            To represent the total no of transaction
-        tree : class
-            To represents the Tree class
-        itemSetCount : int
-            To represents the total no of patterns
-        finalPatterns : dict
-            To store the complete patterns
-
-    :Methods:
-
-        startMine()
-            Mining process will start from here
-        getPatterns()
-            Complete set of patterns will be retrieved with this function
-        save(oFile)
-            Complete set of periodic-frequent patterns will be loaded in to a output file
-        getPatternsAsDataFrame()
-            Complete set of periodic-frequent patterns will be loaded in to a dataframe
-        getMemoryUSS()
-            Total amount of USS memory consumed by the mining process will be retrieved from this function
-        getMemoryRSS()
-            Total amount of RSS memory consumed by the mining process will be retrieved from this function
-        getRuntime()
-            Total amount of runtime taken by the mining process will be retrieved from this function
-        creatingItemSets(fileName)
-            Scans the dataset and stores in a list format
-        PeriodicFrequentOneItem()
-            Extracts the one-periodic-frequent patterns from database
-        updateDatabases()
-            Update the database by removing aperiodic items and sort the Database by item decreased support
-        buildTree()
-            After updating the Database, remaining items will be added into the tree by setting root node as null
-        convert()
-            to convert the user specified value
-
-
-    **Methods to execute code on terminal**
-    ---------------------------------------------
-     .. code-block:: console
+    **Terminal command**
 
+    .. code-block:: console
 
        Format:
 
-       (.venv) $ python3 parallelPFPGrowth.py <inputFile> <outputFile> <minSup> <maxPer> <noWorker>
+       (.venv) $ python3 parallelPFPGrowth.py <inputFile> <outputFile> <minSup> <maxPer> <numWorkers>
 
        Example usage:
 
        (.venv) $ python3 parallelPFPGrowth.py sampleTDB.txt patterns.txt 0.3 0.4 5
 
+    .. note:: minSup will be considered in percentage of database transactions
 
-               .. note:: minSup will be considered in percentage of database transactions
 
-    **Importing this algorithm into a python program**
-    ---------------------------------------------------------
+    **Calling from a python program**
+
     .. code-block:: python
 
-                from PAMI.periodicFrequentPattern.basic import parallelPFPGrowth as alg
+            from PAMI.periodicFrequentPattern.basic import parallelPFPGrowth as alg
 
-                obj = alg.parallelPFPGrowth(iFile, minSup, maxPer, numWorkers, sep='\t')
+            obj = alg.parallelPFPGrowth(iFile, minSup, maxPer, numWorkers, sep='\t')
 
-                obj.startMine()
+            obj.mine()
 
-                periodicFrequentPatterns = obj.getPatterns()
+            periodicFrequentPatterns = obj.getPatterns()
 
-                print("Total number of Periodic Frequent Patterns:", len(periodicFrequentPatterns))
+            print("Total number of Periodic Frequent Patterns:", len(periodicFrequentPatterns))
 
-                obj.save(oFile)
+            obj.save(oFile)
 
-                Df = obj.getPatternsAsDataFrame()
+            Df = obj.getPatternsAsDataFrame()
 
-                memUSS = obj.getMemoryUSS()
+            memUSS = obj.getMemoryUSS()
 
-                print("Total Memory in USS:", memUSS)
+            print("Total Memory in USS:", memUSS)
 
-                memRSS = obj.getMemoryRSS()
+            memRSS = obj.getMemoryRSS()
 
-                print("Total Memory in RSS", memRSS)
+            print("Total Memory in RSS", memRSS)
 
-                run = obj.getRuntime()
+            run = obj.getRuntime()
 
-                print("Total ExecutionTime in seconds:", run)
+            print("Total ExecutionTime in seconds:", run)
 
     """
-    __startTime = float()
-    __endTime = float()
+    _startTime = float()
+    _endTime = float()
     _minSup = str()
-    _maxPer = str()
-    _numWorkers = str()
-    __finalPatterns = {}
+    _maxPer = float()
+    _numWorkers = int()
+    _finalPatterns = {}
     _iFile = " "
     _oFile = " "
     _sep = " "
-    __memoryUSS = float()
-    __memoryRSS = float()
-    __Database = []
-    __mapSupport = {}
-    __lno = 0
-    # __tree = _Tree()
-    __rank = {}
-    __rankDup = {}
-    _numTrans = str()
-
-    def __init__(self, iFile, minSup, maxPer, numWorker, sep='\t'):
-        super().__init__(iFile, minSup, maxPer, numWorker, sep)
-
-    def func1(self, ps1, tid):
-        """
-        Add the tid to the set
-
-        :param ps1: set
-        :param tid: timestamp of a database
-        return: set
-
-        """
-        ps1.add(tid)
-        return ps1
-
-    def func2(self, ps1, ps2):
-        """
-
-        Union of two sets
-
-        :param ps1: set.
-        :param ps2: set
-        return: set
-
-        """
-
-        ps1 |= ps2
-        return ps1
-
-    def func3(self, tids, endts):
-        """
-        Calculate the periodicity of a transaction
-
-        :param tids: timestamps of a database
-        return: periodicity
-
-        """
-        # print(tids)
-        z = sorted(tids)
-        # print(maxPer)
-        cur = 0
-        for i in z:
-            if i - cur > self._maxPer:
-                return -1
-            cur = i
-        if endts - cur > self._maxPer:
-            return -1
-        else:
-            return len(z)
-
-    def getFrequentItems(self, data):
-        """
-        Get the frequent items from the database
-
-        :param data: database
-        :return: frequent items
-
-        """
-        singleItems = data.flatMap(lambda x: [(x[i], x[0]) for i in range(1, len(x))])
-        ps = set()
-        freqItems = singleItems.aggregateByKey(ps, lambda ps1, tid: self.func1(ps1, tid),
-                                               lambda tuple1, tuple2: self.func2(tuple1, tuple2))
-        # print(freqItems.take(10))
-        freqItems = freqItems.map(lambda x: (x[0], self.func3(x[1], self._numTrans.value)))
-        # print(freqItems.take(10))
-        perFreqItems = [x for (x, y) in
-                        sorted(freqItems.filter(lambda c: c[1] >= self._minSup).collect(), key=lambda x: -x[1])]
-        # print(perFreqItems)
-        return perFreqItems
-
-    def getFrequentItemsets(self, data, freqItems):
-        """
-        Get the frequent itemsets from the database
-
-        :param data: database
-        :param freqItems: frequent items
-        :return: frequent itemsets
-
-        """
-        rank = dict([(index, item) for (item, index) in enumerate(self._perFreqItems)])
-        numPartitions = data.getNumPartitions()
-        workByPartition = data.flatMap(
-            lambda basket: self.genCondTransactions(basket[0], basket[1:], rank, numPartitions))
-        emptyTree = PFPTree()
-        forest = workByPartition.aggregateByKey(emptyTree,
-                                                lambda tree, transaction: tree.add(transaction[0], [transaction[1]], 1),
-                                                lambda tree1, tree2: tree1.merge(tree2))
-        itemsets = forest.flatMap(
-            lambda partId_bonsai: partId_bonsai[1].extract(self._minSup, self._maxPer, self._numTrans.value,
-                                                           lambda x: self.getPartitionId(x, numPartitions) ==
-                                                                     partId_bonsai[0]))
-        frequentItemsets = itemsets.map(
-            lambda ranks_count: ([self._perFreqItems[z] for z in ranks_count[0]], ranks_count[1]))
-        return frequentItemsets
-
-    def genCondTransactions(self, tid, basket, rank, nPartitions):
-        """
-        Get the conditional transactions from the database
-
-        :param tid: timestamp of a database
-        :param basket: basket of a database
-        :param rank: rank of a database
-        :param nPartitions: number of partitions
-        """
-        filtered = [rank[int(x)] for x in basket if int(x) in rank.keys()]
-        filtered = sorted(filtered)
-        output = {}
-        for i in range(len(filtered) - 1, -1, -1):
-            item = filtered[i]
-            partition = self.getPartitionId(item, nPartitions)
-            if partition not in output.keys():
-                output[partition] = [filtered[:i + 1], tid]
-        return [x for x in output.items()]
-
-    def getPartitionId(self, key, nPartitions):
-        """
-        Get the partition id
-
-        :param key: key of a database
-        :param nPartitions: number of partitions.
-        :return: partition id
-
-        """
-        return key % nPartitions
+    _memoryUSS = float()
+    _memoryRSS = float()
+    _Database = []
+
+    def __init__(self, iFile, minSup, maxPer, numWorkers=None, sep='\t'):
+        super().__init__(iFile, minSup, maxPer, sep)
+        self._numWorkers = numWorkers
+
+    def _creatingItemSets(self) -> None:
+        """
+        Storing the complete transactions of the database/input file in a database variable
+
+        :return: None
+        """
+        self._Database = []
+        if isinstance(self._iFile, _ab._pd.DataFrame):
+            data, ts = [], []
+            if self._iFile.empty:
+                print("its empty..")
+            i = self._iFile.columns.values.tolist()
+            if 'TS' in i:
+                ts = self._iFile['TS'].tolist()
+            if 'Transactions' in i:
+                data = self._iFile['Transactions'].tolist()
+            for i in range(len(data)):
+                if data[i]:
+                    tr = [str(ts[i])] + [x for x in data[i].split(self._sep)]
+                    self._Database.append(tr)
+                else:
+                    self._Database.append([str(ts[i])])
+
+        if isinstance(self._iFile, str):
+            if _ab._validators.url(self._iFile):
+                data = _ab._urlopen(self._iFile)
+                for line in data:
+                    line = line.decode("utf-8")
+                    temp = [i.rstrip() for i in line.split(self._sep)]
+                    temp = [x for x in temp if x]
+                    self._Database.append(temp)
+            else:
+                try:
+                    with open(self._iFile, 'r', encoding='utf-8') as f:
+                        for line in f:
+                            temp = [i.rstrip() for i in line.split(self._sep)]
+                            temp = [x for x in temp if x]
+                            self._Database.append(temp)
+                except IOError:
+                    print("File Not Found")
+                    quit()
 
-    def __convert(self, value):
+    def _convert(self, value) -> int:
         """
-        to convert the type of user specified minSup value
+        To convert the given user specified value
 
-        :param value: user specified minSup value
-        :return: converted type
+        :param value: user specified value
+        :return: converted value
         """
         if type(value) is int:
             value = int(value)
         if type(value) is float:
-            value = (len(self.__Database) * value)
+            value = (len(self._Database) * value)
         if type(value) is str:
             if '.' in value:
                 value = float(value)
-                value = (len(self.__Database) * value)
+                value = (len(self._Database) * value)
             else:
                 value = int(value)
         return value
 
-    @deprecated("It is recommended to use mine() instead of startMine() for mining process")
-    def startMine(self):
-        """
-        Start the mining process
-
-        """
-        self.__startTime = _ab._time.time()
-        APP_NAME = "parallelPFPGrowth"
-        conf = _ab.SparkConf().setAppName(APP_NAME)
-        # conf = conf.setMaster("local[*]")
-        sc = _ab.SparkContext(conf=conf).getOrCreate()
-        # sc = SparkContext.getOrCreate();
-        data = sc.textFile(self._iFile, minPartitions=self._numWorkers).map(
-            lambda x: [int(y) for y in x.strip().split(self._sep)])
-        # data = sc.textFile(finput).map(lambda x: [int(y) for y in x.strip().split(' ')])
-        data.cache()
-        # minSupport = data.count() * threshold/100
-        # maxPer = data.count() * periodicity_threshold/100
-        self._minSup = self.__convert(self._minSup)
-        self._maxPer = self.__convert(self._maxPer)
-        self._numTrans = sc.broadcast(data.count())
-        self._perFreqItems = self.getFrequentItems(data)
-        freqItemsets = self.getFrequentItemsets(data, self._perFreqItems)
-        self.__finalPatterns = freqItemsets.count()
-        sc.stop()
-        self.__endTime = _ab._time.time()
-        self.__memoryUSS = float()
-        self.__memoryRSS = float()
+    def _rankedDatabase(self, maxTS):
+        """
+        Finds the periodic-frequent items and encodes the database as flat arrays of item ranks.
+
+        :param maxTS: the last timestamp of the database
+        :type maxTS: int
+        :return: the ranked items, and the arrays (items, offsets, ts, tids, tidOffsets) describing the database
+        :rtype: tuple(list, dict)
+        """
+        itemTS = {}
+        for line in self._Database:
+            index = int(line[0])
+            for item in line[1:]:
+                if item not in itemTS:
+                    itemTS[item] = []
+                itemTS[item].append(index)
+        for item, locs in itemTS.items():
+            if len(locs) >= self._minSup:
+                per = _getMaxPer(locs, maxTS)
+                if per <= self._maxPer:
+                    self._finalPatterns[(item,)] = [len(locs), per]
+        ranked = sorted([k[0] for k in self._finalPatterns], key=lambda x: len(itemTS[x]), reverse=True)
+        rank = {item: index for index, item in enumerate(ranked)}
+        items, offsets, ts = [], [0], []
+        for line in self._Database:
+            basket = sorted({rank[item] for item in line[1:] if item in rank})
+            if not basket:
+                continue
+            items.extend(basket)
+            offsets.append(len(items))
+            ts.append(int(line[0]))
+        items = np.array(items, dtype=np.int32)
+        offsets = np.array(offsets, dtype=np.int64)
+        rows = np.repeat(np.arange(len(ts), dtype=np.int64), np.diff(offsets))
+        order = np.argsort(items, kind='stable')
+        tids = rows[order]
+        tidOffsets = np.zeros(len(ranked) + 1, dtype=np.int64)
+        tidOffsets[1:] = np.cumsum(np.bincount(items, minlength=len(ranked)))
+        arrays = {'items': items, 'offsets': offsets, 'ts': np.array(ts, dtype=np.int64), 'tids': tids,
+                  'tidOffsets': tidOffsets}
+        return ranked, arrays
+
+    @deprecated("It is recommended to use 'mine()' instead of 'startMine()' for mining process. Starting from January 2025, 'startMine()' will be completely terminated.")
+    def startMine(self) -> None:
+        self.mine()
+
+    def mine(self) -> None:
+        """
+        Mining process will start from this function
+
+        :return: None
+        """
+        self._startTime = _ab._time.time()
+        if self._iFile is None:
+            raise Exception("Please enter the file path or file name:")
+        if self._minSup is None:
+            raise Exception("Please enter the Minimum Support")
+        if self._maxPer is None:
+            raise Exception("Please enter the Maximum Periodicity")
+        self._creatingItemSets()
+        self._finalPatterns = {}
+        self._minSup = self._convert(self._minSup)
+        self._maxPer = self._convert(self._maxPer)
+        maxTS = len(self._Database)
+        if self._minSup > len(self._Database):
+            raise Exception("Please enter the minSup in range between 0 to 1")
+        ranked, arrays = self._rankedDatabase(maxTS)
+        numWorkers = self._numWorkers if self._numWorkers else _ab._os.cpu_count()
+        # larger conditional databases first so that the pool stays balanced until the end
+        suffixes = sorted(range(1, len(ranked)), key=lambda x: arrays['tidOffsets'][x] - arrays['tidOffsets'][x + 1])
+        blocks, descriptors = _sd.share(arrays)
+        try:
+            with _mp.Pool(int(numWorkers), initializer=_attach,
+                          initargs=(descriptors, self._minSup, self._maxPer, maxTS)) as pool:
+                for patterns in pool.imap_unordered(_mineSuffix, suffixes):
+                    for pattern, value in patterns.items():
+                        self._finalPatterns[tuple(ranked[x] for x in pattern)] = value
+        finally:
+            _sd.release(blocks, unlink=True)
+        self._finalPatterns = {"\t".join(k): v for k, v in self._finalPatterns.items()}
+        self._endTime = _ab._time.time()
         process = _ab._psutil.Process(_ab._os.getpid())
-        self.__memoryUSS = process.memory_full_info().uss
-        self.__memoryRSS = process.memory_info().rss
+        self._memoryUSS = float()
+        self._memoryRSS = float()
+        self._memoryUSS = process.memory_full_info().uss
+        self._memoryRSS = process.memory_info().rss
+        print("Periodic Frequent patterns were generated successfully using parallelPFPGrowth algorithm ")
 
-    def Mine(self):
+    def getMemoryUSS(self) -> float:
         """
-        Start the mining process
-
-        """
-        self.__startTime = _ab._time.time()
-        APP_NAME = "parallelPFPGrowth"
-        conf = _ab.SparkConf().setAppName(APP_NAME)
-        # conf = conf.setMaster("local[*]")
-        sc = _ab.SparkContext(conf=conf).getOrCreate()
-        # sc = SparkContext.getOrCreate();
-        data = sc.textFile(self._iFile, minPartitions=self._numWorkers).map(
-            lambda x: [int(y) for y in x.strip().split(self._sep)])
-        # data = sc.textFile(finput).map(lambda x: [int(y) for y in x.strip().split(' ')])
-        data.cache()
-        # minSupport = data.count() * threshold/100
-        # maxPer = data.count() * periodicity_threshold/100
-        self._minSup = self.__convert(self._minSup)
-        self._maxPer = self.__convert(self._maxPer)
-        self._numTrans = sc.broadcast(data.count())
-        self._perFreqItems = self.getFrequentItems(data)
-        freqItemsets = self.getFrequentItemsets(data, self._perFreqItems)
-        self.__finalPatterns = freqItemsets.count()
-        sc.stop()
-        self.__endTime = _ab._time.time()
-        self.__memoryUSS = float()
-        self.__memoryRSS = float()
-        process = _ab._psutil.Process(_ab._os.getpid())
-        self.__memoryUSS = process.memory_full_info().uss
-        self.__memoryRSS = process.memory_info().rss
-
-    def getMemoryUSS(self):
-        """Total amount of USS memory consumed by the mining process will be retrieved from this function
+        Total amount of USS memory consumed by the mining process will be retrieved from this function
 
         :return: returning USS memory consumed by the mining process
         :rtype: float
         """
 
-        return self.__memoryUSS
+        return self._memoryUSS
 
-    def getMemoryRSS(self):
-        """Total amount of RSS memory consumed by the mining process will be retrieved from this function
+    def getMemoryRSS(self) -> float:
+        """
+        Total amount of RSS memory consumed by the mining process will be retrieved from this function
 
         :return: returning RSS memory consumed by the mining process
         :rtype: float
         """
 
-        return self.__memoryRSS
-
-    def getRuntime(self):
-        """Calculating the total amount of runtime taken by the mining process
+        return self._memoryRSS
 
+    def getRuntime(self) -> float:
+        """
+        Calculating the total amount of runtime taken by the mining process
 
         :return: returning total amount of runtime taken by the mining process
         :rtype: float
         """
 
-        return self.__endTime - self.__startTime
+        return self._endTime - self._startTime
 
-    def getPatternsAsDataFrame(self):
-        """Storing final frequent patterns in a dataframe
+    def getPatternsAsDataFrame(self) -> _ab._pd.DataFrame:
+        """
+        Storing final periodic-frequent patterns in a dataframe
 
-        :return: returning frequent patterns in a dataframe
+        :return: returning periodic-frequent patterns in a dataframe
         :rtype: pd.DataFrame
         """
 
-        dataframe = {}
         data = []
-        for a, b in self.__finalPatterns.items():
-            data.append([a.replace('\t', ' '), b])
-            dataframe = _ab._pd.DataFrame(data, columns=['Patterns', 'Support'])
-        return dataframe
+        for a, b in self._finalPatterns.items():
+            data.append([a, b[0], b[1]])
+        return _ab._pd.DataFrame(data, columns=['Patterns', 'Support', 'Periodicity'])
 
-    def save(self, outFile):
-        """Complete set of frequent patterns will be loaded in to a output file
+    def save(self, outFile: str) -> None:
+        """
+        Complete set of periodic-frequent patterns will be loaded in to an output file
 
         :param outFile: name of the output file
-        :type outFile: file
+        :type outFile: csv file
+        :return: None
         """
         self._oFile = outFile
-        writer = open(self._oFile, 'w+')
-        for x, y in self.__finalPatterns.items():
-            s1 = x.strip() + ":" + str(y)
-            writer.write("%s \n" % s1)
+        with open(self._oFile, 'w+') as writer:
+            for x, y in self._finalPatterns.items():
+                s1 = x + ":" + str(y[0]) + ":" + str(y[1])
+                writer.write("%s \n" % s1)
 
-    def getPatterns(self):
-        """ Function to send the set of frequent patterns after completion of the mining process
-
-        :return: returning frequent patterns
+    def getPatterns(self) -> Dict[str, Tuple[int, int]]:
+        """
+        Function to send the set of periodic-frequent patterns after completion of the mining process
 
+        :return: returning periodic-frequent patterns
         :rtype: dict
         """
-        return self.__finalPatterns
+        return self._finalPatterns
 
-    def printResults(self):
+    def printResults(self) -> None:
         """
         This function is used to print the results
+
+        :return: None
         """
-        print("Total number of Frequent Patterns:", self.getPatterns())
+        print("Total number of Periodic Frequent Patterns:", len(self.getPatterns()))
         print("Total Memory in USS:", self.getMemoryUSS())
         print("Total Memory in RSS", self.getMemoryRSS())
         print("Total ExecutionTime in ms:", self.getRuntime())
@@ -755,23 +541,15 @@ if __name__ == "__main__":
     _ap = str()
     if len(_ab._sys.argv) == 6 or len(_ab._sys.argv) == 7:
         if len(_ab._sys.argv) == 7:
-            _ap = parallelPFPGrowth(_ab._sys.argv[1], _ab._sys.argv[3], _ab._sys.argv[4], _ab._sys.argv[5],
+            _ap = parallelPFPGrowth(_ab._sys.argv[1], _ab._sys.argv[3], _ab._sys.argv[4], int(_ab._sys.argv[5]),
                                     _ab._sys.argv[6])
-        if len(_ab._sys.argv) == 4:
-            _ap = parallelPFPGrowth(_ab._sys.argv[1], _ab._sys.argv[3], _ab._sys.argv[4], _ab._sys.argv[5])
-        _ap.startMine()
-        print("Total number of Frequent Patterns:", _ab.getPatterns())
+        if len(_ab._sys.argv) == 6:
+            _ap = parallelPFPGrowth(_ab._sys.argv[1], _ab._sys.argv[3], _ab._sys.argv[4], int(_ab._sys.argv[5]))
+        _ap.mine()
+        print("Total number of Periodic-Frequent Patterns:", len(_ap.getPatterns()))
         _ap.save(_ab._sys.argv[2])
         print("Total Memory in USS:", _ap.getMemoryUSS())
         print("Total Memory in RSS", _ap.getMemoryRSS())
         print("Total ExecutionTime in ms:", _ap.getRuntime())
     else:
-        _ap = parallelPFPGrowth('Temporal_T10I4D100K.csv', 100, 5000, 5, '\t')
-        _ap.startMine()
-        # print("Total number of Frequent Patterns:", len( _ab.getPatterns()))
-        # _ap.save(_ab._sys.argv[2])
-        _ap.printResults()
-        # print("Total Memory in USS:", _ap.getMemoryUSS())
-        # print("Total Memory in RSS", _ap.getMemoryRSS())
-        # print("Total ExecutionTime in ms:", _ap.getRuntime())
         print("Error! The number of input parameters do not match the total number of parameters provided")
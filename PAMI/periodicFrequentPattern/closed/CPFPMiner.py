@@ -58,6 +58,8 @@ import pandas as pd
 from deprecated import deprecated
 
 from PAMI.periodicFrequentPattern.closed import abstract as _ab
+from PAMI.extras import closedPatternIndex as _cpi
+from PAMI.extras import bitPackedDatabase as _bp
 
 class CPFPMiner(_ab._periodicFrequentPatterns):
     """
@@ -71,7 +73,8 @@ class CPFPMiner(_ab._periodicFrequentPatterns):
                   2020 IEEE International Conference on Big Data (Big Data), 2020, https://ieeexplore.ieee.org/document/9378215
 
     :param  iFile: str :
-                   Name of the Input file to mine complete set of periodic frequent pattern's
+                   Name of the Input file to mine complete set of periodic frequent pattern's. A parquet file or a
+                   PAMI.extras.bitPackedDatabase is mined as a bit-packed vertical database.
     :param  oFile: str :
                    Name of the output file to store complete set of periodic frequent pattern's
     :param  minSup: float:
@@ -196,13 +199,13 @@ class CPFPMiner(_ab._periodicFrequentPatterns):
     _memoryUSS = float()
     _memoryRSS = float()
     _transaction = []
-    _hashing = {}
+    _closedIndex = None
     _mapSupport = {}
     _itemSetCount = 0
     _maxItemId = 0
-    _tableSize = 10000
     _tidList = {}
     _lno = 0
+    _packed = False
 
     def __init__(self, iFile, minSup, maxPer, sep='\t'):
         super().__init__(iFile, minSup, maxPer, sep)
@@ -234,7 +237,13 @@ class CPFPMiner(_ab._periodicFrequentPatterns):
         :return:   Returns the 1-length periodic-frequent items
         """
         Database = []
-        if isinstance(self._iFile, _ab._pd.DataFrame):
+        database = None
+        self._packed = _bp.isBitPacked(self._iFile)
+        if self._packed:
+            # a bit-packed vertical database is mined directly, the tidsets being packed bitmaps over the timestamps
+            database = _bp.bitPackedDatabase.read(self._iFile)
+            self._lno = database.maxTS
+        elif isinstance(self._iFile, _ab._pd.DataFrame):
             ts, data = [], []
             if self._iFile.empty:
                 print("its empty..")
@@ -248,7 +257,7 @@ class CPFPMiner(_ab._periodicFrequentPatterns):
                 tr = tr + data[i]
                 Database.append(tr)
 
-        if isinstance(self._iFile, str):
+        elif isinstance(self._iFile, str):
             if _ab._validators.url(self._iFile):
                 data = _ab._urlopen(self._iFile)
                 for line in data:
@@ -270,6 +279,12 @@ class CPFPMiner(_ab._periodicFrequentPatterns):
                     quit()
         self._tidList = {}
         self._mapSupport = {}
+        if database is not None:
+            for item, words in database.items.items():
+                bounds = _bp.span(words)
+                if bounds is not None:
+                    self._mapSupport[item] = [_bp.support(words), _bp.periodicity(words, self._lno), bounds[1]]
+                    self._tidList[item] = words
         for line in Database:
             self._lno += 1
             s = line
@@ -294,51 +309,24 @@ class CPFPMiner(_ab._periodicFrequentPatterns):
         self._tidList = {k: v for k, v in self._tidList.items() if k in self._mapSupport}
         for x, y in self._tidList.items():
             t1 = 0
-            for i in y:
+            for i in (_bp.timestamps(y).tolist() if self._packed else y):
                 t1 += i
             periodicFrequentItems[x] = t1
         periodicFrequentItems = [key for key, value in sorted(periodicFrequentItems.items(), key=lambda x: x[1])]
         return periodicFrequentItems
 
-    def _calculate(self, tidSet):
-        """
-        To calculate the weight if pattern based on the respective timeStamps
-
-        :param tidSet: timeStamps of the pattern
-        :return: the calculated weight of the timeStamps
-        """
-        hashcode = 0
-        for i in tidSet:
-            hashcode += i
-        if hashcode < 0:
-            hashcode = abs(0 - hashcode)
-        return hashcode % self._tableSize
-
-    def _contains(self, itemSet, val, hashcode):
-        """
-        To check if the key(hashcode) is in dictionary(hashing) variable
-
-        :param itemSet: generated periodic-frequent itemSet
-        :param val: support and periodicity of itemSet
-        :param hashcode: the key generated in calculate() method for every itemSet
-
-        :return: true if itemSet with same support present in dictionary(hashing) or else returns false
-        """
-        if self._hashing.get(hashcode) is None:
-            return False
-        for i in self._hashing[hashcode]:
-            itemSetX = i
-            if val[0] == self._hashing[hashcode][itemSetX][0] and set(itemSetX).issuperset(itemSet):
-                return True
-        return False
-
     def _getPeriodAndSupport(self, timeStamps):
         """
         Calculates the periodicity and support of timeStamps
 
-        :param timeStamps: timeStamps of itemSet
+        :param timeStamps: timeStamps of itemSet, or its packed bitmap when mining a bit-packed database
         :return: periodicity and support
         """
+        if self._packed:
+            per = _bp.periodicity(timeStamps, self._lno)
+            if per > self._maxPer:
+                return [0, 0]
+            return [_bp.support(timeStamps), per]
         timeStamps.sort()
         cur = 0
         per = 0
@@ -352,6 +340,25 @@ class CPFPMiner(_ab._periodicFrequentPatterns):
         per = max(per, self._lno - cur)
         return [sup, per]
 
+    def _support(self, timeStamps):
+        """
+        :param timeStamps: timeStamps of itemSet, or its packed bitmap when mining a bit-packed database
+        :return: the number of timeStamps of the itemSet
+        """
+        if self._packed:
+            return _bp.support(timeStamps)
+        return len(timeStamps)
+
+    def _intersect(self, tidSetI, tidSetJ):
+        """
+        :param tidSetI: timeStamps of an itemSet, or its packed bitmap when mining a bit-packed database
+        :param tidSetJ: timeStamps of another itemSet, in the same form
+        :return: the timeStamps at which both itemSets occur, in the same form
+        """
+        if self._packed:
+            return tidSetI & tidSetJ
+        return list(set(tidSetI).intersection(tidSetJ))
+
     def _save(self, prefix, suffix, tidSetX):
         """
         Saves the generated pattern which satisfies the closed property
@@ -374,17 +381,14 @@ class CPFPMiner(_ab._periodicFrequentPatterns):
         prefix.sort()
         val = self._getPeriodAndSupport(tidSetX)
         if val[0] >= self._minSup and val[1] <= self._maxPer:
-            hashcode = self._calculate(tidSetX)
-            if self._contains(prefix, val, hashcode) is False:
+            key = _bp.fingerprint(tidSetX) if self._packed else self._closedIndex.fingerprint(tidSetX)
+            if not self._closedIndex.contains(prefix, tidSetX, key):
                 self._itemSetCount += 1
                 sample = str()
                 for i in prefix:
                     sample = sample + i + " "
                 self._finalPatterns[sample] = val
-            if hashcode not in self._hashing:
-                self._hashing[hashcode] = {tuple(prefix): val}
-            else:
-                self._hashing[hashcode][tuple(prefix)] = val
+            self._closedIndex.add(prefix, tidSetX, key)
 
     def _processEquivalenceClass(self, prefix, itemSets, tidSets):
         """
@@ -404,15 +408,16 @@ class CPFPMiner(_ab._periodicFrequentPatterns):
             tidSetI = tidSets[0]
             itemJ = itemSets[1]
             tidSetJ = tidSets[1]
-            y1 = list(set(tidSetI).intersection(tidSetJ))
-            if len(y1) >= self._minSup:
+            y1 = self._intersect(tidSetI, tidSetJ)
+            supY1 = self._support(y1)
+            if supY1 >= self._minSup:
                 suffix = []
                 suffix += [itemI, itemJ]
                 suffix = list(set(suffix))
                 self._save(prefix, suffix, y1)
-            if len(y1) != len(tidSetI):
+            if supY1 != self._support(tidSetI):
                 self._save(prefix, [itemI], tidSetI)
-            if len(y1) != len(tidSetJ):
+            if supY1 != self._support(tidSetJ):
                 self._save(prefix, [itemJ], tidSetJ)
             return
         for i in range(len(itemSets)):
@@ -428,16 +433,17 @@ class CPFPMiner(_ab._periodicFrequentPatterns):
                 if itemJ is None:
                     continue
                 tidSetJ = tidSets[j]
-                y = list(set(tidSetX).intersection(tidSetJ))
-                if len(y) < self._minSup:
+                y = self._intersect(tidSetX, tidSetJ)
+                supX, supJ, supY = self._support(tidSetX), self._support(tidSetJ), self._support(y)
+                if supY < self._minSup:
                     continue
-                if len(tidSetX) == len(tidSetJ) and len(y) == len(tidSetX):
+                if supX == supJ and supY == supX:
                     itemSets.insert(j, None)
                     tidSets.insert(j, None)
                     itemSetX.append(itemJ)
-                elif len(tidSetX) < len(tidSetJ) and len(y) == len(tidSetX):
+                elif supX < supJ and supY == supX:
                     itemSetX.append(itemJ)
-                elif len(tidSetX) > len(tidSetJ) and len(y) == len(tidSetJ):
+                elif supX > supJ and supY == supJ:
                     itemSets.insert(j, None)
                     tidSets.insert(j, None)
                     classItemSets.append(itemJ)
@@ -457,7 +463,7 @@ class CPFPMiner(_ab._periodicFrequentPatterns):
         """
         self._startTime = _ab._time.time()
         self._finalPatterns = {}
-        self._hashing = {}
+        self._closedIndex = _cpi.closedPatternIndex()
         periodicFrequentItems = self._scanDatabase()
         for i in range(len(periodicFrequentItems)):
             itemX = periodicFrequentItems[i]
@@ -472,15 +478,16 @@ class CPFPMiner(_ab._periodicFrequentPatterns):
                 if itemJ is None:
                     continue
                 tidSetJ = self._tidList[itemJ]
-                y1 = list(set(tidSetX).intersection(tidSetJ))
-                if len(y1) < self._minSup:
+                y1 = self._intersect(tidSetX, tidSetJ)
+                supX, supJ, supY1 = self._support(tidSetX), self._support(tidSetJ), self._support(y1)
+                if supY1 < self._minSup:
                     continue
-                if len(tidSetX) == len(tidSetJ) and len(y1) is len(tidSetX):
+                if supX == supJ and supY1 == supX:
                     periodicFrequentItems.insert(j, None)
                     itemSetX.append(itemJ)
-                elif len(tidSetX) < len(tidSetJ) and len(y1) is len(tidSetX):
+                elif supX < supJ and supY1 == supX:
                     itemSetX.append(itemJ)
-                elif len(tidSetX) > len(tidSetJ) and len(y1) is len(tidSetJ):
+                elif supX > supJ and supY1 == supJ:
                     periodicFrequentItems.insert(j, None)
                     itemSets.append(itemJ)
                     tidSets.append(y1)
@@ -505,7 +512,7 @@ class CPFPMiner(_ab._periodicFrequentPatterns):
         """
         self._startTime = _ab._time.time()
         self._finalPatterns = {}
-        self._hashing = {}
+        self._closedIndex = _cpi.closedPatternIndex()
         periodicFrequentItems = self._scanDatabase()
         for i in range(len(periodicFrequentItems)):
             itemX = periodicFrequentItems[i]
@@ -520,15 +527,16 @@ class CPFPMiner(_ab._periodicFrequentPatterns):
                 if itemJ is None:
                     continue
                 tidSetJ = self._tidList[itemJ]
-                y1 = list(set(tidSetX).intersection(tidSetJ))
-                if len(y1) < self._minSup:
+                y1 = self._intersect(tidSetX, tidSetJ)
+                supX, supJ, supY1 = self._support(tidSetX), self._support(tidSetJ), self._support(y1)
+                if supY1 < self._minSup:
                     continue
-                if len(tidSetX) == len(tidSetJ) and len(y1) is len(tidSetX):
+                if supX == supJ and supY1 == supX:
                     periodicFrequentItems.insert(j, None)
                     itemSetX.append(itemJ)
-                elif len(tidSetX) < len(tidSetJ) and len(y1) is len(tidSetX):
+                elif supX < supJ and supY1 == supX:
                     itemSetX.append(itemJ)
-                elif len(tidSetX) > len(tidSetJ) and len(y1) is len(tidSetJ):
+                elif supX > supJ and supY1 == supJ:
                     periodicFrequentItems.insert(j, None)
                     itemSets.append(itemJ)
                     tidSets.append(y1)
@@ -6,7 +6,7 @@
 #
 #             obj = alg.TopkPFPGrowth(iFile, k, maxPer,oFile)
 #
-#             obj.startMine()
+#             obj.mine()
 #
 #             periodicFrequentPatterns = obj.getPatterns()
 #
@@ -50,7 +50,8 @@ __copyright__ = """
 
 """
 
-from PAMI.periodicFrequentPattern.basic import abstract as _ab
+from PAMI.periodicFrequentPattern.topk.TopkPFP import abstract as _ab
+from PAMI.periodicFrequentPattern.topk import _topkHeap as _th
 import pandas as pd
 from deprecated import deprecated
 
@@ -96,7 +97,7 @@ class TopkPFPGrowth(_ab._periodicFrequentPatterns):
 
     :Methods:
 
-        startMine()
+        mine()
             Mining process will start from here
         getPatterns()
             Complete set of patterns will be retrieved with this function
@@ -141,7 +142,7 @@ class TopkPFPGrowth(_ab._periodicFrequentPatterns):
 
             obj = alg.TopkPFPGrowth(iFile, k, maxPer)
 
-            obj.startMine()
+            obj.mine()
 
             periodicFrequentPatterns = obj.getPatterns()
 
@@ -184,6 +185,7 @@ class TopkPFPGrowth(_ab._periodicFrequentPatterns):
     _lno = int()
     _minimum = int()
     _mapSupport = {}
+    _heap = None
 
     def _creatingItemSets(self):
         """
@@ -248,11 +250,13 @@ class TopkPFPGrowth(_ab._periodicFrequentPatterns):
 
     def _frequentOneItem(self):
         """
-        Generating one frequent patterns
+        Generating one frequent patterns. Every periodic item is offered to the top-k heap, so the support threshold is
+        already raised to the k-th best single item before the search starts.
         """
 
         self._mapSupport = {}
         self._tidList = {}
+        self._lno = 0
         n = 0
         for line in self._Database:
             self._lno += 1
@@ -272,18 +276,34 @@ class TopkPFPGrowth(_ab._periodicFrequentPatterns):
         self._maxPer = self._convert(self._maxPer)
         self._k = self._convert(self._k)
         self._mapSupport = {k: [v[0], v[1]] for k, v in self._mapSupport.items() if v[1] <= self._maxPer}
-        plist = [key for key, value in sorted(self._mapSupport.items(), key=lambda x: (x[1][0], x[0]), reverse=True)]
-        self._finalPatterns = {}
-        #print(len(plist))
-        for i in plist:
-            if len(self._finalPatterns) >= self._k:
-                break
-            else:
-                self._finalPatterns[i] = [self._mapSupport[i][0], self._mapSupport[i][1]]
-        self._minimum = min([self._finalPatterns[i][0] for i in self._finalPatterns.keys()])
-        plist = list(self._finalPatterns.keys())
+        self._heap = _th._TopkHeap(self._k, _th.supportFirst)
+        for item, (support, periodicity) in self._mapSupport.items():
+            self._heap.push(item + " ", support, periodicity)
+        self._raiseMinimum()
+        # supersets can never beat their subsets, so only the items kept by the heap need to be extended
+        plist = [k.strip() for k in self._heap.patterns()]
         return plist
 
+    def _raiseMinimum(self):
+        """
+        Raises the minimum support to the support of the weakest pattern once the heap holds k patterns.
+        """
+        if self._heap.isFull():
+            self._minimum = self._heap.weakest()[0]
+        else:
+            self._minimum = 1
+
+    def _isPromising(self, val):
+        """
+        Checks whether a pattern, or any of its supersets, can still enter the top-k patterns.
+
+        :param val: support and periodicity of the pattern
+        :type val: list
+        :return: True if the pattern has to be explored
+        :rtype: bool
+        """
+        return val[0] >= self._minimum and val[1] <= self._maxPer and self._heap.admits(val[0], val[1])
+
     def _getSupportAndPeriod(self, timeStamps):
         """To calculate the periodicity and support
 
@@ -291,7 +311,6 @@ class TopkPFPGrowth(_ab._periodicFrequentPatterns):
         :return: support, periodicity
         """
 
-        global lno
         timeStamps.sort()
         cur = 0
         per = list()
@@ -321,24 +340,13 @@ class TopkPFPGrowth(_ab._periodicFrequentPatterns):
         else:
             prefix = prefix + suffix
         val = self._getSupportAndPeriod(tidSetI)
+        if val[1] > self._maxPer:
+            return
         sample = str()
         for i in prefix:
             sample = sample + i + " "
-        if len(self._finalPatterns) < self._k:
-            if val[0] >= self._minimum:
-                self._finalPatterns[sample] = val
-                self._finalPatterns = {k: v for k, v in
-                                  sorted(self._finalPatterns.items(), key=lambda item: item[1], reverse=True)}
-                self._minimum = min([self._finalPatterns[i][0] for i in self._finalPatterns.keys()])
-        else:
-            for x, y in sorted(self._finalPatterns.items(), key=lambda x: x[1][0]):
-                if val[0] > y[0]:
-                    del self._finalPatterns[x]
-                    self._finalPatterns[x] = y
-                    self._finalPatterns = {k: v for k, v in
-                                          sorted(self._finalPatterns.items(), key=lambda item: item[1], reverse=True)}
-                    self._minimum = min([self._finalPatterns[i][0] for i in self._finalPatterns.keys()])
-                    return
+        if self._heap.push(sample, val[0], val[1]):
+            self._raiseMinimum()
 
     def _Generation(self, prefix, itemSets, tidSets):
         """
@@ -362,6 +370,9 @@ class TopkPFPGrowth(_ab._periodicFrequentPatterns):
             if itemI is None:
                 continue
             tidSetI = tidSets[i]
+            # the minimum may have been raised since this class was built
+            if not self._isPromising(self._getSupportAndPeriod(tidSetI)):
+                continue
             classItemSets = []
             classTidSets = []
             itemSetX = [itemI]
@@ -369,50 +380,24 @@ class TopkPFPGrowth(_ab._periodicFrequentPatterns):
                 itemJ = itemSets[j]
                 tidSetJ = tidSets[j]
                 y = list(set(tidSetI).intersection(tidSetJ))
+                if len(y) < self._minimum:
+                    continue
                 val = self._getSupportAndPeriod(y)
-                if val[0] >= self._minimum and val[1] <= self._maxPer:
+                if self._isPromising(val):
                     classItemSets.append(itemJ)
                     classTidSets.append(y)
             newPrefix = list(set(itemSetX)) + prefix
             self._Generation(newPrefix, classItemSets, classTidSets)
             self._save(prefix, list(set(itemSetX)), tidSetI)
 
-    @deprecated("It is recommended to use mine() instead of startMine() for mining process")
+    @deprecated("It is recommended to use 'mine()' instead of 'startMine()' for mining process. Starting from January 2025, 'startMine()' will be completely terminated.")
     def startMine(self):
         """
         Main function of the program
         """
-        self._startTime = _ab._time.time()
-        if self._iFile is None:
-            raise Exception("Please enter the file path or file name:")
-        if self._k is None:
-            raise Exception("Please enter the Minimum Support")
-        self._creatingItemSets()
-        _plist = self._frequentOneItem()
-        for i in range(len(_plist)):
-            itemI = _plist[i]
-            tidSetI = self._tidList[itemI]
-            itemSetX = [itemI]
-            itemSets = []
-            tidSets = []
-            for j in range(i + 1, len(_plist)):
-                itemJ = _plist[j]
-                tidSetJ = self._tidList[itemJ]
-                y1 = list(set(tidSetI).intersection(tidSetJ))
-                val = self._getSupportAndPeriod(y1)
-                if val[0] >= self._minimum and val[1] <= self._maxPer:
-                    itemSets.append(itemJ)
-                    tidSets.append(y1)
-            self._Generation(itemSetX, itemSets, tidSets)
-        print("TopK Periodic Frequent patterns were generated successfully")
-        self._endTime = _ab._time.time()
-        _process = _ab._psutil.Process(_ab._os.getpid())
-        self._memoryRSS = float()
-        self._memoryUSS = float()
-        self._memoryUSS = _process.memory_full_info().uss
-        self._memoryRSS = _process.memory_info().rss
+        self.mine()
 
-    def Mine(self):
+    def mine(self):
         """
         Main function of the program
         """
@@ -426,6 +411,8 @@ class TopkPFPGrowth(_ab._periodicFrequentPatterns):
         for i in range(len(_plist)):
             itemI = _plist[i]
             tidSetI = self._tidList[itemI]
+            if len(tidSetI) < self._minimum:
+                continue
             itemSetX = [itemI]
             itemSets = []
             tidSets = []
@@ -433,11 +420,14 @@ class TopkPFPGrowth(_ab._periodicFrequentPatterns):
                 itemJ = _plist[j]
                 tidSetJ = self._tidList[itemJ]
                 y1 = list(set(tidSetI).intersection(tidSetJ))
+                if len(y1) < self._minimum:
+                    continue
                 val = self._getSupportAndPeriod(y1)
-                if val[0] >= self._minimum and val[1] <= self._maxPer:
+                if self._isPromising(val):
                     itemSets.append(itemJ)
                     tidSets.append(y1)
             self._Generation(itemSetX, itemSets, tidSets)
+        self._finalPatterns = self._heap.patterns()
         print("TopK Periodic Frequent patterns were generated successfully")
         self._endTime = _ab._time.time()
         _process = _ab._psutil.Process(_ab._os.getpid())
@@ -522,7 +512,7 @@ if __name__ == "__main__":
             _ap = TopkPFPGrowth(_ab._sys.argv[1], _ab._sys.argv[3], _ab._sys.argv[4], _ab._sys.argv[5])
         if len(_ab._sys.argv) == 5:
             _ap = TopkPFPGrowth(_ab._sys.argv[1], _ab._sys.argv[3], _ab._sys.argv[4])
-        _ap.startMine()
+        _ap.mine()
         print("Top K Periodic-Frequent Patterns:", len(_ap.getPatterns()))
         _ap.save(_ab._sys.argv[2])
         print("Total Memory in USS:",  _ap.getMemoryUSS())
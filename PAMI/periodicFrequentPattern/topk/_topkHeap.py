@@ -0,0 +1,141 @@
+#  Copyright (C)  2021 Rage Uday Kiran
+#
+#      This program is free software: you can redistribute it and/or modify
+#      it under the terms of the GNU General Public License as published by
+#      the Free Software Foundation, either version 3 of the License, or
+#      (at your option) any later version.
+#
+#      This program is distributed in the hope that it will be useful,
+#      but WITHOUT ANY WARRANTY; without even the implied warranty of
+#      MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#      GNU General Public License for more details.
+#
+#      You should have received a copy of the GNU General Public License
+#      along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import heapq as _heapq
+
+
+def supportFirst(support, periodicity):
+    """
+    Ranking used by the top-k periodic-frequent miners that rank patterns by support.
+    Among patterns with the same support, the pattern with the smaller periodicity is ranked higher.
+
+    :param support: support of the pattern
+    :type support: int
+    :param periodicity: periodicity of the pattern
+    :type periodicity: int
+    :return: the score of the pattern, a larger score is a better pattern
+    :rtype: tuple
+    """
+    return support, -periodicity
+
+
+def periodicityFirst(support, periodicity):
+    """
+    Ranking used by the top-k periodic-frequent miners that rank patterns by periodicity.
+    Among patterns with the same periodicity, the pattern with the larger support is ranked higher.
+
+    :param support: support of the pattern
+    :type support: int
+    :param periodicity: periodicity of the pattern
+    :type periodicity: int
+    :return: the score of the pattern, a larger score is a better pattern
+    :rtype: tuple
+    """
+    return -periodicity, support
+
+
+class _TopkHeap(object):
+    """
+    A bounded min-heap holding the k best patterns seen so far. The root of the heap is the weakest of the k patterns, so
+    a new pattern is admitted, and the weakest one evicted, in O(log k) without sorting the current results.
+
+    :Attributes:
+
+        k : int
+            The number of patterns to be kept
+        score : function
+            Maps (support, periodicity) of a pattern to a comparable score, a larger score is a better pattern
+        heap : list
+            Entries (score, pattern, support, periodicity) of the kept patterns
+
+    :Methods:
+
+        push(pattern, support, periodicity)
+            Offers a pattern to the heap and returns True if it was kept
+        isFull()
+            Returns True once k patterns are kept
+        weakest()
+            Returns (support, periodicity) of the weakest kept pattern
+        patterns()
+            Returns the kept patterns ordered from the best to the weakest
+    """
+
+    def __init__(self, k, score=supportFirst):
+        self.k = int(k)
+        self.score = score
+        self.heap = []
+
+    def __len__(self):
+        return len(self.heap)
+
+    def isFull(self):
+        """
+        :return: True once k patterns are kept
+        :rtype: bool
+        """
+        return len(self.heap) >= self.k
+
+    def admits(self, support, periodicity):
+        """
+        Checks whether a pattern with the given support and periodicity would be kept by the heap.
+
+        :param support: support of the pattern
+        :type support: int
+        :param periodicity: periodicity of the pattern
+        :type periodicity: int
+        :rtype: bool
+        """
+        return not self.isFull() or self.score(support, periodicity) > self.heap[0][0]
+
+    def push(self, pattern, support, periodicity):
+        """
+        Offers a pattern to the heap. When the heap is full, the pattern replaces the weakest kept pattern only if its
+        score is strictly better.
+
+        :param pattern: the pattern
+        :type pattern: str
+        :param support: support of the pattern
+        :type support: int
+        :param periodicity: periodicity of the pattern
+        :type periodicity: int
+        :return: True if the pattern was kept
+        :rtype: bool
+        """
+        if self.k <= 0:
+            return False
+        entry = (self.score(support, periodicity), pattern, support, periodicity)
+        if not self.isFull():
+            _heapq.heappush(self.heap, entry)
+            return True
+        if entry[0] > self.heap[0][0]:
+            _heapq.heapreplace(self.heap, entry)
+            return True
+        return False
+
+    def weakest(self):
+        """
+        :return: (support, periodicity) of the weakest kept pattern, or None while the heap is empty
+        :rtype: tuple
+        """
+        if not self.heap:
+            return None
+        return self.heap[0][2], self.heap[0][3]
+
+    def patterns(self):
+        """
+        :return: the kept patterns as a dictionary of pattern to [support, periodicity], from the best to the weakest
+        :rtype: dict
+        """
+        return {entry[1]: [entry[2], entry[3]] for entry in sorted(self.heap, reverse=True)}
@@ -6,7 +6,7 @@
 #
 #             obj = alg.kPFPMiner(iFile, k)
 #
-#             obj.startMine()
+#             obj.mine()
 #
 #             periodicFrequentPatterns = obj.getPatterns()
 #
@@ -50,11 +50,12 @@ __copyright__ = """
 
 """
 
-from PAMI.periodicFrequentPattern.basic import abstract as _ab
 import pandas as pd
 from deprecated import deprecated
 
 from PAMI.periodicFrequentPattern.topk.kPFPMiner import abstract as _ab
+from PAMI.periodicFrequentPattern.topk import _topkHeap as _th
+from PAMI.extras import bitPackedDatabase as _bp
 
 
 class kPFPMiner(_ab._periodicFrequentPatterns):
@@ -66,7 +67,8 @@ class kPFPMiner(_ab._periodicFrequentPatterns):
                  BDA 2022. Lecture Notes in Computer Science, vol 13773. Springer, Cham. https://doi.org/10.1007/978-3-031-24094-2_14
 
     :param  iFile: str :
-                   Name of the Input file to mine complete set of periodic frequent pattern's
+                   Name of the Input file to mine complete set of periodic frequent pattern's. A parquet file or a
+                   PAMI.extras.bitPackedDatabase is mined as a bit-packed vertical database.
     :param  oFile: str :
                    Name of the output file to store complete set of periodic frequent pattern's
 
@@ -97,7 +99,7 @@ class kPFPMiner(_ab._periodicFrequentPatterns):
 
     :Methods:
 
-        startMine()
+        mine()
             Mining process will start from here
         getPatterns()
             Complete set of patterns will be retrieved with this function
@@ -143,7 +145,7 @@ class kPFPMiner(_ab._periodicFrequentPatterns):
 
             obj = alg.kPFPMiner(iFile, k)
 
-            obj.startMine()
+            obj.mine()
 
             periodicFrequentPatterns = obj.getPatterns()
 
@@ -183,7 +185,9 @@ class kPFPMiner(_ab._periodicFrequentPatterns):
     _Database = []
     _tidList = {}
     lno = int()
-    _maximum = int()
+    _heap = None
+    _packed = False
+    _dbSize = int()
 
     def _creatingItemSets(self):
         """
@@ -220,53 +224,80 @@ class kPFPMiner(_ab._periodicFrequentPatterns):
                     print("File Not Found")
                     quit()
                     
-    def getPer_Sup(self, tids):
+    def _getSupportAndPeriod(self, tids):
+        """To calculate the support and periodicity
+
+        :param tids: Timestamps of an item set, or its packed bitmap when mining a bit-packed database
+        :return: support, periodicity
+        """
+        if self._packed:
+            return [_bp.support(tids), _bp.periodicity(tids, self.lno)]
         tids.sort()
-        cur=0
-        per=list()
-        sup=0
-        #print(tids)
-        for i in range(len(tids)-1):
-            j = i + 1
-            #if tids[j] - cur <= periodicity:
-                #return [0,0]
+        cur = 0
+        per = list()
+        for j in range(len(tids)):
             per.append(tids[j] - cur)
             cur = tids[j]
         per.append(self.lno - cur)
-        return max(per)
+        return [len(tids), max(per)]
+
+    def getPer_Sup(self, tids):
+        """To calculate the periodicity
+
+        :param tids: Timestamps of an item set
+        :return: periodicity
+        """
+        return self._getSupportAndPeriod(tids)[1]
 
     def _frequentOneItem(self):
         """
-        Generating one frequent patterns
+        Generating one frequent patterns. Every item is offered to the top-k heap, so the periodicity threshold is
+        already lowered to the k-th best single item before the search starts.
         """
+
         self._mapSupport = {}
-        self._tidList = {}
-        n = 0
-        for line in self._Database:
-            self.lno += 1
-            n = int(line[0])
-            for i in range(1, len(line)):
-                si = line[i]
-                if self._mapSupport.get(si) is None:
-                    self._mapSupport[si] = [1, abs(0 - n), n]
-                    self._tidList[si] = [n]
-                else:
-                    self._mapSupport[si][0] += 1
-                    self._mapSupport[si][1] = max(self._mapSupport[si][1], abs(n - self._mapSupport[si][2]))
-                    self._mapSupport[si][2] = n
-                    self._tidList[si].append(n)
-        for x, y in self._mapSupport.items():
-            self._mapSupport[x][1] = max(self._mapSupport[x][1], abs(n - self._mapSupport[x][2]))
-        plist = [key for key, value in sorted(self._mapSupport.items(), key=lambda x: x[1], reverse=True)]
-        for i in plist:
-            if len(self._finalPatterns) >= self._k:
-                break
-            else:
-                self._finalPatterns[i] = self._mapSupport[i][1]
-        self._maximum = max([self._finalPatterns[i] for i in self._finalPatterns.keys()])
-        plist = list(self._finalPatterns.keys())
+        if self._packed:
+            # the bitmaps of the items were read with the database
+            for item, words in self._tidList.items():
+                support, periodicity = self._getSupportAndPeriod(words)
+                if support:
+                    self._mapSupport[item] = [support, periodicity, _bp.span(words)[1]]
+        else:
+            self._tidList = {}
+            self.lno = 0
+            n = 0
+            for line in self._Database:
+                self.lno += 1
+                n = int(line[0])
+                for i in range(1, len(line)):
+                    si = line[i]
+                    if self._mapSupport.get(si) is None:
+                        self._mapSupport[si] = [1, abs(0 - n), n]
+                        self._tidList[si] = [n]
+                    else:
+                        self._mapSupport[si][0] += 1
+                        self._mapSupport[si][1] = max(self._mapSupport[si][1], abs(n - self._mapSupport[si][2]))
+                        self._mapSupport[si][2] = n
+                        self._tidList[si].append(n)
+            for x, y in self._mapSupport.items():
+                self._mapSupport[x][1] = max(self._mapSupport[x][1], abs(n - self._mapSupport[x][2]))
+        self._heap = _th._TopkHeap(self._k, _th.periodicityFirst)
+        for item, (support, periodicity, last) in self._mapSupport.items():
+            self._heap.push(item + " ", support, periodicity)
+        # supersets can never beat their subsets, so only the items kept by the heap need to be extended
+        plist = [k.strip() for k in self._heap.patterns()]
         return plist
 
+    def _intersect(self, tidSetI, tidSetJ):
+        """To intersect the timestamps of two item sets
+
+        :param tidSetI: Timestamps of an item set, or its packed bitmap when mining a bit-packed database
+        :param tidSetJ: Timestamps of another item set, in the same form
+        :return: the timestamps at which both item sets occur, in the same form
+        """
+        if self._packed:
+            return tidSetI & tidSetJ
+        return list(set(tidSetI).intersection(tidSetJ))
 
     def _save(self, prefix, suffix, tidSetI):
         """Saves the patterns that satisfy the periodic frequent property.
@@ -283,25 +314,11 @@ class kPFPMiner(_ab._periodicFrequentPatterns):
             prefix = suffix
         else:
             prefix = prefix + suffix
-        val = self.getPer_Sup(tidSetI)
+        val = self._getSupportAndPeriod(tidSetI)
         sample = str()
         for i in prefix:
             sample = sample + i + " "
-        if len(self._finalPatterns) < self._k:
-            if val < self._maximum:
-                self._finalPatterns[sample] = val
-                self._finalPatterns = {k: v for k, v in sorted(self._finalPatterns.items(), key=lambda item: item[1], reverse=True)}
-                self._maximum = max([i for i in self._finalPatterns.values()])
-        else:
-            for x, y in sorted(self._finalPatterns.items(), key=lambda x: x[1], reverse=True):
-                if val < y:
-                    del self._finalPatterns[x]
-                    self._finalPatterns[sample] = val
-                    self._finalPatterns = {k: v for k, v in
-                                              sorted(self._finalPatterns.items(), key=lambda item: item[1],
-                                                     reverse=True)}
-                    self._maximum = max([i for i in self._finalPatterns.values()])
-                    return
+        self._heap.push(sample, val[0], val[1])
 
     def _Generation(self, prefix, itemSets, tidSets):
         """Equivalence class is followed  and checks for the patterns generated for periodic-frequent patterns.
@@ -312,7 +329,6 @@ class kPFPMiner(_ab._periodicFrequentPatterns):
         :type itemSets: list
         :param tidSets: timestamps of the items in the argument itemSets
         :type tidSets: list
-
         """
         if len(itemSets) == 1:
             i = itemSets[0]
@@ -324,14 +340,18 @@ class kPFPMiner(_ab._periodicFrequentPatterns):
             if itemI is None:
                 continue
             tidSetI = tidSets[i]
+            # the heap may have tightened since this class was built
+            if not self._heap.admits(*self._getSupportAndPeriod(tidSetI)):
+                continue
             classItemSets = []
             classTidSets = []
             itemSetX = [itemI]
             for j in range(i + 1, len(itemSets)):
                 itemJ = itemSets[j]
                 tidSetJ = tidSets[j]
-                y = list(set(tidSetI).intersection(tidSetJ))
-                if self.getPer_Sup(y) <= self._maximum:
+                y = self._intersect(tidSetI, tidSetJ)
+                val = self._getSupportAndPeriod(y)
+                if val[0] and self._heap.admits(*val):
                     classItemSets.append(itemJ)
                     classTidSets.append(y)
             newPrefix = list(set(itemSetX)) + prefix
@@ -348,42 +368,63 @@ class kPFPMiner(_ab._periodicFrequentPatterns):
         if type(value) is int:
             value = int(value)
         if type(value) is float:
-            value = (len(self._Database) * value)
+            value = (self._dbSize * value)
         if type(value) is str:
             if '.' in value:
                 value = float(value)
-                value = ((len(self._Database)) * value)
+                value = (self._dbSize * value)
             else:
                 value = int(value)
         return value
 
+    @deprecated("It is recommended to use 'mine()' instead of 'startMine()' for mining process. Starting from January 2025, 'startMine()' will be completely terminated.")
     def startMine(self):
         """
         Main function of the program
 
+        """
+        self.mine()
+
+    def mine(self):
+        """
+        Main function of the program
+
         """
         self._startTime = _ab._time.time()
         if self._iFile is None:
             raise Exception("Please enter the file path or file name:")
         if self._k is None:
             raise Exception("Please enter the Minimum Support")
-        self._creatingItemSets()
+        self._packed = _bp.isBitPacked(self._iFile)
+        if self._packed:
+            # a bit-packed vertical database is mined directly, the tidsets being packed bitmaps over the timestamps
+            database = _bp.bitPackedDatabase.read(self._iFile)
+            self._tidList = dict(database.items)
+            self.lno = database.maxTS
+            self._dbSize = database.dbSize
+        else:
+            self._creatingItemSets()
+            self._dbSize = len(self._Database)
         self._k = self._convert(self._k)
         plist = self._frequentOneItem()
         for i in range(len(plist)):
             itemI = plist[i]
             tidSetI = self._tidList[itemI]
+            if not self._heap.admits(*self._getSupportAndPeriod(tidSetI)):
+                continue
             itemSetX = [itemI]
             itemSets = []
             tidSets = []
             for j in range(i + 1, len(plist)):
                 itemJ = plist[j]
                 tidSetJ = self._tidList[itemJ]
-                y1 = list(set(tidSetI).intersection(tidSetJ))
-                if self.getPer_Sup(y1) <= self._maximum:
+                y1 = self._intersect(tidSetI, tidSetJ)
+                val = self._getSupportAndPeriod(y1)
+                if val[0] and self._heap.admits(*val):
                     itemSets.append(itemJ)
                     tidSets.append(y1)
             self._Generation(itemSetX, itemSets, tidSets)
+        self._finalPatterns = {k: v[1] for k, v in self._heap.patterns().items()}
         print("kPFPMiner has successfully generated top-k frequent patterns")
         self._endTime = _ab._time.time()
         self._memoryUSS = float()
@@ -468,7 +509,7 @@ if __name__ == "__main__":
             _ap = kPFPMiner(_ab._sys.argv[1], _ab._sys.argv[3], _ab._sys.argv[4])
         if len(_ab._sys.argv) == 4:
             _ap = kPFPMiner(_ab._sys.argv[1], _ab._sys.argv[3])
-        _ap.startMine()
+        _ap.mine()
         _Patterns = _ap.getPatterns()
         print("Total number of top-k periodic frequent patterns:", len(_Patterns))
         _ap.save(_ab._sys.argv[2])
@@ -56,6 +56,7 @@ __copyright__ = """
 import pandas as pd
 from deprecated import deprecated
 from PAMI.relativeHighUtilityPattern.basic import abstract as _ab
+from PAMI.extras import utilityProjection as _up
 
 
 class _Transaction:
@@ -77,8 +78,6 @@ class _Transaction:
 
     :Methods:
 
-        projectedTransaction(offsetE):
-            A method to create new Transaction from existing starting from offsetE until the end
         getItems():
             return items in transaction
         getUtilities():
@@ -98,22 +97,6 @@ class _Transaction:
         self.utilities = utilities
         self.transactionUtility = transactionUtility
 
-    def projectTransaction(self, offsetE: int) -> '_Transaction':
-        """
-        A method to create new Transaction from existing transaction starting from offsetE until the end
-
-        :param offsetE: an offset over the original transaction for projecting the transaction
-        :type offsetE: int
-        """
-        new_transaction = _Transaction(self.items, self.utilities, self.transactionUtility)
-        utilityE = self.utilities[offsetE]
-        new_transaction.prefixUtility = self.prefixUtility + utilityE
-        new_transaction.transactionUtility = self.transactionUtility - utilityE
-        for i in range(self.offset, offsetE):
-            new_transaction.transactionUtility -= self.utilities[i]
-        new_transaction.offset = offsetE + 1
-        return new_transaction
-
     def getItems(self) -> list:
         """
         A method to return items in transaction
@@ -377,14 +360,8 @@ class RHUIM(_ab._utilityPatterns):
                A method to calculate the sub-tree utility and local utility of all items that can extend itemSet P and e
         output(tempPosition, utility)
                A method to output a relative-high-utility itemSet to file or memory depending on what the user chose
-        is_equal(transaction1, transaction2)
-               A method to Check if two transaction are identical
         useUtilityBinArrayToCalculateSubtreeUtilityFirstTime(dataset)
               A method to calculate the sub tree utility values for single items
-        sortDatabase(self, transactions)
-              A Method to sort transaction
-        sort_transaction(self, trans1, trans2)
-              A Method to sort transaction
         useUtilityBinArrayToCalculateLocalUtilityFirstTime(self, dataset)
              A method to calculate local utility values for single itemSets
 
@@ -495,12 +472,7 @@ class RHUIM(_ab._utilityPatterns):
             currentName += 1
         for transaction in self._dataset.getTransactions():
             transaction.removeUnpromisingItems(self._oldNamesToNewNames)
-        self.sortDatabase(self._dataset.getTransactions())
-        emptyTransactionCount = 0
-        for transaction in self._dataset.getTransactions():
-            if len(transaction.getItems()) == 0:
-                emptyTransactionCount += 1
-        self._dataset.transactions = self._dataset.transactions[emptyTransactionCount:]
+        self._dataset.transactions = [transaction for transaction in self._dataset.transactions if transaction.items]
         self._useUtilityBinArrayToCalculateSubtreeUtilityFirstTime(self._dataset)
         itemsToExplore = []
         for item in itemsToKeep:
@@ -536,56 +508,8 @@ class RHUIM(_ab._utilityPatterns):
         """
         self._candidateCount += len(itemsToExplore)
         for idx, e in enumerate(itemsToExplore):
-            transactionsPe = []
-            utilityPe = 0
             utilitySumPe = utilitySumP + self._singleItemSetsUtilities[e]
-            previousTransaction = transactionsOfP[0]
-            consecutiveMergeCount = 0
-            for transaction in transactionsOfP:
-                items = transaction.getItems()
-                if e in items:
-                    positionE = items.index(e)
-                    if transaction.getLastPosition() == positionE:
-                        utilityPe += transaction.getUtilities()[positionE] + transaction.prefixUtility
-                    else:
-                        projectedTransaction = transaction.projectTransaction(positionE)
-                        utilityPe += projectedTransaction.prefixUtility
-                        if previousTransaction == transactionsOfP[0]:
-                            previousTransaction = projectedTransaction
-                        elif self._isEqual(projectedTransaction, previousTransaction):
-                            if consecutiveMergeCount == 0:
-                                items = previousTransaction.items[previousTransaction.offset:]
-                                utilities = previousTransaction.utilities[previousTransaction.offset:]
-                                itemsCount = len(items)
-                                positionPrevious = 0
-                                positionProjection = projectedTransaction.offset
-                                while positionPrevious < itemsCount:
-                                    utilities[positionPrevious] += projectedTransaction.utilities[positionProjection]
-                                    positionPrevious += 1
-                                    positionProjection += 1
-                                previousTransaction.prefixUtility += projectedTransaction.prefixUtility
-                                sumUtilities = previousTransaction.prefixUtility
-                                previousTransaction = _Transaction(items, utilities, previousTransaction.transactionUtility + projectedTransaction.transactionUtility)
-                                previousTransaction.prefixUtility = sumUtilities
-                            else:
-                                positionPrevious = 0
-                                positionProjected = projectedTransaction.offset
-                                itemsCount = len(previousTransaction.items)
-                                while positionPrevious < itemsCount:
-                                    previousTransaction.utilities[positionPrevious] += projectedTransaction.utilities[
-                                        positionProjected]
-                                    positionPrevious += 1
-                                    positionProjected += 1
-                                previousTransaction.transactionUtility += projectedTransaction.transactionUtility
-                                previousTransaction.prefixUtility += projectedTransaction.prefixUtility
-                            consecutiveMergeCount += 1
-                        else:
-                            transactionsPe.append(previousTransaction)
-                            previousTransaction = projectedTransaction
-                            consecutiveMergeCount = 0
-                    transaction.offset = positionE
-            if previousTransaction != transactionsOfP[0]:
-                transactionsPe.append(previousTransaction)
+            utilityPe, _, transactionsPe = _up.project(transactionsOfP, e, _Transaction)
             self._temp[prefixLength] = self._newNamesToOldNames[e]
             utility_ratio_pe = float(utilityPe / utilitySumPe)
             if (utilityPe >= self._minUtil) and (utility_ratio_pe * 100 >= self._minUR):
@@ -656,32 +580,6 @@ class RHUIM(_ab._utilityPatterns):
                 s1 += "\t"
         self._finalPatterns[s1] = [utility, utilityRatio]
 
-    def _isEqual(self, transaction1: _Transaction, transaction2: _Transaction) -> bool:
-        """
-         A method to Check if two transaction are identical
-
-         :Attributes:
-
-         :param  transaction1: the first transaction.
-         :type  transaction1: Transaction
-         :param  transaction2:   The second transaction.
-         :type  transaction2: Transaction
-         :return : whether both are identical or not
-         :rtype: bool
-        """
-        length1 = len(transaction1.items) - transaction1.offset
-        length2 = len(transaction2.items) - transaction2.offset
-        if length1 != length2:
-            return False
-        position1 = transaction1.offset
-        position2 = transaction2.offset
-        while position1 < len(transaction1.items):
-            if transaction1.items[position1] != transaction2.items[position2]:
-                return False
-            position1 += 1
-            position2 += 1
-        return True
-
     def _useUtilityBinArrayToCalculateSubtreeUtilityFirstTime(self, dataset: _Dataset) -> None:
         """
         Scan the initial database to calculate the subtree utility of each item using a utility-bin array
@@ -706,62 +604,6 @@ class RHUIM(_ab._utilityPatterns):
                     self._utilityBinArraySU[item] = sumSU
                 i -= 1
 
-    def sortDatabase(self, transactions: list) -> None:
-        """
-        A Method to sort transaction
-
-        :Attributes:
-
-        :param transactions: transaction of items
-        :type transactions: list
-        :return: sorted transactions.
-        :rtype: Transactions or list
-        """
-        cmp_items = _ab._functools.cmp_to_key(self.sort_transaction)
-        transactions.sort(key=cmp_items)
-
-    def sort_transaction(self, trans1: _Transaction, trans2: _Transaction) -> int:
-        """
-        A Method to sort transaction
-
-        :Attributes:
-
-        :param trans1: the first transaction .
-        :type trans1: Transaction
-        :param trans2:the second transaction.
-        :type trans2: Transaction
-        :return: sorted transaction.
-        :rtype:   Transaction
-        """
-        trans1_items = trans1.getItems()
-        trans2_items = trans2.getItems()
-        pos1 = len(trans1_items) - 1
-        pos2 = len(trans2_items) - 1
-        if len(trans1_items) < len(trans2_items):
-            while pos1 >= 0:
-                sub = trans2_items[pos2] - trans1_items[pos1]
-                if sub != 0:
-                    return sub
-                pos1 -= 1
-                pos2 -= 1
-            return -1
-        elif len(trans1_items) > len(trans2_items):
-            while pos2 >= 0:
-                sub = trans2_items[pos2] - trans1_items[pos1]
-                if sub != 0:
-                    return sub
-                pos1 -= 1
-                pos2 -= 1
-            return 1
-        else:
-            while pos2 >= 0:
-                sub = trans2_items[pos2] - trans1_items[pos1]
-                if sub != 0:
-                    return sub
-                pos1 -= 1
-                pos2 -= 1
-            return 0
-
     def _useUtilityBinArrayToCalculateLocalUtilityFirstTime(self, dataset: _Dataset) -> None:
         """
         A method to calculate local utility of single itemSets
@@ -58,80 +58,13 @@ import os
 import time
 import mmap
 import psutil
-import cupy as cp
 import numpy as np
 
-from PAMI.relativeHighUtilitytPattern.basic import abstract as _ab
+from PAMI.relativeHighUtilityPattern.basic import abstract as _ab
+from PAMI.extras import utilitySearchBackend as _usb
 import pandas as pd
 from deprecated import deprecated
 
-searchGPU = cp.RawKernel(r'''
-
-#define uint32_t unsigned int
-
-extern "C" __global__
-void searchGPU(uint32_t *items, uint32_t *utils, uint32_t *indexesStart, uint32_t *indexesEnd, uint32_t numTransactions,
-                uint32_t *candidates, uint32_t candidateSize, uint32_t numCandidates,
-                uint32_t *candidateCost, uint32_t *candidateLocalUtil, uint32_t *candidateSubtreeUtil,
-                uint32_t *secondaryReference, uint32_t *secondaries, uint32_t numSecondaries)
-{
-
-    uint32_t tid = blockDim.x * blockIdx.x + threadIdx.x;
-    if (tid >= numTransactions) return;
-    uint32_t *cands = new uint32_t[candidateSize];
-
-    uint32_t start = indexesStart[tid];
-    uint32_t end = indexesEnd[tid];
-
-    for (uint32_t i = 0; i < numCandidates; i++) {
-        for (uint32_t j = 0; j < candidateSize; j++) {
-            cands[j] = candidates[i * candidateSize + j];
-        }
-
-        uint32_t found = 0;
-        uint32_t foundCost = 0;
-        uint32_t foundLoc = 0;
-
-        for (uint32_t j = start; j < end; j++)
-        {
-            if (items[j] == cands[found])
-            {
-                found++;
-                foundCost += utils[j];
-                foundLoc = j;
-            }
-        }
-
-        if (found != candidateSize) continue;
-
-        atomicAdd(&candidateCost[i], foundCost);
-
-        for (uint32_t j = foundLoc + 1; j < end; j++)
-        {
-            if (secondaries[secondaryReference[i] * numSecondaries + items[j]])
-            {
-                foundCost += utils[j];
-            }
-        }
-
-        uint32_t temp = 0;
-        for (uint32_t j = foundLoc + 1; j < end; j++)
-        {
-            if (secondaries[secondaryReference[i] * numSecondaries + items[j]])
-            {
-                atomicAdd(&candidateLocalUtil[i * numSecondaries + items[j]], foundCost);
-                atomicAdd(&candidateSubtreeUtil[i * numSecondaries + items[j]], foundCost - temp);
-                temp += utils[j];
-            }
-        }
-    }
-
-    delete[] cands;
-
-}
-
-''', 'searchGPU')
-
 class GPUEFIM:
 
     """
@@ -151,6 +84,8 @@ class GPUEFIM:
                    This variable is used to distinguish items from one another in a transaction. The default seperator is tab space. However, the users can override their default separator.
     :param  minUtil: int :
                    The minimum utility threshold.
+    :param  backend: str :
+                   'cupy' runs the candidate search as a CUDA kernel, 'numpy' runs the same search on the CPU and 'auto', the default, uses cupy only when a CUDA device is available.
 
 
 
@@ -160,7 +95,7 @@ class GPUEFIM:
         inputFile (str): The input file path.
         minUtil (int): The minimum utility threshold.
         sep (str): The separator used in the input file.
-        threads (int): The number of threads to use.
+        backend (str): The search backend, 'auto', 'numpy' or 'cupy'.
         Patterns (dict): A dictionary containing the discovered patterns.
         rename (dict): A dictionary containing the mapping between the item IDs and their names.
         runtime (float): The runtime of the algorithm in seconds.
@@ -182,10 +117,11 @@ class GPUEFIM:
     """
 
 
-    def __init__(self, inputFile, minUtil, ratio, sep = '\t'):
+    def __init__(self, inputFile, minUtil, ratio, sep = '\t', backend='auto'):
         self.inputFile = inputFile
         self.minUtil = minUtil
         self.sep = sep
+        self.backend = backend
         self.Patterns = {}
         self.rename = {}
         self.ratio = ratio
@@ -242,6 +178,8 @@ class GPUEFIM:
         # Filter and sort transactions
         subtree = {}
         filtered_transactions = {}
+        # utility of every single item, the denominator of the ratio of an itemset
+        self._singleUtil = {}
 
         for col in file_data:
             zipped = zip(col[0], col[1])
@@ -268,6 +206,7 @@ class GPUEFIM:
                     else:
                         subtree[item] += subUtil - temp
                     temp += val[i]
+                    self._singleUtil[item] = self._singleUtil.get(item, 0) + val[i]
 
         indexesStart = [0]
         indexesEnd = []
@@ -286,10 +225,7 @@ class GPUEFIM:
 
         indexesStart.pop()
 
-        self.items = cp.array(items, dtype=np.uint32)
-        self.utils = cp.array(utils, dtype=np.uint32)
-        self.indexesStart = cp.array(indexesStart, dtype=np.uint32)
-        self.indexesEnd = cp.array(indexesEnd, dtype=np.uint32)
+        self._searchBackend = _usb.searchBackend(self.backend, items, utils, indexesStart, indexesEnd)
 
         primary = [key for key in subtree.keys() if subtree[key] >= self.minUtil]
 
@@ -310,8 +246,6 @@ class GPUEFIM:
             collections (list): The collections to search in.
         """
 
-        storeAll = {}
-
         while len(collection) > 0:
             candidates = []
             secondaryReference = []
@@ -332,81 +266,36 @@ class GPUEFIM:
             numCandidates = len(candidates)
             # print("Candidates: ", numCandidates)
 
-            # flatten candidates
-            candidates = [item for sublist in candidates for item in sublist]
-            candidates = cp.array(candidates, dtype=np.uint32)
-
-            # print(secondaries)
-            secondaries = cp.array(secondaries, dtype=np.uint32)
-            secondaryReference = cp.array(secondaryReference, dtype=np.uint32)
-
-            costs = cp.zeros(numCandidates, dtype=np.uint32)
-            localUtil = cp.zeros(numCandidates * self.secondaryLen, dtype=np.uint32)
-            subtreeUtil = cp.zeros(numCandidates * self.secondaryLen, dtype=np.uint32)
-
-            # items, utils, indexesStart, indexesEnd, numTransactions
-            # candidates, candidateSize, numCandidates,
-            # candidateCost, candidateLocalUtil, candidateSubtreeUtil, 
-            # secondaryReference, secondaries, numSecondaries
-
-            numOfThreads = 32
-            numOfBlocks = self.numTransactions // numOfThreads + 1
-
-            searchGPU((numOfBlocks,), (numOfThreads,), 
-                    (self.items, self.utils, self.indexesStart, self.indexesEnd, self.numTransactions,
-                        candidates, candidateSize, numCandidates,  
-                        costs, localUtil, subtreeUtil,
-                        secondaryReference, secondaries, self.secondaryLen))
-            cp.cuda.runtime.deviceSynchronize()
-
-            # get results from GPU
-            candidates = candidates.get()
-            costs = costs.get()
-            localUtil = localUtil.get()
-            subtreeUtil = subtreeUtil.get()
-
-            # resize candidates
-            candidates = np.resize(candidates, (numCandidates, candidateSize))
-            localUtil = np.resize(localUtil, (numCandidates, self.secondaryLen))
-            subtreeUtil = np.resize(subtreeUtil, (numCandidates, self.secondaryLen))
+            candidates = np.array(candidates, dtype=np.int64).reshape(numCandidates, candidateSize)
+            costs, localUtil, subtreeUtil = self._searchBackend.search(candidates, secondaryReference, secondaries,
+                                                                       self.secondaryLen)
 
             newCollections = []
             #  collection = [[[], primary, secondary]]  
 
             for i in range(numCandidates):
-                if len(candidates[i]) == 1:
-                  storeAll[tuple(candidates[i])] = costs[i]
+                candidate = tuple(candidates[i].tolist())
+                cost = int(costs[i])
 
                 # print(candidates[i], costs[i], subtreeUtil[i], localUtil[i])
-                if costs[i] >= self.minUtil:
-                    if len(candidates[i]) == 1:
-                      self.Patterns[tuple(candidates[i])] = [costs[i],1]
+                if cost >= self.minUtil:
+                    if len(candidate) == 1:
+                      self.Patterns[candidate] = [cost,1]
                     else:
                       tcos = 0
-                      for x in candidates[i]:
-                        tcos += storeAll[tuple([x])]
-                      ratio = costs[i] / tcos
+                      for x in candidate:
+                        tcos += self._singleUtil[x]
+                      ratio = cost / tcos
                       if ratio >= self.ratio:
-                        self.Patterns[tuple(candidates[i])] = [costs[i],ratio]
-                        
-                
-                newSubtreeUtil = []
-                newLocalUtil = []
+                        self.Patterns[candidate] = [cost,ratio]
 
-                for j in range(len(subtreeUtil[i])):
-                    if subtreeUtil[i][j] >= self.minUtil:
-                        newSubtreeUtil.append(j)
+                newSubtreeUtil = np.flatnonzero(subtreeUtil[i] >= self.minUtil).tolist()
                 if len(newSubtreeUtil) > 0:
-                    for j in range(len(localUtil[i])):
-                        if localUtil[i][j] >= self.minUtil:
-                            newLocalUtil.append(1)
-                        else:
-                            newLocalUtil.append(0)
+                    newLocalUtil = (localUtil[i] >= self.minUtil).astype(np.uint32).tolist()
 
                     # print(candidates[i], newSubtreeUtil, newLocalUtil)
-                    newCollections.append([list(candidates[i]), newSubtreeUtil, newLocalUtil])
-                    # print()
-                
+                    newCollections.append([list(candidate), newSubtreeUtil, newLocalUtil])
+
             collection = newCollections
 
 
@@ -14,7 +14,11 @@
 #      You should have received a copy of the GNU General Public License
 #      along with this program.  If not, see <https://www.gnu.org/licenses/>.
 from PAMI.sequentialPattern.basic import abstract as _ab
+from PAMI.extras import sequenceConstraints as _sc
+from array import array as _array
+from itertools import groupby as _groupby
 import sys
+import warnings as _warnings
 sys.setrecursionlimit(10000)
 
 class PrefixSpan(_ab._sequentialPatterns):
@@ -51,11 +55,20 @@ class PrefixSpan(_ab._sequentialPatterns):
                 To store the total amount of RSS memory consumed by the program
             Database : list
                 To store the transactions of a database in list
-            maxLength:int
-                to store the maximum length of sequence pattern
+            maxLen:int
+                the maximum number of itemsets of a sequence pattern
+            maxlen:int
+                deprecated alias of maxLen
             maxGap   :int
-                to store the maximum gap of sequence pattern
-                gap means the length of interval between two itemsets
+                consecutive itemsets of an occurrence of a pattern are less than maxGap itemsets apart
+            minGap   :int
+                consecutive itemsets of an occurrence of a pattern are at least minGap itemsets apart
+            maxWindow:int
+                the last itemset of an occurrence of a pattern is less than maxWindow itemsets after its first one
+            requiredItems:list
+                the items every sequence pattern holds
+            constraints:sequenceConstraints
+                the above constraints, evaluated while the projected databases are built
             seqSep   :str
                 separator to separate each itemset
 
@@ -121,8 +134,14 @@ class PrefixSpan(_ab._sequentialPatterns):
         --------
             The complete program was written by Suzuki Shota under the supervision of Professor Rage Uday Kiran.
     """
-    def __init__(self,iFile, minSup, sep="\t",maxlen=float("inf"),maxGap=float("inf"),sepSeq="-1"):
+    def __init__(self,iFile, minSup, sep="\t",maxLen=float("inf"),maxGap=float("inf"),sepSeq="-1",minGap=1,
+                 maxWindow=float("inf"),requiredItems=None,maxlen=None):
         super().__init__( iFile, minSup, sep,sepSeq)
+        if maxlen is not None:
+            _warnings.warn("It is recommended to use 'maxLen' instead of 'maxlen', the name used by the other "
+                           "sequential miners. 'maxlen' will be removed in a future release.", DeprecationWarning,
+                           stacklevel=2)
+            maxLen = maxlen
 
 
         self._startTime = float()
@@ -133,8 +152,8 @@ class PrefixSpan(_ab._sequentialPatterns):
         self._memoryRSS = float()
         self._Database = []
         self._sepDatabase={}
-        self._maxLength=maxlen
-        self._maxGap=maxGap
+        self._constraints = _sc.sequenceConstraints(maxGap=maxGap, minGap=minGap, maxWindow=maxWindow, maxLen=maxLen,
+                                                    requiredItems=requiredItems)
     def _creatingItemSets(self):
         """
             Storing the complete transactions of the database/input file in a database variable
@@ -202,264 +221,215 @@ class PrefixSpan(_ab._sequentialPatterns):
             else:
                 value = int(value)
         return value
-    def makeNext(self,sepDatabase,startrow):
+    def _internDatabase(self):
         """
-         To get next pattern by adding head word to next sequence of startrow
-        :param sepDatabase: dict
-            what words and rows startrow have to add it
-        :param startrow:
-            the patterns get before
+        To intern the items of the frequent 1-sequences and lay the database out in flat arrays. Items are numbered in
+        their sorted order, so the items of an itemset stay sorted by number, and infrequent items are dropped while
+        their itemsets are kept, so itemset positions are those of the input sequences. Sequences lacking a required
+        item are emptied before anything is counted.
         """
-        for head in sepDatabase.keys():
-            newrow=[i for i in startrow]
-
-            if len(sepDatabase[head])>=self._minSup:
-                if newrow!=[]:
-                    newrow.append(self._sepSeq)
-                newrow.append(head)
-                newrow.append(self._sepSeq)
-                if str(newrow) not in self._finalPatterns:
-                    self._finalPatterns[str(newrow)]=len(sepDatabase[head])
-                    give = []
-                    give.append(head)
-                    sepDatabase[head] = self.makeSupDatabase(sepDatabase[head], give)
-                    newrow.pop()
-                    self.makeSeqDatabaseSame(sepDatabase[head], newrow)
-                elif len(sepDatabase[head]) > self._finalPatterns[str(newrow)]:
-                    self._finalPatterns[str(newrow)] = len(sepDatabase[head])
-                    give = []
-                    give.append(head)
-                    sepDatabase[head] = self.makeSupDatabase(sepDatabase[head], give)
-                    newrow.pop()
-                    self.makeSeqDatabaseSame(sepDatabase[head], newrow)
-
-
-
-    def makeSupDatabase(self,database,head):
+        self._Database = [line if self._constraints.accepts(line) else [] for line in self._Database]
+        support = {}
+        for line in self._Database:
+            for item in set(line):
+                if item != self._sepSeq:
+                    support[item] = support.get(item, 0) + 1
+        self._itemNames = sorted(item for item, count in support.items() if count >= self._minSup)
+        self._oneSupports = [support[item] for item in self._itemNames]
+        rank = {item: number for number, item in enumerate(self._itemNames)}
+        self._items = _array('i')
+        self._elementOf = _array('i')
+        self._elementOffsets = _array('l', [0])
+        self._sequenceElements = _array('l', [0])
+        for line in self._Database:
+            element = []
+            for item in line:
+                if item != self._sepSeq:
+                    number = rank.get(item)
+                    if number is not None:
+                        element.append(number)
+                    continue
+                for number in sorted(set(element)):
+                    self._items.append(number)
+                    self._elementOf.append(len(self._elementOffsets) - 1)
+                self._elementOffsets.append(len(self._items))
+                element = []
+            self._sequenceElements.append(len(self._elementOffsets) - 1)
+
+    def _project(self, projected, lastItemSet):
         """
-         To delete not frequent words without words in latest sequence
-        :param database: list
-            database of lines have same startrow and head word
-        :param head:list
-         words in latest sequence
-        :return: changed database
-
+        To count the extensions of a prefix over its pseudo-projected database and to build their projections. An
+        entry (sid, offset) of a projection is the position, in the flat item array, of the last item of an occurrence
+        of the prefix in sequence sid. Without constraints on the occurrences, the first occurrence of every sequence
+        is enough: the itemset extensions are also looked for in the later itemsets holding the whole last itemset of
+        the prefix. Every item counts a sequence once through its entry in the last-seen arrays.
+
+        :param projected: the (sid, offset) entries of the prefix, in increasing order
+        :type projected: list
+        :param lastItemSet: the items of the last itemset of the prefix
+        :type lastItemSet: list
+        :return: the projections of the itemset extensions and of the sequence extensions, keyed by item
+        :rtype: tuple
         """
-
-        supDatabase={}
-        alreadyInData=[]
-        newDatabase = []
-        for line in database:
-            alreadyInLine = []
-            for data in line:
-                    if data not in alreadyInLine:
-                        if data not in alreadyInData:
-                            supDatabase[data]=1
-                            alreadyInData.append(data)
-                        else:
-                            supDatabase[data]+=1
-                        alreadyInLine.append(data)
-        for line in database:
-                newLine=[]
-                for i in line:
-                    if supDatabase[i]>=self._minSup or i in head:
-                        if len(newLine)>1:
-                            if (newLine[-1]!=self._sepSeq or i!=self._sepSeq):
-                                newLine.append(i)
-                        else:
-                            newLine.append(i)
-                newDatabase.append(newLine)
-
-        return newDatabase
-
-    def makeNextSame(self,sepDatabase,startrow):
+        items, elementOf, elementOffsets = self._items, self._elementOf, self._elementOffsets
+        iSeen, sSeen = self._iSeen, self._sSeen
+        extendSequence = self._constraints.extends(len(self._pattern))
+        iProjected, sProjected = {}, {}
+        stamp = self._stamp
+        for sid, offset in projected:
+            stamp += 1
+            element = elementOf[offset]
+            end = elementOffsets[element + 1]
+            for position in range(offset + 1, end):
+                item = items[position]
+                iSeen[item] = stamp
+                iProjected.setdefault(item, []).append((sid, position))
+            last = self._sequenceElements[sid + 1]
+            for later in range(element + 1, last):
+                start, stop = elementOffsets[later], elementOffsets[later + 1]
+                row = items[start:stop]
+                if lastItemSet[-1] not in row or not all(item in row for item in lastItemSet):
+                    continue
+                for position in range(start + row.index(lastItemSet[-1]) + 1, stop):
+                    item = items[position]
+                    if iSeen[item] != stamp:
+                        iSeen[item] = stamp
+                        iProjected.setdefault(item, []).append((sid, position))
+            if not extendSequence:
+                continue
+            for position in range(end, elementOffsets[last]):
+                item = items[position]
+                if sSeen[item] != stamp:
+                    sSeen[item] = stamp
+                    sProjected.setdefault(item, []).append((sid, position))
+        self._stamp = stamp
+        return iProjected, sProjected
+
+    def _projectConstrained(self, projected):
         """
-         To get next pattern by adding head word to latest sequence of startrow
-        :param sepDatabase: dict
-            what words and rows startrow have to add it
-        :param startrow:
-            the patterns get before
+        To build the projections of the extensions of a prefix under gap or window constraints. An entry (sid, offset,
+        start) also holds the first itemset of the occurrence, and every occurrence is kept, as a later one may allow
+        an extension an earlier one does not. The itemset extensions are looked for in the itemset of every entry, and
+        the sequence extensions only in the itemsets the constraints allow after it, so infeasible occurrences never
+        enter a projection. An item position reached from several entries keeps the latest start, which leaves the
+        widest window to its extensions.
+
+        :param projected: the (sid, offset, start) entries of the prefix, in increasing order
+        :type projected: list
+        :return: the projections of the itemset extensions and of the sequence extensions, keyed by item
+        :rtype: tuple
         """
-        for head in sepDatabase.keys():
-
-            if len(sepDatabase[head])>=self._minSup:
-                newrow = startrow.copy()
-                newrow.append(head)
-                newrow.append(self._sepSeq)
-                if str(newrow) not in self._finalPatterns.keys():
-                    self._finalPatterns[str(newrow)]=len(sepDatabase[head])
-                    if self._sepSeq in startrow:
-                        give = self.getSameSeq(startrow)
-                    else:
-                        give = startrow.copy()
-                    give.append(head)
-                    sepDatabase[head] = self.makeSupDatabase(sepDatabase[head], give)
-                    newrow.pop()
-                    self.makeSeqDatabaseSame(sepDatabase[head], newrow)
-                elif len(sepDatabase[head])>self._finalPatterns[str(newrow)]:
-                    self._finalPatterns[str(newrow)] = len(sepDatabase[head])
-                    if self._sepSeq in startrow:
-                        give = self.getSameSeq(startrow)
-                    else:
-                        give = startrow.copy()
-                    give.append(head)
-                    sepDatabase[head] = self.makeSupDatabase(sepDatabase[head], give)
-                    newrow.pop()
-                    self.makeSeqDatabaseSame(sepDatabase[head], newrow)
-
-
-
-
-
-
-
+        items, elementOf, elementOffsets = self._items, self._elementOf, self._elementOffsets
+        extendSequence = self._constraints.extends(len(self._pattern))
+        iProjected, sProjected = {}, {}
+        for sid, entries in _groupby(projected, key=lambda entry: entry[0]):
+            reached = {}
+            last = self._sequenceElements[sid + 1]
+            for _, offset, start in entries:
+                element = elementOf[offset]
+                for position in range(offset + 1, elementOffsets[element + 1]):
+                    iProjected.setdefault(items[position], []).append((sid, position, start))
+                if not extendSequence:
+                    continue
+                for later in self._constraints.nextElements(element, start, last):
+                    for position in range(elementOffsets[later], elementOffsets[later + 1]):
+                        if reached.get(position, -1) < start:
+                            reached[position] = start
+            for position in sorted(reached):
+                sProjected.setdefault(items[position], []).append((sid, position, reached[position]))
+        return iProjected, sProjected
+
+    def _expand(self, projected, lastItemSet):
+        """
+        To record the frequent extensions of the prefix held in self._pattern and to mine them depth first
 
-    def makeSeqDatabaseFirst(self,database):
+        :param projected: the (sid, offset) entries of the prefix, or its (sid, offset, start) entries under gap or
+            window constraints
+        :type projected: list
+        :param lastItemSet: the items of the last itemset of the prefix
+        :type lastItemSet: list
         """
-        To make 1 length sequence dataset list which start from same word. It was stored only 1 from 1 line.
-        :param database:
-                To store the transactions of a database in list
+        if self._constraints.constrainsOccurrences:
+            iProjected, sProjected = self._projectConstrained(projected)
+        else:
+            iProjected, sProjected = self._project(projected, lastItemSet)
+        for item, entries in sorted(iProjected.items()):
+            support = self._support(entries)
+            if support < self._minSup:
+                continue
+            lastItemSet.append(item)
+            self._record(support)
+            self._expand(entries, lastItemSet)
+            lastItemSet.pop()
+        for item, entries in sorted(sProjected.items()):
+            support = self._support(entries)
+            if support < self._minSup:
+                continue
+            self._pattern.append([item])
+            self._record(support)
+            self._expand(entries, self._pattern[-1])
+            self._pattern.pop()
+
+    def _support(self, entries):
         """
-        startrow=[]
-        seqDatabase={}
-
-        for line in database:
-            alreadyInLine=[]
-            for data in range(len(line)):
-                if line[data] not in alreadyInLine and line[data]!=self._sepSeq:
-                    if line[data] not in seqDatabase.keys():
-                        seqDatabase[line[data]]=[]
-                        seqDatabase[line[data]].append(line[data+1:])
-                        alreadyInLine.append(line[data])
-                    else:
-                        seqDatabase[line[data]].append(line[data+1:])
-                        alreadyInLine.append(line[data])
-
-        if len(seqDatabase)>0:
-            self.makeNext(seqDatabase,startrow)
-
-    def serchSame(self,database,startrow,give):
+        :param entries: the entries of a projection, grouped by sid
+        :type entries: list
+        :return: the number of sequences of the projection
+        :rtype: int
         """
-         To get 2 or more length patterns in same sequence.
-        :param database: list
-            To store the transactions of a database in list which have same startrow and head word
-        :param startrow: list
-            the patterns get before
-        :param give: list
-            the word in latest sequence of startrow
-        :return:
+        if not self._constraints.constrainsOccurrences:
+            return len(entries)
+        return sum(1 for _ in _groupby(entries, key=lambda entry: entry[0]))
+
+    def _record(self, support):
         """
-        sepDatabaseSame={}
-        sepDatabaseSame[startrow[-1]]=[]
-        for line in database:
-            addLine=0
-            i=0
-            if len(line)>1:
-                while line[i]!=self._sepSeq:
-                    if line[i]==startrow[-1]:
-                        sepDatabaseSame[startrow[-1]].append(line[i+1:])
-                        addLine=1
-                        break
-                    i+=1
-                if addLine!=1:
-                    ok=[]
-                    while i <len(line):
-                        if line[i]==self._sepSeq:
-                            ok=[]
-                        elif line[i]==startrow[-1]:
-                            ok.append("sk1")
-                        for x in give:
-                            if x==line[i]:
-                                ok.append(x)
-                        if len(ok)==1+len(give):
-                            sepDatabaseSame[startrow[-1]].append(line[i+1:])
-                            break
-                        i+=1
-        startrow2=[startrow[0]]
-        startrow.append(self._sepSeq)
-        if str(startrow) not in self._finalPatterns.keys():
-                self.makeNextSame(sepDatabaseSame,startrow2)
-        elif self._finalPatterns[str(startrow)]<len(sepDatabaseSame[startrow[-2]]):
-            self.makeNextSame(sepDatabaseSame,startrow2)
-        return sepDatabaseSame[startrow[-2]]
-
-    def getSameSeq(self,startrow):
+        To store the prefix held in self._pattern with its support, in the format of the former str(newrow) keys, when
+        it holds every required item
+
+        :param support: the number of sequences holding the prefix
+        :type support: int
         """
-         To get words in latest sequence
-        :param startrow:
-         the patterns get before
-        :return:
+        row = []
+        for itemSet in self._pattern:
+            row.extend(self._itemNames[item] for item in itemSet)
+            row.append(self._sepSeq)
+        if self._constraints.accepts(row):
+            self._finalPatterns[str(row)] = support
+
+    def _projectItems(self):
         """
-        give = []
-        newrow = startrow.copy()
-        while newrow[-1] != self._sepSeq:
-            y = newrow.pop()
-            give.append(y)
-        return give
-
+        To make the pseudo-projected database of every frequent item, every item starting with its first occurrence in
+        every sequence, or with all of them, each one starting an occurrence, under gap or window constraints
 
-    def makeSeqDatabaseSame(self,database,startrow):
+        :return: the (sid, offset) or (sid, offset, start) entries of every item
+        :rtype: list
         """
-            To make sequence dataset list which start from same word(head). It was stored only 1 from 1 line.
-            And it separated by having head in latest sequence of startrow or not.
-
-            :param database:
-                    To store the transactions of a database in list
-            :param startrow: list
-                    the patterns get before
-
-            """
-        seqDatabase={}
-        seqDatabaseSame={}
-        seqLength=startrow.count(self._sepSeq)+1
-        for line in database:
-            if len(line)>1:
-                alreadyInLine=[]
-                i = 0
-                while line[i] != self._sepSeq:
-                        if line[i] not in seqDatabaseSame:
-                            if self._sepSeq in startrow:
-                                give=self.getSameSeq(startrow)
-                            else:
-                                give=startrow.copy()
-                            newrow= [startrow[-1], line[i]]
-                            seqDatabaseSame[line[i]] = self.serchSame(database, newrow,give)
-
-                        i += 1
-                same=0
-                seqCount=0
-                if self._maxLength>seqLength:
-                    while len(line)>i and self._maxGap>seqCount:
-                        if line[i]!=self._sepSeq:
-                            if line[i] not in alreadyInLine:
-                                if line[i] not in seqDatabase:
-                                    seqDatabase[line[i]]=[]
-                                seqDatabase[line[i]].append(line[i + 1:])
-                                alreadyInLine.append(line[i])
-                            if line[i]==startrow[-1]:
-                                same=1
-
-
-                            elif same==1 and line[i] not in seqDatabaseSame:
-                                if self._sepSeq in startrow:
-                                    give=self.getSameSeq(startrow)
-                                else:
-                                    give=startrow.copy()
-                                newrow= [startrow[-1], line[i]]
-                                seqDatabaseSame[line[i]] = self.serchSame(database, newrow,give)
-
-                        else:
-                            same=0
-                            seqCount+=1
-                        i+=1
-
-
-        if len(seqDatabase)!=0:
-            self.makeNext(seqDatabase,startrow)
-        if len(seqDatabaseSame)!=0:
-            self.makeNextSame(seqDatabaseSame,startrow)
-
-
+        self._iSeen = [0] * len(self._itemNames)
+        self._sSeen = [0] * len(self._itemNames)
+        self._stamp = 0
+        firstProjected = [[] for _ in self._itemNames]
+        allOccurrences = self._constraints.constrainsOccurrences
+        for sid in range(len(self._sequenceElements) - 1):
+            start = self._elementOffsets[self._sequenceElements[sid]]
+            stop = self._elementOffsets[self._sequenceElements[sid + 1]]
+            self._stamp += 1
+            for position in range(start, stop):
+                item = self._items[position]
+                if allOccurrences:
+                    firstProjected[item].append((sid, position, self._elementOf[position]))
+                elif self._iSeen[item] != self._stamp:
+                    self._iSeen[item] = self._stamp
+                    firstProjected[item].append((sid, position))
+        return firstProjected
+
+    def _mineFrequentSequences(self):
+        """
+        To mine the frequent sequences depth first from the frequent items
+        """
+        for item, entries in enumerate(self._projectItems()):
+            self._pattern = [[item]]
+            self._record(self._oneSupports[item])
+            self._expand(entries, self._pattern[-1])
 
     def startMine(self):
         """
@@ -468,11 +438,9 @@ class PrefixSpan(_ab._sequentialPatterns):
         self._Database = []
         self._startTime = _ab._time.time()
         self._creatingItemSets()
-        self._Database=self.makeSupDatabase(self._Database,"")
         self._minSup = self._convert(self._minSup)
-        print(_ab._time.time()-self._startTime)
-        print(_ab._time.time()-self._startTime)
-        self.makeSeqDatabaseFirst(self._Database)
+        self._internDatabase()
+        self._mineFrequentSequences()
         self._endTime = _ab._time.time()
         process = _ab._psutil.Process(_ab._os.getpid())
         self._memoryUSS = float()
@@ -59,9 +59,28 @@ import pandas as pd
 from deprecated import deprecated
 
 from PAMI.sequentialPattern.basic import abstract as _ab
+from PAMI.extras import sequenceConstraints as _sc
+import numpy as _np
 
 _ab._sys.setrecursionlimit(10000)
 
+_idListType = _np.dtype([('sid', _np.int32), ('eid', _np.int32)])
+
+_chunkPairs = 1 << 22
+
+
+def _pairsWithin(starts, sizes):
+    """
+    :param starts: first row of every group
+    :param sizes: number of rows of every group
+    :return: the rows of every ordered pair of rows of a same group, a row being paired with itself too
+    """
+    counts = sizes.astype(_np.int64) ** 2
+    group = _np.repeat(_np.arange(len(sizes)), counts)
+    local = _np.arange(counts.sum()) - _np.repeat(_np.cumsum(counts) - counts, counts)
+    return starts[group] + local // sizes[group], starts[group] + local % sizes[group]
+
+
 class SPADE(_ab._sequentialPatterns):
     """
     :Description:
@@ -81,6 +100,16 @@ class SPADE(_ab._sequentialPatterns):
                     Example: minSup=10 will be treated as integer, while minSup=10.0 will be treated as float
     :param  sep: str :
                    This variable is used to distinguish items from one another in a transaction. The default seperator is tab space. However, the users can override their default separator.
+    :param  maxGap: int :
+                   Consecutive itemsets of an occurrence of a pattern are less than maxGap itemsets apart
+    :param  minGap: int :
+                   Consecutive itemsets of an occurrence of a pattern are at least minGap itemsets apart
+    :param  maxWindow: int :
+                   The last itemset of an occurrence of a pattern is less than maxWindow itemsets after its first one
+    :param  maxLen: int :
+                   The maximum number of itemsets of a pattern
+    :param  requiredItems: list :
+                   The items every pattern holds
 
     :Attributes:
 
@@ -108,10 +137,14 @@ class SPADE(_ab._sequentialPatterns):
                 To store the total amount of RSS memory consumed by the program
             Database : list
                 To store the transactions of a database in list
-            _xLenDatabase: dict
-                To store the datas in different sequence separated by sequence, rownumber, length.
-            _xLenDatabaseSame : dict
-                To store the datas in same sequence separated by sequence, rownumber, length.
+            _idLists: list
+                To store the id-list of every frequent item as a structured array of (sid, eid) pairs
+            _sequenceMatrix : numpy.ndarray
+                To store the support of every 2 length pattern whose items are in different itemsets
+            _itemSetMatrix : numpy.ndarray
+                To store the support of every 2 length pattern whose items are in the same itemset
+            _constraints : sequenceConstraints
+                The gap, window, length and item constraints, evaluated in the joins
             _seqSep   :str
                 separator to separate each itemset
 
@@ -200,8 +233,15 @@ class SPADE(_ab._sequentialPatterns):
     _memoryUSS = float()
     _memoryRSS = float()
     _Database = []
-    _xLenDatabase={}
-    _xLenDatabaseSame = {}
+    _itemNames = []
+    _idLists = []
+
+    def __init__(self, iFile, minSup, sep="\t", sepSeq="-1", maxGap=float("inf"), minGap=1, maxWindow=float("inf"),
+                 maxLen=float("inf"), requiredItems=None):
+        super().__init__(iFile, minSup, sep, sepSeq)
+        self._constraints = _sc.sequenceConstraints(maxGap=maxGap, minGap=minGap, maxWindow=maxWindow, maxLen=maxLen,
+                                                    requiredItems=requiredItems)
+
     def _creatingItemSets(self):
         """
         Storing the complete transactions of the database/input file in a database variable
@@ -282,460 +322,238 @@ class SPADE(_ab._sequentialPatterns):
 
     def make1LenDatabase(self):
         """
-        To make 1 length frequent patterns by breadth-first search technique   and update Database to sequential database
-        """
-
-        idDatabase={}
-        alreadyInData=[]
-        lineNumber=0
-        alreadyInLine={}
-        for line in self._Database:
-            seqNumber=0
-            for seq in line:
-
-                for data in seq:
-                    if data in alreadyInData:
-                        if lineNumber in alreadyInLine[data]:
-                            idDatabase[data][lineNumber].append(seqNumber)
-                        else:
-                            idDatabase[data][lineNumber] = []
-                            idDatabase[data][lineNumber].append(seqNumber)
-                            alreadyInLine[data].append(lineNumber)
-                    else:
-                        idDatabase[data]={}
-                        idDatabase[data][lineNumber]=[]
-                        idDatabase[data][lineNumber].append(seqNumber)
-                        alreadyInData.append(data)
-                        alreadyInLine[data]=[]
-                        alreadyInLine[data].append(lineNumber)
-
-
-
-                seqNumber+=1
-            lineNumber+=1
-
-        newDatabase={i :idDatabase[i] for i in idDatabase.keys()}
-        for key in idDatabase.keys():
-            if len(idDatabase[key].keys())<self._minSup:
-                newDatabase.pop(key)
-            else:
-                self._finalPatterns[str(key)]=len(idDatabase[key].keys())
-        self._Database=newDatabase
-
+        To make 1 length frequent patterns and update Database to the vertical database: the id-list of every frequent
+        item is a structured array of the (sid, eid) pairs where it occurs, sorted by sid and eid. Frequent items are
+        numbered in their sorted order. Sequences lacking a required item are left out.
+        """
+        sids, eids, names = [], [], []
+        for sid, line in enumerate(self._Database):
+            if not self._constraints.accepts([item for itemSet in line for item in itemSet]):
+                continue
+            for eid, itemSet in enumerate(line):
+                for item in set(itemSet):
+                    sids.append(sid)
+                    eids.append(eid)
+                    names.append(item)
+        sids = _np.array(sids, dtype=_np.int32)
+        eids = _np.array(eids, dtype=_np.int32)
+        itemNames, items = _np.unique(_np.array(names, dtype=str), return_inverse=True)
+        items = items.reshape(-1)
+        order = _np.lexsort((eids, sids, items))
+        sids, eids, items = sids[order], eids[order], items[order]
+        starts = _np.searchsorted(items, _np.arange(len(itemNames)))
+        ends = _np.r_[starts[1:], len(items)].astype(starts.dtype)
+        newSequence = _np.r_[True, (items[1:] != items[:-1]) | (sids[1:] != sids[:-1])]
+        supports = _np.bincount(items[newSequence[:len(items)]], minlength=len(itemNames))
+        frequent = supports >= self._minSup
+        self._itemNames = itemNames[frequent].tolist()
+        self._idLists = []
+        self._keys = []
+        for start, end, support in zip(starts[frequent], ends[frequent], supports[frequent]):
+            idList = _np.empty(end - start, dtype=_idListType)
+            idList['sid'] = sids[start:end]
+            idList['eid'] = eids[start:end]
+            if self._constraints.accepts([itemNames[items[start]]]):
+                self._finalPatterns[str(itemNames[items[start]])] = int(support)
+            self._idLists.append(idList)
+            self._keys.append(self._pairKeys(idList))
+        keep = frequent[items]
+        self._Database = (sids[keep], eids[keep], (_np.cumsum(frequent) - 1)[items[keep]])
 
     def make2LenDatabase(self):
         """
-        To make 2 length frequent patterns by joining two one length patterns by breadth-first search technique  and update xlen Database to sequential database
-        """
-        self._xLenDatabase = {}
-        keyList=[i for i in self._Database.keys()]
-        nextDatabase={i:{} for i in self._Database.keys()}
-        nextDatabaseSame={i:{} for i in self._Database.keys()}
-        keyNumber=-1
-        for key1 in keyList:
-            keyNumber+=1
-            for key2 in keyList[keyNumber:]:
-                if key1!=key2:
-
-
-                    if len(self._Database[key1].keys())>=len(self._Database[key1].keys()):
-                        nextDatabase[key1][key2] = {}
-                        nextDatabase[key2][key1] = {}
-                        nextDatabaseSame[key1][key2] = {}
-
-                        for seq in self._Database[key2].keys():
-                            if seq in self._Database[key1].keys():
-                                x=[i for i in self._Database[key1][seq] if i >self._Database[key2][seq][0]]
-                                if len(x) != 0:
-                                    nextDatabase[key2][key1][seq]=x
-                                x = [i for i in self._Database[key2][seq] if i > self._Database[key1][seq][0]]
-                                if len(x) != 0:
-                                    nextDatabase[key1][key2][seq]=x
-                                x=list(sorted(set(self._Database[key1][seq])&set(self._Database[key2][seq])))
-                                if len(x)!=0:
-                                    nextDatabaseSame[key1][key2][seq]=x
-                    else:
-                        nextDatabase[key1][key2] = {}
-                        nextDatabase[key2][key1] = {}
-                        nextDatabaseSame[key1][key2] = {}
-
-                        for seq in self._Database[key1].keys():
-                            x = [i for i in self._Database[key1][seq] if
-                                                                    i > self._Database[key2][seq][0]]
-                            if len(x)!=0:
-                                nextDatabase[key2][key1][seq]=0
-                            x = [i for i in self._Database[key2][seq] if
-                                                                    i > self._Database[key1][seq][0]]
-                            if len(x)!=0:
-                                nextDatabase[key1][key2][seq]=x
-                            x= list(
-                                sorted(set(self._Database[key1][seq]) & set(self._Database[key2][seq])))
-                            if len(x)!=0:
-                                nextDatabaseSame[key1][key2][seq]=x
-                else:
-                    nextDatabase[key1][key2] = {}
-                    for seq in self._Database[key2].keys():
-                        if len(self._Database[key1][seq])>=2:
-                            nextDatabase[key1][key2][seq]= self._Database[key2][seq][1:]
-        self._xLenDatabase[2] = {tuple([i]): {} for i in nextDatabase.keys()}
-        for key1 in nextDatabase.keys():
-            for key2 in nextDatabase[key1].keys():
-                if len(nextDatabase[key1][key2].keys())>=self._minSup:
-                    self._finalPatterns[str((key1,self._sepSeq,key2,self._sepSeq))]=len(nextDatabase[key1][key2].keys())
-                    self._xLenDatabase[2][tuple([key1])][key2]=nextDatabase[key1][key2]
-        self._xLenDatabaseSame[2]={tuple([i]): {} for i in nextDatabaseSame.keys()}
-        for key1 in nextDatabaseSame.keys():
-            for key2 in nextDatabaseSame[key1].keys():
-                if len(nextDatabaseSame[key1][key2].keys()) >= self._minSup:
-                    self._finalPatterns[str((key1,key2,self._sepSeq))]=len(nextDatabaseSame[key1][key2].keys())
-                    self._xLenDatabaseSame[2][tuple([key1])][key2]={i:nextDatabaseSame[key1][key2][i] for i in nextDatabaseSame[key1][key2].keys()}
-                    self._xLenDatabaseSame[2][tuple([key2])][key1] = {i: nextDatabaseSame[key1][key2][i] for i in nextDatabaseSame[key1][key2].keys()}
+        To make 2 length frequent patterns from the co-occurrence matrices of the frequent items. sequenceMatrix[x, y]
+        counts the sequences where y occurs in an itemset after one holding x, and itemSetMatrix[x, y], for x < y, the
+        sequences where x and y share an itemset. The pairs of a sequence are generated at once for a chunk of sequences.
+        The matrices ignore gaps and windows, so under such constraints they only bound the supports and the patterns of
+        two itemsets are left to the joins.
+        """
+        count = len(self._itemNames)
+        self._sequenceMatrix = _np.zeros((count, count), dtype=_np.int64)
+        self._itemSetMatrix = _np.zeros((count, count), dtype=_np.int64)
+        sids, eids, items = self._Database
+        if not len(sids):
+            return
+        order = _np.lexsort((items, eids, sids))
+        sids, eids, items = sids[order], eids[order], items[order]
+        sequenceStarts = _np.flatnonzero(_np.r_[True, sids[1:] != sids[:-1]])
+        sequenceEnds = _np.r_[sequenceStarts[1:], len(sids)]
+        pairs = _np.cumsum((sequenceEnds - sequenceStarts).astype(_np.int64) ** 2)
+        first = 0
+        while first < len(sequenceStarts):
+            last = max(first + 1, int(_np.searchsorted(pairs, pairs[first] - (sequenceEnds[first] - sequenceStarts[first]) ** 2 + _chunkPairs, 'right')))
+            start, end = sequenceStarts[first], sequenceEnds[last - 1]
+            self._countPairs(sids[start:end], eids[start:end], items[start:end])
+            first = last
+        if not self._constraints.constrainsOccurrences and self._constraints.extends(1):
+            for x, y in zip(*_np.nonzero(self._sequenceMatrix >= self._minSup)):
+                self._record((self._itemNames[x], self._sepSeq, self._itemNames[y], self._sepSeq), self._sequenceMatrix[x, y])
+        for x, y in zip(*_np.nonzero(self._itemSetMatrix >= self._minSup)):
+            self._record((self._itemNames[x], self._itemNames[y], self._sepSeq), self._itemSetMatrix[x, y])
+
+    def _record(self, row, support):
+        """
+        To store a pattern with its support when it holds every required item
+
+        :param row: the pattern as a tuple of items, every itemset being followed by sepSeq
+        :param support: the number of sequences holding the pattern
+        """
+        if self._constraints.accepts(row):
+            self._finalPatterns[str(row)] = int(support)
+
+    def _countPairs(self, sids, eids, items):
+        """
+        To add the pairs of a chunk of whole sequences to the co-occurrence matrices
+
+        :param sids: sequence of every entry, sorted
+        :param eids: itemset of every entry, sorted within a sequence
+        :param items: item of every entry, sorted within an itemset
+        """
+        count = len(self._itemNames)
+        newItemSet = _np.r_[True, (sids[1:] != sids[:-1]) | (eids[1:] != eids[:-1])]
+        left, right = _pairsWithin(_np.flatnonzero(newItemSet), _np.diff(_np.r_[_np.flatnonzero(newItemSet), len(sids)]))
+        keep = items[left] < items[right]
+        keys = _np.unique(sids[left[keep]].astype(_np.int64) * count * count + items[left[keep]] * count + items[right[keep]])
+        self._itemSetMatrix += _np.bincount(keys % (count * count), minlength=count * count).reshape(count, count)
+        order = _np.lexsort((eids, items, sids))
+        sids, eids, items = sids[order], eids[order], items[order]
+        newItem = _np.flatnonzero(_np.r_[True, (sids[1:] != sids[:-1]) | (items[1:] != items[:-1])])
+        firstEids, lastEids = eids[newItem], eids[_np.r_[newItem[1:], len(sids)] - 1]
+        sids, items = sids[newItem], items[newItem]
+        newSequence = _np.flatnonzero(_np.r_[True, sids[1:] != sids[:-1]])
+        left, right = _pairsWithin(newSequence, _np.diff(_np.r_[newSequence, len(sids)]))
+        keep = firstEids[left] < lastEids[right]
+        self._sequenceMatrix += _np.bincount(items[left[keep]].astype(_np.int64) * count + items[right[keep]], minlength=count * count).reshape(count, count)
 
     def make3LenDatabase(self):
         """
-        To call each 2 length patterns to make 3 length frequent patterns depth-first search technique
-        """
-        for i in self._xLenDatabase[2].keys():
-            for k in self._xLenDatabase[2][i].keys():
-                self.makexLenDatabase(2,i,k)
-        for i in self._xLenDatabaseSame[2].keys():
-            for k in self._xLenDatabaseSame[2][i].keys():
-                self.makexLenDatabaseSame(2,i,k)
-
-    def makexLenDatabase(self, rowLen, bs, latestWord):
-            """
-            To make "rowLen" length frequent patterns from pattern which the latest word is in same seq  by joining "rowLen"self._sepSeq length patterns by depth-first search technique  and update xlenDatabase to sequential database
-
-            :param rowLen: row length of patterns.
-            :param bs : patterns without the latest one
-            :param latestWord : latest word of patterns
-            """
-            if rowLen+1 not in self._xLenDatabase:
-                self._xLenDatabase[rowLen+1]={}
-                self._xLenDatabaseSame[rowLen+1]={}
-            for latestWord2 in self._xLenDatabase[rowLen][bs].keys():
-                if latestWord != latestWord2:
-
-                    if len(self._xLenDatabase[rowLen][bs][latestWord].keys()) <= len(self._xLenDatabase[rowLen][bs][latestWord2].keys()):
-                        next={}
-                        next2={}
-                        nextSame={}
-
-                        for seq in self._xLenDatabase[rowLen][bs][latestWord].keys():
-                            if seq in self._xLenDatabase[rowLen][bs][latestWord2].keys():
-                                if self._xLenDatabase[rowLen][bs][latestWord2][seq]!=[] and self._xLenDatabase[rowLen][bs][latestWord][seq]!=[]:
-                                    x = [i for i in self._xLenDatabase[rowLen][bs][latestWord2][seq] if
-                                            i > self._xLenDatabase[rowLen][bs][latestWord][seq][0]]
-                                    if len(x) != 0:
-                                        next[seq] = x
-                                    x = [i for i in self._xLenDatabase[rowLen][bs][latestWord][seq] if
-                                            i > self._xLenDatabase[rowLen][bs][latestWord2][seq][0]]
-                                    if len(x) != 0:
-                                        next2[seq] = x
-                                    x = list(sorted(set(self._xLenDatabase[rowLen][bs][latestWord][seq]) & set(
-                                        self._xLenDatabase[rowLen][bs][latestWord2][seq])))
-                                    if len(x) != 0:
-                                        nextSame[seq] = x
-                        if len(next)>=self._minSup:
-                            nextRow,nextbs= self.makeNextRow(bs,latestWord,latestWord2)
-                            if str(nextRow) not in self._finalPatterns.keys():
-                                self._finalPatterns[str(nextRow)] = len(next)
-                                if nextbs not in self._xLenDatabase[rowLen + 1]:
-                                    self._xLenDatabase[rowLen + 1][nextbs]={}
-                                self._xLenDatabase[rowLen+1][nextbs][latestWord2]={i:next[i] for i in next }
-                                self.makexLenDatabase(rowLen+1,nextbs,latestWord2)
-                        if len(next2)>=self._minSup:
-                            nextRow,nextbs = self.makeNextRow(bs, latestWord2, latestWord)
-                            if str(nextRow) not in self._finalPatterns.keys():
-                                if nextbs not in self._xLenDatabase[rowLen + 1]:
-                                    self._xLenDatabase[rowLen + 1][nextbs]={}
-                                self._finalPatterns[str(nextRow)] = len(next2)
-                                self._xLenDatabase[rowLen+1][nextbs][latestWord] = {i:next2[i] for i in next2 }
-                                self.makexLenDatabase(rowLen+1, nextbs, latestWord)
-                        if len(nextSame) >= self._minSup:
-                            nextRow,nextbs ,nextlste= self.makeNextRowSame3(bs, latestWord, latestWord2)
-                            if str(nextRow) not in self._finalPatterns.keys():
-                                if nextbs not in self._xLenDatabaseSame[rowLen + 1]:
-                                    self._xLenDatabaseSame[rowLen + 1][nextbs]={}
-                                self._finalPatterns[str(nextRow)] = len(nextSame)
-                                self._xLenDatabaseSame[rowLen+1][nextbs][nextlste]={i:nextSame[i] for i in nextSame }
-                                self.makexLenDatabaseSame(rowLen+1, nextbs, nextlste)
-
-                    else:
-                        next = {}
-                        next2 = {}
-                        nextSame = {}
-
-                        for seq in self._xLenDatabase[rowLen][bs][latestWord2].keys():
-                            if seq in self._xLenDatabase[rowLen][bs][latestWord].keys():
-                                if self._xLenDatabase[rowLen][bs][latestWord2][seq] != [] and self._xLenDatabase[rowLen][bs][latestWord][seq] != []:
-                                    x = [i for i in self._xLenDatabase[rowLen][bs][latestWord2][seq] if i > self._xLenDatabase[rowLen][bs][latestWord][seq][0]]
-                                    if len(x)!=0:
-                                        next[seq]=x
-                                    x= [i for i in self._xLenDatabase[rowLen][bs][latestWord][seq] if i > self._xLenDatabase[rowLen][bs][latestWord2][seq][0]]
-                                    if len(x)!=0:
-                                        next2[seq]=x
-                                    x= list(sorted(set(self._xLenDatabase[rowLen][bs][latestWord][seq]) & set(
-                                            self._xLenDatabase[rowLen][bs][latestWord2][seq])))
-                                    if len(x)!=0:
-                                        nextSame[seq]=x
-                        if len(next) >= self._minSup:
-                            nextRow,nextbs = self.makeNextRow(bs, latestWord, latestWord2)
-                            if str(nextRow) not in self._finalPatterns.keys():
-                                if nextbs not in self._xLenDatabase[rowLen + 1]:
-                                    self._xLenDatabase[rowLen+1][nextbs]={}
-                                self._finalPatterns[str(nextRow)] = len(next)
-                                self._xLenDatabase[rowLen + 1][nextbs][latestWord2] ={i:next[i] for i in next }
-                                self.makexLenDatabase(rowLen+1, nextbs, latestWord2)
-                        if len(next2) >= self._minSup:
-                            nextRow,nextbs = self.makeNextRow(bs, latestWord2, latestWord)
-                            if str(nextRow) not in self._finalPatterns.keys():
-                                if nextbs not in self._xLenDatabase[rowLen + 1]:
-                                    self._xLenDatabase[rowLen + 1][nextbs]={}
-                                self._finalPatterns[str(nextRow)] = len(next2)
-                                self._xLenDatabase[rowLen+1][nextbs][latestWord] = {i:next2[i] for i in next2 }
-                                self.makexLenDatabase(rowLen+1, nextbs, latestWord)
-                        if len(nextSame) >= self._minSup:
-                            nextRow,nextbs,nextlate = self.makeNextRowSame3(bs,latestWord,latestWord2)
-                            if str(nextRow) not in self._finalPatterns.keys():
-                                if nextbs not in self._xLenDatabaseSame[rowLen + 1]:
-                                    self._xLenDatabaseSame[rowLen + 1][nextbs]={}
-                                self._finalPatterns[str(nextRow)] = len(nextSame)
-                                self._xLenDatabaseSame[rowLen+1][nextbs][nextlate] = {i:nextSame[i] for i in nextSame}
-                                self.makexLenDatabaseSame(rowLen+1, nextbs, nextlate)
+        To make 3 or more length frequent patterns by extending every frequent item depth first. Under a window, every
+        occurrence of an item starts at its own itemset.
+        """
+        everyItem = _np.arange(len(self._itemNames))
+        window = self._constraints.maxWindow != float("inf")
+        for item, name in enumerate(self._itemNames):
+            idList = self._idLists[item]
+            self.makexLenDatabase(1, (name, self._sepSeq), item, idList, everyItem, everyItem[item + 1:],
+                                  idList['eid'].copy() if window else None)
 
-                else:
-                    next= {}
-                    for seq in self._xLenDatabase[rowLen][bs][latestWord2].keys():
-                        if len(self._xLenDatabase[rowLen][bs][latestWord][seq])>=2:
-                            next[seq]= self._xLenDatabase[rowLen][bs][latestWord][seq][1:]
-                    if len(next) >= self._minSup:
-                        nextRow, nextbs= self.makeNextRow(bs,latestWord,latestWord2)
-                        if str(nextRow) not in self._finalPatterns.keys():
-                            if nextbs not in self._xLenDatabase[rowLen+1]:
-                                self._xLenDatabase[rowLen+1][nextbs]={}
-                            self._finalPatterns[str(nextRow)] = len(next)
-                            self._xLenDatabase[rowLen+1][nextbs][latestWord2] ={i:next[i] for i in next }
-                            self.makexLenDatabase(rowLen+1, nextbs, latestWord2)
-            if bs in self._xLenDatabaseSame[rowLen]:
-                for latestWord2 in self._xLenDatabaseSame[rowLen][bs]:
-
-
-                        if len(self._xLenDatabase[rowLen][bs][latestWord].keys()) <= len(
-                                self._xLenDatabaseSame[rowLen][bs][latestWord2].keys()):
-                            next = {}
-
-                            for seq in self._xLenDatabase[rowLen][bs][latestWord].keys():
-                                if seq in self._xLenDatabaseSame[rowLen][bs][latestWord2].keys():
-                                    if self._xLenDatabaseSame[rowLen][bs][latestWord2][seq] != []:
-                                        x= [i for i in self._xLenDatabase[rowLen][bs][latestWord][seq] if i > self._xLenDatabaseSame[rowLen][bs][latestWord2][seq][0]]
-                                        if len(x) != 0:
-                                            next[seq] = x
-                            if len(next) >= self._minSup:
-
-                                nextRow ,nextbs= self.makeNextRowSame(bs, latestWord2, latestWord)
-                                if str(nextRow) not in self._finalPatterns.keys():
-                                    if nextbs not in self._xLenDatabase[rowLen + 1]:
-                                        self._xLenDatabase[rowLen + 1][nextbs] = {}
-                                    self._finalPatterns[str(nextRow)] = len(next)
-                                    self._xLenDatabase[rowLen + 1][nextbs][latestWord] = {i:next[i] for i in next }
-                                    self.makexLenDatabase(rowLen + 1, nextbs, latestWord)
-
-                        else:
-                            next = {}
-                            for seq in self._xLenDatabaseSame[rowLen][bs][latestWord2].keys():
-                                if seq in self._xLenDatabase[rowLen][bs][latestWord].keys():
-                                    if self._xLenDatabaseSame[rowLen][bs][latestWord2][seq] != [] :
-                                        x= [i for i in self._xLenDatabase[rowLen][bs][latestWord][seq] if
-                                                         i > self._xLenDatabaseSame[rowLen][bs][latestWord2][seq][0]]
-                                        if len(x) != 0:
-                                            next[seq] = x
-                            if len(next) >= self._minSup:
-                                nextRow,nextbs = self.makeNextRowSame(bs, latestWord2, latestWord)
-                                if str(nextRow) not in self._finalPatterns.keys():
-                                    if nextbs not in self._xLenDatabase[rowLen + 1]:
-                                        self._xLenDatabase[rowLen + 1][nextbs] = {}
-                                    self._finalPatterns[str(nextRow)] = len(next)
-                                    self._xLenDatabase[rowLen+1][nextbs][latestWord] = {i:next[i] for i in next }
-                                    self.makexLenDatabase(rowLen + 1, nextbs,latestWord)
-
-    def makexLenDatabaseSame(self, rowLen, bs, latestWord):
-        """
-        To make 3 or more length frequent patterns from pattern which the latest word is in different seq  by depth-first search technique  and update xlenDatabase to sequential database
-
-        :param rowLen: row length of previous patterns.
-        :param bs : previous patterns without the latest one
-        :param latestWord : latest word of previous patterns
-        """
-        if rowLen + 1 not in self._xLenDatabase:
-            self._xLenDatabase[rowLen + 1] = {}
-            self._xLenDatabaseSame[rowLen + 1] = {}
-        if bs in self._xLenDatabase[rowLen]:
-            for latestWord2 in self._xLenDatabase[rowLen][bs]:
-                if len(self._xLenDatabaseSame[rowLen][bs][latestWord].keys()) <= len(self._xLenDatabase[rowLen][bs][latestWord2].keys()):
-                    next = {}
-
-                    for seq in self._xLenDatabaseSame[rowLen][bs][latestWord].keys():
-                        if seq in self._xLenDatabase[rowLen][bs][latestWord2].keys():
-                            if self._xLenDatabaseSame[rowLen][bs][latestWord][seq] != []:
-                                x= [i for i in self._xLenDatabase[rowLen][bs][latestWord2][seq] if
-                                             i > self._xLenDatabaseSame[rowLen][bs][latestWord][seq][0]]
-                                if len(x) != 0:
-                                    next[seq] = x
-                    if len(next) >= self._minSup:
-                        nextRow ,nextbs= self.makeNextRowSame(bs, latestWord, latestWord2)
-                        if str(nextRow) not in self._finalPatterns.keys():
-                            if nextbs not in self._xLenDatabase[rowLen + 1]:
-                                self._xLenDatabase[rowLen + 1][nextbs] = {}
-                            self._finalPatterns[str(nextRow)] = len(next)
-                            self._xLenDatabase[rowLen + 1][nextbs][latestWord2]= {i:next[i] for i in next}
-                            self.makexLenDatabase(rowLen + 1, nextbs, latestWord2)
+    @staticmethod
+    def _pairKeys(idList):
+        """
+        To encode the (sid, eid) pairs of an id-list as sorted 64-bit keys
 
-                else:
-                    next = {}
-
-                    for seq in self._xLenDatabase[rowLen][bs][latestWord2].keys():
-                        if seq in self._xLenDatabaseSame[rowLen][bs][latestWord].keys():
-                            if self._xLenDatabaseSame[rowLen][bs][latestWord][seq] != []:
-                                x= [i for i in self._xLenDatabase[rowLen][bs][latestWord2][seq] if
-                                             i > self._xLenDatabaseSame[rowLen][bs][latestWord][seq][0]]
-                                if len(x) != 0:
-                                    next[seq] = x
-                    if len(next) >= self._minSup:
-                        nextRow,nextbs = self.makeNextRowSame(bs, latestWord, latestWord2)
-                        if str(nextRow) not in self._finalPatterns.keys():
-                            if nextbs not in self._xLenDatabase[rowLen + 1]:
-                                self._xLenDatabase[rowLen + 1][nextbs] = {}
-                            self._finalPatterns[str(nextRow)] = len(next)
-                            self._xLenDatabase[rowLen + 1][nextbs][latestWord2] = {i:next[i] for i in next}
-                            self.makexLenDatabase(rowLen + 1,nextbs, latestWord2)
-        if bs in self._xLenDatabaseSame[rowLen]:
-            for latestWord2 in self._xLenDatabaseSame[rowLen][bs]:
-                if latestWord2!=latestWord:
-                    if len(self._xLenDatabaseSame[rowLen][bs][latestWord].keys()) <= len(
-                            self._xLenDatabaseSame[rowLen][bs][latestWord2].keys()):
-                        next = {}
-
-                        for seq in self._xLenDatabaseSame[rowLen][bs][latestWord].keys():
-                            if seq in self._xLenDatabaseSame[rowLen][bs][latestWord2].keys():
-                                x= list(sorted(set(self._xLenDatabaseSame[rowLen][bs][latestWord][seq]) & set(
-                                        self._xLenDatabaseSame[rowLen][bs][latestWord2][seq])))
-                                if len(x) != 0:
-                                    next[seq] = x
-                        if len(next) >= self._minSup:
-
-                                nextRow, nextbs,nextLate= self.makeNextRowSame2(bs, latestWord, latestWord2)
-                                if str(nextRow) not in self._finalPatterns.keys():
-                                    if nextbs not in self._xLenDatabaseSame[rowLen+1]:
-                                        self._xLenDatabaseSame[rowLen + 1][nextbs] = {}
-
-                                    self._finalPatterns[str(nextRow)] = len(next)
-                                    self._xLenDatabaseSame[rowLen + 1][nextbs][nextLate] = {i:next[i] for i in next}
-                                    self.makexLenDatabaseSame(rowLen + 1, nextbs, nextLate)
-                    else:
-                        next = {}
-
-                        for seq in self._xLenDatabaseSame[rowLen][bs][latestWord2].keys():
-                            if seq in self._xLenDatabaseSame[rowLen][bs][latestWord].keys():
-                                x= list(sorted(set(self._xLenDatabaseSame[rowLen][bs][latestWord][seq]) & set(
-                                        self._xLenDatabaseSame[rowLen][bs][latestWord2][seq])))
-                                if len(x) != 0:
-                                    next[seq] = x
-                        if len(next) >= self._minSup:
-
-                                nextRow, nextbs,nextLate= self.makeNextRowSame2(bs, latestWord, latestWord2)
-                                if str(nextRow) not in self._finalPatterns.keys():
-                                    if nextbs not in self._xLenDatabaseSame[rowLen+1]:
-                                        self._xLenDatabaseSame[rowLen + 1][nextbs] = {}
-
-                                    self._finalPatterns[str(nextRow)] = len(next)
-                                    self._xLenDatabaseSame[rowLen + 1][nextbs][nextLate] = {i:next[i] for i in next}
-                                    self.makexLenDatabaseSame(rowLen + 1, nextbs, nextLate)
-
-    def makeNextRow(self,bs, latestWord, latestWord2):
-        """
-        To make pattern row when two patterns have the latest word in different sequence
-
-        :param bs : previous pattern without the latest one
-        :param latestWord : latest word of one previous pattern
-        :param latestWord2 : latest word of other previous pattern
-        """
-
-        bs=bs+(self._sepSeq,latestWord)
-        bs2=bs+(self._sepSeq,latestWord2,self._sepSeq)
-        return bs2,bs
-
-    def makeNextRowSame(self,bs, latestWord, latestWord2):
-        """
-        To make pattern row when one pattern have the latestWord1 in different sequence and other(latestWord2) in same
-
-        :param bs : previous pattern without the latest one
-        :param latestWord : latest word of one previous pattern in same sequence
-        :param latestWord2 : latest word of other previous pattern in different sequence
-        """
-
-        bs=list(bs)
-        x=1
-        x2=[latestWord,]
-        while bs:
-            x=bs.pop()
-            if x!=self._sepSeq:
-                x2.append(x)
-            else:
-                break
-        x2=list(sorted(set(x2)))
-        if len(bs)!=0:
-            bs=tuple(bs)+(self._sepSeq,)+tuple(x2)
-        else:
-            bs=tuple(x2)
-        bs2=tuple(bs)+(self._sepSeq,latestWord2,self._sepSeq)
-        return bs2,bs
+        :param idList: id-list sorted by sid and eid
+        :return: sid * 2 ** 32 + eid for every pair
+        """
+        return (idList['sid'].astype(_np.int64) << 32) | idList['eid'].astype(_np.int64)
 
+    @staticmethod
+    def _support(idList):
+        """
+        :param idList: id-list sorted by sid and eid
+        :return: the number of sequences of the id-list
+        """
+        sids = idList['sid']
+        return int(len(sids) and 1 + _np.count_nonzero(sids[1:] != sids[:-1]))
 
-    def makeNextRowSame2(self,bs, latestWord, latestWord2):
+    def _sequenceJoin(self, firstSids, firstEids, item):
         """
-        To make pattern row when two patterns have the latest word in same sequence
+        To make the id-list of a sequence extension (S-step): the pairs of the item after the first occurrence of the
+        prefix in the same sequence, the prefix being given by its sequences and its first itemset in each of them.
 
-        :param bs : previous pattern without the latest one
-        :param latestWord : latest word of one previous pattern
-        :param latestWord2 : latest word of the other previous pattern
+        :param firstSids: sorted sequences of the prefix
+        :param firstEids: first itemset of the prefix in every sequence of firstSids
+        :param item: the item appended in a new itemset
+        :return: id-list of the extended pattern
         """
+        atom = self._idLists[item]
+        at = _np.minimum(_np.searchsorted(firstSids, atom['sid']), len(firstSids) - 1)
+        return atom[(firstSids[at] == atom['sid']) & (atom['eid'] > firstEids[at])]
 
-        bs = list(bs)
-        x = 1
-        x2 = [latestWord, latestWord2]
-        while bs:
-            x = bs.pop()
-            if x != self._sepSeq:
-                x2.append(x)
-            else:
-                break
-        x2 = list(sorted(set(x2)))
-        x3 = x2.pop()
-        if len(bs)!=0:
-            bs = tuple(bs)+(self._sepSeq,)+ tuple(x2)
-        else:
-            bs = tuple(x2)
-        bs2 = tuple(bs) + (x3, self._sepSeq)
+    def _constrainedSequenceJoin(self, idList, starts, item):
+        """
+        To make the id-list of a sequence extension under gap or window constraints: the pairs of the item at an
+        allowed gap after an occurrence of the prefix, every occurrence of the prefix being a pair of its id-list.
 
-        return bs2, bs, x3
+        :param idList: id-list of the prefix
+        :param starts: first itemset of the occurrence ending at every pair of idList, None without a window
+        :param item: the item appended in a new itemset
+        :return: id-list of the extended pattern and the first itemsets of its occurrences
+        """
+        atom = self._idLists[item]
+        mask, nextStarts = self._constraints.sequenceJoin(idList['sid'], idList['eid'], starts, atom['sid'], atom['eid'])
+        return atom[mask], nextStarts
 
+    def _itemSetJoin(self, keys, starts, item):
+        """
+        To make the id-list of an itemset extension (I-step): the pairs of the item that are pairs of the prefix.
 
-    def makeNextRowSame3(self, bs, latestWord, latestWord2):
+        :param keys: sorted pair keys of the prefix
+        :param starts: first itemset of the occurrence ending at every pair of the prefix, None without a window
+        :param item: the item appended to the last itemset
+        :return: id-list of the extended pattern and the first itemsets of its occurrences
         """
-        To make pattern row when two patterns have the latest word in different sequence and both latest word is in same sequence
+        atomKeys = self._keys[item]
+        at = _np.minimum(_np.searchsorted(keys, atomKeys), len(keys) - 1)
+        mask = keys[at] == atomKeys
+        return self._idLists[item][mask], None if starts is None else starts[at[mask]]
 
-        :param bs : previous pattern without the latest one
-        :param latestWord : latest word of one previous pattern
-        :param latestWord2 : latest word of other previous pattern
+    def makexLenDatabase(self, rowLen, row, latestWord, idList, sequenceItems, itemSetItems, starts=None):
         """
+        To extend a pattern by its frequent sequence and itemset extensions depth first. Candidates are the extensions
+        found frequent for the parent pattern, filtered by the co-occurrence matrices against the latest item. Under
+        gap or window constraints, the sequence extensions are joined against every occurrence of the pattern and
+        the patterns of two itemsets are recorded here. A maximum gap does not hold for the pattern without one of its
+        middle itemsets, so under it the sequence extensions of a child are looked for among all frequent items.
 
-        x = list(sorted({latestWord, latestWord2}))
-        x2 = x.pop()
-        x3=x.pop()
-        bs = bs + (self._sepSeq,x3)
-        bs2 = bs + (x2,)
-        return  bs2,bs,x2
+        :param rowLen: number of items of the pattern
+        :param row: the pattern as a tuple of items, every itemset being followed by sepSeq
+        :param latestWord: latest item of the pattern
+        :param idList: id-list of the pattern
+        :param sequenceItems: candidate items of the sequence extensions
+        :param itemSetItems: candidate items of the itemset extensions, all greater than latestWord
+        :param starts: first itemset of the occurrence ending at every pair of idList, None without a window
+        """
+        constrained = self._constraints.constrainsOccurrences
+        if not self._constraints.extends(row.count(self._sepSeq)):
+            sequenceItems = sequenceItems[:0]
+        sequenceItems = sequenceItems[self._sequenceMatrix[latestWord, sequenceItems] >= self._minSup]
+        itemSetItems = itemSetItems[self._itemSetMatrix[latestWord, itemSetItems] >= self._minSup]
+        sequenceExtensions = []
+        if not constrained:
+            newSequence = _np.r_[True, idList['sid'][1:] != idList['sid'][:-1]]
+            firstSids, firstEids = idList['sid'][newSequence], idList['eid'][newSequence]
+        for item in sequenceItems.tolist():
+            if constrained:
+                nextIdList, nextStarts = self._constrainedSequenceJoin(idList, starts, item)
+            else:
+                nextIdList, nextStarts = self._sequenceJoin(firstSids, firstEids, item), None
+            support = self._support(nextIdList)
+            if support >= self._minSup:
+                sequenceExtensions.append((item, nextIdList, nextStarts, support))
+        itemSetExtensions = []
+        if len(itemSetItems):
+            keys = self._pairKeys(idList)
+            for item in itemSetItems.tolist():
+                nextIdList, nextStarts = self._itemSetJoin(keys, starts, item)
+                support = self._support(nextIdList)
+                if support >= self._minSup:
+                    itemSetExtensions.append((item, nextIdList, nextStarts, support))
+        sequenceItems = _np.array([extension[0] for extension in sequenceExtensions], dtype=int)
+        itemSetItems = _np.array([extension[0] for extension in itemSetExtensions], dtype=int)
+        childItems = _np.arange(len(self._itemNames)) if self._constraints.maxGap != float("inf") else sequenceItems
+        for item, nextIdList, nextStarts, support in sequenceExtensions:
+            nextRow = row + (self._itemNames[item], self._sepSeq)
+            if rowLen > 1 or constrained:
+                self._record(nextRow, support)
+            self.makexLenDatabase(rowLen + 1, nextRow, item, nextIdList, childItems, sequenceItems[sequenceItems > item],
+                                  nextStarts)
+        for item, nextIdList, nextStarts, support in itemSetExtensions:
+            nextRow = row[:-1] + (self._itemNames[item], self._sepSeq)
+            if rowLen > 1:
+                self._record(nextRow, support)
+            self.makexLenDatabase(rowLen + 1, nextRow, item, nextIdList, childItems, itemSetItems[itemSetItems > item],
+                                  nextStarts)
 
     @deprecated("It is recommended to use mine() instead of startMine() for mining process")
     def startMine(self):
@@ -58,6 +58,8 @@ import pandas as pd
 from deprecated import deprecated
 
 from PAMI.sequentialPattern.basic import abstract as _ab
+from PAMI.extras import sequenceBitmap as _sb
+from PAMI.extras import sequenceConstraints as _sc
 _ab._sys.setrecursionlimit(10000)
 
 class SPAM(_ab._sequentialPatterns):
@@ -77,6 +79,16 @@ class SPAM(_ab._sequentialPatterns):
                     Example: minSup=10 will be treated as integer, while minSup=10.0 will be treated as float
     :param  sep: str :
                    This variable is used to distinguish items from one another in a transaction. The default seperator is tab space. However, the users can override their default separator.
+    :param  maxGap: int :
+                   Consecutive itemsets of an occurrence of a pattern are less than maxGap itemsets apart
+    :param  minGap: int :
+                   Consecutive itemsets of an occurrence of a pattern are at least minGap itemsets apart
+    :param  maxWindow: int :
+                   The last itemset of an occurrence of a pattern is less than maxWindow itemsets after its first one
+    :param  maxLen: int :
+                   The maximum number of itemsets of a pattern
+    :param  requiredItems: list :
+                   The items every pattern holds
 
     :Attributes:
 
@@ -105,9 +117,11 @@ class SPAM(_ab._sequentialPatterns):
             Database : list
                 To store the sequences of a database in list
             _idDatabase : dict
-                To store the sequences of a database by bit map
-            _maxSeqLen:
-                the maximum length of subsequence in sequence.
+                To store the bitmap of every frequent item
+            _bitmap : sequenceBitmap
+                the layout of the bitmaps, every sequence owning a block of words
+            _constraints : sequenceConstraints
+                The gap, window, length and item constraints, evaluated in the S-steps
             _seqSep   :str
                 separator to separate each itemset
 
@@ -119,10 +133,8 @@ class SPAM(_ab._sequentialPatterns):
                 To convert the user specified minSup value
             make2BitDatabase():
                 To make 1 length frequent patterns by breadth-first search technique   and update Database to sequential database
-            DfsPruning(items,sStep,iStep):
+            DfsPruning(items,bitmap,sStep,iStep):
                 the main algorithm of spam. This can search sstep and istep items and find next patterns, its sstep, and its istep. And call this function again by using them. Recursion until there are no more items available for exploration.
-            Sstep(s):
-                To convert bit to ssteo bit.The first time you get 1, you set it to 0 and subsequent ones to 1.(like 010101=>001111, 00001001=>00000111)
             startMine()
                 Mining process will start from here
             getPatterns()
@@ -203,8 +215,15 @@ class SPAM(_ab._sequentialPatterns):
     _memoryRSS = float()
     _Database = []
     _idDatabase={}
-    _maxSeqLen=0
+    _bitmap = None
     _sepSeq=""
+
+    def __init__(self, iFile, minSup, sep="\t", sepSeq="-1", maxGap=float("inf"), minGap=1, maxWindow=float("inf"),
+                 maxLen=float("inf"), requiredItems=None):
+        super().__init__(iFile, minSup, sep, sepSeq)
+        self._constraints = _sc.sequenceConstraints(maxGap=maxGap, minGap=minGap, maxWindow=maxWindow, maxLen=maxLen,
+                                                    requiredItems=requiredItems)
+
     def _creatingItemSets(self):
         """
         Storing the complete sequences of the database/input file in a database variable
@@ -285,133 +304,67 @@ class SPAM(_ab._sequentialPatterns):
 
     def make2BitDatabase(self):
         """
-        To make 1 length frequent patterns by breadth-first search technique   and update Database to sequential database
+        To make 1 length frequent patterns and the bitmap of every frequent item, every sequence owning a block of
+        numpy.uint64 words in the bitmap. Sequences lacking a required item are emptied.
         """
-        self._maxSeqLen=max([len(i) for i in self._Database])
-        lineNumber=0
-        idDatabase={}
-        for line in self._Database:
-            seqNumber=1
-            for seq in line:
-
-                for data in seq:
-                    if data in idDatabase:
-                        while lineNumber+1!=len(idDatabase[data]):
-                            idDatabase[data].append(0)
-                        idDatabase[data][lineNumber]+=int(2**(self._maxSeqLen-seqNumber))
-
-                    else:
-                        idDatabase[data]=[]
-                        while lineNumber+1!=len(idDatabase[data]):
-                            idDatabase[data].append(0)
-                        idDatabase[data][lineNumber]+=(int(2 ** (self._maxSeqLen-seqNumber)))
-
-                seqNumber+=1
-            lineNumber+=1
-        for key,val in idDatabase.items():
-
-            sup=self.countSup(val)
-            while lineNumber+1!=len(idDatabase[key]):
-                            idDatabase[key].append(0)
-            if sup>=self._minSup:
-                self._finalPatterns[str(key)+self._sep+"-2"]=sup
-                self._idDatabase[str(key)]=val
-
-    def DfsPruning(self,items,sStep,iStep):
+        accepts = self._constraints.accepts
+        self._bitmap = _sb.sequenceBitmap([seq if accepts([item for itemSet in seq for item in itemSet]) else []
+                                           for seq in self._Database])
+        self._idDatabase = {}
+        for key, val in self._bitmap.items.items():
+            sup = self._bitmap.support(val)
+            if sup >= self._minSup:
+                if accepts([str(key)]):
+                    self._finalPatterns[str(key)+self._sep+"-2"] = sup
+                self._idDatabase[str(key)] = val
+
+    def DfsPruning(self, items, bitmap, sStep, iStep, length=1):
         """
         the main algorithm of spam. This can search sstep and istep items and find next patterns, its sstep, and its istep. And call this function again by using them. Recursion until there are no more items available for exploration.
+        A maximum gap does not hold for a pattern without one of its middle itemsets, so under it every frequent item is tried as sstep.
 
         :Attributes:
 
         items : str
             The pattrens I got before
+        bitmap : numpy.ndarray
+            The bitmap of items
         sStep : list
             Items presumed to have "sstep" relationship with "items".(sstep is What appears later like a-b and a-c)
         iStep : list
             Items presumed to have "istep" relationship with "items"(istep is What appears in same time like ab and ac)
+        length : int
+            The number of itemsets of "items"
 
         """
-        Snext=[]
-        Inext=[]
-        ns = self.Sstep(self._idDatabase[items])
-        for i in sStep:
-            nnext=[]
-            for k in  range(len(self._idDatabase[items])):
-                nandi=ns[k] & self._idDatabase[i][k]
-                nnext.append(nandi)
-
-
-            sup=self.countSup(nnext)
-            if sup>=self._minSup:
-                key=items+self._sep+self._sepSeq+self._sep+i
-                self._finalPatterns[key+self._sep+self._sepSeq+self._sep+"-2"]=sup
-                self._idDatabase[key]=nnext
-                Snext.append(i)
-
-        for i in Snext:
-            key = items+self._sep+self._sepSeq+self._sep+i
-            self.DfsPruning(key,Snext,[k for k in Snext if self._Database.index(i)<self._Database.index(k)])
+        constraints = self._constraints
+        Snext = []
+        if constraints.extends(length):
+            ns = constraints.sequenceStep(self._bitmap, bitmap)
+            for i in sStep:
+                nnext = ns & self._idDatabase[i]
+                sup = constraints.support(self._bitmap, nnext)
+                if sup >= self._minSup:
+                    key = items+self._sep+self._sepSeq+self._sep+i
+                    if constraints.accepts(key.split(self._sep)):
+                        self._finalPatterns[key+self._sep+self._sepSeq+self._sep+"-2"] = sup
+                    Snext.append((i, nnext))
+        Inext = []
         for i in iStep:
-            nnext = []
-
-            for k in range(len(self._idDatabase[items])):
-                nandi = self._idDatabase[items][k] & self._idDatabase[i][k]
-                nnext.append(nandi)
-            sup=self.countSup(nnext)
-            if sup>=self._minSup:
-                key=items+self._sep+str(i)
-                self._finalPatterns[key+self._sep+self._sepSeq+self._sep+"-2"]=sup
-                self._idDatabase[key]=nnext
-                Inext.append(i)
-        for i in Inext:
-            key = items +self._sep +str(i)
-            self.DfsPruning(key,Snext,[k for k in Inext if self._Database.index(i)<self._Database.index(k)])
-
-    def Sstep(self,s):
-        """
-        To convert bit to Sstep bit.The first time you get 1, you set it to 0 and subsequent ones to 1.(like 010101=>001111, 00001001=>00000111)
-
-
-        :param s:list
-            to store each bit sequence
-        :return:
-            nextS:list to store the bit sequence converted by sstep
-
-        """
-        nextS=[]
-        for bins in s:
-            binS=str(bin(bins))
-
-
-            LenNum=2
-            for i in range(len(binS)-2):
-                if binS[LenNum] == "1":
-
-                    binS = binS[:LenNum] + "0" + binS[LenNum + 1:]
-                    while len(binS)-1!=LenNum:
-                        LenNum += 1
-                        binS = binS[:LenNum] + "1" + binS[LenNum + 1:]
-                    break
-                LenNum+=1
-            nextS.append(int(binS, 0))
-
-
-        return nextS
-
-    def countSup(self,n):
-        """
-        count support
-
-        :param n:list
-                to store each bit sequence
-        :return:
-            count: int support of this list
-        """
-        count=0
-        for i in n:
-            if "1" in str(bin(i)):
-                count+=1
-        return count
+            nnext = bitmap & self._idDatabase[i]
+            sup = constraints.support(self._bitmap, nnext)
+            if sup >= self._minSup:
+                key = items+self._sep+str(i)
+                if constraints.accepts(key.split(self._sep)):
+                    self._finalPatterns[key+self._sep+self._sepSeq+self._sep+"-2"] = sup
+                Inext.append((i, nnext))
+        sItems = [i for i, _ in Snext]
+        nextSStep = self._Database if constraints.maxGap != float("inf") else sItems
+        for index, (i, nnext) in enumerate(Snext):
+            self.DfsPruning(items+self._sep+self._sepSeq+self._sep+i, nnext, nextSStep, sItems[index + 1:], length + 1)
+        iItems = [i for i, _ in Inext]
+        for index, (i, nnext) in enumerate(Inext):
+            self.DfsPruning(items+self._sep+str(i), nnext, nextSStep, iItems[index + 1:], length)
 
     def startMine(self):
         """
@@ -423,13 +376,8 @@ class SPAM(_ab._sequentialPatterns):
         self._minSup = self._convert(self._minSup)
         self.make2BitDatabase()
         self._Database = [i for i in self._idDatabase.keys()]
-        for i in self._Database:
-            x=[]
-            for j in self._Database:
-                if self._Database.index(i)<self._Database.index(j):
-                    x.append(j)
-
-            self.DfsPruning(i,self._Database,x)
+        for index, i in enumerate(self._Database):
+            self.DfsPruning(i, self._constraints.root(self._idDatabase[i]), self._Database, self._Database[index + 1:])
         self._endTime = _ab._time.time()
         process = _ab._psutil.Process(_ab._os.getpid())
         self._memoryUSS = float()
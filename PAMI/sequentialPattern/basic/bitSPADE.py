@@ -59,6 +59,8 @@ import pandas as pd
 from deprecated import deprecated
 
 from PAMI.sequentialPattern.basic import abstract as _ab
+from PAMI.extras import sequenceBitmap as _sb
+from PAMI.extras import sequenceConstraints as _sc
 
 _ab._sys.setrecursionlimit(10000)
 
@@ -81,6 +83,16 @@ class bitSPADE(_ab._sequentialPatterns):
                     Example: minSup=10 will be treated as integer, while minSup=10.0 will be treated as float
     :param  sep: str :
                    This variable is used to distinguish items from one another in a transaction. The default seperator is tab space. However, the users can override their default separator.
+    :param  maxGap: int :
+                   Consecutive itemsets of an occurrence of a pattern are less than maxGap itemsets apart
+    :param  minGap: int :
+                   Consecutive itemsets of an occurrence of a pattern are at least minGap itemsets apart
+    :param  maxWindow: int :
+                   The last itemset of an occurrence of a pattern is less than maxWindow itemsets after its first one
+    :param  maxLen: int :
+                   The maximum number of itemsets of a pattern
+    :param  requiredItems: list :
+                   The items every pattern holds
 
     :Attributes:
 
@@ -109,9 +121,11 @@ class bitSPADE(_ab._sequentialPatterns):
             Database : list
                 To store the transactions of a database in list
             _xLenDatabase: dict
-                To store the datas in different sequence separated by sequence, rownumber, length.
-            _xLenDatabaseSame : dict
-                To store the datas in same sequence separated by sequence, rownumber, length.
+                To store the items of the frequent sequence and itemset extensions of every frequent item
+            _bitmap : sequenceBitmap
+                the layout of the bitmaps, every sequence owning a block of words
+            _constraints : sequenceConstraints
+                The gap, window, length and item constraints, evaluated in the S-steps
             _seqSep   :str
                 separator to separate each itemset
 
@@ -201,7 +215,14 @@ class bitSPADE(_ab._sequentialPatterns):
     _memoryRSS = float()
     _Database = []
     _xLenDatabase={}
-    _xLenDatabaseSame = {}
+    _bitmap = None
+
+    def __init__(self, iFile, minSup, sep="\t", sepSeq="-1", maxGap=float("inf"), minGap=1, maxWindow=float("inf"),
+                 maxLen=float("inf"), requiredItems=None):
+        super().__init__(iFile, minSup, sep, sepSeq)
+        self._constraints = _sc.sequenceConstraints(maxGap=maxGap, minGap=minGap, maxWindow=maxWindow, maxLen=maxLen,
+                                                    requiredItems=requiredItems)
+
     def _creatingItemSets(self):
         """
         Storing the complete transactions of the database/input file in a database variable
@@ -282,372 +303,105 @@ class bitSPADE(_ab._sequentialPatterns):
 
     def make1LenDatabase(self):
         """
-        To make 1 length frequent patterns by breadth-first search technique   and update Database to sequential database
-        """
-
-        idDatabase={}
-        alreadyInData=[]
-        lineNumber=0
-        alreadyInLine={}
-        for line in self._Database:
-            seqNumber=0
-            for seq in line:
-
-                for data in seq:
-                    if data in alreadyInData:
-                        if lineNumber in alreadyInLine[data]:
-                            idDatabase[data][lineNumber]=idDatabase[data][lineNumber]|2**seqNumber
-                        else:
-                            idDatabase[data][lineNumber] = 0b0
-                            idDatabase[data][lineNumber]=idDatabase[data][lineNumber]|2**seqNumber
-                            alreadyInLine[data].append(lineNumber)
-                    else:
-                        idDatabase[data]={}
-                        idDatabase[data][lineNumber]=0b0
-                        idDatabase[data][lineNumber]=idDatabase[data][lineNumber]|2**seqNumber
-                        alreadyInData.append(data)
-                        alreadyInLine[data]=[]
-                        alreadyInLine[data].append(lineNumber)
-
-
-
-                seqNumber+=1
-            lineNumber+=1
-
-        self._Database={i :idDatabase[i] for i in idDatabase.keys() if len(idDatabase[i]) >=self._minSup}
-        
-        self._finalPatterns={key:len(idDatabase[key]) for key in self._Database.keys()}
-    def transform_binary(self,n):
-        """
-        do sStep to the each bit itemset
-        input:
-            n:int  itemset
-        output:
-            transformed_n:int   itemset converted by step
-        """
-        if n==0b0:
-            return 0
-        bin_str = bin(n)[2:]
-        
-        first_one_index = bin_str.find('1')
-        
-        
-        transformed_str = bin_str[:first_one_index] + '0' + '1' * (len(bin_str) - first_one_index - 1)
-        transformed_n = int(transformed_str, 2)
-        return transformed_n
-
-    
-    def sStep(self,database):
-        """
-        make new database by sStep
-        input:
-            n:dict  input database              
-        return:
-            sStepDatabase: dict   database converted by sStep
-        """
-        sStepDatabase={k:self.transform_binary(v) for k,v in database.items() if self.transform_binary(v)!=0}
-        
-        return sStepDatabase
-
- 
-
-    def combDifPatterns(self,database1,database2):
-        """
-        combine two patterns have different eid
-        input:
-            database1:dict
-                the pattern comes before
-            database1:dict
-                the pattern comes after
-        return:
-            newDatabase:dict
-                the pattern made by two patterns({database1, database2})
-        """
-        database1=self.sStep(database1)
-        newDatabase={}
-        if len(database1.keys())>len(database2.keys()):
-            for line in database2.keys():
-                 if line in database1.keys():
-                       newDatabase[line]=database1[line]&database2[line]
-        else:
-            for line in database1.keys():
-                 if line in database2.keys():
-                       newDatabase[line]=database1[line]&database2[line]
-        newDatabase={line:sup for line,sup in newDatabase.items() if sup!=0 }
-        return newDatabase
-
-    def combSamePatterns(self,database1,database2):
-        """
-        combine two patterns have same eid
-        input:
-            database1:dict
-                the pattern comes before
-            database1:dict
-                the pattern comes after
-        return:
-            newDatabase:dict
-                the pattern made by two patterns({{database1, database2}})
-        """
-        newDatabase={}
-        if len(database1.keys())>len(database2.keys()):
-            for line in database2.keys():
-                 if line in database1.keys():
-                       newDatabase[line]=database1[line]&database2[line]
-        else:
-            for line in database1.keys():
-                 if line in database2.keys():
-                       newDatabase[line]=database1[line]&database2[line]
-        newDatabase={line:sup for line,sup in newDatabase.items() if sup!=0 }
-        return newDatabase
-            
-
-
-    
+        To make 1 length frequent patterns and update Database to the bitmaps of the frequent items, every sequence
+        owning a block of numpy.uint64 words in a bitmap. Frequent items are kept in their sorted order. Sequences
+        lacking a required item are emptied.
+        """
+        accepts = self._constraints.accepts
+        self._bitmap = _sb.sequenceBitmap([line if accepts([item for itemSet in line for item in itemSet]) else []
+                                           for line in self._Database])
+        supports = {item: self._bitmap.support(words) for item, words in self._bitmap.items.items()}
+        self._Database = {item: self._bitmap.items[item] for item in sorted(supports) if supports[item] >= self._minSup}
+        self._itemNames = list(self._Database)
+        self._finalPatterns = {key: supports[key] for key in self._itemNames if accepts([key])}
+
     def make2LenDatabase(self):
         """
-        To make 2 length frequent patterns by joining two one length patterns by breadth-first search technique  and update xlen Database to sequential database
+        To make 2 length frequent patterns by joining the bitmaps of every two frequent items, and to keep for every item
+        the items of its frequent sequence and itemset extensions
         """
+        bitmaps = list(self._Database.values())
+        constraints = self._constraints
         self._xLenDatabase = {}
-        keyList=[i for i in self._Database.keys()]
-        nextDatabase={i:{} for i in self._Database.keys()}
-        nextDatabaseSame={i:{} for i in self._Database.keys()}
-        keyNumber=-1
-        for key1 in keyList:
-            keyNumber+=1
-            for key2 in keyList[keyNumber:]:
-                if key1!=key2:
-
-                    nextDatabase[key1][key2] = self.combDifPatterns(self._Database[key1],self._Database[key2])
-                    nextDatabase[key2][key1] =self.combDifPatterns(self._Database[key2],self._Database[key1])
-                    nextDatabaseSame[key1][key2]=self.combSamePatterns(self._Database[key1],self._Database[key2])
-
-                else:
-                    nextDatabase[key1][key2] = self.combDifPatterns(self._Database[key1],self._Database[key2])
-        self._xLenDatabase[2] = {tuple([i]): {} for i in nextDatabase.keys()}
-        for key1 in nextDatabase.keys():
-            for key2 in nextDatabase[key1].keys():
-                if len(nextDatabase[key1][key2].keys())>=self._minSup:
-                    self._finalPatterns[str((key1,self._sepSeq,key2,self._sepSeq))]=len(nextDatabase[key1][key2].keys())
-                    self._xLenDatabase[2][tuple([key1])][key2]=nextDatabase[key1][key2]
-        self._xLenDatabaseSame[2]={tuple([i]): {} for i in nextDatabaseSame.keys()}
-        for key1 in nextDatabaseSame.keys():
-            for key2 in nextDatabaseSame[key1].keys():
-                if len(nextDatabaseSame[key1][key2].keys()) >= self._minSup:
-                    self._finalPatterns[str((key1,key2,self._sepSeq))]=len(nextDatabaseSame[key1][key2].keys())
-                    self._xLenDatabaseSame[2][tuple([key1])][key2]={i:nextDatabaseSame[key1][key2][i] for i in nextDatabaseSame[key1][key2].keys()}
-                    self._xLenDatabaseSame[2][tuple([key2])][key1] = {i: nextDatabaseSame[key1][key2][i] for i in nextDatabaseSame[key1][key2].keys()}
+        for key1, words1 in enumerate(bitmaps):
+            transformed = constraints.sequenceStep(self._bitmap, constraints.root(words1))
+            sequenceItems, itemSetItems = [], []
+            for key2, words2 in enumerate(bitmaps):
+                if constraints.extends(1):
+                    sup = constraints.support(self._bitmap, transformed & words2)
+                    if sup >= self._minSup:
+                        self._record((self._itemNames[key1], self._sepSeq, self._itemNames[key2], self._sepSeq), sup)
+                        sequenceItems.append(key2)
+                if key2 > key1:
+                    sup = self._bitmap.support(words1 & words2)
+                    if sup >= self._minSup:
+                        self._record((self._itemNames[key1], self._itemNames[key2], self._sepSeq), sup)
+                        itemSetItems.append(key2)
+            self._xLenDatabase[key1] = (sequenceItems, itemSetItems)
+
+    def _record(self, row, sup):
+        """
+        To store a pattern with its support when it holds every required item
+
+        :param row: the pattern as a tuple of items, every itemset being followed by sepSeq
+        :param sup: the number of sequences holding the pattern
+        """
+        if self._constraints.accepts(row):
+            self._finalPatterns[str(row)] = sup
 
     def make3LenDatabase(self):
         """
         To call each 2 length patterns to make 3 length frequent patterns depth-first search technique
         """
-        for i in self._xLenDatabase[2].keys():
-            for k in self._xLenDatabase[2][i].keys():
-                self.makexLenDatabase(2,i,k)
-        for i in self._xLenDatabaseSame[2].keys():
-            for k in self._xLenDatabaseSame[2][i].keys():
-                self.makexLenDatabaseSame(2,i,k)
-
-    def makexLenDatabase(self, rowLen, bs, latestWord):
-            """
-            To make "rowLen" length frequent patterns from pattern which the latest word is in same seq  by joining "rowLen"self._sepSeq length patterns by depth-first search technique  and update xlenDatabase to sequential database
-
-            :param rowLen: row length of patterns.
-            :param bs : patterns without the latest one
-            :param latestWord : latest word of patterns
-            """
-            if rowLen+1 not in self._xLenDatabase:
-                self._xLenDatabase[rowLen+1]={}
-                self._xLenDatabaseSame[rowLen+1]={}
-            for latestWord2 in self._xLenDatabase[rowLen][bs].keys():
-                if latestWord != latestWord2:
-
-                        next=self.combDifPatterns(self._xLenDatabase[rowLen][bs][latestWord],self._xLenDatabase[rowLen][bs][latestWord2])
-                        next2=self.combDifPatterns(self._xLenDatabase[rowLen][bs][latestWord2],self._xLenDatabase[rowLen][bs][latestWord])
-                        nextSame=self.combSamePatterns(self._xLenDatabase[rowLen][bs][latestWord],self._xLenDatabase[rowLen][bs][latestWord2])
-
-                        
-                        if len(next)>=self._minSup:
-                            nextRow,nextbs= self.makeNextRow(bs,latestWord,latestWord2)
-                            if str(nextRow) not in self._finalPatterns.keys():
-                                self._finalPatterns[str(nextRow)] = len(next)
-                                if nextbs not in self._xLenDatabase[rowLen + 1]:
-                                    self._xLenDatabase[rowLen + 1][nextbs]={}
-                                self._xLenDatabase[rowLen+1][nextbs][latestWord2]={i:next[i] for i in next }
-                                self.makexLenDatabase(rowLen+1,nextbs,latestWord2)
-                        if len(next2)>=self._minSup:
-                            nextRow,nextbs = self.makeNextRow(bs, latestWord2, latestWord)
-                            if str(nextRow) not in self._finalPatterns.keys():
-                                if nextbs not in self._xLenDatabase[rowLen + 1]:
-                                    self._xLenDatabase[rowLen + 1][nextbs]={}
-                                self._finalPatterns[str(nextRow)] = len(next2)
-                                self._xLenDatabase[rowLen+1][nextbs][latestWord] = {i:next2[i] for i in next2 }
-                                self.makexLenDatabase(rowLen+1, nextbs, latestWord)
-                        if len(nextSame) >= self._minSup:
-                            nextRow,nextbs ,nextlste= self.makeNextRowSame3(bs, latestWord, latestWord2)
-                            if str(nextRow) not in self._finalPatterns.keys():
-                                if nextbs not in self._xLenDatabaseSame[rowLen + 1]:
-                                    self._xLenDatabaseSame[rowLen + 1][nextbs]={}
-                                self._finalPatterns[str(nextRow)] = len(nextSame)
-                                self._xLenDatabaseSame[rowLen+1][nextbs][nextlste]={i:nextSame[i] for i in nextSame }
-                                self.makexLenDatabaseSame(rowLen+1, nextbs, nextlste)
-
-                   
-
-                else:
-                    next= self.combDifPatterns(self._xLenDatabase[rowLen][bs][latestWord],self._xLenDatabase[rowLen][bs][latestWord2])
-                    
-                    if len(next) >= self._minSup:
-                        nextRow, nextbs= self.makeNextRow(bs,latestWord,latestWord2)
-                        if str(nextRow) not in self._finalPatterns.keys():
-                            if nextbs not in self._xLenDatabase[rowLen+1]:
-                                self._xLenDatabase[rowLen+1][nextbs]={}
-                            self._finalPatterns[str(nextRow)] = len(next)
-                            self._xLenDatabase[rowLen+1][nextbs][latestWord2] ={i:next[i] for i in next }
-                            self.makexLenDatabase(rowLen+1, nextbs, latestWord2)
-            if bs in self._xLenDatabaseSame[rowLen]:
-                for latestWord2 in self._xLenDatabaseSame[rowLen][bs]:
-
-
-                            next = self.combDifPatterns(self._xLenDatabaseSame[rowLen][bs][latestWord2],self._xLenDatabase[rowLen][bs][latestWord])
-
-                            
-                            if len(next) >= self._minSup:
-
-                                nextRow ,nextbs= self.makeNextRowSame(bs, latestWord2, latestWord)
-                                if str(nextRow) not in self._finalPatterns.keys():
-                                    if nextbs not in self._xLenDatabase[rowLen + 1]:
-                                        self._xLenDatabase[rowLen + 1][nextbs] = {}
-                                    self._finalPatterns[str(nextRow)] = len(next)
-                                    self._xLenDatabase[rowLen + 1][nextbs][latestWord] = {i:next[i] for i in next }
-                                    self.makexLenDatabase(rowLen + 1, nextbs, latestWord)
-
-                       
-
-    def makexLenDatabaseSame(self, rowLen, bs, latestWord):
-        """
-        To make 3 or more length frequent patterns from pattern which the latest word is in different seq  by depth-first search technique  and update xlenDatabase to sequential database
-
-        :param rowLen: row length of previous patterns.
-        :param bs : previous patterns without the latest one
-        :param latestWord : latest word of previous patterns
-        """
-        if rowLen + 1 not in self._xLenDatabase:
-            self._xLenDatabase[rowLen + 1] = {}
-            self._xLenDatabaseSame[rowLen + 1] = {}
-        if bs in self._xLenDatabase[rowLen]:
-            for latestWord2 in self._xLenDatabase[rowLen][bs]:
-                    next =self.combDifPatterns(self._xLenDatabaseSame[rowLen][bs][latestWord],self._xLenDatabase[rowLen][bs][latestWord2])
-                    if len(next) >= self._minSup:
-                        nextRow ,nextbs= self.makeNextRowSame(bs, latestWord, latestWord2)
-                        if str(nextRow) not in self._finalPatterns.keys():
-                            if nextbs not in self._xLenDatabase[rowLen + 1]:
-                                self._xLenDatabase[rowLen + 1][nextbs] = {}
-                            self._finalPatterns[str(nextRow)] = len(next)
-                            self._xLenDatabase[rowLen + 1][nextbs][latestWord2]= {i:next[i] for i in next}
-                            self.makexLenDatabase(rowLen + 1, nextbs, latestWord2)
-
-               
-        if bs in self._xLenDatabaseSame[rowLen]:
-            for latestWord2 in self._xLenDatabaseSame[rowLen][bs]:
-                if latestWord2!=latestWord:
-                        next= self.combSamePatterns(self._xLenDatabaseSame[rowLen][bs][latestWord],self._xLenDatabaseSame[rowLen][bs][latestWord2])
-
-                        if len(next) >= self._minSup:
-
-                                nextRow, nextbs,nextLate= self.makeNextRowSame2(bs, latestWord, latestWord2)
-                                if str(nextRow) not in self._finalPatterns.keys():
-                                    if nextbs not in self._xLenDatabaseSame[rowLen+1]:
-                                        self._xLenDatabaseSame[rowLen + 1][nextbs] = {}
-
-                                    self._finalPatterns[str(nextRow)] = len(next)
-                                    self._xLenDatabaseSame[rowLen + 1][nextbs][nextLate] = {i:next[i] for i in next}
-                                    self.makexLenDatabaseSame(rowLen + 1, nextbs, nextLate)
-                    
-    def makeNextRow(self,bs, latestWord, latestWord2):
-        """
-        To make pattern row when two patterns have the latest word in different sequence
-
-        :param bs : previous pattern without the latest one
-        :param latestWord : latest word of one previous pattern
-        :param latestWord2 : latest word of other previous pattern
-        """
-
-        bs=bs+(self._sepSeq,latestWord)
-        bs2=bs+(self._sepSeq,latestWord2,self._sepSeq)
-        return bs2,bs
-
-    def makeNextRowSame(self,bs, latestWord, latestWord2):
-        """
-        To make pattern row when one pattern have the latestWord1 in different sequence and other(latestWord2) in same
-
-        :param bs : previous pattern without the latest one
-        :param latestWord : latest word of one previous pattern in same sequence
-        :param latestWord2 : latest word of other previous pattern in different sequence
-        """
-
-        bs=list(bs)
-        x=1
-        x2=[latestWord,]
-        while bs:
-            x=bs.pop()
-            if x!=self._sepSeq:
-                x2.append(x)
-            else:
-                break
-        x2=list(sorted(set(x2)))
-        if len(bs)!=0:
-            bs=tuple(bs)+(self._sepSeq,)+tuple(x2)
-        else:
-            bs=tuple(x2)
-        bs2=tuple(bs)+(self._sepSeq,latestWord2,self._sepSeq)
-        return bs2,bs
-
-
-    def makeNextRowSame2(self,bs, latestWord, latestWord2):
-        """
-        To make pattern row when two patterns have the latest word in same sequence
-
-        :param bs : previous pattern without the latest one
-        :param latestWord : latest word of one previous pattern
-        :param latestWord2 : latest word of the other previous pattern
-        """
-
-        bs = list(bs)
-        x = 1
-        x2 = [latestWord, latestWord2]
-        while bs:
-            x = bs.pop()
-            if x != self._sepSeq:
-                x2.append(x)
-            else:
-                break
-        x2 = list(sorted(set(x2)))
-        x3 = x2.pop()
-        if len(bs)!=0:
-            bs = tuple(bs)+(self._sepSeq,)+ tuple(x2)
-        else:
-            bs = tuple(x2)
-        bs2 = tuple(bs) + (x3, self._sepSeq)
-
-        return bs2, bs, x3
-
-
-    def makeNextRowSame3(self, bs, latestWord, latestWord2):
-        """
-        To make pattern row when two patterns have the latest word in different sequence and both latest word is in same sequence
-
-        :param bs : previous pattern without the latest one
-        :param latestWord : latest word of one previous pattern
-        :param latestWord2 : latest word of other previous pattern
-        """
-
-        x = list(sorted({latestWord, latestWord2}))
-        x2 = x.pop()
-        x3=x.pop()
-        bs = bs + (self._sepSeq,x3)
-        bs2 = bs + (x2,)
-        return  bs2,bs,x2
+        bitmaps = list(self._Database.values())
+        for key1, (sequenceItems, itemSetItems) in self._xLenDatabase.items():
+            self.makexLenDatabase(1, (self._itemNames[key1], self._sepSeq), key1, self._constraints.root(bitmaps[key1]),
+                                  sequenceItems, itemSetItems)
+
+    def makexLenDatabase(self, rowLen, row, latestWord, bitmap, sequenceItems, itemSetItems):
+        """
+        To extend a pattern by its frequent sequence extensions, the S-step transform of its bitmap ANDed with the bitmap
+        of an item, and its frequent itemset extensions, its bitmap ANDed with the bitmap of an item, depth first.
+        Candidates are the extensions found frequent for the parent pattern. A maximum gap does not hold for the
+        pattern without one of its middle itemsets, so under it the sequence extensions of a child are looked for among
+        all frequent items.
+
+        :param rowLen: number of items of the pattern
+        :param row: the pattern as a tuple of items, every itemset being followed by sepSeq
+        :param latestWord: latest item of the pattern
+        :param bitmap: bitmap of the pattern
+        :param sequenceItems: candidate items of the sequence extensions
+        :param itemSetItems: candidate items of the itemset extensions, all greater than latestWord
+        """
+        bitmaps = list(self._Database.values())
+        constraints = self._constraints
+        sequenceExtensions = []
+        if constraints.extends(row.count(self._sepSeq)):
+            transformed = constraints.sequenceStep(self._bitmap, bitmap)
+            for item in sequenceItems:
+                nextBitmap = transformed & bitmaps[item]
+                sup = constraints.support(self._bitmap, nextBitmap)
+                if sup >= self._minSup:
+                    sequenceExtensions.append((item, nextBitmap, sup))
+        itemSetExtensions = []
+        for item in itemSetItems:
+            nextBitmap = bitmap & bitmaps[item]
+            sup = constraints.support(self._bitmap, nextBitmap)
+            if sup >= self._minSup:
+                itemSetExtensions.append((item, nextBitmap, sup))
+        sequenceItems = [item for item, _, _ in sequenceExtensions]
+        itemSetItems = [item for item, _, _ in itemSetExtensions]
+        childItems = list(range(len(bitmaps))) if constraints.maxGap != float("inf") else sequenceItems
+        for item, nextBitmap, sup in sequenceExtensions:
+            nextRow = row + (self._itemNames[item], self._sepSeq)
+            if rowLen > 1:
+                self._record(nextRow, sup)
+            self.makexLenDatabase(rowLen + 1, nextRow, item, nextBitmap, childItems, [i for i in sequenceItems if i > item])
+        for item, nextBitmap, sup in itemSetExtensions:
+            nextRow = row[:-1] + (self._itemNames[item], self._sepSeq)
+            if rowLen > 1:
+                self._record(nextRow, sup)
+            self.makexLenDatabase(rowLen + 1, nextRow, item, nextBitmap, childItems, [i for i in itemSetItems if i > item])
 
     @deprecated("It is recommended to use mine() instead of startMine() for mining process")
     def startMine(self):
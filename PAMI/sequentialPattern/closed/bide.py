@@ -0,0 +1,323 @@
+# BIDE is an algorithm to discover closed sequential patterns in a sequence database. A sequential pattern is closed if no
+# super-sequence has the same support. BIDE grows the patterns depth first over pseudo-projected databases like PrefixSpan
+# and checks the closure of a pattern in both directions, without keeping the patterns found so far.
+#
+# **Importing this algorithm into a python program**
+#
+#             from PAMI.sequentialPattern.closed import bide as alg
+#
+#             iFile = 'sampleDB.txt'
+#
+#             minSup = 10  # can also be specified between 0 and 1
+#
+#             obj = alg.BIDE(iFile, minSup, " ")
+#
+#             obj.startMine()
+#
+#             sequentialPatterns = obj.getPatterns()
+#
+#             print("Total number of Closed Sequential Patterns:", len(sequentialPatterns))
+#
+#             obj.save(oFile)
+#
+#             Df = obj.getPatternsAsDataFrame()
+#
+#             memUSS = obj.getMemoryUSS()
+#
+#             print("Total Memory in USS:", memUSS)
+#
+#             memRSS = obj.getMemoryRSS()
+#
+#             print("Total Memory in RSS", memRSS)
+#
+#             run = obj.getRuntime()
+#
+#             print("Total ExecutionTime in seconds:", run)
+#
+
+
+__copyright__ = """
+Copyright (C)  2021 Rage Uday Kiran
+
+     This program is free software: you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+
+     This program is distributed in the hope that it will be useful,
+     but WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+     GNU General Public License for more details.
+
+     You should have received a copy of the GNU General Public License
+     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+
+from PAMI.sequentialPattern.closed import abstract as _ab
+from PAMI.sequentialPattern.basic import PrefixSpan as _ps
+
+
+class BIDE(_ps.PrefixSpan):
+    """
+    **About this algorithm**
+
+    :**Description**: BIDE is an algorithm to discover closed sequential patterns in a sequence database. A sequential pattern is closed if no super-sequence has the same support. The patterns are grown depth first over the pseudo-projected databases of PrefixSpan. A pattern is reported only when no forward extension, no appended itemset nor item of its last itemset, and no backward extension, an item inserted before its end, has its support. A pattern whose semi-maximum periods share an item in every sequence is not extended at all, since none of its extensions can be closed.
+
+    :**Reference**:  J. Wang and J. Han, BIDE: Efficient Mining of Frequent Closed Sequences, Proceedings of the 20th
+                     International Conference on Data Engineering, ICDE 2004, 79-90, https://doi.org/10.1109/ICDE.2004.1319986
+
+    :**Parameters**:    - **iFile** (*str*) -- *Name of the Input file to mine complete set of closed sequential patterns. Every line is a sequence whose itemsets are separated by sepSeq.*
+                        - **oFile** (*str*) -- *Name of the output file to store complete set of closed sequential patterns.*
+                        - **minSup** (*int or float or str*) -- *The user can specify minSup either in count or proportion of database size. If the program detects the data type of minSup is integer, then it treats minSup is expressed in count. Otherwise, it will be treated as float.*
+                        - **sep** (*str*) -- *This variable is used to distinguish items from one another in an itemset. The default seperator is tab space. However, the users can override their default separator.*
+                        - **sepSeq** (*str*) -- *This variable is used to distinguish itemsets from one another in a sequence. The default seperator is -1.*
+
+    :**Attributes**:    - **startTime** (*float*) -- *To record the start time of the mining process.*
+                        - **endTime** (*float*) -- *To record the completion time of the mining process.*
+                        - **finalPatterns** (*dict*) -- *Storing the complete set of patterns in a dictionary variable.*
+                        - **memoryUSS** (*float*) -- *To store the total amount of USS memory consumed by the program.*
+                        - **memoryRSS** (*float*) -- *To store the total amount of RSS memory consumed by the program.*
+                        - **Database** (*list*) -- *To store the sequences of a database in list.*
+                        - **elementSets** (*list*) -- *To store the items of every itemset of the interned database as a frozenset.*
+
+    :**Methods**:       - **startMine()** -- *Mining process will start from here.*
+                        - **getPatterns()** -- *Complete set of patterns will be retrieved with this function.*
+                        - **save(oFile)** -- *Complete set of closed sequential patterns will be loaded in to a output file.*
+                        - **getPatternsAsDataFrame()** -- *Complete set of closed sequential patterns will be loaded in to a dataframe.*
+                        - **getMemoryUSS()** -- *Total amount of USS memory consumed by the mining process will be retrieved from this function.*
+                        - **getMemoryRSS()** -- *Total amount of RSS memory consumed by the mining process will be retrieved from this function.*
+                        - **getRuntime()** -- *Total amount of runtime taken by the mining process will be retrieved from this function.*
+
+    **Execution methods**
+
+    **Terminal command**
+
+    .. code-block:: console
+
+      Format:
+
+      (.venv) $ python3 bide.py <inputFile> <outputFile> <minSup> <sep>
+
+      Example Usage:
+
+      (.venv) $ python3 bide.py sampleDB.txt patterns.txt 10.0 " "
+
+    .. note:: minSup will be considered in percentage of database sequences
+
+    **Calling from a python program**
+
+    .. code-block:: python
+
+            from PAMI.sequentialPattern.closed import bide as alg
+
+            obj = alg.BIDE(iFile, minSup, " ")
+
+            obj.startMine()
+
+            sequentialPatterns = obj.getPatterns()
+
+            print("Total number of Closed Sequential Patterns:", len(sequentialPatterns))
+
+            obj.save(oFile)
+
+            Df = obj.getPatternsAsDataFrame()
+
+            memUSS = obj.getMemoryUSS()
+
+            print("Total Memory in USS:", memUSS)
+
+            memRSS = obj.getMemoryRSS()
+
+            print("Total Memory in RSS", memRSS)
+
+            run = obj.getRuntime()
+
+            print("Total ExecutionTime in seconds:", run)
+    """
+
+    def __init__(self, iFile, minSup, sep="\t", sepSeq="-1"):
+        super().__init__(iFile, minSup, sep, sepSeq=sepSeq)
+        self._elementSets = []
+
+    def _instances(self, sid, itemSets):
+        """
+        To locate the first and the last instance of the pattern in a sequence holding it
+
+        :param sid: the sequence
+        :type sid: int
+        :param itemSets: the itemsets of the pattern
+        :type itemSets: list
+        :return: first[k], the itemset where the earliest instance of the first k itemsets of the pattern ends, first[0]
+                 being before the sequence, and last[k], the itemset where the latest instance of the itemsets from k on
+                 starts, last[n] being after the sequence
+        :rtype: tuple
+        """
+        elementSets = self._elementSets
+        start, end = self._sequenceElements[sid], self._sequenceElements[sid + 1]
+        first = [start - 1]
+        element = start
+        for itemSet in itemSets:
+            while not itemSet <= elementSets[element]:
+                element += 1
+            first.append(element)
+            element += 1
+        last = [end] * (len(itemSets) + 1)
+        element = end - 1
+        for k in range(len(itemSets) - 1, -1, -1):
+            while not itemSets[k] <= elementSets[element]:
+                element -= 1
+            last[k] = element
+            element -= 1
+        return first, last
+
+    def _insertions(self, sid, itemSets, semiMaximum, candidates=None):
+        """
+        To find the items that can be inserted in the pattern in a sequence. An item inserted as a new itemset before
+        the itemset k, or at the end when k is the length of the pattern, is keyed 2 * k, and an item added to the
+        itemset k is keyed 2 * k + 1. In the maximum periods, the items are looked for between the first instance of
+        the itemsets before the insertion and the last instance of the itemsets after it, which finds every extension.
+        In the semi-maximum periods, they are looked for within the first instance of the pattern, before its last
+        itemset, which stays the first instance of the prefix of every extension of the pattern.
+
+        :param sid: a sequence holding the pattern
+        :type sid: int
+        :param itemSets: the itemsets of the pattern
+        :type itemSets: list
+        :param semiMaximum: looks in the semi-maximum periods instead of the maximum periods
+        :type semiMaximum: bool
+        :param candidates: when given, only these insertions are looked for
+        :type candidates: dict
+        :return: the items of the insertions found, keyed as above
+        :rtype: dict
+        """
+        elementSets = self._elementSets
+        first, last = self._instances(sid, itemSets)
+        length = len(itemSets)
+        insertions = {}
+        for k in range(length if semiMaximum else length + 1):
+            wanted = None if candidates is None else candidates.get(2 * k)
+            if candidates is not None and wanted is None:
+                continue
+            found = set()
+            for element in range(first[k] + 1, first[k + 1] if semiMaximum else last[k]):
+                found |= elementSets[element] if wanted is None else elementSets[element] & wanted
+            if found:
+                insertions[2 * k] = found
+        for k in range(length - 1 if semiMaximum else length):
+            wanted = None if candidates is None else candidates.get(2 * k + 1)
+            if candidates is not None and wanted is None:
+                continue
+            itemSet = itemSets[k]
+            found = set()
+            for element in (first[k + 1],) if semiMaximum else range(first[k] + 1, last[k + 1]):
+                if itemSet <= elementSets[element]:
+                    found |= elementSets[element] - itemSet if wanted is None else elementSets[element] & wanted
+            if found:
+                insertions[2 * k + 1] = found
+        return insertions
+
+    def _extensible(self, sids, semiMaximum):
+        """
+        To check whether one insertion is found in every sequence holding the pattern. The shortest sequences are
+        scanned first, and every other sequence is only searched for the insertions common to the sequences before it.
+
+        :param sids: the sequences holding the pattern
+        :type sids: list
+        :param semiMaximum: looks in the semi-maximum periods instead of the maximum periods
+        :type semiMaximum: bool
+        :return: True if an insertion is common to all the sequences
+        :rtype: bool
+        """
+        itemSets = [frozenset(itemSet) for itemSet in self._pattern]
+        sequenceElements = self._sequenceElements
+        common = None
+        for sid in sorted(sids, key=lambda sid: sequenceElements[sid + 1] - sequenceElements[sid]):
+            common = self._insertions(sid, itemSets, semiMaximum, common)
+            if not common:
+                return False
+        return True
+
+    def _bide(self, projected, support):
+        """
+        To record the pattern held in self._pattern if it is closed and to mine its extensions depth first
+
+        :param projected: the (sid, offset) entries of the pattern, one per sequence holding it
+        :type projected: list
+        :param support: the support of the pattern
+        :type support: int
+        """
+        sids = [sid for sid, _ in projected]
+        if self._extensible(sids, True):
+            return
+        lastItemSet = self._pattern[-1]
+        iProjected, sProjected = self._project(projected, lastItemSet)
+        iProjected = {item: entries for item, entries in iProjected.items() if len(entries) >= self._minSup}
+        sProjected = {item: entries for item, entries in sProjected.items() if len(entries) >= self._minSup}
+        closed = all(len(entries) != support for entries in iProjected.values())
+        closed = closed and all(len(entries) != support for entries in sProjected.values())
+        if closed and not self._extensible(sids, False):
+            self._record(support)
+        for item, entries in sorted(iProjected.items()):
+            lastItemSet.append(item)
+            self._bide(entries, len(entries))
+            lastItemSet.pop()
+        for item, entries in sorted(sProjected.items()):
+            self._pattern.append([item])
+            self._bide(entries, len(entries))
+            self._pattern.pop()
+
+    def _mineFrequentSequences(self):
+        """
+        To mine the closed sequences depth first from the frequent items
+        """
+        self._elementSets = [frozenset(self._items[self._elementOffsets[element]:self._elementOffsets[element + 1]])
+                             for element in range(len(self._elementOffsets) - 1)]
+        for item, entries in enumerate(self._projectItems()):
+            self._pattern = [[item]]
+            self._bide(entries, self._oneSupports[item])
+
+    def startMine(self):
+        """
+        Closed sequential pattern mining process will start from here
+        """
+        self._Database = []
+        self._finalPatterns = {}
+        self._startTime = _ab._time.time()
+        self._creatingItemSets()
+        self._minSup = self._convert(self._minSup)
+        self._internDatabase()
+        self._mineFrequentSequences()
+        self._endTime = _ab._time.time()
+        process = _ab._psutil.Process(_ab._os.getpid())
+        self._memoryUSS = float()
+        self._memoryRSS = float()
+        self._memoryUSS = process.memory_full_info().uss
+        self._memoryRSS = process.memory_info().rss
+        print("Closed sequential patterns were generated successfully using BIDE algorithm ")
+
+    def printResults(self):
+        """
+        This function is used to print the results
+        """
+        print("Total number of Closed Sequential Patterns:", len(self.getPatterns()))
+        print("Total Memory in USS:", self.getMemoryUSS())
+        print("Total Memory in RSS", self.getMemoryRSS())
+        print("Total ExecutionTime in ms:", self.getRuntime())
+
+
+if __name__ == "__main__":
+    _ap = str()
+    if len(_ab._sys.argv) == 4 or len(_ab._sys.argv) == 5:
+        if len(_ab._sys.argv) == 5:
+            _ap = BIDE(_ab._sys.argv[1], _ab._sys.argv[3], _ab._sys.argv[4])
+        if len(_ab._sys.argv) == 4:
+            _ap = BIDE(_ab._sys.argv[1], _ab._sys.argv[3])
+        _ap.startMine()
+        print("Total number of Closed Sequential Patterns:", len(_ap.getPatterns()))
+        _ap.save(_ab._sys.argv[2])
+        print("Total Memory in USS:", _ap.getMemoryUSS())
+        print("Total Memory in RSS", _ap.getMemoryRSS())
+        print("Total ExecutionTime in ms:", _ap.getRuntime())
+    else:
+        print("Error! The number of input parameters do not match the total number of parameters provided")
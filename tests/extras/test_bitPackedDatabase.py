@@ -0,0 +1,149 @@
+import os
+import random
+import tempfile
+import unittest
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from PAMI.extras import bitPackedDatabase as bp
+from PAMI.extras.converters import CSV2BitInteger, CSV2Integer
+from PAMI.partialPeriodicPattern.basic.PPP_ECLAT import PPP_ECLAT
+from PAMI.partialPeriodicPattern.closed.PPPClose import PPPClose
+from PAMI.partialPeriodicPattern.topk.k3PMiner import k3PMiner
+from PAMI.periodicFrequentPattern.basic.PFECLAT import PFECLAT
+from PAMI.periodicFrequentPattern.basic.PFPMC import PFPMC
+from PAMI.periodicFrequentPattern.closed.CPFPMiner import CPFPMiner
+from PAMI.periodicFrequentPattern.topk.kPFPMiner.kPFPMiner import kPFPMiner
+from tests.temporalGen import generate_temporal_dataset, write_dataset
+
+warnings.filterwarnings("ignore")
+
+
+def generate_skewed_temporal_dataset(num_timestamps, num_items, seed):
+    rng = random.Random(seed)
+    return [(ts, [item for item in range(1, num_items + 1) if rng.random() < 1.0 / item] or [1])
+            for ts in range(1, num_timestamps + 1)]
+
+
+def item_timestamps(dataset):
+    timestamps = {}
+    for ts, items in dataset:
+        for item in items:
+            timestamps.setdefault(str(item), []).append(ts)
+    return timestamps
+
+
+def normalise(patterns):
+    result = {}
+    for pattern, value in patterns.items():
+        if isinstance(value, (list, tuple)):
+            value = tuple(value[:2])
+        result[tuple(sorted(pattern.replace("\t", " ").split()))] = value
+    return result
+
+
+class TestKernels(unittest.TestCase):
+    def test_kernels_match_the_timestamps(self):
+        rng = random.Random(0)
+        for _ in range(500):
+            maxTS = rng.choice([5, 63, 64, 65, 127, 300])
+            density = rng.choice([0.0, 0.02, 0.2, 0.6, 1.0])
+            ts = [t for t in range(maxTS + 1) if rng.random() < density]
+            words = bp.bitPackedDatabase.fromTimestamps({"a": ts, "b": [maxTS]}).items["a"]
+            stamps = np.array(ts, dtype=np.int64)
+            self.assertEqual(bp.timestamps(words).tolist(), ts)
+            self.assertEqual(bp.support(words), len(ts))
+            self.assertEqual(bp.span(words), (ts[0], ts[-1]) if ts else None)
+            expected = max(ts[0], maxTS - ts[-1], int(np.diff(stamps).max(initial=0))) if ts else maxTS
+            self.assertEqual(bp.periodicity(words, maxTS), expected, ts)
+            for period in (0, 1, 1.5, 2, 7, 31, 62, 63, 64, 200, float("inf")):
+                self.assertEqual(bp.periodicSupport(words, period),
+                                 int(np.count_nonzero(np.diff(stamps) <= period)), (ts, period))
+
+
+class TestRead(unittest.TestCase):
+    def setUp(self):
+        self.dataset = generate_temporal_dataset(150, 8, 4, 1)
+        self.file = write_dataset(self.dataset)
+        self.expected = item_timestamps(self.dataset)
+
+    def tearDown(self):
+        os.remove(self.file)
+
+    def read(self, convert, layout='auto'):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "db.parquet")
+            convert(self.file, path)
+            return bp.bitPackedDatabase.read(path, layout)
+
+    def assertTimestamps(self, database):
+        self.assertEqual({item: bp.timestamps(words).tolist() for item, words in database.items.items()},
+                         self.expected)
+
+    def test_converters_record_their_layout(self):
+        self.assertTimestamps(self.read(CSV2BitInteger.csvToBitInteger))
+        self.assertTimestamps(self.read(CSV2BitInteger.csvToBitInteger, 'bits'))
+        database = self.read(CSV2Integer.csvToBitInteger)
+        self.assertEqual(sorted(bp.timestamps(words).tolist() for words in database.items.values()),
+                         sorted(self.expected.values()))
+
+    def test_save_round_trip(self):
+        database = bp.bitPackedDatabase.fromTimestamps(self.expected)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "db.parquet")
+            database.save(path)
+            self.assertTimestamps(bp.bitPackedDatabase.read(path))
+
+    def test_unrecorded_layout(self):
+        words = pd.DataFrame(np.array([[3, 0], [0, 1]], dtype=np.uint32), index=["a", "b"], columns=["0", "1"])
+        database = bp.bitPackedDatabase.read(words)
+        self.assertEqual(bp.timestamps(database.items["a"]).tolist(), [30, 31])
+        ambiguous = pd.DataFrame(np.array([[1, 0], [0, 1]], dtype=np.uint32), index=["a", "b"], columns=["0", "1"])
+        with self.assertRaises(ValueError):
+            bp.bitPackedDatabase.read(ambiguous)
+        self.assertEqual(bp.timestamps(bp.bitPackedDatabase.read(ambiguous, 'bits').items["b"]).tolist(), [1])
+        self.assertEqual(bp.timestamps(bp.bitPackedDatabase.read(ambiguous, 'words').items["b"]).tolist(), [63])
+        with self.assertRaises(ValueError):
+            bp.bitPackedDatabase.read(ambiguous, 'columns')
+
+
+class TestMiners(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def assertSamePatterns(self, dataset, miner, *args):
+        file = write_dataset(dataset)
+        try:
+            parquet = os.path.join(self.directory.name, "db.parquet")
+            bp.bitPackedDatabase.fromTimestamps(item_timestamps(dataset)).save(parquet)
+            results = []
+            for iFile in (file, parquet, bp.bitPackedDatabase.read(parquet)):
+                obj = miner(iFile, *args)
+                # CPFPMiner names its mining method Mine
+                obj.Mine() if miner is CPFPMiner else obj.mine()
+                results.append(normalise(obj.getPatterns()))
+        finally:
+            os.remove(file)
+        self.assertGreater(max(len(pattern) for pattern in results[0]), 1, miner.__name__)
+        self.assertEqual(results[1], results[0], miner.__name__)
+        self.assertEqual(results[2], results[0], miner.__name__)
+
+    def test_bit_packed_input_matches_text_input(self):
+        dataset = generate_temporal_dataset(300, 6, 6, 2)
+        self.assertSamePatterns(dataset, PFECLAT, 20, 20, "\t")
+        self.assertSamePatterns(dataset, PFPMC, 20, 20, "\t")
+        self.assertSamePatterns(dataset, PPP_ECLAT, 30, 3, "\t")
+        self.assertSamePatterns(dataset, PPPClose, 20, 2, "\t")
+        self.assertSamePatterns(dataset, CPFPMiner, 20, 20, "\t")
+        self.assertSamePatterns(dataset, kPFPMiner, 40, "\t")
+        # k3PMiner only keeps an itemset beating the weakest item, so it needs items of unequal frequency
+        self.assertSamePatterns(generate_skewed_temporal_dataset(300, 8, 1), k3PMiner, 40, 8, "\t")
+
+
+if __name__ == '__main__':
+    unittest.main()
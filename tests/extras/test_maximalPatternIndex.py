@@ -0,0 +1,67 @@
+import random
+import unittest
+
+from PAMI.extras import maximalPatternIndex as mpi
+
+
+def generate_patterns(num_patterns, num_items, max_items_per_pattern, seed):
+    rng = random.Random(seed)
+    items = ["item-{}".format(i) for i in range(1, num_items + 1)]
+    return [rng.sample(items, rng.randint(1, max_items_per_pattern)) for _ in range(num_patterns)]
+
+
+def brute_force(patterns, itemSet):
+    return any(set(itemSet) <= set(pattern) for pattern in patterns)
+
+
+class TestMaximalPatternIndex(unittest.TestCase):
+    def test_has_superset(self):
+        patterns = generate_patterns(30, 12, 6, 3)
+        candidates = generate_patterns(300, 14, 4, 4)
+        index = mpi.maximalPatternIndex()
+        for pattern in patterns:
+            index.add(pattern)
+        self.assertEqual(len(index), len(patterns))
+        for candidate in candidates:
+            self.assertEqual(index.hasSuperset(candidate), brute_force(patterns, candidate), candidate)
+        self.assertTrue(index.hasSuperset([]))
+        self.assertFalse(mpi.maximalPatternIndex().hasSuperset(["item-1"]))
+
+    def test_focus_keeps_the_patterns_containing_the_prefix(self):
+        patterns = generate_patterns(40, 8, 5, 5)
+        index = mpi.maximalPatternIndex()
+        for pattern in patterns:
+            index.add(pattern)
+        for prefix in (["item-1"], ["item-2", "item-5"], ["item-3", "item-4", "item-7"]):
+            focused = index.focus(prefix)
+            kept = [pattern for pattern in patterns if set(prefix) <= set(pattern)]
+            self.assertEqual(sorted(focused.patterns), sorted(index.encode(pattern) for pattern in kept))
+            for candidate in generate_patterns(50, 8, 3, 6):
+                self.assertEqual(focused.hasSuperset(prefix + candidate), brute_force(kept, prefix + candidate))
+
+    def test_add_propagates_to_every_index_focused_from(self):
+        index = mpi.maximalPatternIndex()
+        index.add(["a", "b"])
+        child = index.focus(["a"])
+        grandchild = child.focus(["a", "c"])
+        sibling = index.focus(["b"])
+        self.assertEqual(len(grandchild), 0)
+        grandchild.add(["a", "c", "d"])
+        for focused in (index, child, grandchild):
+            self.assertTrue(focused.hasSuperset(["a", "c", "d"]))
+        self.assertFalse(sibling.hasSuperset(["a", "c", "d"]))
+        self.assertEqual((len(index), len(child), len(grandchild), len(sibling)), (2, 2, 1, 1))
+        child.add(["a", "e"])
+        self.assertEqual((len(index), len(child), len(grandchild)), (3, 3, 1))
+        self.assertFalse(grandchild.hasSuperset(["a", "e"]))
+
+    def test_focused_indexes_share_the_item_bits(self):
+        index = mpi.maximalPatternIndex()
+        focused = index.focus(["x"])
+        focused.add(["x", "y"])
+        self.assertIs(focused.bits, index.bits)
+        self.assertEqual(index.encode(["x", "y"]), focused.patterns[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,165 @@
+import copy
+import random
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from PAMI.extras import utilityProjection as up
+
+
+class Transaction:
+    offset = 0
+    prefixUtility = 0
+
+    def __init__(self, items, utilities, transactionUtility):
+        self.items = items
+        self.utilities = utilities
+        self.transactionUtility = transactionUtility
+
+
+def generate_transactions(num_transactions, num_items, max_items_per_transaction, seed):
+    rng = random.Random(seed)
+    transactions = []
+    for _ in range(num_transactions):
+        items = sorted(rng.sample(range(1, num_items + 1), rng.randint(1, max_items_per_transaction)))
+        utilities = [rng.randint(1, 10) for _ in items]
+        transaction = Transaction(items, utilities, sum(utilities))
+        transaction.offset = rng.randint(0, len(items) - 1)
+        transaction.prefixUtility = rng.randint(0, 20)
+        transactions.append(transaction)
+    return transactions
+
+
+def brute_force_project(transactions, item):
+    utility, support, projected = 0, 0, {}
+    for transaction in transactions:
+        items = transaction.items[transaction.offset:]
+        if item not in items:
+            continue
+        position = items.index(item)
+        prefixUtility = transaction.prefixUtility + transaction.utilities[transaction.offset + position]
+        count = getattr(transaction, 'support', 1)
+        utility += prefixUtility
+        support += count
+        key = tuple(items[position + 1:])
+        if not key:
+            continue
+        remaining = transaction.utilities[transaction.offset + position + 1:]
+        merged = projected.setdefault(key, [[0] * len(key), 0, 0, 0])
+        merged[0] = [a + b for a, b in zip(merged[0], remaining)]
+        merged[1] += prefixUtility
+        merged[2] += count
+        merged[3] += sum(remaining)
+    return utility, support, projected
+
+
+def describe(projected):
+    return {tuple(t.items[t.offset:]): [list(t.utilities[t.offset:]), t.prefixUtility, t.support, t.transactionUtility]
+            for t in projected}
+
+
+def flatten(transactions):
+    items = np.array([item for items, _, _ in transactions for item in items], dtype=np.int64)
+    utilities = np.array([utility for _, utilities, _ in transactions for utility in utilities], dtype=np.int64)
+    offsets = np.zeros(len(transactions) + 1, dtype=np.int64)
+    np.cumsum([len(items) for items, _, _ in transactions], out=offsets[1:])
+    prefixUtilities = np.array([prefixUtility for _, _, prefixUtility in transactions], dtype=np.int64)
+    return items, utilities, offsets, prefixUtilities
+
+
+def brute_force_merge(transactions):
+    merged = {}
+    for items, utilities, prefixUtility in transactions:
+        group = merged.setdefault(tuple(items), [[0] * len(items), 0])
+        group[0] = [a + b for a, b in zip(group[0], utilities)]
+        group[1] += prefixUtility
+    return [(list(items), utilities, prefixUtility) for items, (utilities, prefixUtility) in merged.items()]
+
+
+def unflatten(items, utilities, offsets, prefixUtilities):
+    return [(items[offsets[t]:offsets[t + 1]].tolist(), utilities[offsets[t]:offsets[t + 1]].tolist(),
+             int(prefixUtilities[t])) for t in range(len(offsets) - 1)]
+
+
+class TestProject(unittest.TestCase):
+    def assertProjects(self, transactions, item):
+        before = copy.deepcopy([t.__dict__ for t in transactions])
+        utility, support, projected = up.project(transactions, item, Transaction)
+        expected = brute_force_project(transactions, item)
+        self.assertEqual((utility, support), expected[:2])
+        self.assertEqual(len(projected), len(expected[2]))
+        self.assertEqual(describe(projected), expected[2])
+        self.assertEqual([t.__dict__ for t in transactions], before)
+        return projected
+
+    def test_matches_brute_force(self):
+        for seed in range(20):
+            transactions = generate_transactions(60, 8, 6, seed)
+            for item in range(1, 9):
+                projected = self.assertProjects(transactions, item)
+                self.assertProjects(projected, item + 1)
+
+    def test_non_adjacent_duplicates_are_merged(self):
+        first = Transaction([1, 2, 3], [1, 2, 3], 6)
+        other = Transaction([2, 4], [5, 6], 11)
+        second = Transaction([0, 2, 3], [7, 8, 9], 24)
+        second.offset = 1
+        projected = self.assertProjects([first, other, second], 2)
+        self.assertEqual(describe(projected), {(3,): [[12], 10, 2, 12], (4,): [[6], 5, 1, 6]})
+
+    def test_colliding_suffixes_are_kept_apart(self):
+        transactions = [Transaction([0, 1, 4], [1, 1, 1], 3), Transaction([0, 2, 3], [1, 1, 1], 3)]
+        projected = self.assertProjects(transactions, 0)
+        self.assertEqual(len(projected), 2)
+
+    def test_long_transactions(self):
+        rng = random.Random(1)
+        transactions = []
+        for _ in range(30):
+            items = sorted(rng.sample(range(1, 101), rng.choice([70, 100])))
+            transactions.append(Transaction(items, [rng.randint(1, 5) for _ in items], 0))
+        for item in (1, 5, 30):
+            self.assertProjects(transactions, item)
+
+
+class TestMergeIdentical(unittest.TestCase):
+    def assertMerges(self, transactions):
+        merged = up.mergeIdentical(*flatten(transactions))
+        self.assertEqual(unflatten(*merged), brute_force_merge(transactions))
+        return merged
+
+    def test_matches_brute_force(self):
+        rng = random.Random(2)
+        for _ in range(50):
+            transactions = []
+            for _ in range(rng.randint(2, 40)):
+                items = sorted(rng.sample(range(1, 7), rng.randint(1, 3)))
+                transactions.append((items, [rng.randint(1, 9) for _ in items], rng.randint(0, 9)))
+            self.assertMerges(transactions)
+
+    def test_distinct_transactions_are_returned_unchanged(self):
+        database = flatten([([1, 2], [1, 1], 0), ([1, 3], [2, 2], 1), ([2], [4], 2)])
+        merged = up.mergeIdentical(*database)
+        for left, right in zip(merged, database):
+            self.assertIs(left, right)
+
+    def test_forced_hash_collisions(self):
+        with mock.patch.object(up, "_weights", np.ones(64, dtype=np.uint64)):
+            self.assertMerges([([1, 4], [1, 1], 1), ([2, 3], [1, 1], 2)])
+            self.assertMerges([([1, 4], [1, 1], 1), ([2, 3], [1, 1], 2), ([1, 4], [2, 3], 4), ([5], [1], 0),
+                               ([2, 3], [5, 5], 1)])
+
+    def test_long_transactions(self):
+        weights = up._weights
+        rng = random.Random(3)
+        distinct = [sorted(rng.sample(range(1, 201), length)) for length in (65, 100, 130)]
+        transactions = [(items, [rng.randint(1, 9) for _ in items], rng.randint(0, 9))
+                        for items in distinct + distinct[::-1] + distinct[:1]]
+        self.assertMerges(transactions)
+        self.assertIs(up._weights, weights)
+        self.assertEqual(len(up._weights), 64)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+import random
+import unittest
+
+import numpy as np
+
+from PAMI.extras import utilitySearchBackend as usb
+
+
+def generate_database(num_transactions, num_items, max_items_per_transaction, max_utility, seed):
+    rng = random.Random(seed)
+    items, utils, indexesStart, indexesEnd = [], [], [], []
+    for _ in range(num_transactions):
+        transaction = sorted(rng.sample(range(1, num_items + 1), rng.randint(1, max_items_per_transaction)))
+        indexesStart.append(len(items))
+        items.extend(transaction)
+        utils.extend(rng.randint(1, max_utility) for _ in transaction)
+        indexesEnd.append(len(items))
+    return items, utils, indexesStart, indexesEnd
+
+
+def generate_candidates(num_items, size, num_prefixes, seed):
+    rng = random.Random(seed)
+    candidates, secondaryReference, secondaries = [], [], []
+    for reference in range(num_prefixes):
+        prefix = sorted(rng.sample(range(1, num_items), size - 1))
+        start = prefix[-1] + 1 if prefix else 1
+        for item in range(start, num_items + 1):
+            candidates.append(prefix + [item])
+            secondaryReference.append(reference)
+        secondaries.extend(rng.randint(0, 1) for _ in range(num_items + 1))
+    return np.array(candidates, dtype=np.int64).reshape(len(candidates), size), secondaryReference, secondaries
+
+
+@unittest.skipUnless(usb.cupyAvailable(), "the cupy backend needs cupy and a CUDA device")
+class TestCupyBackend(unittest.TestCase):
+    def test_numpy_and_cupy_backends_agree(self):
+        database = generate_database(400, 20, 8, 10, 5)
+        numpyBackend = usb.numpyBackend(*database)
+        cupyBackend = usb.cupyBackend(*database)
+        for size in (1, 2, 3):
+            candidates, secondaryReference, secondaries = generate_candidates(20, size, 1 if size == 1 else 4, size)
+            expected = numpyBackend.search(candidates, secondaryReference, secondaries, 21)
+            result = cupyBackend.search(candidates, secondaryReference, secondaries, 21)
+            for name, left, right in zip(("costs", "localUtil", "subtreeUtil"), expected, result):
+                np.testing.assert_array_equal(np.asarray(left, dtype=np.int64), np.asarray(right, dtype=np.int64),
+                                              "%s, candidates of size %d" % (name, size))
+
+
+if __name__ == '__main__':
+    unittest.main()
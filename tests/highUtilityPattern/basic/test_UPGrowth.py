@@ -0,0 +1,40 @@
+import os
+import unittest
+import warnings
+
+from PAMI.highUtilityPattern.basic.UPGrowth import UPGrowth
+from tests.utilityGen import brute_force, generate_utility_dataset, write_dataset
+
+warnings.filterwarnings("ignore")
+
+
+def run_upgrowth(dataset, min_util):
+    file = write_dataset(dataset)
+    try:
+        obj = UPGrowth(file, min_util)
+        obj.mine()
+        return {frozenset(key.split()): value for key, value in obj.getPatterns().items()}
+    finally:
+        os.remove(file)
+
+
+class TestUPGrowth(unittest.TestCase):
+    def test_tied_twu(self):
+        # u1-style databases: sixty transactions over eight items with small utilities give many items the same TWU
+        for seed in range(10):
+            dataset = generate_utility_dataset(60, 8, 5, 10, seed)
+            for min_util in (20, 30, 40, 50, 100):
+                self.assertEqual(run_upgrowth(dataset, min_util), brute_force(dataset, min_util),
+                                 "seed %d, minUtil %d" % (seed, min_util))
+
+    def test_equal_utilities(self):
+        # every utility equal, so every tie is broken by the item order alone
+        for seed in range(10):
+            dataset = [(items, [1] * len(items)) for items, _ in generate_utility_dataset(15, 8, 5, 1, seed)]
+            for min_util in (4, 6, 8):
+                self.assertEqual(run_upgrowth(dataset, min_util), brute_force(dataset, min_util),
+                                 "seed %d, minUtil %d" % (seed, min_util))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,27 @@
+import os
+import unittest
+import warnings
+
+from PAMI.highUtilityPatterns.parallel.GPUEFIM import GPUEFIM
+from tests.utilityGen import brute_force, generate_utility_dataset, write_dataset
+
+warnings.filterwarnings("ignore")
+
+
+class TestGPUEFIM(unittest.TestCase):
+    def test_numpy_backend_matches_brute_force(self):
+        for seed in (3, 11):
+            dataset = generate_utility_dataset(120, 9, 6, 10, seed)
+            file = write_dataset(dataset)
+            try:
+                for min_util in (20, 60, 150):
+                    obj = GPUEFIM(file, min_util, "\t", backend='numpy')
+                    obj.mine()
+                    patterns = {frozenset(key): value for key, value in obj.getPatterns().items()}
+                    self.assertEqual(patterns, brute_force(dataset, min_util), "seed %d, minUtil %d" % (seed, min_util))
+            finally:
+                os.remove(file)
+
+
+if __name__ == '__main__':
+    unittest.main()
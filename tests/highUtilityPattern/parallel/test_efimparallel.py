@@ -0,0 +1,55 @@
+import multiprocessing
+import os
+import unittest
+import warnings
+from unittest import mock
+
+from PAMI.highUtilityPattern.parallel import efimparallel
+from tests.utilityGen import brute_force, generate_utility_dataset, write_dataset
+
+warnings.filterwarnings("ignore")
+
+
+def shared_blocks():
+    return set(os.listdir("/dev/shm")) if os.path.isdir("/dev/shm") else set()
+
+
+class TestEfimParallel(unittest.TestCase):
+    def setUp(self):
+        self.dataset = generate_utility_dataset(80, 10, 6, 10, 7)
+        self.file = write_dataset(self.dataset)
+
+    def tearDown(self):
+        os.remove(self.file)
+
+    def mine(self, min_util, threads):
+        obj = efimparallel.efimParallel(self.file, min_util, "\t", threads)
+        obj.mine()
+        return {frozenset(key.split("\t")): value for key, value in obj.getPatterns().items()}
+
+    def test_matches_brute_force(self):
+        for min_util in (30, 60, 120):
+            expected = brute_force(self.dataset, min_util)
+            for threads in (1, 3):
+                self.assertEqual(self.mine(min_util, threads), expected, "minUtil %d, threads %d" % (min_util, threads))
+
+    @unittest.skipUnless(multiprocessing.get_start_method() == "fork", "the patched search reaches the workers by fork")
+    def test_worker_exception_is_raised(self):
+        before = shared_blocks()
+        with mock.patch.object(efimparallel, "_extend", side_effect=ValueError("broken projection")):
+            with self.assertRaisesRegex(ValueError, "broken projection"):
+                self.mine(30, 3)
+        self.assertEqual(shared_blocks() - before, set())
+
+    @unittest.skipUnless(multiprocessing.get_start_method() == "fork", "the patched search reaches the workers by fork")
+    def test_dead_worker_is_reported(self):
+        before = shared_blocks()
+        with mock.patch.object(efimparallel, "_pollInterval", 0.1), \
+                mock.patch.object(efimparallel, "_extend", side_effect=lambda *args: os._exit(3)):
+            with self.assertRaisesRegex(RuntimeError, "exit code 3"):
+                self.mine(30, 3)
+        self.assertEqual(shared_blocks() - before, set())
+
+
+if __name__ == '__main__':
+    unittest.main()
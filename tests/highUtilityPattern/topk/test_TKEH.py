@@ -0,0 +1,53 @@
+import os
+import unittest
+import warnings
+
+from PAMI.highUtilityPattern.topk.TKEH import TKEH
+from tests.utilityGen import brute_force, generate_utility_dataset, write_dataset
+
+warnings.filterwarnings("ignore")
+
+
+def run_tkeh(dataset, k):
+    file = write_dataset(dataset)
+    try:
+        obj = TKEH(file, k)
+        obj.mine()
+        return {frozenset(key.split("\t")): value for key, value in obj.getPatterns().items()}
+    finally:
+        os.remove(file)
+
+
+class TestTKEH(unittest.TestCase):
+    def check_top_k(self, dataset, k):
+        oracle = brute_force(dataset)
+        patterns = run_tkeh(dataset, k)
+        expected = sorted(oracle.values(), reverse=True)[:k]
+        self.assertEqual(len(patterns), len(expected))
+        for pattern, utility in patterns.items():
+            self.assertEqual(utility, oracle.get(pattern), "utility of %s" % sorted(pattern))
+        # ties at the k-th utility may be broken either way, but the utilities must be the k best ones
+        self.assertEqual(sorted(patterns.values(), reverse=True), expected)
+        kth = expected[-1] if expected else 0
+        for pattern, utility in oracle.items():
+            if utility > kth:
+                self.assertIn(pattern, patterns)
+
+    def test_top_k(self):
+        for seed in range(10):
+            dataset = generate_utility_dataset(40, 10, 5, 10, seed)
+            for k in (1, 5, 20, 100):
+                self.check_top_k(dataset, k)
+
+    def test_k_exceeds_occurring_itemsets(self):
+        for seed in range(5):
+            dataset = generate_utility_dataset(20, 8, 4, 10, seed)
+            occurring = len(brute_force(dataset))
+            patterns = run_tkeh(dataset, occurring + 500)
+            self.assertEqual(len(patterns), occurring)
+            self.assertTrue(all(utility > 0 for utility in patterns.values()))
+            self.check_top_k(dataset, occurring + 500)
+
+
+if __name__ == '__main__':
+    unittest.main()
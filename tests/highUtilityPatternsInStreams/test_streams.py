@@ -0,0 +1,78 @@
+import asyncio
+import random
+import unittest
+import warnings
+
+from PAMI.highUtilityPatternsInStreams import HUPMS, SHUGrowth
+from tests.utilityGen import as_line, brute_force, generate_utility_dataset
+
+warnings.filterwarnings("ignore")
+
+MINERS = (HUPMS.HUPMS, SHUGrowth.SHUGrowth)
+
+
+def generate_stream(num_transactions, items, max_items_per_transaction, max_utility, seed):
+    """Transactions as (items, utilities, transaction utility)"""
+    return [(chosen, utilities, sum(utilities)) for chosen, utilities in
+            generate_utility_dataset(num_transactions, items, max_items_per_transaction, max_utility, seed)]
+
+
+def window_patterns(miner):
+    return {frozenset(items): float(utility) for items, utility in miner.currentPatterns()}
+
+
+class TestStreamMiners(unittest.TestCase):
+    window_size, pane_size = 3, 10
+    # item names sharing their first character, listed in no particular order within a transaction
+    items = ["a", "ab", "b", "ba", "bc", "c", "ca"]
+
+    def test_lines_pushed_in_uneven_batches(self):
+        for seed in range(5):
+            stream = generate_stream(95, self.items, 4, 8, seed)
+            lines = [as_line(transaction, ",") for transaction in stream]
+            for min_util in (20, 30, 45):
+                for cls in MINERS:
+                    miner = cls(None, None, min_util, self.window_size, self.pane_size)
+                    rng = random.Random(seed)
+                    position = 0
+                    while position < len(lines):
+                        size = rng.randint(1, 25)
+                        miner.addTransactions(lines[position:position + size])
+                        position = min(position + size, len(lines))
+                        # the window holds the last complete panes only
+                        end = (position // self.pane_size) * self.pane_size
+                        start = max(0, end - self.window_size * self.pane_size)
+                        self.assertEqual(window_patterns(miner), brute_force(stream[start:end], min_util),
+                                         "%s, seed %d, minUtil %d, after %d transactions"
+                                         % (cls.__name__, seed, min_util, position))
+
+    def test_transactions_ending_at_a_shared_node(self):
+        # <a b c> ends at the node of c in both panes, and <a b c d> continues below it in the first one
+        stream = [(["a", "b", "c"], [1, 1, 10], 12), (["a", "b", "c", "d"], [5, 5, 1, 5], 16),
+                  (["a", "b", "c"], [1, 1, 1], 3), (["e"], [1], 1)]
+        for cls in MINERS:
+            miner = cls(None, None, 15, 2, 2)
+            miner.addTransactions(stream)
+            self.assertEqual(window_patterns(miner), brute_force(stream, 15), cls.__name__)
+
+    def test_queue_and_short_pane(self):
+        stream = generate_stream(45, self.items, 4, 8, 3)
+        for cls in MINERS:
+            miner = cls(None, None, 30, self.window_size, self.pane_size)
+
+            async def feed():
+                queue = asyncio.Queue()
+                for items, utilities, total in stream:
+                    await queue.put((items, [float(u) for u in utilities], float(total)))
+                await queue.put(None)
+                await miner.addTransactionsFromQueue(queue)
+
+            asyncio.run(feed())
+            # the window holds the panes 10-20, 20-30 and 30-40, and the five pending transactions enter it as a short
+            # pane that pushes out the oldest one
+            miner.slide()
+            self.assertEqual(window_patterns(miner), brute_force(stream[20:45], 30), cls.__name__)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,30 @@
+import os
+import unittest
+import warnings
+
+from PAMI.partialPeriodicPattern.basic.parallel3PGrowth import parallel3PGrowth
+from tests.temporalGen import generate_temporal_dataset, partial_periodic_brute_force, write_dataset
+
+warnings.filterwarnings("ignore")
+
+
+class TestParallel3PGrowth(unittest.TestCase):
+    def test_matches_brute_force(self):
+        for seed in range(3):
+            dataset = generate_temporal_dataset(150, 12, 8, seed, gaps=True)
+            file = write_dataset(dataset)
+            try:
+                for min_ps, period in ((30, 3), (15, 4), (5, 6)):
+                    expected = partial_periodic_brute_force(dataset, min_ps, period)
+                    for workers in (1, 3):
+                        obj = parallel3PGrowth(file, min_ps, period, workers)
+                        obj.mine()
+                        found = {frozenset(key.split("\t")): int(value) for key, value in obj.getPatterns().items()}
+                        self.assertEqual(found, expected, "seed %d, minPS %d, period %d, workers %d"
+                                         % (seed, min_ps, period, workers))
+            finally:
+                os.remove(file)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+import os
+import tempfile
+import unittest
+import warnings
+
+from PAMI.periodicFrequentPattern.basic.incrementalPFECLAT import incrementalPFECLAT
+from tests.temporalGen import generate_temporal_dataset, periodic_frequent_brute_force, write_dataset
+
+warnings.filterwarnings("ignore")
+
+
+def patterns_of(obj):
+    return {frozenset(key.split("\t")): (int(value[0]), int(value[1])) for key, value in obj.getPatterns().items()}
+
+
+class TestIncrementalPFECLAT(unittest.TestCase):
+    def batches(self, seed):
+        initial = generate_temporal_dataset(150, 12, 8, seed, gaps=True)
+        second = generate_temporal_dataset(40, 12, 8, seed + 100, initial[-1][0], True)
+        third = generate_temporal_dataset(25, 12, 8, seed + 200, second[-1][0], True)
+        return [initial, second, third]
+
+    def test_initial_mining(self):
+        for seed in range(3):
+            initial = self.batches(seed)[0]
+            file = write_dataset(initial)
+            try:
+                for min_sup, max_per in ((5, 30), (10, 50), (20, 25)):
+                    obj = incrementalPFECLAT(file, min_sup, max_per)
+                    obj.mine()
+                    self.assertEqual(patterns_of(obj), periodic_frequent_brute_force(initial, min_sup, max_per),
+                                     "seed %d, minSup %d, maxPer %d" % (seed, min_sup, max_per))
+            finally:
+                os.remove(file)
+
+    def test_updates_match_mining_from_scratch(self):
+        for seed in range(3):
+            batches = self.batches(seed)
+            files = [write_dataset(batch) for batch in batches]
+            try:
+                for min_sup, max_per in ((5, 30), (10, 50), (20, 25)):
+                    obj = incrementalPFECLAT(files[0], min_sup, max_per)
+                    obj.mine()
+                    database = list(batches[0])
+                    for batch, file in zip(batches[1:], files[1:]):
+                        obj.update(file)
+                        database += batch
+                        self.assertEqual(patterns_of(obj), periodic_frequent_brute_force(database, min_sup, max_per),
+                                         "seed %d, minSup %d, maxPer %d, %d transactions"
+                                         % (seed, min_sup, max_per, len(database)))
+            finally:
+                for file in files:
+                    os.remove(file)
+
+    def test_saved_state(self):
+        batches = self.batches(7)
+        files = [write_dataset(batch) for batch in batches]
+        state = tempfile.NamedTemporaryFile(suffix=".pkl", delete=False).name
+        try:
+            obj = incrementalPFECLAT(files[0], 0.05, 0.2)
+            obj.mine()
+            min_sup, max_per = 0.05 * batches[0][-1][0], 0.2 * batches[0][-1][0]
+            database = list(batches[0])
+            for batch, file in zip(batches[1:], files[1:]):
+                obj.saveState(state)
+                # the thresholds of the state replace the ones given here
+                obj = incrementalPFECLAT(None, 1, 1)
+                obj.loadState(state)
+                obj.update(file)
+                database += batch
+                self.assertEqual(patterns_of(obj), periodic_frequent_brute_force(database, min_sup, max_per))
+        finally:
+            for file in files + [state]:
+                os.remove(file)
+
+    def test_rejects_old_timestamps(self):
+        batches = self.batches(1)
+        files = [write_dataset(batches[0]), write_dataset(batches[0][-5:])]
+        try:
+            obj = incrementalPFECLAT(files[0], 5, 30)
+            obj.mine()
+            with self.assertRaises(Exception):
+                obj.update(files[1])
+        finally:
+            for file in files:
+                os.remove(file)
+
+
+if __name__ == '__main__':
+    unittest.main()
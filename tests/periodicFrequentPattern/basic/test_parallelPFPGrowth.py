@@ -0,0 +1,41 @@
+import os
+import unittest
+import warnings
+
+from PAMI.periodicFrequentPattern.basic.parallelPFPGrowth import parallelPFPGrowth
+from tests.temporalGen import generate_temporal_dataset, periodic_frequent_brute_force, write_dataset
+
+warnings.filterwarnings("ignore")
+
+
+class TestParallelPFPGrowth(unittest.TestCase):
+    def run_parallel(self, file, min_sup, max_per, workers):
+        obj = parallelPFPGrowth(file, min_sup, max_per, workers)
+        obj.mine()
+        return {frozenset(key.split("\t")): (int(value[0]), int(value[1])) for key, value in obj.getPatterns().items()}
+
+    def test_matches_brute_force(self):
+        for seed in range(3):
+            dataset = generate_temporal_dataset(150, 12, 8, seed)
+            file = write_dataset(dataset)
+            try:
+                for min_sup, max_per in ((5, 30), (10, 50), (20, 25)):
+                    expected = periodic_frequent_brute_force(dataset, min_sup, max_per, len(dataset))
+                    for workers in (1, 3):
+                        self.assertEqual(self.run_parallel(file, min_sup, max_per, workers), expected,
+                                         "seed %d, minSup %d, maxPer %d, workers %d" % (seed, min_sup, max_per, workers))
+            finally:
+                os.remove(file)
+
+    def test_relative_thresholds(self):
+        dataset = generate_temporal_dataset(200, 10, 7, 11)
+        file = write_dataset(dataset)
+        try:
+            expected = periodic_frequent_brute_force(dataset, 0.05 * len(dataset), 0.2 * len(dataset), len(dataset))
+            self.assertEqual(self.run_parallel(file, 0.05, 0.2, 2), expected)
+        finally:
+            os.remove(file)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,42 @@
+import os
+import unittest
+import warnings
+
+from PAMI.relativeHighUtilityPattern.parallel.cuREFIM import GPUEFIM
+from tests.utilityGen import brute_force, generate_utility_dataset, write_dataset
+
+warnings.filterwarnings("ignore")
+
+
+def relative_brute_force(dataset, min_util, ratio):
+    utilities = brute_force(dataset, 0)
+    expected = {}
+    for key, value in utilities.items():
+        relative = value / sum(utilities[frozenset([item])] for item in key)
+        if value >= min_util and (len(key) == 1 or relative >= ratio):
+            expected[key] = (value, 1 if len(key) == 1 else relative)
+    return expected
+
+
+class TestCuREFIM(unittest.TestCase):
+    def test_numpy_backend_matches_brute_force(self):
+        for seed in (1, 3):
+            dataset = generate_utility_dataset(100, 10, 7, 10, seed)
+            file = write_dataset(dataset)
+            try:
+                # at minUtil 300 some itemsets hold an item whose own subtree utility is below minUtil
+                for min_util, ratio in ((20, 0.1), (60, 0.3), (150, 0.5), (300, 0.2)):
+                    obj = GPUEFIM(file, min_util, ratio, "\t", backend='numpy')
+                    obj.Mine()
+                    patterns = {frozenset(key): tuple(value) for key, value in obj.getPatterns().items()}
+                    expected = relative_brute_force(dataset, min_util, ratio)
+                    self.assertEqual(patterns.keys(), expected.keys(), "seed %d, minUtil %d" % (seed, min_util))
+                    for key, (value, relative) in expected.items():
+                        self.assertEqual(patterns[key][0], value)
+                        self.assertAlmostEqual(patterns[key][1], relative)
+            finally:
+                os.remove(file)
+
+
+if __name__ == '__main__':
+    unittest.main()
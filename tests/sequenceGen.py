@@ -0,0 +1,89 @@
+import ast
+import random
+import tempfile
+
+INF = float("inf")
+
+
+def generate_sequence_dataset(num_sequences, items, max_items_per_itemset, max_itemsets_per_sequence, seed):
+    """Sequences as lists of itemsets, every itemset a sorted tuple"""
+    rng = random.Random(seed)
+    return [[tuple(sorted(rng.sample(items, rng.randint(1, max_items_per_itemset))))
+             for _ in range(rng.randint(1, max_itemsets_per_sequence))] for _ in range(num_sequences)]
+
+
+def write_dataset(dataset, sep="\t"):
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as f:
+        for sequence in dataset:
+            f.write(sep.join(sep.join(itemset) + sep + "-1" for itemset in sequence) + "\n")
+    return f.name
+
+
+def contains(sequence, pattern, constraints=None):
+    """Searches every occurrence of pattern in sequence for one whose itemsets e1 < ... < ek satisfy
+    minGap <= e(j+1) - ej < maxGap and ek - e1 < maxWindow"""
+    constraints = constraints or {}
+    min_gap = constraints.get("minGap", 1)
+    max_gap = constraints.get("maxGap", INF)
+    max_window = constraints.get("maxWindow", INF)
+
+    def search(index, start, previous, first):
+        if index == len(pattern):
+            return True
+        for position in range(start, len(sequence)):
+            if previous is not None and position - previous < min_gap:
+                continue
+            if previous is not None and position - previous >= max_gap:
+                break
+            if first is not None and position - first >= max_window:
+                break
+            if set(pattern[index]).issubset(sequence[position]) and \
+                    search(index + 1, position + 1, position, position if first is None else first):
+                return True
+        return False
+
+    return search(0, 0, None, None)
+
+
+def brute_force(dataset, min_sup, constraints=None):
+    """Depth-first enumeration of the frequent sequential patterns by S- and I-extensions under the constraints.
+    Sequences lacking a required item are not counted, patterns lacking one are grown but not reported"""
+    constraints = constraints or {}
+    required = set(constraints.get("requiredItems") or ())
+    dataset = [sequence for sequence in dataset if required.issubset(item for itemset in sequence for item in itemset)]
+    items = sorted({item for sequence in dataset for itemset in sequence for item in itemset})
+    max_len = constraints.get("maxLen", INF)
+    patterns = {}
+
+    def grow(pattern):
+        for item in items:
+            candidates = [pattern + [[item]]]
+            if pattern and item > pattern[-1][-1]:
+                candidates.append(pattern[:-1] + [pattern[-1] + [item]])
+            for candidate in candidates:
+                if len(candidate) > max_len:
+                    continue
+                support = sum(1 for sequence in dataset if contains(sequence, candidate, constraints))
+                if support < min_sup:
+                    continue
+                if required.issubset(item for itemset in candidate for item in itemset):
+                    patterns[tuple(tuple(itemset) for itemset in candidate)] = support
+                grow(candidate)
+
+    grow([])
+    return patterns
+
+
+def parse(key):
+    """Reads the pattern keys of the miners: a list of items and -1 separators, as a list or as a string"""
+    key = str(key).strip()
+    tokens = list(ast.literal_eval(key)) if key[0] in "([" else key.split()
+    pattern, itemset = [], []
+    for token in tokens + ["-1"]:
+        if token in ("-1", "-2"):
+            if itemset:
+                pattern.append(tuple(sorted(itemset)))
+            itemset = []
+        else:
+            itemset.append(token)
+    return tuple(pattern)
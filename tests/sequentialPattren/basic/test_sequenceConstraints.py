@@ -0,0 +1,64 @@
+import contextlib
+import importlib
+import io
+import os
+import unittest
+import warnings
+
+from tests.sequenceGen import brute_force, generate_sequence_dataset, parse, write_dataset
+
+warnings.filterwarnings("ignore")
+
+MINERS = ("PrefixSpan", "SPADE", "SPAM", "bitSPADE")
+
+
+def run_miner(name, file, min_sup, constraints):
+    module = importlib.import_module("PAMI.sequentialPattern.basic." + name)
+    obj = getattr(module, name)(file, min_sup, " ", **constraints)
+    with contextlib.redirect_stdout(io.StringIO()):
+        obj.startMine()
+    return {parse(key): value for key, value in obj.getPatterns().items()}
+
+
+class TestSequenceConstraints(unittest.TestCase):
+    CASES = (
+        {},
+        {"maxGap": 2},
+        {"maxGap": 3},
+        {"minGap": 2},
+        {"maxWindow": 3},
+        {"minGap": 2, "maxGap": 3, "maxWindow": 4},
+        {"maxLen": 2},
+        {"requiredItems": ["b"]},
+        {"maxGap": 2, "maxLen": 3, "requiredItems": ["a"]},
+    )
+
+    def setUp(self):
+        self.dataset = generate_sequence_dataset(40, list("abcdef"), 3, 6, 5)
+        self.file = write_dataset(self.dataset, " ")
+
+    def tearDown(self):
+        os.remove(self.file)
+
+    def test_miners_match_brute_force(self):
+        for min_sup in (6, 12):
+            for constraints in self.CASES:
+                expected = brute_force(self.dataset, min_sup, constraints)
+                for name in MINERS:
+                    self.assertEqual(run_miner(name, self.file, min_sup, constraints), expected,
+                                     "%s, minSup %d, %s" % (name, min_sup, constraints))
+
+    def test_prefixspan_maxlen_alias(self):
+        from PAMI.sequentialPattern.basic.PrefixSpan import PrefixSpan
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            obj = PrefixSpan(self.file, 6, " ", maxlen=2)
+        self.assertTrue(any(issubclass(w.category, DeprecationWarning) for w in caught))
+        with contextlib.redirect_stdout(io.StringIO()):
+            obj.startMine()
+        found = {parse(key): value for key, value in obj.getPatterns().items()}
+        self.assertEqual(found, brute_force(self.dataset, 6, {"maxLen": 2}))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+import contextlib
+import io
+import os
+import random
+import unittest
+import warnings
+
+from PAMI.sequentialPattern.closed.bide import BIDE
+from tests.sequenceGen import brute_force, contains, generate_sequence_dataset, parse, write_dataset
+
+warnings.filterwarnings("ignore")
+
+
+def plant_sequences(num_sequences, seed):
+    """Random sequences, most of them holding the pattern <(a b) (a c)>, so that many frequent patterns are not closed"""
+    rng = random.Random(seed)
+    dataset = []
+    for sequence in generate_sequence_dataset(num_sequences, list("cdef"), 2, 3, seed):
+        if rng.random() < 0.6:
+            first = rng.randint(0, len(sequence))
+            sequence.insert(first, ("a", "b"))
+            sequence.insert(rng.randint(first + 1, len(sequence)), ("a", "c"))
+        dataset.append(sequence)
+    return dataset
+
+
+def closed_sequences(dataset, min_sup):
+    """The frequent patterns that no other frequent pattern with the same support contains"""
+    patterns = brute_force(dataset, min_sup)
+    return {pattern: support for pattern, support in patterns.items()
+            if not any(other != pattern and patterns[other] == support and contains(other, pattern)
+                       for other in patterns)}
+
+
+def run_bide(dataset, min_sup):
+    file = write_dataset(dataset)
+    try:
+        obj = BIDE(file, min_sup)
+        with contextlib.redirect_stdout(io.StringIO()):
+            obj.startMine()
+        return {parse(key): value for key, value in obj.getPatterns().items()}
+    finally:
+        os.remove(file)
+
+
+class TestBIDE(unittest.TestCase):
+    def test_matches_brute_force(self):
+        for seed in range(4):
+            dataset = generate_sequence_dataset(30, list("abcde"), 3, 4, seed)
+            for min_sup in (4, 8, 12):
+                self.assertEqual(run_bide(dataset, min_sup), closed_sequences(dataset, min_sup),
+                                 "seed %d, minSup %d" % (seed, min_sup))
+
+    def test_planted_pattern(self):
+        for seed in range(3):
+            dataset = plant_sequences(30, seed)
+            for min_sup in (4, 8, 12):
+                self.assertEqual(run_bide(dataset, min_sup), closed_sequences(dataset, min_sup),
+                                 "seed %d, minSup %d" % (seed, min_sup))
+
+    def test_repeated_items(self):
+        # few items and long sequences, so that items repeat and the backward extensions are exercised
+        for seed in range(4):
+            dataset = generate_sequence_dataset(20, list("abc"), 2, 6, seed)
+            for min_sup in (5, 10):
+                self.assertEqual(run_bide(dataset, min_sup), closed_sequences(dataset, min_sup),
+                                 "seed %d, minSup %d" % (seed, min_sup))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+import random
+import tempfile
+
+
+def generate_temporal_dataset(num_transactions, num_items, max_items_per_transaction, seed, start=0, gaps=False):
+    """Transactions with increasing timestamps from start on, items 0 to num_items - 1 drawn with skewed probabilities
+    so that periodic itemsets exist. With gaps, a few timestamps are skipped"""
+    rng = random.Random(seed)
+    weights = [1.0 / (item + 2) ** 0.5 for item in range(num_items)]
+    dataset = []
+    ts = start
+    for _ in range(num_transactions):
+        ts += rng.choice((1, 1, 1, 2)) if gaps else 1
+        size = rng.randint(1, max_items_per_transaction)
+        dataset.append((ts, set(rng.choices(range(num_items), weights=weights, k=size))))
+    return dataset
+
+
+def _levelwise(dataset, measure):
+    """Level-wise enumeration of the itemsets for which measure, called with their timestamps and anti-monotone,
+    returns a value other than None"""
+    patterns = {}
+    level = [(item,) for item in sorted({item for _, items in dataset for item in items})]
+    while level:
+        kept = []
+        for candidate in level:
+            value = measure([ts for ts, items in dataset if items.issuperset(candidate)])
+            if value is not None:
+                patterns[frozenset(str(item) for item in candidate)] = value
+                kept.append(candidate)
+        level = sorted({a + (b[-1],) for a in kept for b in kept if a[:-1] == b[:-1] and a[-1] < b[-1]})
+    return patterns
+
+
+def periodic_frequent_brute_force(dataset, min_sup, max_per, max_ts=None):
+    """The (support, periodicity) of every periodic-frequent itemset, the periodicity closed by max_ts, the last
+    timestamp of the dataset by default"""
+    max_ts = max(ts for ts, _ in dataset) if max_ts is None else max_ts
+
+    def measure(timestamps):
+        if len(timestamps) < min_sup:
+            return None
+        stamps = [0] + timestamps + [max_ts]
+        period = max(b - a for a, b in zip(stamps, stamps[1:]))
+        return (len(timestamps), period) if period <= max_per else None
+
+    return _levelwise(dataset, measure)
+
+
+def partial_periodic_brute_force(dataset, min_ps, period):
+    """The periodic-support, the number of consecutive occurrences at most period apart, of every partial periodic
+    itemset"""
+    def measure(timestamps):
+        periodic_support = sum(1 for a, b in zip(timestamps, timestamps[1:]) if b - a <= period)
+        return periodic_support if periodic_support >= min_ps else None
+
+    return _levelwise(dataset, measure)
+
+
+def write_dataset(dataset):
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as f:
+        for ts, items in dataset:
+            f.write("\t".join([str(ts)] + [str(item) for item in sorted(items)]) + "\n")
+    return f.name
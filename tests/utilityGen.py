@@ -0,0 +1,38 @@
+import random
+import tempfile
+from itertools import combinations
+
+
+def generate_utility_dataset(num_transactions, items, max_items_per_transaction, max_utility, seed):
+    """Transactions as (items, utilities), the items listed in no particular order. items is either the number of
+    items, named 1 to items, or the list of their names"""
+    rng = random.Random(seed)
+    population = range(1, items + 1) if isinstance(items, int) else items
+    dataset = []
+    for _ in range(num_transactions):
+        chosen = rng.sample(population, rng.randint(1, max_items_per_transaction))
+        dataset.append((chosen, [rng.randint(1, max_utility) for _ in chosen]))
+    return dataset
+
+
+def brute_force(dataset, min_util=0):
+    """The utility of every itemset occurring in the dataset, as a frozenset of item names, reaching min_util"""
+    utilities = {}
+    for items, values, *_ in dataset:
+        for size in range(1, len(items) + 1):
+            for positions in combinations(range(len(items)), size):
+                key = frozenset(str(items[p]) for p in positions)
+                utilities[key] = utilities.get(key, 0) + sum(values[p] for p in positions)
+    return {key: value for key, value in utilities.items() if value >= min_util}
+
+
+def as_line(transaction, sep="\t"):
+    items, values = transaction[:2]
+    return sep.join(map(str, items)) + ":" + str(sum(values)) + ":" + sep.join(map(str, values))
+
+
+def write_dataset(dataset, sep="\t"):
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as f:
+        for transaction in dataset:
+            f.write(as_line(transaction, sep) + "\n")
+    return f.name